@@ -13,6 +13,7 @@ Uses the refactored service architecture:
 
 from __future__ import annotations
 
+import asyncio
 import json
 from typing import Annotated, Any, Literal
 
@@ -63,6 +64,18 @@ class ApproveRequest(BaseModel):
     parameters: dict[str, Any] | None = None
 
 
+class BulkApproveRequest(BaseModel):
+    """Request body for approving several actions at once.
+
+    approval_ids defaults to every pending approval of the session except
+    destructive ones, which must be listed explicitly.
+    parameters holds optional modified parameters keyed by approval ID.
+    """
+
+    approval_ids: list[str] | None = None
+    parameters: dict[str, dict[str, Any]] | None = None
+
+
 async def _event_generator(
     orchestrator: ChatOrchestrator,
     user_message: str,
@@ -262,6 +275,82 @@ async def approve_action(
         )
 
 
+@router.post("/chat/approve-batch")
+async def approve_actions(
+    token: Annotated[str, Depends(get_token)],
+    session: Annotated[ChatSession, Depends(get_session)],
+    executor: Annotated[ToolExecutor, Depends(get_executor)],
+    body: BulkApproveRequest | None = None,
+) -> JSONResponse:
+    """Approve several pending actions and execute them.
+
+    Independent actions run concurrently (Homebox writes stay rate limited);
+    actions that depend on an earlier one in the batch, such as creating an
+    item in a location created by the same batch, run after it.
+
+    Args:
+        token: Auth token
+        session: Chat session for this user
+        executor: Shared ToolExecutor instance
+        body: Optional approval IDs (default: all pending non-destructive
+            actions) and modified parameters
+
+    Returns:
+        Per-approval results in request order, plus the IDs of destructive
+        actions left pending when no IDs were given
+    """
+    if not settings.chat_enabled:
+        raise HTTPException(status_code=503, detail="Chat feature is disabled")
+    if settings.demo_mode:
+        raise HTTPException(status_code=403, detail="Chat is disabled in demo mode")
+
+    approval_service = ApprovalService(session, executor)
+    still_pending: list[str] = []
+    if body and body.approval_ids is not None:
+        approval_ids = body.approval_ids
+    else:
+        approval_ids, still_pending = approval_service.default_batch()
+
+    outcomes = await approval_service.execute_many(
+        approval_ids, token, modified_params=body.parameters if body else None
+    )
+
+    results = []
+    for approval_id, result, approval in outcomes:
+        results.append({
+            "approval_id": approval_id,
+            "success": result.success,
+            "tool": approval.tool_name if approval else None,
+            "data": result.data,
+            "error": result.error,
+            "confirmation": StreamEmitter.confirmation_message(
+                tool_name=approval.tool_name,
+                success=result.success,
+                data=result.data,
+                error=result.error,
+                display_info=approval.display_info,
+            )
+            if approval
+            else f"✗ {result.error}",
+        })
+
+    succeeded = sum(1 for r in results if r["success"])
+    logger.info(
+        f"Bulk approval executed: {succeeded}/{len(results)} succeeded "
+        f"(approval_ids={approval_ids})"
+    )
+
+    return JSONResponse(
+        content={
+            "success": succeeded == len(results),
+            "results": results,
+            "succeeded": succeeded,
+            "failed": len(results) - succeeded,
+            "pending": still_pending,
+        }
+    )
+
+
 @router.post("/chat/reject/{approval_id}")
 async def reject_action(
     approval_id: str,
@@ -305,7 +394,7 @@ async def clear_history(
     if settings.demo_mode:
         raise HTTPException(status_code=403, detail="Chat is disabled in demo mode")
 
-    session_store_holder.get().delete(token)
+    await asyncio.to_thread(session_store_holder.get().delete, token)
 
     # Note: LLM debug logs are now managed by loguru with automatic retention,
     # so we don't clear them here. They provide cross-session debugging value.
@@ -5,6 +5,7 @@ Provides endpoints for:
 - View debug log status
 - Get recent debug log entries
 - Clear debug logs
+- Inspect and reset circuit breakers
 """
 
 from __future__ import annotations
@@ -12,11 +13,24 @@ from __future__ import annotations
 from typing import Any
 
 from fastapi import APIRouter, Depends
+from loguru import logger
 from pydantic import BaseModel, Field
 
+from homebox_companion.ai import get_completion_coalescing_stats, get_json_repair_stats
+from homebox_companion.core.circuit_breaker import (
+    get_circuit_breaker_stats,
+    reset_circuit_breakers,
+)
+from homebox_companion.core.hedging import get_latency_tracker
+from homebox_companion.core.transport import get_transport_registry
 from homebox_companion.services.debug_logger import get_debug_logger
+from homebox_companion.services.enrichment import get_retailer_domain_health
+from homebox_companion.services.inventory_mirror import get_inventory_mirror
+from homebox_companion.services.search_index import get_item_search_index
+from homebox_companion.services.search_providers import get_search_cache
 
 from ..dependencies import require_auth
+from .enrichment import get_prefetch_stats, get_warmup_stats
 
 router = APIRouter(dependencies=[Depends(require_auth)])
 
@@ -32,6 +46,39 @@ class DebugStatusResponse(BaseModel):
     enabled: bool = Field(description="Whether debug logging is currently enabled")
     log_file: str = Field(description="Path to the debug log file")
     entry_count: int = Field(description="Number of entries in the log file")
+    json_repair: dict[str, Any] | None = Field(
+        default=None, description="Hit counts and rates for each JSON repair tier"
+    )
+    llm_coalescing: dict[str, Any] | None = Field(
+        default=None, description="Executed vs coalesced concurrent identical LLM calls"
+    )
+    http_pools: dict[str, Any] | None = Field(
+        default=None, description="Per-upstream-host HTTP connection pool stats"
+    )
+    llm_latency: dict[str, Any] | None = Field(
+        default=None, description="Rolling per-provider LLM latency percentiles (seconds)"
+    )
+    circuit_breakers: dict[str, Any] | None = Field(
+        default=None, description="State of the Homebox and LLM provider circuit breakers"
+    )
+    inventory_mirror: dict[str, Any] | None = Field(
+        default=None, description="Size, freshness and sync counts of the inventory mirror"
+    )
+    search_index: dict[str, Any] | None = Field(
+        default=None, description="Size of the local item search index"
+    )
+    search_cache: dict[str, Any] | None = Field(
+        default=None, description="Web search response cache statistics (hit rate, entries)"
+    )
+    retailer_domains: dict[str, Any] | None = Field(
+        default=None, description="Per-domain latency and backoff of retailer page fetches"
+    )
+    enrichment_prefetch: dict[str, Any] | None = Field(
+        default=None, description="Background enrichment of detected products (queue, outcomes)"
+    )
+    enrichment_warmup: dict[str, Any] | None = Field(
+        default=None, description="Progress and daily budget usage of the inventory enrichment warm-up"
+    )
 
 
 class DebugLogEntry(BaseModel):
@@ -58,6 +105,14 @@ class ClearLogsResponse(BaseModel):
     message: str
 
 
+class CircuitBreakersResponse(BaseModel):
+    """Circuit breaker states keyed by breaker name."""
+
+    breakers: dict[str, dict[str, Any]] = Field(
+        description="Per-breaker state, failure counts and seconds until the next probe"
+    )
+
+
 class DebugLogRequest(BaseModel):
     """Request to write a debug log entry from frontend."""
 
@@ -77,11 +132,23 @@ async def get_debug_status() -> DebugStatusResponse:
     """Get current debug logging status."""
     debug_logger = get_debug_logger()
     entries = debug_logger.get_recent_logs(count=10000)  # Count all
+    registry = get_transport_registry()
 
     return DebugStatusResponse(
         enabled=debug_logger.enabled,
         log_file=str(debug_logger.log_file_path),
         entry_count=len(entries),
+        json_repair=get_json_repair_stats(),
+        llm_coalescing=get_completion_coalescing_stats(),
+        http_pools=registry.stats() if registry else None,
+        llm_latency=get_latency_tracker().stats(),
+        circuit_breakers=get_circuit_breaker_stats(),
+        inventory_mirror=get_inventory_mirror().stats(),
+        search_index=get_item_search_index().stats(),
+        search_cache=get_search_cache().stats(),
+        retailer_domains=get_retailer_domain_health().stats(),
+        enrichment_prefetch=get_prefetch_stats(),
+        enrichment_warmup=get_warmup_stats(),
     )
 
 
@@ -156,6 +223,20 @@ async def clear_debug_logs() -> ClearLogsResponse:
     )
 
 
+@router.get("/debug/circuit-breakers", response_model=CircuitBreakersResponse)
+async def get_circuit_breakers() -> CircuitBreakersResponse:
+    """Get the state of the Homebox and LLM provider circuit breakers."""
+    return CircuitBreakersResponse(breakers=get_circuit_breaker_stats())
+
+
+@router.post("/debug/circuit-breakers/reset", response_model=CircuitBreakersResponse)
+async def reset_all_circuit_breakers() -> CircuitBreakersResponse:
+    """Force all circuit breakers closed (e.g. after fixing an upstream outage)."""
+    count = reset_circuit_breakers()
+    logger.info(f"Reset {count} circuit breaker(s) via debug endpoint")
+    return CircuitBreakersResponse(breakers=get_circuit_breaker_stats())
+
+
 @router.post("/debug/log")
 async def write_debug_log(request: DebugLogRequest) -> dict[str, str]:
     """Write a debug log entry from the frontend.
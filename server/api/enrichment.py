@@ -3,32 +3,54 @@
 Provides endpoints for:
 - Enriching product data with AI-powered specification lookup
 - Managing enrichment cache
+
+Also prefetches enrichment for products found by vision detection
+(see prefetch_enrichment) and warms the cache for products already in
+Homebox (see start_enrichment_warmup).
 """
 
 from __future__ import annotations
 
+import json
 import logging
+import time
+from collections.abc import Iterable
 from pathlib import Path
-from typing import Annotated
+from typing import Annotated, Any
 
 from fastapi import APIRouter, Depends, HTTPException
 from pydantic import BaseModel, Field
+from sse_starlette.sse import EventSourceResponse
 
 from homebox_companion.core.ai_config import load_ai_config, AIProvider
 from homebox_companion.core.app_preferences import load_app_preferences
 from homebox_companion.core.config import settings
 from homebox_companion.providers import OllamaProvider, LiteLLMProvider
 from homebox_companion.services.enrichment import EnrichmentService, EnrichmentResult
+from homebox_companion.services.enrichment_prefetch import EnrichmentPrefetcher
+from homebox_companion.services.enrichment_warmup import EnrichmentWarmup
+from homebox_companion.services.search_providers import close_search_cache
 from homebox_companion.services.debug_logger import debug_log
 
-from ..dependencies import require_auth, LLMConfig, get_configured_llm
+from ..dependencies import (
+    require_auth,
+    LLMConfig,
+    duplicate_detector_holder,
+    get_configured_llm,
+    get_llm_config,
+)
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(dependencies=[Depends(require_auth)])
 
-# Singleton enrichment service (lazy initialized)
+# Max products per batch enrichment request
+_MAX_BATCH_ITEMS = 100
+
+# Singleton enrichment service, prefetcher and warm-up job (lazy initialized)
 _enrichment_service: EnrichmentService | None = None
+_enrichment_prefetcher: EnrichmentPrefetcher | None = None
+_enrichment_warmup: EnrichmentWarmup | None = None
 
 
 def get_enrichment_service() -> EnrichmentService:
@@ -44,6 +66,21 @@ def get_enrichment_service() -> EnrichmentService:
     return _enrichment_service
 
 
+async def close_enrichment_service() -> None:
+    """Close the enrichment service, its background jobs and the search cache (on app shutdown)."""
+    global _enrichment_service, _enrichment_prefetcher, _enrichment_warmup
+    if _enrichment_warmup is not None:
+        await _enrichment_warmup.close()
+        _enrichment_warmup = None
+    if _enrichment_prefetcher is not None:
+        await _enrichment_prefetcher.close()
+        _enrichment_prefetcher = None
+    if _enrichment_service is not None:
+        await _enrichment_service.aclose()
+        _enrichment_service = None
+    close_search_cache()
+
+
 def configure_search_provider(service: EnrichmentService) -> None:
     """Configure the search provider and custom retailer domains from app preferences."""
     prefs = load_app_preferences()
@@ -86,6 +123,121 @@ def create_ai_provider(llm_config: LLMConfig) -> OllamaProvider | LiteLLMProvide
         )
 
 
+def _prepare_enrichment_service(llm_config: LLMConfig) -> EnrichmentService:
+    """Check that enrichment is enabled and configure the service's providers.
+
+    Raises:
+        HTTPException: If enrichment is disabled or the AI provider cannot be created.
+    """
+    # Check if enrichment is enabled
+    prefs = load_app_preferences()
+    debug_log("ENRICHMENT_API", "Loaded app preferences", {
+        "enrichment_enabled": prefs.enrichment_enabled,
+        "enrichment_auto_enrich": prefs.enrichment_auto_enrich,
+    })
+
+    if not prefs.enrichment_enabled:
+        debug_log("ENRICHMENT_API", "Enrichment disabled in preferences", level="WARNING")
+        raise HTTPException(
+            status_code=400,
+            detail="Enrichment is disabled. Enable it in Settings.",
+        )
+
+    # Get the enrichment service
+    service = get_enrichment_service()
+
+    # Create and set the AI provider based on LLM config
+    try:
+        ai_provider = create_ai_provider(llm_config)
+        debug_log("ENRICHMENT_API", f"Created AI provider: {type(ai_provider).__name__}", {
+            "provider_type": llm_config.provider,
+            "model": llm_config.model,
+        })
+        service.set_provider(ai_provider)
+    except Exception as e:
+        debug_log("ENRICHMENT_API", f"Failed to create AI provider: {e}", level="ERROR")
+        raise HTTPException(
+            status_code=503,
+            detail=f"Failed to create AI provider: {str(e)}",
+        )
+
+    # Configure search provider from preferences
+    configure_search_provider(service)
+    debug_log("ENRICHMENT_API", "Search provider configured", {
+        "has_search_provider": service.has_search_provider,
+        "provider": service.search_provider.provider_name if service.search_provider else "none",
+    })
+
+    return service
+
+
+def prefetch_enrichment(products: Iterable[tuple[str, str, str]], llm_config: LLMConfig) -> int:
+    """Queue detected products for background enrichment, if enabled.
+
+    Does nothing unless HBC_ENRICHMENT_PREFETCH_ENABLED is set and enrichment
+    is enabled in preferences. Never raises, so detection is not affected.
+
+    Args:
+        products: (manufacturer, model_number, product_name) triples
+        llm_config: LLM configuration of the detection request
+
+    Returns:
+        Number of products queued
+    """
+    global _enrichment_prefetcher
+    if not settings.enrichment_prefetch_enabled:
+        return 0
+    products = [product for product in products if product[0] and product[1]]
+    if not products:
+        return 0
+
+    try:
+        service = _prepare_enrichment_service(llm_config)
+    except HTTPException as e:
+        debug_log("ENRICHMENT_API", f"Skipping enrichment prefetch: {e.detail}", level="DEBUG")
+        return 0
+
+    if _enrichment_prefetcher is None:
+        _enrichment_prefetcher = EnrichmentPrefetcher(service)
+    return _enrichment_prefetcher.submit(products)
+
+
+def get_prefetch_stats() -> dict[str, Any] | None:
+    """Get enrichment prefetch statistics, or None if prefetching never ran."""
+    if _enrichment_prefetcher is None:
+        return None
+    return _enrichment_prefetcher.stats()
+
+
+def _get_warmup_service() -> EnrichmentService | None:
+    """Get the enrichment service set up with the configured LLM, or None if unavailable."""
+    try:
+        return _prepare_enrichment_service(get_llm_config())
+    except HTTPException as e:
+        debug_log("ENRICHMENT_API", f"Skipping enrichment warm-up: {e.detail}", level="DEBUG")
+        return None
+
+
+def start_enrichment_warmup() -> None:
+    """Start the background warm-up over existing inventory (on app startup), if enabled.
+
+    Products come from the duplicate detector's index, so the warm-up has
+    nothing to do until the detector has been created and loaded.
+    """
+    global _enrichment_warmup
+    if not settings.enrichment_warmup_enabled or _enrichment_warmup is not None:
+        return
+    _enrichment_warmup = EnrichmentWarmup(_get_warmup_service, duplicate_detector_holder.get)
+    _enrichment_warmup.start()
+
+
+def get_warmup_stats() -> dict[str, Any] | None:
+    """Get enrichment warm-up statistics, or None if the warm-up is disabled."""
+    if _enrichment_warmup is None:
+        return None
+    return _enrichment_warmup.stats()
+
+
 # =============================================================================
 # Request/Response Models
 # =============================================================================
@@ -132,6 +284,16 @@ class EnrichResponse(BaseModel):
         )
 
 
+class BatchEnrichRequest(BaseModel):
+    """Request to enrich many products."""
+
+    items: list[EnrichRequest] = Field(
+        min_length=1,
+        max_length=_MAX_BATCH_ITEMS,
+        description="Products to enrich; identical manufacturer/model pairs are looked up once",
+    )
+
+
 class ClearCacheResponse(BaseModel):
     """Response from clearing the cache."""
 
@@ -173,44 +335,7 @@ async def enrich_product(
             detail="Model number is required for enrichment.",
         )
 
-    # Check if enrichment is enabled
-    prefs = load_app_preferences()
-    debug_log("ENRICHMENT_API", "Loaded app preferences", {
-        "enrichment_enabled": prefs.enrichment_enabled,
-        "enrichment_auto_enrich": prefs.enrichment_auto_enrich,
-    })
-
-    if not prefs.enrichment_enabled:
-        debug_log("ENRICHMENT_API", "Enrichment disabled in preferences", level="WARNING")
-        raise HTTPException(
-            status_code=400,
-            detail="Enrichment is disabled. Enable it in Settings.",
-        )
-
-    # Get the enrichment service
-    service = get_enrichment_service()
-
-    # Create and set the AI provider based on LLM config
-    try:
-        ai_provider = create_ai_provider(llm_config)
-        debug_log("ENRICHMENT_API", f"Created AI provider: {type(ai_provider).__name__}", {
-            "provider_type": llm_config.provider,
-            "model": llm_config.model,
-        })
-        service.set_provider(ai_provider)
-    except Exception as e:
-        debug_log("ENRICHMENT_API", f"Failed to create AI provider: {e}", level="ERROR")
-        raise HTTPException(
-            status_code=503,
-            detail=f"Failed to create AI provider: {str(e)}",
-        )
-
-    # Configure search provider from preferences
-    configure_search_provider(service)
-    debug_log("ENRICHMENT_API", "Search provider configured", {
-        "has_search_provider": service.has_search_provider,
-        "provider": service.search_provider.provider_name if service.search_provider else "none",
-    })
+    service = _prepare_enrichment_service(llm_config)
 
     # Perform enrichment
     try:
@@ -231,6 +356,74 @@ async def enrich_product(
         raise HTTPException(status_code=500, detail=f"Enrichment failed: {str(e)}")
 
 
+async def _batch_event_generator(
+    service: EnrichmentService,
+    items: list[EnrichRequest],
+):
+    """Generate SSE events for a batch enrichment.
+
+    Yields:
+        One "result" event per input item as its product finishes, then "done"
+    """
+    started = time.perf_counter()
+    enriched = 0
+    try:
+        async for indices, result in service.enrich_many(
+            [(item.manufacturer, item.model_number, item.product_name) for item in items]
+        ):
+            response = EnrichResponse.from_result(result, service).model_dump()
+            for index in indices:
+                enriched += result.enriched
+                yield {
+                    "event": "result",
+                    "data": json.dumps({"index": index, **response}),
+                }
+    except Exception as e:
+        logger.error(f"Batch enrichment failed: {e}")
+        debug_log("ENRICHMENT_API", f"Batch enrichment failed: {e}", level="ERROR")
+        yield {"event": "error", "data": json.dumps({"message": str(e)})}
+
+    yield {
+        "event": "done",
+        "data": json.dumps({
+            "total": len(items),
+            "enriched": enriched,
+            "duration_ms": round((time.perf_counter() - started) * 1000, 1),
+        }),
+    }
+
+
+@router.post("/enrichment/batch")
+async def enrich_products(
+    request: BatchEnrichRequest,
+    llm_config: Annotated[LLMConfig, Depends(get_configured_llm)],
+) -> EventSourceResponse:
+    """
+    Enrich many products, streaming each result as soon as it is ready.
+
+    Searches, retailer page fetches and AI parses run as separately bounded
+    concurrent stages, and duplicate manufacturer/model pairs are enriched
+    once. Items without a model number get an empty result.
+
+    The response is a Server-Sent Events stream:
+    - result: {"index": int, ...same fields as /enrichment/lookup}
+    - error: {"message": string}
+    - done: {"total": int, "enriched": int, "duration_ms": float}
+    """
+    debug_log("ENRICHMENT_API", "POST /enrichment/batch called", {
+        "item_count": len(request.items),
+        "llm_provider": llm_config.provider,
+        "llm_model": llm_config.model,
+    })
+
+    service = _prepare_enrichment_service(llm_config)
+
+    return EventSourceResponse(
+        _batch_event_generator(service, request.items),
+        media_type="text/event-stream",
+    )
+
+
 @router.delete("/enrichment/cache", response_model=ClearCacheResponse)
 async def clear_enrichment_cache() -> ClearCacheResponse:
     """Clear the enrichment cache."""
@@ -6,9 +6,11 @@ from fastapi import APIRouter, Depends, File, HTTPException, Query, UploadFile
 from fastapi.responses import JSONResponse, Response
 from loguru import logger
 
-from homebox_companion import DetectedItem, HomeboxAuthError, HomeboxClient
+from homebox_companion import DetectedItem, HomeboxAuthError, HomeboxClient, settings
 from homebox_companion.homebox import ItemCreate
 from homebox_companion.services.duplicate_detector import DuplicateDetector
+from homebox_companion.services.inventory_mirror import get_inventory_mirror
+from homebox_companion.services.search_index import get_item_search_index
 
 from ..dependencies import get_client, get_duplicate_detector, get_token, validate_file_size
 from ..schemas.items import (
@@ -31,16 +33,28 @@ async def list_items(
     token: Annotated[str, Depends(get_token)],
     client: Annotated[HomeboxClient, Depends(get_client)],
     location_id: str | None = Query(None, alias="location_id"),
+    q: str | None = Query(None, description="Optional text search query"),
 ) -> list[dict]:
     """
-    List items, optionally filtered by location.
+    List items, optionally filtered by location and/or a search query.
+
+    Searches are answered from the local search index, ranked by relevance,
+    once the inventory mirror has synced; until then they are passed to Homebox.
 
     Returns a simplified list of items suitable for selection UI.
     """
-    logger.debug(f"Fetching items for location_id={location_id}")
-
-    response = await client.list_items(token, location_id=location_id)
-    items = response.get("items", [])
+    logger.debug(f"Fetching items for location_id={location_id}, q={q!r}")
+
+    items: list[dict] | None = None
+    if q and settings.search_index_enabled:
+        mirror = get_inventory_mirror()
+        mirror.touch(token)
+        index = get_item_search_index()
+        if mirror.is_ready_for(token) and index.is_ready:
+            items = [hit.item for hit in index.search(q, location_id=location_id)]
+    if items is None:
+        response = await client.list_items(token, location_id=location_id, query=q)
+        items = response.get("items", [])
 
     # Return simplified item data
     result = [
@@ -189,9 +203,11 @@ async def create_items(
             # Non-fatal - log but don't fail the request
             logger.warning(f"Failed to ensure asset IDs: {e}")
 
-        # Add created items to duplicate detection index (incremental update)
+        # Add created items to the inventory mirror and duplicate index (incremental update)
+        mirror = get_inventory_mirror()
         items_added = 0
         for item in created:
+            mirror.record_item(item)
             if detector.add_item_to_index(item):
                 items_added += 1
         if items_added > 0:
@@ -370,6 +386,7 @@ async def delete_item(
     logger.info(f"Deleting item: {item_id}")
 
     await client.delete_item(token, item_id)
+    get_inventory_mirror().forget_item(item_id)
     logger.info(f"Successfully deleted item {item_id}")
     return {"message": "Item deleted"}
 
@@ -524,6 +541,7 @@ async def merge_item(
     # Perform the update
     try:
         result = await client.update_item(token, item_id, update_data)
+        get_inventory_mirror().record_item(result)
         logger.info(
             f"Merged item {item_id}: {len(fields_updated)} updated, "
             f"{len(fields_skipped)} skipped"
@@ -5,6 +5,7 @@ from typing import Annotated, Any
 from fastapi import APIRouter, Depends
 
 from homebox_companion import HomeboxClient
+from homebox_companion.services.inventory_mirror import get_inventory_mirror
 
 from ..dependencies import get_client, get_token
 
@@ -18,7 +19,12 @@ async def get_labels(
 ) -> list[dict[str, Any]]:
     """Fetch all available labels.
 
+    Served from the inventory mirror once it has synced for this token.
     Exceptions (HomeboxAuthError, RuntimeError) are handled by
     the centralized domain_error_handler in app.py.
     """
+    mirror = get_inventory_mirror()
+    mirror.touch(token)
+    if mirror.is_ready_for(token) and mirror.labels is not None:
+        return mirror.labels
     return await client.list_labels(token)
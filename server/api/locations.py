@@ -7,6 +7,7 @@ from fastapi import APIRouter, Depends, Query
 from loguru import logger
 
 from homebox_companion import HomeboxClient
+from homebox_companion.services.inventory_mirror import get_inventory_mirror
 
 from ..dependencies import get_client, get_token
 from ..schemas.locations import LocationCreate, LocationUpdate
@@ -25,6 +26,10 @@ async def get_locations(
     Args:
         filter_children: If true, returns only top-level locations.
     """
+    mirror = get_inventory_mirror()
+    mirror.touch(token)
+    if not filter_children and mirror.is_ready_for(token) and mirror.locations is not None:
+        return mirror.locations
     return await client.list_locations(token, filter_children=filter_children)
 
 
@@ -124,12 +129,14 @@ async def create_location(
     client: Annotated[HomeboxClient, Depends(get_client)],
 ) -> dict[str, Any]:
     """Create a new location."""
-    return await client.create_location(
+    location = await client.create_location(
         token,
         name=data.name,
         description=data.description,
         parent_id=data.parent_id,
     )
+    get_inventory_mirror().request_sync()
+    return location
 
 
 @router.put("/locations/{location_id}")
@@ -140,10 +147,12 @@ async def update_location(
     client: Annotated[HomeboxClient, Depends(get_client)],
 ) -> dict[str, Any]:
     """Update an existing location."""
-    return await client.update_location(
+    location = await client.update_location(
         token,
         location_id=location_id,
         name=data.name,
         description=data.description,
         parent_id=data.parent_id,
     )
+    get_inventory_mirror().request_sync()
+    return location
@@ -9,10 +9,11 @@ Uses the ToolExecutor service for centralized tool execution.
 from __future__ import annotations
 
 import json
+import time
 from typing import Annotated, Any
 
 from fastapi import APIRouter, Depends, Request
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 from loguru import logger
 
 from homebox_companion import settings
@@ -23,11 +24,14 @@ from ..dependencies import get_executor
 
 router = APIRouter()
 
+# Max tool calls accepted in one batch request
+_MAX_BATCH_CALLS = 500
+
 
 @router.get("/mcp/v1/tools")
 async def list_mcp_tools(
     executor: Annotated[ToolExecutor, Depends(get_executor)],
-) -> JSONResponse:
+) -> Response:
     """List available MCP tools and their schemas.
 
     This endpoint is primarily for discovery and debugging.
@@ -42,19 +46,11 @@ async def list_mcp_tools(
             status_code=503, content={"error": "Chat/MCP feature is disabled"}
         )
 
-    # Get schemas with token parameter included for MCP protocol
-    schemas = executor.get_tool_schemas(include_write=False, include_token=True)
-
-    # Convert to dict format for JSON response
-    tools_dict = {
-        schema["function"]["name"]: {
-            "description": schema["function"]["description"],
-            "parameters": schema["function"]["parameters"],
-        }
-        for schema in schemas
-    }
-
-    return JSONResponse(content={"tools": tools_dict})
+    # Read-only schemas with the token parameter, pre-serialized once
+    return Response(
+        content=executor.get_tool_listing_json(include_write=False, include_token=True),
+        media_type="application/json",
+    )
 
 
 @router.post("/mcp/v1/tools/{tool_name}")
@@ -130,6 +126,102 @@ async def execute_mcp_tool(
     return JSONResponse(content=result.to_dict())
 
 
+@router.post("/mcp/v1/batch")
+async def execute_mcp_batch(
+    request: Request,
+    executor: Annotated[ToolExecutor, Depends(get_executor)],
+) -> JSONResponse:
+    """Execute many MCP tools in one request.
+
+    READ tools run concurrently. WRITE tools are only accepted when
+    HBC_MCP_BATCH_ALLOW_WRITES is enabled and are pipelined under the
+    Homebox write rate limiter. Destructive tools are always rejected.
+
+    Args:
+        request: FastAPI request containing JSON body with:
+            - token: Homebox auth token (required)
+            - calls: List of {"tool": name, "params": {...}}
+        executor: Shared ToolExecutor instance
+
+    Returns:
+        JSON response with per-call results (in request order) and timings
+    """
+    if not settings.chat_enabled:
+        return JSONResponse(
+            status_code=503, content={"error": "Chat/MCP feature is disabled"}
+        )
+
+    try:
+        body = await request.json()
+    except json.JSONDecodeError:
+        return JSONResponse(
+            status_code=400, content={"success": False, "error": "Invalid JSON body"}
+        )
+    if not isinstance(body, dict):
+        return JSONResponse(
+            status_code=400, content={"success": False, "error": "Invalid JSON body"}
+        )
+
+    token = body.get("token")
+    if not token:
+        return JSONResponse(
+            status_code=401,
+            content={"success": False, "error": "Missing required token parameter"},
+        )
+
+    raw_calls = body.get("calls")
+    if not isinstance(raw_calls, list) or not raw_calls:
+        return JSONResponse(
+            status_code=400,
+            content={"success": False, "error": "calls must be a non-empty list"},
+        )
+    if len(raw_calls) > _MAX_BATCH_CALLS:
+        return JSONResponse(
+            status_code=400,
+            content={
+                "success": False,
+                "error": f"Too many calls in batch (max {_MAX_BATCH_CALLS})",
+            },
+        )
+
+    calls: list[tuple[str, dict[str, Any]]] = []
+    for index, call in enumerate(raw_calls):
+        if (
+            not isinstance(call, dict)
+            or not isinstance(call.get("tool"), str)
+            or not isinstance(call.get("params", {}), dict)
+        ):
+            return JSONResponse(
+                status_code=400,
+                content={
+                    "success": False,
+                    "error": f"Invalid call at index {index}: expected "
+                    '{"tool": str, "params": object}',
+                },
+            )
+        calls.append((call["tool"], call.get("params", {})))
+
+    allowed = (
+        (ToolPermission.READ, ToolPermission.WRITE)
+        if settings.mcp_batch_allow_writes
+        else (ToolPermission.READ,)
+    )
+
+    logger.debug(f"Executing MCP batch via HTTP: {len(calls)} calls")
+    started = time.perf_counter()
+    results = await executor.execute_batch(calls, token, allowed_permissions=allowed)
+    succeeded = sum(1 for r in results if r.result.success)
+
+    return JSONResponse(
+        content={
+            "results": [r.to_dict() for r in results],
+            "succeeded": succeeded,
+            "failed": len(results) - succeeded,
+            "duration_ms": round((time.perf_counter() - started) * 1000, 1),
+        }
+    )
+
+
 @router.get("/mcp/v1/health")
 async def mcp_health() -> dict[str, Any]:
     """Health check for MCP server.
@@ -24,6 +24,7 @@ from homebox_companion import (
 from homebox_companion import (
     correct_item as llm_correct_item,
 )
+from homebox_companion.core.hedging import get_latency_tracker, hedged_call, timed
 
 from ...dependencies import (
     LLMConfig,
@@ -45,6 +46,7 @@ from ...schemas.vision import (
     GroupedDetectionResponse,
     TokenUsageResponse,
 )
+from ..enrichment import prefetch_enrichment
 
 router = APIRouter()
 
@@ -154,6 +156,11 @@ def get_llm_model_for_litellm(llm_config: LLMConfig) -> str:
     return llm_config.model
 
 
+def _latency_key(llm_config: LLMConfig) -> str:
+    """Get the latency tracker key for a provider configuration."""
+    return f"{llm_config.provider}:{llm_config.model}"
+
+
 async def run_with_fallback(
     primary_config: LLMConfig,
     fallback_config: LLMConfig | None,
@@ -167,6 +174,11 @@ async def run_with_fallback(
     If the primary provider fails and a fallback is configured,
     retry with the fallback provider.
 
+    When hedging is enabled (HBC_LLM_HEDGING_ENABLED) and the primary has
+    enough latency history, the fallback is started as soon as the primary
+    runs past its rolling p90 latency. The first successful result wins and
+    the other call is cancelled.
+
     Args:
         primary_config: Primary LLM configuration.
         fallback_config: Fallback LLM configuration (or None).
@@ -181,15 +193,45 @@ async def run_with_fallback(
     Raises:
         The original exception if fallback is not available or also fails.
     """
+
+    def call_with(llm_config: LLMConfig):
+        return lambda: timed(
+            _latency_key(llm_config),
+            lambda: async_fn(
+                *args,
+                api_key=llm_config.api_key,
+                model=get_llm_model_for_litellm(llm_config),
+                api_base=llm_config.api_base,
+                **kwargs,
+            ),
+        )
+
+    if settings.llm_hedging_enabled and fallback_config is not None:
+        hedge_delay = get_latency_tracker().hedge_delay(_latency_key(primary_config))
+        if hedge_delay is not None:
+            try:
+                result, fallback_won = await hedged_call(
+                    call_with(primary_config),
+                    call_with(fallback_config),
+                    hedge_delay,
+                    primary_key=_latency_key(primary_config),
+                )
+            except Exception as e:
+                logger.error(
+                    f"[HEDGE] Primary '{primary_config.provider}' and fallback "
+                    f"'{fallback_config.provider}' both failed for {operation_name}: "
+                    f"{type(e).__name__}"
+                )
+                raise
+            if fallback_won:
+                logger.info(
+                    f"[HEDGE] Fallback '{fallback_config.provider}' answered first for {operation_name}"
+                )
+            return result
+
     try:
         # Try primary provider
-        return await async_fn(
-            *args,
-            api_key=primary_config.api_key,
-            model=get_llm_model_for_litellm(primary_config),
-            api_base=primary_config.api_base,
-            **kwargs,
-        )
+        return await call_with(primary_config)()
     except Exception as primary_error:
         # Log primary failure
         error_msg = str(primary_error)
@@ -211,13 +253,7 @@ async def run_with_fallback(
             f"(model: {fallback_config.model})"
         )
         try:
-            result = await async_fn(
-                *args,
-                api_key=fallback_config.api_key,
-                model=get_llm_model_for_litellm(fallback_config),
-                api_base=fallback_config.api_base,
-                **kwargs,
-            )
+            result = await call_with(fallback_config)()
             logger.info(f"[FALLBACK] Fallback to '{fallback_config.provider}' succeeded")
             return result
         except Exception as fallback_error:
@@ -331,6 +367,12 @@ async def detect_items(
 
     logger.info(f"Detected {len(detection_result.items)} items, compressed {len(compressed_images)} images")
 
+    # Warm the enrichment cache while the user reviews the items (if enabled)
+    prefetch_enrichment(
+        ((item.manufacturer, item.model_number, item.name) for item in detection_result.items),
+        llm_config,
+    )
+
     # Filter out default label from AI suggestions (frontend will auto-add it)
     return DetectionResponse(
         items=[
@@ -500,6 +542,12 @@ async def detect_items_batch(
     failed = len(results) - successful
     total_items = sum(len(r.items) for r in results)
 
+    # Warm the enrichment cache while the user reviews the items (if enabled)
+    prefetch_enrichment(
+        ((item.manufacturer, item.model_number, item.name) for r in results for item in r.items),
+        llm_config,
+    )
+
     # Aggregate token usage across all successful results
     total_prompt_tokens = 0
     total_completion_tokens = 0
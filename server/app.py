@@ -22,8 +22,11 @@ from homebox_companion import (
     settings,
     setup_logging,
 )
+from homebox_companion.core.transport import close_transport_registry, init_transport_registry
+from homebox_companion.services.inventory_mirror import get_inventory_mirror
 
 from .api import api_router
+from .api.enrichment import close_enrichment_service, start_enrichment_warmup
 from .dependencies import client_holder, session_store_holder, tool_executor_holder
 from .middleware import RequestIDMiddleware, SecurityHeadersMiddleware, request_id_var
 
@@ -292,10 +295,20 @@ async def lifespan(app: FastAPI):
     # Run connectivity test in debug mode
     await _test_homebox_connectivity()
 
+    # Shared pooled HTTP transports for upstream calls (Ollama, search, retailers)
+    init_transport_registry()
+
     # Initialize shared service holders
     client = HomeboxClient(base_url=settings.api_url)
     client_holder.set(client)
 
+    # Shared inventory mirror; syncs on demand once requests supply a token
+    if settings.inventory_sync_interval > 0:
+        get_inventory_mirror().start(client)
+
+    # Background enrichment of products already in Homebox (HBC_ENRICHMENT_WARMUP_ENABLED)
+    start_enrichment_warmup()
+
     # Session store and executor are lazily initialized on first use
     # (see their .get() methods in dependencies.py)
 
@@ -306,8 +319,11 @@ async def lifespan(app: FastAPI):
 
     # Reset holders (executor and session store don't need async cleanup)
     tool_executor_holder.reset()
-    session_store_holder.reset()
+    session_store_holder.close()
+    await get_inventory_mirror().close()
+    await close_enrichment_service()
     await client_holder.close()
+    await close_transport_registry()
     logger.info("Shutdown complete")
 
 
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Annotated
@@ -20,6 +21,7 @@ if TYPE_CHECKING:
 from homebox_companion.core.field_preferences import FieldPreferences, load_field_preferences
 from homebox_companion.core.ai_config import load_ai_config, AIProvider
 from homebox_companion.services.duplicate_detector import DuplicateDetector
+from homebox_companion.services.inventory_mirror import get_inventory_mirror
 
 
 class ClientHolder:
@@ -137,7 +139,7 @@ class SessionStoreHolder:
         # In app lifespan:
         session_store_holder.set(MemorySessionStore())
         yield
-        # No cleanup needed for memory store
+        session_store_holder.close()  # Flushes persistent stores
 
         # In tests:
         session_store_holder.set(mock_store)
@@ -163,12 +165,24 @@ class SessionStoreHolder:
             The shared session store instance.
         """
         if self._store is None:
-            from homebox_companion.chat.store import MemorySessionStore
+            if settings.chat_session_store == "sqlite":
+                from homebox_companion.chat.store import SQLiteSessionStore
 
-            self._store = MemorySessionStore()
-            logger.debug("Created default MemorySessionStore")
+                self._store = SQLiteSessionStore()
+            else:
+                from homebox_companion.chat.store import MemorySessionStore
+
+                self._store = MemorySessionStore()
+                logger.debug("Created default MemorySessionStore")
         return self._store
 
+    def close(self) -> None:
+        """Flush and close the store (if it holds resources), then reset."""
+        close = getattr(self._store, "close", None)
+        if close is not None:
+            close()
+        self._store = None
+
     def reset(self) -> None:
         """Reset the holder (for testing).
 
@@ -294,13 +308,14 @@ def get_executor(
 
 
 
-def get_session(
+async def get_session(
     token: Annotated[str, Depends(get_token)],
 ) -> ChatSession:
     """Get the chat session for the current user.
 
     This is a FastAPI dependency that retrieves (or creates) the session
-    for the authenticated user.
+    for the authenticated user. Stores may block on disk (see
+    SQLiteSessionStore), so the lookup runs in a worker thread.
 
     Args:
         token: The user's auth token (from get_token dependency).
@@ -309,7 +324,7 @@ def get_session(
         The ChatSession for this user.
     """
     store = session_store_holder.get()
-    return store.get(token)
+    return await asyncio.to_thread(store.get, token)
 
 
 def require_auth(token: Annotated[str, Depends(get_token)]) -> None:
@@ -559,8 +574,13 @@ async def get_labels_for_context(token: str) -> list[dict[str, str]]:
         RuntimeError: If the API returns an unexpected error (not transient).
     """
     client = get_client()
+    mirror = get_inventory_mirror()
+    mirror.touch(token)
     try:
-        raw_labels = await client.list_labels(token)
+        if mirror.is_ready_for(token) and mirror.labels is not None:
+            raw_labels = mirror.labels
+        else:
+            raw_labels = await client.list_labels(token)
         return [
             {"id": str(label.get("id", "")), "name": str(label.get("name", ""))}
             for label in raw_labels
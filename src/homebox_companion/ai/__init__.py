@@ -4,6 +4,7 @@
 from ..core.exceptions import (
     CapabilityNotSupportedError,
     JSONRepairError,
+    LLMCircuitOpenError,
     LLMServiceError,
 )
 from .images import (
@@ -14,6 +15,8 @@ from .images import (
 from .llm import (
     chat_completion,
     vision_completion,
+    get_completion_coalescing_stats,
+    get_json_repair_stats,
     CompletionResult,
     TokenUsage,
 )
@@ -34,10 +37,13 @@ __all__ = [
     # LLM helpers
     "chat_completion",
     "vision_completion",
+    "get_completion_coalescing_stats",
+    "get_json_repair_stats",
     "CompletionResult",
     "TokenUsage",
     # LLM exceptions
     "LLMServiceError",
+    "LLMCircuitOpenError",
     "CapabilityNotSupportedError",
     "JSONRepairError",
     # Model capabilities
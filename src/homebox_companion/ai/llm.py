@@ -9,12 +9,25 @@ from __future__ import annotations
 
 import copy
 import json
+from collections import Counter
 from dataclasses import dataclass, field
 from typing import Any
 
 import litellm
 from loguru import logger
 
+from ..core import config
+from ..core.circuit_breaker import CircuitBreaker, get_circuit_breaker
+from ..core.exceptions import (
+    CapabilityNotSupportedError,
+    JSONRepairError,
+    LLMCircuitOpenError,
+    LLMServiceError,
+)
+from ..core.rate_limiter import acquire_rate_limit, estimate_tokens, is_rate_limiting_enabled
+from ..core.single_flight import SingleFlight, make_flight_key
+from .model_capabilities import get_model_capabilities
+
 
 @dataclass
 class TokenUsage:
@@ -54,14 +67,6 @@ class CompletionResult:
     content: dict[str, Any] = field(default_factory=dict)
     usage: TokenUsage = field(default_factory=TokenUsage)
 
-from ..core import config
-from ..core.exceptions import (
-    CapabilityNotSupportedError,
-    JSONRepairError,
-    LLMServiceError,
-)
-from ..core.rate_limiter import acquire_rate_limit, estimate_tokens, is_rate_limiting_enabled
-from .model_capabilities import get_model_capabilities
 
 # Silence LiteLLM's verbose logging (we use loguru)
 litellm.suppress_debug_info = True
@@ -69,6 +74,56 @@ litellm.suppress_debug_info = True
 # Maximum characters to include from malformed response in repair prompt
 MAX_REPAIR_CONTEXT_LENGTH = 2000
 
+# Maximum number of times local repair truncates back to an earlier comma
+# before giving up and falling through to the remote (LLM) repair round-trip
+MAX_LOCAL_REPAIR_ATTEMPTS = 8
+
+# Outcome counters for each JSON repair tier:
+# - direct: response parsed without any repair
+# - local: fixed by the deterministic local repair stage
+# - remote: fixed by asking the LLM to repair its own output
+# - failed: still invalid after remote repair
+_json_repair_stats: Counter[str] = Counter()
+_JSON_REPAIR_TIERS = ("direct", "local", "remote", "failed")
+
+# Coalesces concurrent identical completions (frontend retries, duplicate
+# submissions from multiple tabs) into a single upstream call
+_completion_flight = SingleFlight("llm")
+
+
+def get_completion_coalescing_stats() -> dict[str, Any]:
+    """Get single-flight statistics for LLM completions.
+
+    Returns:
+        Dict with executed, coalesced and in-flight call counts.
+    """
+    return _completion_flight.stats()
+
+
+def get_json_repair_stats() -> dict[str, Any]:
+    """Get hit counts and rates for each JSON repair tier.
+
+    Returns:
+        Dict with total parsed responses plus count and rate per tier.
+    """
+    total = sum(_json_repair_stats[tier] for tier in _JSON_REPAIR_TIERS)
+    return {
+        "total": total,
+        "tiers": {
+            tier: {
+                "count": _json_repair_stats[tier],
+                "rate": round(_json_repair_stats[tier] / total, 4) if total else 0.0,
+            }
+            for tier in _JSON_REPAIR_TIERS
+        },
+    }
+
+
+def reset_json_repair_stats() -> None:
+    """Reset JSON repair tier counters (primarily for testing)."""
+    _json_repair_stats.clear()
+
+
 def _format_messages_for_logging(messages: list[dict[str, Any]]) -> str:
     """Format messages for readable logging output.
 
@@ -202,6 +257,180 @@ def _parse_json_response(
     return parsed, None
 
 
+def _extract_largest_json_object(content: str) -> dict[str, Any] | None:
+    """Find the largest valid JSON object embedded in arbitrary text.
+
+    Handles responses where the model wraps the JSON in prose
+    ("Here is the result: {...} Let me know...") or emits several objects.
+
+    Args:
+        content: Raw content that may contain one or more JSON objects.
+
+    Returns:
+        The largest decodable JSON object, or None if none is found.
+    """
+    decoder = json.JSONDecoder()
+    best: dict[str, Any] | None = None
+    best_length = 0
+    pos = content.find("{")
+    while pos != -1:
+        try:
+            parsed, end = decoder.raw_decode(content, pos)
+        except json.JSONDecodeError:
+            pos = content.find("{", pos + 1)
+            continue
+        if isinstance(parsed, dict) and end - pos > best_length:
+            best, best_length = parsed, end - pos
+        # Skip past this object; nested objects are never larger than their parent
+        pos = content.find("{", end)
+    return best
+
+
+def _close_truncated_json(content: str) -> tuple[str, int | None]:
+    """Structurally repair JSON text in a single string-aware pass.
+
+    Strips trailing commas before closing brackets, drops unmatched closers,
+    closes an unterminated string and appends any missing closing brackets.
+
+    Args:
+        content: JSON text starting at the opening brace.
+
+    Returns:
+        Tuple of (repaired text, index of the last comma outside a string
+        in the input or None). The comma index lets callers cut back to the
+        last complete member when the tail is too damaged to close.
+    """
+    out: list[str] = []
+    closers: list[str] = []
+    in_string = False
+    escaped = False
+    last_comma: int | None = None
+
+    def strip_trailing_comma() -> None:
+        while out and out[-1].isspace():
+            out.pop()
+        if out and out[-1] == ",":
+            out.pop()
+
+    for i, ch in enumerate(content):
+        if in_string:
+            out.append(ch)
+            if escaped:
+                escaped = False
+            elif ch == "\\":
+                escaped = True
+            elif ch == '"':
+                in_string = False
+            continue
+
+        if ch == '"':
+            in_string = True
+        elif ch in "{[":
+            closers.append("}" if ch == "{" else "]")
+        elif ch in "}]":
+            if not closers or closers[-1] != ch:
+                continue  # Unmatched closer - drop it
+            strip_trailing_comma()
+            closers.pop()
+        elif ch == ",":
+            last_comma = i
+        out.append(ch)
+
+    if in_string:
+        if escaped:
+            out.pop()  # Dangling backslash would escape our closing quote
+        out.append('"')
+
+    strip_trailing_comma()
+    while out and out[-1].isspace():
+        out.pop()
+    if out and out[-1] == ":":
+        out.append("null")
+
+    out.extend(reversed(closers))
+    return "".join(out), last_comma
+
+
+def _repair_json_locally(
+    raw_content: str,
+    expected_keys: list[str] | None = None,
+) -> dict[str, Any] | None:
+    """Attempt deterministic JSON repair without another LLM round-trip.
+
+    Most malformed responses are a trailing comma, prose around the object or
+    output truncated mid-structure. These are cheap to fix locally, so this
+    runs before the remote repair that re-sends the whole conversation.
+
+    Tries, in order:
+    1. Stripping trailing commas, closing strings and balancing brackets
+    2. Cutting back to the last complete member and balancing again
+    3. Extracting the largest valid JSON object from the text
+
+    Args:
+        raw_content: Raw string content from the model.
+        expected_keys: Optional keys that must be present in the result.
+
+    Returns:
+        The repaired dict if a candidate parses and has all expected keys,
+        otherwise None.
+    """
+    content = _strip_markdown_code_blocks(raw_content)
+
+    def accept(parsed: dict[str, Any] | None) -> bool:
+        return parsed is not None and all(k in parsed for k in expected_keys or ())
+
+    start = content.find("{")
+    if start == -1:
+        return None
+    candidate = content[start:]
+
+    for _ in range(MAX_LOCAL_REPAIR_ATTEMPTS):
+        repaired, last_comma = _close_truncated_json(candidate)
+        try:
+            parsed = json.loads(repaired)
+        except json.JSONDecodeError:
+            parsed = None
+        if isinstance(parsed, dict) and accept(parsed):
+            return parsed
+        if last_comma is None:
+            break
+        # Drop the damaged trailing member and try again
+        candidate = candidate[:last_comma]
+
+    # Complete object(s) surrounded by prose
+    extracted = _extract_largest_json_object(content)
+    return extracted if accept(extracted) else None
+
+
+def _strip_image_parts(messages: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Copy messages for a repair request, replacing image parts with a note.
+
+    The repair prompt only needs the malformed text, so re-sending every
+    base64 image would double token cost and latency for no benefit.
+
+    Args:
+        messages: Original chat messages (not modified).
+
+    Returns:
+        New message list with image_url parts removed from list content.
+    """
+    stripped: list[dict[str, Any]] = []
+    for msg in messages:
+        content = msg.get("content")
+        if not isinstance(content, list):
+            stripped.append(dict(msg))
+            continue
+
+        text_parts = [part for part in content if part.get("type") != "image_url"]
+        image_count = len(content) - len(text_parts)
+        if image_count:
+            text_parts.append(
+                {"type": "text", "text": f"[{image_count} image(s) omitted from repair request]"}
+            )
+        stripped.append({**msg, "content": text_parts})
+    return stripped
+
+
 def _extract_provider_from_model(model: str) -> str:
     """Extract the provider name from a model string.
 
@@ -221,6 +450,77 @@ def _extract_provider_from_model(model: str) -> str:
     return "unknown"
 
 
+# LiteLLM errors that mean the provider is unreachable or down (trip the breaker)
+_PROVIDER_OUTAGE_ERRORS: tuple[type[Exception], ...] = (
+    litellm.APIConnectionError,
+    litellm.Timeout,  # Not an APIConnectionError subclass
+    litellm.InternalServerError,
+    litellm.BadGatewayError,
+    litellm.ServiceUnavailableError,
+)
+
+# LiteLLM errors the provider answered with - it is reachable (close the breaker)
+_PROVIDER_ANSWERED_ERRORS: tuple[type[Exception], ...] = (
+    litellm.AuthenticationError,
+    litellm.PermissionDeniedError,
+    litellm.BadRequestError,  # Includes context window and content policy errors
+    litellm.NotFoundError,
+    litellm.UnprocessableEntityError,
+    litellm.RateLimitError,
+)
+
+
+def _get_provider_breaker(model: str, api_base: str | None) -> CircuitBreaker | None:
+    """Get the circuit breaker for an LLM provider endpoint.
+
+    Args:
+        model: Model identifier (provider is derived from its prefix).
+        api_base: Custom API base URL, if any (e.g. an Ollama server).
+
+    Returns:
+        The provider's breaker, or None if circuit breakers are disabled.
+    """
+    provider = _extract_provider_from_model(model)
+    name = f"llm:{provider}@{api_base}" if api_base else f"llm:{provider}"
+    return get_circuit_breaker(name)
+
+
+def _check_provider_breaker(model: str, api_base: str | None) -> CircuitBreaker | None:
+    """Get the provider's breaker, failing fast while its circuit is open.
+
+    Raises:
+        LLMCircuitOpenError: If the provider's circuit is open.
+    """
+    breaker = _get_provider_breaker(model, api_base)
+    if breaker is not None and not breaker.allow_request():
+        retry_after = breaker.retry_after()
+        raise LLMCircuitOpenError(
+            f"LLM provider circuit '{breaker.name}' is open; skipping call to {model}",
+            user_message=(
+                f"AI provider is currently unreachable. Retrying automatically in {retry_after:.0f}s."
+            ),
+            context={"circuit": breaker.name, "retry_after": round(retry_after, 1)},
+        )
+    return breaker
+
+
+async def _guarded_acompletion(breaker: CircuitBreaker | None, **kwargs: Any) -> Any:
+    """Call litellm.acompletion, reporting the outcome to the provider's breaker."""
+    if breaker is None:
+        return await litellm.acompletion(**kwargs)
+    try:
+        completion = await litellm.acompletion(**kwargs)
+    except _PROVIDER_OUTAGE_ERRORS:
+        breaker.record_failure()
+        raise
+    except _PROVIDER_ANSWERED_ERRORS:
+        breaker.record_success()
+        raise
+    # Other errors say nothing about the provider's health: leave the breaker alone
+    breaker.record_success()
+    return completion
+
+
 async def _acompletion_with_repair(
     messages: list[dict[str, Any]],
     *,
@@ -229,6 +529,53 @@ async def _acompletion_with_repair(
     api_base: str | None = None,
     response_format: dict[str, str] | None = None,
     expected_keys: list[str] | None = None,
+) -> CompletionResult:
+    """Call LiteLLM with JSON repair, coalescing concurrent identical requests.
+
+    Requests with the same model, messages, response format and endpoint that
+    overlap in time share one upstream call. Every caller receives its own
+    copy of the parsed content, but the same TokenUsage record, so usage is
+    only counted once.
+
+    Args:
+        messages: Chat messages.
+        model: Model identifier.
+        api_key: API key for the provider.
+        api_base: Optional custom API base URL.
+        response_format: Optional response format (e.g., {"type": "json_object"}).
+        expected_keys: Keys to check in JSON response (triggers repair if missing).
+
+    Returns:
+        CompletionResult containing parsed JSON response and token usage.
+
+    Raises:
+        JSONRepairError: If JSON parsing fails after repair attempt.
+        LLMServiceError: For other LLM-related errors.
+    """
+    key = make_flight_key(model, messages, response_format, expected_keys, api_base, api_key)
+    result = await _completion_flight.do(
+        key,
+        lambda: _acompletion_with_repair_uncoalesced(
+            messages,
+            model=model,
+            api_key=api_key,
+            api_base=api_base,
+            response_format=response_format,
+            expected_keys=expected_keys,
+        ),
+    )
+    # Callers may mutate the parsed content - don't let them share it
+    return CompletionResult(content=copy.deepcopy(result.content), usage=result.usage)
+
+
+async def _acompletion_with_repair_uncoalesced(
+    messages: list[dict[str, Any]],
+    *,
+    model: str,
+    api_key: str,
+    api_base: str | None = None,
+    response_format: dict[str, str] | None = None,
+    expected_keys: list[str] | None = None,
 ) -> CompletionResult:
     """Call LiteLLM with optional JSON repair on failure.
 
@@ -265,6 +612,9 @@ async def _acompletion_with_repair(
         f">>> PROMPT SENT TO LLM ({model}) >>>{_format_messages_for_logging(messages)}\n{'=' * 60}"
     )
 
+    # Fail fast (so callers can fall back) while the provider's circuit is open
+    breaker = _check_provider_breaker(model, api_base)
+
     # Acquire rate limit before making API call
     if is_rate_limiting_enabled():
         estimated_tokens = estimate_tokens(messages)
@@ -281,7 +631,7 @@ async def _acompletion_with_repair(
             ) from e
 
     try:
-        completion = await litellm.acompletion(**kwargs)
+        completion = await _guarded_acompletion(breaker, **kwargs)
     except litellm.AuthenticationError as e:
         logger.error(f"Authentication failed: {e}")
         raise LLMServiceError(f"Authentication failed. Check your API key. Error: {e}") from e
@@ -328,9 +678,17 @@ async def _acompletion_with_repair(
     # Parse and validate
     parsed, error = _parse_json_response(raw_content, expected_keys)
     if error is None:
+        _json_repair_stats["direct"] += 1
         return CompletionResult(content=parsed, usage=usage)
 
-    # Repair attempt (one retry only)
+    # Local repair attempt (no extra LLM call)
+    locally_repaired = _repair_json_locally(raw_content, expected_keys)
+    if locally_repaired is not None:
+        logger.info(f"JSON repaired locally: {error}")
+        _json_repair_stats["local"] += 1
+        return CompletionResult(content=locally_repaired, usage=usage)
+
+    # Remote repair attempt (one retry only)
     logger.warning(f"JSON validation failed, attempting repair: {error}")
 
     expected_schema = "JSON object"
@@ -338,8 +696,8 @@ async def _acompletion_with_repair(
         expected_schema = f"JSON object with keys: {expected_keys}"
 
     repair_prompt = _build_repair_prompt(raw_content, error, expected_schema)
-    # Deep copy to prevent modifications to vision messages with nested structures
-    repair_messages = copy.deepcopy(messages)
+    # Images are not needed to fix the JSON text - drop them from the resent conversation
+    repair_messages = _strip_image_parts(messages)
     repair_messages.append({"role": "assistant", "content": raw_content})
     repair_messages.append({"role": "user", "content": repair_prompt})
 
@@ -360,7 +718,8 @@ async def _acompletion_with_repair(
             ) from e
 
     try:
-        repair_completion = await litellm.acompletion(
+        repair_completion = await _guarded_acompletion(
+            breaker,
             model=model,
             messages=repair_messages,
             api_key=api_key,
@@ -370,11 +729,13 @@ async def _acompletion_with_repair(
         )
     except Exception as e:
         logger.error(f"Repair request failed: {e}")
+        _json_repair_stats["failed"] += 1
         raise JSONRepairError(
             f"Failed to repair JSON response. Original error: {error}. Repair error: {e}"
         ) from e
 
     if not repair_completion.choices:
+        _json_repair_stats["failed"] += 1
         raise JSONRepairError("LLM returned empty response during repair attempt")
 
     repaired_content = repair_completion.choices[0].message.content
@@ -395,10 +756,12 @@ async def _acompletion_with_repair(
     repaired_parsed, repaired_error = _parse_json_response(repaired_content, expected_keys)
     if repaired_error is None:
         logger.info("JSON repair successful")
+        _json_repair_stats["remote"] += 1
         return CompletionResult(content=repaired_parsed, usage=usage)
 
     # Repair failed
     logger.error(f"JSON repair failed: {repaired_error}")
+    _json_repair_stats["failed"] += 1
     raise JSONRepairError(
         f"AI returned invalid JSON that could not be repaired. "
         f"Original error: {error}. Repair error: {repaired_error}. "
@@ -7,7 +7,7 @@ Key components:
 - ChatOrchestrator: Thin facade coordinating the chat flow
 - ChatSession: Pure state management for conversations and approvals
 - ApprovalService: Approval execution lifecycle
-- SessionStoreProtocol/MemorySessionStore: Pluggable session storage
+- SessionStoreProtocol/MemorySessionStore/SQLiteSessionStore: Pluggable session storage
 - LLMClient: LiteLLM communication wrapper
 - StreamEmitter: SSE event generation
 """
@@ -16,7 +16,7 @@ from .approvals import ApprovalService
 from .llm_client import LLMClient, TokenUsage
 from .orchestrator import ChatOrchestrator
 from .session import ApprovalOutcome, ChatSession, PendingApproval
-from .store import MemorySessionStore, SessionStoreProtocol
+from .store import MemorySessionStore, SessionStoreProtocol, SQLiteSessionStore
 from .stream import ChatEvent, ChatEventType, StreamEmitter
 from .types import ChatMessage, ToolCall
 
@@ -33,6 +33,7 @@ __all__ = [
     # Storage
     "SessionStoreProtocol",
     "MemorySessionStore",
+    "SQLiteSessionStore",
     # LLM communication
     "LLMClient",
     "TokenUsage",
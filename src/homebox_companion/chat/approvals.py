@@ -3,20 +3,105 @@
 This module provides the ApprovalService which handles the approval
 lifecycle: validation, execution, and cleanup. This separates execution
 coordination from pure session state management.
+
+Approving many actions at once (execute_many) runs independent writes
+concurrently; the Homebox client's write rate limiter paces the requests.
+A bulk approval without explicit IDs only covers non-destructive actions
+(see default_batch); deletions always have to be named.
+Calls touching the same resource keep their original order, as do calls
+that reference a kind of resource (e.g. a location) after a call in the
+same batch that creates one.
 """
 
 from __future__ import annotations
 
+import asyncio
 import json
+from collections.abc import Sequence
 from typing import TYPE_CHECKING, Any
 
 from loguru import logger
 
+from ..mcp.types import ToolPermission, ToolResult
+
 if TYPE_CHECKING:
     from ..mcp.executor import ToolExecutor
-    from ..mcp.types import ToolResult
     from .session import ChatSession, PendingApproval
 
+# Max approved actions of a bulk approval executing at once
+_BULK_APPROVAL_CONCURRENCY = 4
+
+# Tools that create a new resource of a kind; later calls referencing that
+# kind may depend on it, so they wait
+_CREATES_KIND = {
+    "create_location": "location",
+    "create_label": "label",
+}
+
+# Tools that touch every item (must not overlap other item writes)
+_ALL_ITEMS_TOOLS = {"ensure_asset_ids"}
+
+
+def _resource_keys(tool_name: str, params: dict[str, Any]) -> tuple[set[str], set[str]]:
+    """Derive the resources a write tool call reads and writes.
+
+    Keys are "<kind>:<id>" for a specific resource or "<kind>:*" for the
+    kind as a whole.
+
+    Returns:
+        (reads, writes) key sets.
+    """
+    reads: set[str] = set()
+    writes: set[str] = set()
+    target_kind = tool_name.split("_", 1)[-1]  # update_location -> location
+
+    if item_id := params.get("item_id"):
+        writes.add(f"item:{item_id}")
+        reads.add("item:*")
+    if tool_name in _ALL_ITEMS_TOOLS:
+        writes.add("item:*")
+    if kind := _CREATES_KIND.get(tool_name):
+        writes.add(f"{kind}:*")
+
+    for kind in ("location", "label"):
+        if (resource_id := params.get(f"{kind}_id")) is not None:
+            if target_kind == kind:
+                writes.add(f"{kind}:{resource_id}")
+            else:
+                reads.update((f"{kind}:{resource_id}", f"{kind}:*"))
+    if (parent_id := params.get("parent_id")) is not None:
+        reads.update((f"location:{parent_id}", "location:*"))
+    for label_id in params.get("label_ids") or ():
+        reads.update((f"label:{label_id}", "label:*"))
+
+    return reads, writes
+
+
+def plan_dependencies(calls: Sequence[tuple[str, dict[str, Any]]]) -> list[set[int]]:
+    """Find which calls of a write batch must wait for earlier ones.
+
+    A call depends on an earlier call when it reads a resource the earlier
+    call writes, or both write the same resource. A call writing a whole kind
+    ("<kind>:*") also depends on every earlier write of that kind.
+
+    Args:
+        calls: (tool_name, params) pairs in approval order.
+
+    Returns:
+        For each call, the indices of the earlier calls it depends on.
+    """
+    keys = [_resource_keys(tool_name, params) for tool_name, params in calls]
+    dependencies: list[set[int]] = []
+    for index, (reads, writes) in enumerate(keys):
+        whole_kinds = {key[:-1] for key in writes if key.endswith(":*")}  # "item:*" -> "item:"
+        dependencies.append({
+            earlier
+            for earlier in range(index)
+            if keys[earlier][1] & (reads | writes)
+            or any(key.startswith(kind) for key in keys[earlier][1] for kind in whole_kinds)
+        })
+    return dependencies
+
 
 class ApprovalService:
     """Handles approval lifecycle: validation, execution, cleanup.
@@ -72,6 +157,117 @@ class ApprovalService:
         if not approval:
             raise ValueError(f"Approval not found or expired: {approval_id}")
 
+        return await self._execute_approval(approval, token, modified_params), approval
+
+    def default_batch(self) -> tuple[list[str], list[str]]:
+        """Split the pending approvals for a bulk approval without explicit IDs.
+
+        DESTRUCTIVE and unknown tools are held back, so deleting data always
+        needs its approval ID named.
+
+        Returns:
+            (approval IDs to execute, approval IDs left pending)
+        """
+        approved: list[str] = []
+        held_back: list[str] = []
+        for approval in self._session.list_pending_approvals():
+            tool = self._executor.get_tool(approval.tool_name)
+            if tool is None or tool.permission == ToolPermission.DESTRUCTIVE:
+                held_back.append(approval.id)
+            else:
+                approved.append(approval.id)
+        return approved, held_back
+
+    async def execute_many(
+        self,
+        approval_ids: Sequence[str],
+        token: str,
+        modified_params: dict[str, dict[str, Any]] | None = None,
+    ) -> list[tuple[str, ToolResult, PendingApproval | None]]:
+        """Execute several approved actions, concurrently where independent.
+
+        Each action goes through the same lifecycle as execute(). Actions
+        that depend on an earlier action in the batch (see plan_dependencies)
+        wait for it, and are skipped if it failed.
+
+        Args:
+            approval_ids: IDs of the approvals to execute, in order.
+            token: Homebox authentication token.
+            modified_params: Optional parameter overrides keyed by approval ID.
+
+        Returns:
+            (approval_id, result, approval) per requested ID, in input order.
+            The approval is None if it was not found or had expired.
+        """
+        modified_params = modified_params or {}
+        approval_ids = list(dict.fromkeys(approval_ids))
+        approvals = [self._session.get_pending_approval(aid) for aid in approval_ids]
+        found = [approval for approval in approvals if approval is not None]
+
+        dependencies = plan_dependencies([
+            (approval.tool_name, {**approval.parameters, **modified_params.get(approval.id, {})})
+            for approval in found
+        ])
+        tasks: list[asyncio.Task[ToolResult]] = []
+        slots = asyncio.Semaphore(_BULK_APPROVAL_CONCURRENCY)
+
+        async def run(index: int, approval: PendingApproval) -> ToolResult:
+            for dependency in sorted(dependencies[index]):
+                try:
+                    succeeded = (await tasks[dependency]).success
+                except Exception:
+                    succeeded = False
+                if not succeeded:
+                    blocker = found[dependency].tool_name
+                    result = ToolResult(
+                        success=False, error=f"Skipped because {blocker} failed"
+                    )
+                    self._record_result(approval, result)
+                    return result
+            async with slots:
+                return await self._execute_approval(
+                    approval, token, modified_params.get(approval.id)
+                )
+
+        for index, approval in enumerate(found):
+            tasks.append(asyncio.create_task(run(index, approval)))
+        if tasks:
+            await asyncio.wait(tasks)
+
+        results = iter(tasks)
+        outcomes: list[tuple[str, ToolResult, PendingApproval | None]] = []
+        for approval_id, approval in zip(approval_ids, approvals, strict=True):
+            if approval is None:
+                outcomes.append((
+                    approval_id,
+                    ToolResult(success=False, error=f"Approval not found or expired: {approval_id}"),
+                    None,
+                ))
+                continue
+            task = next(results)
+            exc = task.exception()
+            if exc is not None:
+                logger.opt(exception=exc).error(
+                    f"Approved action execution failed: {approval_id}"
+                )
+                self._session.remove_approval(approval_id)
+                outcomes.append((approval_id, ToolResult(success=False, error=str(exc)), approval))
+            else:
+                outcomes.append((approval_id, task.result(), approval))
+
+        logger.info(
+            f"Executed {len(found)} approved actions "
+            f"({sum(1 for deps in dependencies if deps)} with dependencies)"
+        )
+        return outcomes
+
+    async def _execute_approval(
+        self,
+        approval: PendingApproval,
+        token: str,
+        modified_params: dict[str, Any] | None,
+    ) -> ToolResult:
+        """Run a validated approval: merge params, execute, record the result."""
         # 2. Merge parameters
         final_params = {**approval.parameters}
         if modified_params:
@@ -84,7 +280,9 @@ class ApprovalService:
         logger.info(
             f"Executing approved action: {approval.tool_name} with params {final_params}"
         )
-        result = await self._executor.execute(approval.tool_name, final_params, token)
+        result = await self._executor.execute(
+            approval.tool_name, final_params, token, cache=self._session.tool_cache
+        )
 
         # Log execution result for debugging
         logger.debug(
@@ -92,6 +290,11 @@ class ApprovalService:
             f"success={result.success}, error={result.error}"
         )
 
+        self._record_result(approval, result)
+        return result
+
+    def _record_result(self, approval: PendingApproval, result: ToolResult) -> None:
+        """Write an approval's result into history and drop it from pending."""
         # 4. Update the tool message in history (use tool_call_id directly from approval)
         if approval.tool_call_id:
             result_message = {
@@ -107,9 +310,7 @@ class ApprovalService:
             self._session.update_tool_message(approval.tool_call_id, json.dumps(result_message))
 
         # 5. Remove from pending
-        self._session.remove_approval(approval_id)
-
-        return result, approval
+        self._session.remove_approval(approval.id)
 
     def reject(self, approval_id: str, reason: str) -> bool:
         """Reject an approval and update history.
@@ -19,9 +19,13 @@ from dataclasses import dataclass
 from datetime import UTC, datetime
 from typing import Any
 
-import litellm
 from loguru import logger
 
+from homebox_companion.ai.llm import (
+    _PROVIDER_OUTAGE_ERRORS,
+    _check_provider_breaker,
+    _guarded_acompletion,
+)
 from homebox_companion.core import config
 from homebox_companion.core.logging import get_log_level_value
 from homebox_companion.core.ai_config import load_ai_config, AIProvider
@@ -307,12 +311,14 @@ class LLMClient:
             LLMResponse with content, tool_calls, and usage.
 
         Raises:
+            LLMCircuitOpenError: If the provider's circuit breaker is open.
             Exception: If the LLM call fails.
         """
         kwargs = self._build_request_kwargs(messages, tools, stream=False)
+        breaker = _check_provider_breaker(kwargs["model"], kwargs.get("api_base"))
 
         start_time = time.perf_counter()
-        response = await litellm.acompletion(**kwargs)
+        response = await _guarded_acompletion(breaker, **kwargs)
         elapsed_ms = (time.perf_counter() - start_time) * 1000
 
         # Extract response data
@@ -365,18 +371,26 @@ class LLMClient:
             Raw LiteLLM stream chunks.
 
         Raises:
+            LLMCircuitOpenError: If the provider's circuit breaker is open.
             Exception: If the LLM call fails.
         """
         kwargs = self._build_request_kwargs(messages, tools, stream=True)
+        breaker = _check_provider_breaker(kwargs["model"], kwargs.get("api_base"))
 
         logger.debug(
             f"[LLM] Starting streaming completion with {len(messages)} messages, "
             f"{len(tools) if tools else 0} tools"
         )
 
-        response = await litellm.acompletion(**kwargs)
-        async for chunk in response:
-            yield chunk
+        response = await _guarded_acompletion(breaker, **kwargs)
+        try:
+            async for chunk in response:
+                yield chunk
+        except _PROVIDER_OUTAGE_ERRORS:
+            # The provider went away mid-stream
+            if breaker is not None:
+                breaker.record_failure()
+            raise
 
     def _build_request_kwargs(
         self,
@@ -748,7 +748,9 @@ class ChatOrchestrator:
             """Execute a single tool and capture result."""
             start_time = time.perf_counter()
             try:
-                result = await self._executor.execute(tc.name, tc.arguments, token)
+                result = await self._executor.execute(
+                    tc.name, tc.arguments, token, cache=self._session.tool_cache
+                )
             except Exception as e:
                 logger.exception(f"[CHAT] Tool '{tc.name}' raised unexpected exception")
                 from ..mcp.tools import ToolResult
@@ -798,11 +800,15 @@ class ChatOrchestrator:
                 f"with args: {tc.arguments}"
             )
 
-            # Add tool result to history (in order)
+            # Add tool result to history (in order). The LLM gets the dense
+            # tabular form of list results; the frontend event keeps full JSON.
+            llm_dict = (
+                result.to_llm_dict() if settings.chat_tabular_tool_results else result_dict
+            )
             self._session.add_message(
                 ChatMessage(
                     role="tool",
-                    content=json.dumps(result_dict),
+                    content=json.dumps(llm_dict),
                     tool_call_id=tc.id,
                 )
             )
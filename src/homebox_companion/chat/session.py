@@ -4,7 +4,7 @@ This module provides session state management for the conversational assistant,
 including message history and pending approval tracking.
 
 The ChatSession is the single source of truth for conversation state:
-- Message history (with structure-aware truncation)
+- Message history (with structure-aware, token-budgeted truncation)
 - Pending approval lifecycle (create, reject)
 - Tool message updates
 
@@ -17,7 +17,9 @@ Uses Pydantic models for consistency with the Pydantic-first architecture.
 from __future__ import annotations
 
 import json
+import threading
 import uuid
+from dataclasses import dataclass
 from datetime import UTC, datetime, timedelta
 from typing import Any, Literal
 
@@ -25,6 +27,7 @@ from loguru import logger
 from pydantic import BaseModel, Field, computed_field
 
 from ..core.config import settings
+from ..mcp.result_cache import ToolResultCache
 from ..mcp.types import DisplayInfo
 from .types import ChatMessage
 
@@ -99,8 +102,63 @@ class PendingApproval(BaseModel):
 
 
 # Number of messages from the end of history before tool results are compressed
+# (for the default window: counted when the window was last trimmed)
 _TOOL_COMPRESSION_THRESHOLD = 6
 
+# When the history window overflows, trim it to this fraction of the limit so the
+# following turns can append without shifting the start (keeps the prompt prefix
+# stable for provider-side prompt caching)
+_HISTORY_PRUNE_RATIO = 0.75
+
+
+def _estimate_message_tokens(formatted: dict[str, Any]) -> int:
+    """Estimate tokens for one LLM-format message (~4 chars per token).
+
+    Args:
+        formatted: Message dict as produced by ChatMessage.to_llm_format()
+
+    Returns:
+        Estimated token count, including per-message overhead
+    """
+    chars = len(formatted.get("content") or "")
+    for tool_call in formatted.get("tool_calls", ()):
+        function = tool_call["function"]
+        chars += len(function["name"]) + len(function["arguments"])
+    return chars // 4 + 4
+
+
+@dataclass(slots=True)
+class _FormattedMessage:
+    """LLM-format rendering of a message, cached at insert time.
+
+    The content reference is kept so in-place content updates
+    (see ChatSession.update_tool_message) are detected as stale.
+    """
+
+    message: ChatMessage
+    content: str
+    full: dict[str, Any]
+    full_tokens: int
+    compressed: dict[str, Any] | None = None
+    compressed_tokens: int = 0
+
+
+@dataclass(slots=True)
+class SessionChanges:
+    """Unpersisted changes of a session, taken by ChatSession.consume_changes().
+
+    Attributes:
+        cleared: The session was cleared; stored messages and approvals are dropped
+        dirty_from: Index of the first changed message, or None if no message changed
+        messages: Snapshot of the messages from dirty_from onward
+        approvals: Changed pending approvals by ID (None = removed)
+    """
+
+    cleared: bool
+    dirty_from: int | None
+    messages: list[ChatMessage]
+    approvals: dict[str, PendingApproval | None]
+
 
 class ChatSession:
     """Manages conversation state for a user session.
@@ -112,6 +170,7 @@ class ChatSession:
         session_id: Unique identifier for this session instance (for frontend sync)
         messages: List of messages in the conversation
         pending_approvals: Dict mapping approval ID to PendingApproval
+        tool_cache: Per-session cache of READ tool results
     """
 
     def __init__(self):
@@ -126,6 +185,22 @@ class ChatSession:
         self._tool_message_index: dict[str, ChatMessage] = {}
         # Track recent auto-rejections for context injection
         self._recent_auto_rejections: list[ApprovalOutcome] = []
+        # LLM-format cache keyed by id(message) (entries hold the message, so ids stay unique)
+        self._formatted_cache: dict[int, _FormattedMessage] = {}
+        # Start of the default history window, carried across turns
+        self._history_start = 0
+        # Tool results before this index are sent compressed in the default window;
+        # only moves when the window is trimmed, so message forms stay fixed between trims
+        self._compress_before = 0
+        # Changes since the last persist (see consume_changes). The lock is shared
+        # with the store's flusher thread, which takes the changes while the event
+        # loop keeps adding messages
+        self._changes_lock = threading.Lock()
+        self._dirty_from: int | None = None
+        self._changed_approvals: set[str] = set()
+        self._cleared = False
+        # Short-lived READ tool results, cleared by any write in this session
+        self.tool_cache = ToolResultCache()
 
     def add_message(self, message: ChatMessage) -> None:
         """Add a message to the conversation history.
@@ -134,11 +209,14 @@ class ChatSession:
             message: The message to add
         """
         self.messages.append(message)
+        self.mark_changed(len(self.messages) - 1)
 
         # Maintain tool message index for O(1) lookup
         if message.role == "tool" and message.tool_call_id:
             self._tool_message_index[message.tool_call_id] = message
 
+        self._get_formatted(message)
+
         logger.trace(f"Added {message.role} message, total: {len(self.messages)}")
 
         # TRACE: Log actual message content
@@ -170,67 +248,156 @@ class ChatSession:
             )
             logger.trace(f"[SESSION] {message.role} message: {content_preview}")
 
-    def get_history(self, max_messages: int | None = None) -> list[dict[str, Any]]:
+    def get_history(
+        self,
+        max_messages: int | None = None,
+        max_tokens: int | None = None,
+    ) -> list[dict[str, Any]]:
         """Get conversation history in LLM format with structure-aware truncation.
 
-        Ensures that 'tool' messages are always preceded by their 'assistant' calls,
-        preventing API errors from orphaned tool results during truncation.
+        The window is limited both by message count and by estimated tokens.
+        It always starts on a message boundary that keeps 'tool' messages
+        together with their 'assistant' calls, preventing API errors from
+        orphaned tool results, and it never drops the latest user turn.
+
+        With the default limits, the window start is carried over between
+        turns and only moves forward when a limit is exceeded, at which point
+        the window is trimmed to _HISTORY_PRUNE_RATIO of the limit. Which tool
+        results are sent compressed is also decided only at a trim, so between
+        trims every call returns the previous call's messages as an unchanged
+        prefix, which lets provider-side prompt caching hit.
 
         Args:
             max_messages: Maximum number of messages to return.
                          If None, uses settings.chat_max_history.
+            max_tokens: Token budget for the returned messages.
+                       If None, uses settings.chat_max_history_tokens (0 = no limit).
 
         Returns:
             List of message dicts in LLM API format
         """
+        use_defaults = max_messages is None and max_tokens is None
         limit = max_messages or settings.chat_max_history
-        if not limit or len(self.messages) <= limit:
-            recent_messages = self.messages
-        else:
-            # Initial slice point
-            start_idx = len(self.messages) - limit
-
-            # If we start with a 'tool' message, we MUST move back to find its
-            # parent assistant call. The parent must be an assistant message
-            # WITH tool_calls that contains this tool's tool_call_id.
-            while start_idx > 0:
-                msg = self.messages[start_idx]
-                if msg.role != "tool":
-                    # Found a non-tool message. Verify it's a valid starting point.
-                    # If it's an assistant WITH tool_calls, check if the next message
-                    # is a tool result for this call - if so, we're good.
-                    # If it's user or plain assistant, we're also good.
-                    break
-                start_idx -= 1
-
-            # Final safety: if start_idx lands on a user message but the next
-            # message is a tool result (which would be orphaned), keep moving back.
-            # This handles edge cases where tool results follow user messages due
-            # to session corruption or manual edits.
-            if start_idx < len(self.messages) - 1:
-                next_msg = self.messages[start_idx + 1]
-                if next_msg.role == "tool":
-                    # The next message is a tool result, but we're on a non-assistant
-                    # or an assistant without tool_calls. Keep going back.
-                    while start_idx > 0:
-                        candidate = self.messages[start_idx]
-                        if candidate.role == "assistant" and candidate.tool_calls:
-                            break
-                        start_idx -= 1
-
-            recent_messages = self.messages[start_idx:]
-
-        result = []
-        for i, msg in enumerate(recent_messages):
-            formatted = msg.to_llm_format()
-
-            # Compress tool results older than threshold
-            messages_from_end = len(recent_messages) - i
-            if msg.role == "tool" and messages_from_end > _TOOL_COMPRESSION_THRESHOLD:
-                formatted["content"] = self._compress_tool_result(formatted["content"])
-
-            result.append(formatted)
-        return result
+        budget = settings.chat_max_history_tokens if max_tokens is None else max_tokens
+
+        entries = [self._get_formatted(msg) for msg in self.messages]
+        total = len(entries)
+
+        start = self._history_start if use_defaults and self._history_start < total else 0
+        compress_before = self._compress_before if use_defaults else total - _TOOL_COMPRESSION_THRESHOLD
+        trimmed = False
+        if limit and total - start > limit:
+            trimmed = True
+            start = self._boundary_at_or_before(total - limit)
+            if use_defaults:
+                slack_start = self._boundary_at_or_before(
+                    total - max(1, int(limit * _HISTORY_PRUNE_RATIO))
+                )
+                start = max(start, slack_start)
+
+        if budget:
+            tokens = [self._form_tokens(entry, i < compress_before) for i, entry in enumerate(entries)]
+            used = sum(tokens[start:])
+            if used > budget and use_defaults and not trimmed:
+                # A trim re-decides compression first; it may be enough on its own
+                trimmed = True
+                compress_before = total - _TOOL_COMPRESSION_THRESHOLD
+                tokens = [self._form_tokens(entry, i < compress_before) for i, entry in enumerate(entries)]
+                used = sum(tokens[start:])
+            if used > budget:
+                target = int(budget * _HISTORY_PRUNE_RATIO) if use_defaults else budget
+                latest_turn = self._latest_turn_start()
+                while used > target and start < latest_turn:
+                    next_start = self._next_boundary(start)
+                    used -= sum(tokens[start:next_start])
+                    start = next_start
+                logger.debug(
+                    f"[SESSION] History trimmed to {total - start} messages "
+                    f"(~{used} tokens, budget {budget})"
+                )
+
+        if use_defaults:
+            if trimmed:
+                compress_before = max(compress_before, total - _TOOL_COMPRESSION_THRESHOLD)
+                self._compress_before = compress_before
+            self._history_start = start
+
+        # Shallow copies so callers can't corrupt the cache
+        return [
+            dict(self._select_form(entries[i], i < compress_before)) for i in range(start, total)
+        ]
+
+    def _get_formatted(self, message: ChatMessage) -> _FormattedMessage:
+        """Get the cached LLM-format rendering of a message, building it if stale.
+
+        Tool results also get their compressed form computed here, so the
+        JSON parse happens once per message instead of once per turn.
+        """
+        entry = self._formatted_cache.get(id(message))
+        if entry is not None and entry.message is message and entry.content is message.content:
+            return entry
+
+        full = message.to_llm_format()
+        entry = _FormattedMessage(
+            message=message,
+            content=message.content,
+            full=full,
+            full_tokens=_estimate_message_tokens(full),
+        )
+        if message.role == "tool":
+            compressed_content = self._compress_tool_result(message.content)
+            if compressed_content != message.content:
+                entry.compressed = {**full, "content": compressed_content}
+                entry.compressed_tokens = _estimate_message_tokens(entry.compressed)
+        self._formatted_cache[id(message)] = entry
+        return entry
+
+    @staticmethod
+    def _select_form(entry: _FormattedMessage, compress: bool) -> dict[str, Any]:
+        """Pick the compressed form (if the message has one) or the full form."""
+        if compress and entry.compressed is not None:
+            return entry.compressed
+        return entry.full
+
+    @staticmethod
+    def _form_tokens(entry: _FormattedMessage, compress: bool) -> int:
+        """Estimated tokens of the form chosen by _select_form."""
+        if compress and entry.compressed is not None:
+            return entry.compressed_tokens
+        return entry.full_tokens
+
+    def _is_boundary(self, index: int) -> bool:
+        """Check whether history can start at index without orphaning tool results."""
+        if index == 0:
+            return True
+        msg = self.messages[index]
+        if msg.role == "tool":
+            return False
+        if index + 1 < len(self.messages) and self.messages[index + 1].role == "tool":
+            # Only the assistant call that owns the following tool results may lead
+            return msg.role == "assistant" and bool(msg.tool_calls)
+        return True
+
+    def _boundary_at_or_before(self, index: int) -> int:
+        """Find the closest valid window start at or before index."""
+        index = max(0, min(index, len(self.messages) - 1))
+        while not self._is_boundary(index):
+            index -= 1
+        return index
+
+    def _latest_turn_start(self) -> int:
+        """Find the window start that keeps the latest user message and its replies."""
+        for index in range(len(self.messages) - 1, -1, -1):
+            if self.messages[index].role == "user":
+                return self._boundary_at_or_before(index)
+        return self._boundary_at_or_before(len(self.messages) - 1)
+
+    def _next_boundary(self, index: int) -> int:
+        """Find the next valid window start after index (or len(messages))."""
+        index += 1
+        while index < len(self.messages) and not self._is_boundary(index):
+            index += 1
+        return index
 
     def _compress_tool_result(self, content: str) -> str:
         """Compress a tool result to a summary for older messages.
@@ -249,6 +416,16 @@ class ChatSession:
                     return json.dumps(
                         {"success": True, "_summary": f"{len(result_data)} items returned"}
                     )
+                elif isinstance(result_data, dict) and isinstance(result_data.get("rows"), list):
+                    # Tabular-encoded list result
+                    return json.dumps(
+                        {"success": True, "_summary": f"{len(result_data['rows'])} items returned"}
+                    )
+                elif isinstance(result_data, dict) and "items" in result_data:
+                    # Paginated item list (plain or tabular)
+                    items = result_data["items"]
+                    count = len(items.get("rows", ())) if isinstance(items, dict) else len(items)
+                    return json.dumps({"success": True, "_summary": f"{count} items returned"})
                 elif isinstance(result_data, dict):
                     # For single items, just note it was retrieved
                     name = result_data.get("name", "item")
@@ -264,6 +441,7 @@ class ChatSession:
             approval: The approval to add
         """
         self.pending_approvals[approval.id] = approval
+        self._mark_approval_changed(approval.id)
         logger.info(f"Added pending approval {approval.id} for tool {approval.tool_name}")
 
     def get_pending_approval(self, approval_id: str) -> PendingApproval | None:
@@ -279,6 +457,7 @@ class ChatSession:
         if approval and approval.is_expired:
             logger.debug(f"Approval {approval_id} is expired, removing")
             del self.pending_approvals[approval_id]
+            self._mark_approval_changed(approval_id)
             return None
         return approval
 
@@ -293,6 +472,7 @@ class ChatSession:
         """
         if approval_id in self.pending_approvals:
             del self.pending_approvals[approval_id]
+            self._mark_approval_changed(approval_id)
             logger.debug(f"Removed approval {approval_id}")
             return True
         return False
@@ -315,6 +495,10 @@ class ChatSession:
         msg = self._tool_message_index.get(tool_call_id)
         if msg:
             msg.content = new_content
+            for index in range(len(self.messages) - 1, -1, -1):
+                if self.messages[index] is msg:
+                    self.mark_changed(index)
+                    break
             logger.debug(f"Updated tool message for tool_call_id={tool_call_id}")
             return True
         logger.debug(f"Tool message not found for tool_call_id={tool_call_id}")
@@ -431,6 +615,7 @@ class ChatSession:
             self.update_tool_message(tool_call_id, rejection_message)
 
         del self.pending_approvals[approval_id]
+        self._mark_approval_changed(approval_id)
         logger.info(f"Rejected approval {approval_id} for tool {approval.tool_name}: {reason}")
         return True
 
@@ -462,8 +647,72 @@ class ChatSession:
         self.pending_approvals.clear()
         self._tool_message_index.clear()
         self._recent_auto_rejections.clear()
+        self._formatted_cache.clear()
+        self.tool_cache.clear()
+        self._history_start = 0
+        self._compress_before = 0
+        with self._changes_lock:
+            self._cleared = True
+            self._changed_approvals.clear()
+            self._dirty_from = 0
         logger.info("Cleared chat session")
 
+    def mark_changed(self, index: int) -> None:
+        """Record that messages from index onward need persisting.
+
+        Args:
+            index: Index of the first changed message
+        """
+        with self._changes_lock:
+            if self._dirty_from is None or index < self._dirty_from:
+                self._dirty_from = index
+
+    def _mark_approval_changed(self, approval_id: str) -> None:
+        """Record that a pending approval was added or removed."""
+        with self._changes_lock:
+            self._changed_approvals.add(approval_id)
+
+    @property
+    def has_changes(self) -> bool:
+        """Whether anything changed since the last consume_changes() call."""
+        with self._changes_lock:
+            return self._dirty_from is not None or bool(self._changed_approvals) or self._cleared
+
+    def consume_changes(self) -> SessionChanges | None:
+        """Take a snapshot of the changes since the last call and reset them.
+
+        Used by persistent session stores for write-behind flushing (from
+        another thread): every message from dirty_from onward must be
+        rewritten, and the changed approvals written or removed.
+
+        Returns:
+            The changes, or None if nothing changed
+        """
+        with self._changes_lock:
+            if self._dirty_from is None and not self._changed_approvals and not self._cleared:
+                return None
+            changes = SessionChanges(
+                cleared=self._cleared,
+                dirty_from=self._dirty_from,
+                messages=[] if self._dirty_from is None else self.messages[self._dirty_from:],
+                approvals={
+                    approval_id: self.pending_approvals.get(approval_id)
+                    for approval_id in self._changed_approvals
+                },
+            )
+            self._dirty_from = None
+            self._changed_approvals = set()
+            self._cleared = False
+            return changes
+
+    def restore_changes(self, changes: SessionChanges) -> None:
+        """Mark changes taken by consume_changes() as unpersisted again (failed write)."""
+        with self._changes_lock:
+            self._cleared = self._cleared or changes.cleared
+            self._changed_approvals.update(changes.approvals)
+        if changes.dirty_from is not None:
+            self.mark_changed(changes.dirty_from)
+
 
 def create_approval_id() -> str:
     """Generate a unique approval ID."""
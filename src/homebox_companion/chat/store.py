@@ -5,23 +5,32 @@ future implementations (Redis, database, etc.) to replace the
 in-memory default.
 
 The MemorySessionStore is the default implementation suitable for
-single-worker deployments. For multi-worker production deployments,
-implement a shared backend (e.g., Redis) that satisfies the protocol.
+single-worker deployments. The SQLiteSessionStore persists sessions in a
+WAL-mode SQLite database under the data directory, so conversations survive
+restarts and can be shared between uvicorn workers
+(HBC_CHAT_SESSION_STORE=sqlite).
 """
 
 from __future__ import annotations
 
 import hashlib
+import sqlite3
 import threading
 import time
+from collections import OrderedDict
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
 from typing import TYPE_CHECKING, Protocol, runtime_checkable
 
 from loguru import logger
+from pydantic import ValidationError
 
 from ..core.config import settings
 
 if TYPE_CHECKING:
-    from .session import ChatSession
+    from .session import ChatSession, SessionChanges
 
 # Default session TTL: 24 hours (in seconds)
 _DEFAULT_SESSION_TTL = 24 * 60 * 60
@@ -225,3 +234,503 @@ class MemorySessionStore:
         with self._lock:
             return len(self._sessions)
 
+
+
+@dataclass
+class _HotSession:
+    """A session held in the SQLiteSessionStore's in-memory LRU.
+
+    Attributes:
+        session: The live session object handed out to callers
+        version: Database version this copy matches (0 = never persisted,
+            -1 = the database has writes from other workers this copy lacks)
+        seqs: Database sequence number of each persisted message, by index
+        last_access: Last get() time
+        persisted_access: Last access time written to the database
+    """
+
+    session: ChatSession
+    version: int = 0
+    seqs: list[int] = field(default_factory=list)
+    last_access: float = 0.0
+    persisted_access: float = 0.0
+
+
+class SQLiteSessionStore:
+    """SQLite-backed session store with an LRU of hot sessions.
+
+    Sessions live in a WAL-mode SQLite database (one row per session, one
+    row per message), so they survive restarts and can be shared between
+    worker processes. Recently used sessions stay in an in-memory LRU and
+    are handed out directly, so chat reads do not deserialize history.
+
+    Writes are deferred: ChatSession tracks which messages and pending
+    approvals changed, and a background thread flushes them every flush
+    interval (also on LRU eviction, TTL cleanup and close()). Flushes merge
+    rather than overwrite: changed messages are updated by their sequence
+    number, new messages are appended after the stored ones (sequence
+    numbers are never reused within a session), and approvals are written
+    by ID, so concurrent writes from several workers are all kept. Each
+    flush bumps the session's version; a hot session whose database version
+    was bumped by another worker is reloaded on its next get() once it has
+    no unflushed changes. Clearing a session drops what was stored, and a
+    session deleted by another worker stays deleted.
+
+    Thread-safety: All database and LRU access happens under a lock; the
+    SQLite connection is shared with the flusher thread. get() and delete()
+    may wait for a flush and touch the database, so async code calls them
+    from a worker thread (asyncio.to_thread); expired sessions are swept
+    by flush(), not by get().
+
+    Example:
+        >>> store = SQLiteSessionStore()
+        >>> session = store.get("user-token")
+        >>> store.close()
+    """
+
+    def __init__(
+        self,
+        path: str | Path | None = None,
+        session_ttl: int | None = None,
+        cache_size: int | None = None,
+        flush_interval: float | None = None,
+    ) -> None:
+        """Open (or create) the session database.
+
+        Args:
+            path: Database file. Defaults to chat_sessions.db in HBC_DATA_DIR.
+            session_ttl: Session TTL in seconds. Defaults to 24 hours.
+            cache_size: Max sessions kept in memory.
+                Defaults to HBC_CHAT_SESSION_CACHE_SIZE.
+            flush_interval: Seconds between write-behind flushes; 0 disables
+                the background thread (flush() must then be called explicitly).
+                Defaults to HBC_CHAT_SESSION_FLUSH_INTERVAL.
+        """
+        self._path = Path(path) if path else Path(settings.data_dir) / "chat_sessions.db"
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        self._session_ttl = session_ttl or getattr(
+            settings, "chat_session_ttl", _DEFAULT_SESSION_TTL
+        )
+        self._cache_size = cache_size or settings.chat_session_cache_size
+        self._flush_interval = (
+            settings.chat_session_flush_interval if flush_interval is None else flush_interval
+        )
+        self._hot: OrderedDict[str, _HotSession] = OrderedDict()
+        self._last_cleanup: float = time.time()
+        self._cleanup_interval = 300
+        self._lock = threading.RLock()
+        self._closed = False
+
+        # Autocommit mode; multi-statement writes use explicit transactions
+        self._conn = sqlite3.connect(
+            str(self._path), check_same_thread=False, isolation_level=None
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("PRAGMA busy_timeout=5000")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS chat_sessions (
+                key TEXT PRIMARY KEY,
+                session_id TEXT NOT NULL,
+                version INTEGER NOT NULL,
+                next_seq INTEGER NOT NULL,
+                last_access REAL NOT NULL
+            )
+            """
+        )
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS chat_messages (
+                session_key TEXT NOT NULL,
+                seq INTEGER NOT NULL,
+                data TEXT NOT NULL,
+                PRIMARY KEY (session_key, seq)
+            ) WITHOUT ROWID
+            """
+        )
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS chat_approvals (
+                session_key TEXT NOT NULL,
+                approval_id TEXT NOT NULL,
+                data TEXT NOT NULL,
+                PRIMARY KEY (session_key, approval_id)
+            ) WITHOUT ROWID
+            """
+        )
+
+        self._stop = threading.Event()
+        self._flusher: threading.Thread | None = None
+        if self._flush_interval > 0:
+            self._flusher = threading.Thread(
+                target=self._flush_loop, name="session-store-flusher", daemon=True
+            )
+            self._flusher.start()
+
+        logger.info(f"SQLite session store at {self._path}")
+
+    def _get_session_key(self, token: str) -> str:
+        """Generate a deterministic session key from a token.
+
+        Args:
+            token: The user's auth token
+
+        Returns:
+            A hashed session key (first 16 chars of SHA-256)
+        """
+        return hashlib.sha256(token.encode()).hexdigest()[:16]
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        """Run statements in a single write transaction."""
+        self._conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield self._conn
+        except BaseException:
+            self._conn.execute("ROLLBACK")
+            raise
+        self._conn.execute("COMMIT")
+
+    def _load(self, session_key: str, now: float) -> _HotSession | None:
+        """Load a session from the database.
+
+        Note: Caller must hold self._lock.
+
+        Returns:
+            The loaded session, or None if missing, expired or unreadable
+        """
+        from .session import ChatSession, PendingApproval
+        from .types import ChatMessage
+
+        row = self._conn.execute(
+            "SELECT session_id, version, last_access FROM chat_sessions WHERE key = ?",
+            (session_key,),
+        ).fetchone()
+        if row is None:
+            return None
+        session_id, version, last_access = row
+        if now - last_access > self._session_ttl:
+            self._delete_rows(session_key)
+            logger.debug(f"Session {session_key[:8]}... expired, creating new")
+            return None
+
+        session = ChatSession()
+        session.session_id = session_id
+        seqs: list[int] = []
+        try:
+            for seq, data in self._conn.execute(
+                "SELECT seq, data FROM chat_messages WHERE session_key = ? ORDER BY seq",
+                (session_key,),
+            ):
+                session.add_message(ChatMessage.model_validate_json(data))
+                seqs.append(seq)
+            for (data,) in self._conn.execute(
+                "SELECT data FROM chat_approvals WHERE session_key = ?", (session_key,)
+            ):
+                session.add_pending_approval(PendingApproval.model_validate_json(data))
+        except ValidationError as e:
+            # A partial history could orphan tool results; start over instead
+            logger.warning(f"Discarding unreadable session {session_key[:8]}...: {e}")
+            self._delete_rows(session_key)
+            return None
+        session.consume_changes()
+
+        logger.debug(
+            f"Loaded session {session_key[:8]}... ({len(session.messages)} messages) from disk"
+        )
+        return _HotSession(
+            session=session,
+            version=version,
+            seqs=seqs,
+            last_access=now,
+            persisted_access=last_access,
+        )
+
+    def _delete_rows(self, session_key: str) -> int:
+        """Delete a session's rows. Caller must hold self._lock.
+
+        Returns:
+            Number of session rows deleted (0 or 1)
+        """
+        with self._transaction() as conn:
+            conn.execute("DELETE FROM chat_messages WHERE session_key = ?", (session_key,))
+            conn.execute("DELETE FROM chat_approvals WHERE session_key = ?", (session_key,))
+            cursor = conn.execute("DELETE FROM chat_sessions WHERE key = ?", (session_key,))
+        return cursor.rowcount
+
+    def _flush_session(self, session_key: str, hot: _HotSession) -> None:
+        """Write a session's changes and access time.
+
+        Note: Caller must hold self._lock.
+        """
+        changes = hot.session.consume_changes()
+        if changes is None and hot.last_access <= hot.persisted_access:
+            return
+
+        try:
+            with self._transaction() as conn:
+                row = conn.execute(
+                    "SELECT session_id, version, next_seq FROM chat_sessions WHERE key = ?",
+                    (session_key,),
+                ).fetchone()
+                if hot.version != 0 and (row is None or row[0] != hot.session.session_id):
+                    # Deleted by another worker: it stays deleted, and the next
+                    # get() replaces this copy
+                    hot.version = -1
+                    return
+                if changes is None:
+                    conn.execute(
+                        "UPDATE chat_sessions SET last_access = ? WHERE key = ?",
+                        (hot.last_access, session_key),
+                    )
+                    seqs, version = hot.seqs, hot.version
+                else:
+                    seqs, version = self._write_changes(conn, session_key, hot, changes, row)
+        except sqlite3.Error as e:
+            logger.warning(f"Failed to persist session {session_key[:8]}...: {e}")
+            if changes is not None:
+                hot.session.restore_changes(changes)
+            return
+        hot.seqs = seqs
+        hot.version = version
+        hot.persisted_access = hot.last_access
+
+    def _write_changes(
+        self,
+        conn: sqlite3.Connection,
+        session_key: str,
+        hot: _HotSession,
+        changes: SessionChanges,
+        row: tuple[str, int, int] | None,
+    ) -> tuple[list[int], int]:
+        """Merge a session's changes into the database (inside a transaction).
+
+        Returns:
+            The sequence numbers of the session's messages and the version
+            the session copy now matches
+        """
+        stored_version, next_seq = (row[1], row[2]) if row is not None else (0, 0)
+        seqs = list(hot.seqs)
+        if changes.cleared:
+            conn.execute("DELETE FROM chat_messages WHERE session_key = ?", (session_key,))
+            conn.execute("DELETE FROM chat_approvals WHERE session_key = ?", (session_key,))
+            seqs = []
+
+        if changes.dirty_from is not None:
+            updated, appended = [], []
+            for index, message in enumerate(changes.messages, changes.dirty_from):
+                if index < len(seqs):
+                    updated.append((message.model_dump_json(), session_key, seqs[index]))
+                else:
+                    appended.append((session_key, next_seq, message.model_dump_json()))
+                    seqs.append(next_seq)
+                    next_seq += 1
+            # Messages another worker cleared meanwhile stay deleted
+            conn.executemany(
+                "UPDATE chat_messages SET data = ? WHERE session_key = ? AND seq = ?", updated
+            )
+            conn.executemany(
+                "INSERT INTO chat_messages (session_key, seq, data) VALUES (?, ?, ?)", appended
+            )
+
+        for approval_id, approval in changes.approvals.items():
+            if approval is None:
+                conn.execute(
+                    "DELETE FROM chat_approvals WHERE session_key = ? AND approval_id = ?",
+                    (session_key, approval_id),
+                )
+            else:
+                conn.execute(
+                    "INSERT OR REPLACE INTO chat_approvals (session_key, approval_id, data) "
+                    "VALUES (?, ?, ?)",
+                    (session_key, approval_id, approval.model_dump_json()),
+                )
+
+        conn.execute(
+            """
+            INSERT INTO chat_sessions (key, session_id, version, next_seq, last_access)
+            VALUES (?, ?, 1, ?, ?)
+            ON CONFLICT(key) DO UPDATE SET
+                version = chat_sessions.version + 1,
+                next_seq = excluded.next_seq,
+                last_access = excluded.last_access
+            """,
+            (session_key, hot.session.session_id, next_seq, hot.last_access),
+        )
+        if stored_version != hot.version:
+            # Another worker wrote since this copy was loaded; reload it once clean
+            return seqs, -1
+        return seqs, stored_version + 1
+
+    def _refresh_if_stale(self, session_key: str, hot: _HotSession, now: float) -> _HotSession:
+        """Reconcile a hot session with writes made by other workers.
+
+        Note: Caller must hold self._lock.
+        """
+        from .session import ChatSession
+
+        row = self._conn.execute(
+            "SELECT version FROM chat_sessions WHERE key = ?", (session_key,)
+        ).fetchone()
+        if hot.version == 0 or (row is not None and row[0] == hot.version):
+            return hot
+
+        if row is None:
+            # Deleted (or expired) by another worker
+            logger.debug(f"Session {session_key[:8]}... removed elsewhere, creating new")
+            return _HotSession(session=ChatSession(), last_access=now)
+
+        if hot.session.has_changes:
+            # Merge unflushed local changes first, then reload the merged session
+            self._flush_session(session_key, hot)
+            if hot.session.has_changes:
+                return hot
+
+        return self._load(session_key, now) or _HotSession(session=ChatSession(), last_access=now)
+
+    def _maybe_cleanup_expired(self, now: float) -> None:
+        """Periodically remove expired sessions from memory and disk.
+
+        Note: Caller must hold self._lock and have flushed access times,
+        so active sessions are not swept.
+        """
+        if now - self._last_cleanup < self._cleanup_interval:
+            return
+        self._last_cleanup = now
+
+        for key in [k for k, hot in self._hot.items() if now - hot.last_access > self._session_ttl]:
+            del self._hot[key]
+
+        cutoff = now - self._session_ttl
+        with self._transaction() as conn:
+            conn.execute(
+                "DELETE FROM chat_messages WHERE session_key IN "
+                "(SELECT key FROM chat_sessions WHERE last_access < ?)",
+                (cutoff,),
+            )
+            conn.execute(
+                "DELETE FROM chat_approvals WHERE session_key IN "
+                "(SELECT key FROM chat_sessions WHERE last_access < ?)",
+                (cutoff,),
+            )
+            cursor = conn.execute("DELETE FROM chat_sessions WHERE last_access < ?", (cutoff,))
+        if cursor.rowcount:
+            logger.info(f"Cleaned up {cursor.rowcount} expired sessions")
+
+    def get(self, token: str) -> ChatSession:
+        """Get or create a session for the given token.
+
+        Args:
+            token: The user's auth token
+
+        Returns:
+            The ChatSession for this user
+        """
+        from .session import ChatSession
+
+        session_key = self._get_session_key(token)
+        now = time.time()
+
+        with self._lock:
+            hot = self._hot.get(session_key)
+            if hot is not None and now - hot.last_access > self._session_ttl:
+                self._hot.pop(session_key)
+                self._delete_rows(session_key)
+                logger.debug(f"Session {session_key[:8]}... expired, creating new")
+                hot = None
+
+            if hot is not None:
+                hot = self._refresh_if_stale(session_key, hot, now)
+                self._hot[session_key] = hot
+                self._hot.move_to_end(session_key)
+            else:
+                hot = self._load(session_key, now)
+                if hot is None:
+                    hot = _HotSession(session=ChatSession())
+                    logger.debug(f"Created new session for key {session_key[:8]}...")
+                self._hot[session_key] = hot
+                self._evict()
+
+            hot.last_access = now
+            return hot.session
+
+    def _evict(self) -> None:
+        """Flush and drop least recently used sessions beyond the cache size.
+
+        Note: Caller must hold self._lock.
+        """
+        while len(self._hot) > self._cache_size:
+            key, hot = self._hot.popitem(last=False)
+            self._flush_session(key, hot)
+
+    def delete(self, token: str) -> bool:
+        """Delete a session.
+
+        Args:
+            token: The user's auth token
+
+        Returns:
+            True if session existed and was deleted
+        """
+        session_key = self._get_session_key(token)
+        with self._lock:
+            was_hot = self._hot.pop(session_key, None) is not None
+            deleted = self._delete_rows(session_key) > 0 or was_hot
+            if deleted:
+                logger.info(f"Deleted session for key {session_key[:8]}...")
+            return deleted
+
+    def clear_all(self) -> int:
+        """Clear all sessions.
+
+        Returns:
+            Number of sessions cleared
+        """
+        with self._lock:
+            (stored,) = self._conn.execute("SELECT COUNT(*) FROM chat_sessions").fetchone()
+            unsaved = sum(1 for hot in self._hot.values() if hot.version == 0)
+            with self._transaction() as conn:
+                conn.execute("DELETE FROM chat_messages")
+                conn.execute("DELETE FROM chat_approvals")
+                conn.execute("DELETE FROM chat_sessions")
+            self._hot.clear()
+            count = stored + unsaved
+            logger.info(f"Cleared all {count} sessions")
+            return count
+
+    def flush(self) -> None:
+        """Persist pending changes of all in-memory sessions, then sweep expired ones."""
+        with self._lock:
+            if self._closed:
+                return
+            for key, hot in list(self._hot.items()):
+                self._flush_session(key, hot)
+            self._maybe_cleanup_expired(time.time())
+
+    def _flush_loop(self) -> None:
+        """Background write-behind loop."""
+        while not self._stop.wait(self._flush_interval):
+            try:
+                self.flush()
+            except Exception:
+                logger.exception("Session store flush failed")
+
+    def close(self) -> None:
+        """Stop the flusher, persist pending changes and close the database."""
+        self._stop.set()
+        if self._flusher is not None:
+            self._flusher.join(timeout=5)
+        with self._lock:
+            if self._closed:
+                return
+            self.flush()
+            self._closed = True
+            self._conn.close()
+
+    @property
+    def session_count(self) -> int:
+        """Get the number of stored sessions (including not yet flushed ones)."""
+        with self._lock:
+            (stored,) = self._conn.execute("SELECT COUNT(*) FROM chat_sessions").fetchone()
+            return stored + sum(1 for hot in self._hot.values() if hot.version == 0)
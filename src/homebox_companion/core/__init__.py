@@ -5,10 +5,12 @@ from .exceptions import (
     CapabilityNotSupportedError,
     HomeboxAPIError,
     HomeboxAuthError,
+    HomeboxCircuitOpenError,
     HomeboxCompanionError,
     HomeboxConnectionError,
     HomeboxTimeoutError,
     JSONRepairError,
+    LLMCircuitOpenError,
     LLMServiceError,
 )
 from .field_preferences import (
@@ -32,9 +34,11 @@ __all__ = [
     "HomeboxCompanionError",
     "HomeboxAuthError",
     "HomeboxConnectionError",
+    "HomeboxCircuitOpenError",
     "HomeboxTimeoutError",
     "HomeboxAPIError",
     "LLMServiceError",
+    "LLMCircuitOpenError",
     "CapabilityNotSupportedError",
     "JSONRepairError",
     # Logging
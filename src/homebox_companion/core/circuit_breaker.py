@@ -0,0 +1,206 @@
+"""Circuit breakers for upstream dependencies (Homebox server, LLM providers).
+
+When an upstream is down, every request would otherwise wait out its full
+connect or request timeout before failing. A circuit breaker counts
+consecutive outage-type failures (connection errors, timeouts, 502/503/504)
+and, past a threshold, opens: requests fail immediately (or are routed to a
+fallback by the caller) instead of waiting.
+
+After a recovery timeout the breaker goes half-open and lets a single probe
+request through. A successful probe closes the breaker; a failed probe
+re-opens it for another recovery period.
+
+State transitions:
+    CLOSED --(threshold consecutive failures)--> OPEN
+    OPEN --(recovery timeout elapsed)--> HALF_OPEN
+    HALF_OPEN --(probe succeeds)--> CLOSED
+    HALF_OPEN --(probe fails)--> OPEN
+
+Breakers are kept in a process-wide registry keyed by name so their state
+can be shown on the debug endpoints.
+"""
+
+from __future__ import annotations
+
+import time
+from enum import Enum
+from typing import Any
+
+from loguru import logger
+
+from .config import settings
+
+
+class CircuitState(str, Enum):
+    """Circuit breaker states."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """Consecutive-failure circuit breaker with half-open probing.
+
+    Not thread-safe; intended for use from a single event loop. There are
+    no awaits inside its methods, so updates are atomic under asyncio.
+
+    Attributes:
+        name: Identifier shown in logs and debug output.
+        failure_threshold: Consecutive failures that open the circuit.
+        recovery_timeout: Seconds the circuit stays open before probing.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int | None = None,
+        recovery_timeout: float | None = None,
+    ) -> None:
+        """Initialize a closed breaker.
+
+        Args:
+            name: Identifier shown in logs and debug output.
+            failure_threshold: Consecutive failures that open the circuit.
+                Defaults to HBC_CIRCUIT_BREAKER_FAILURE_THRESHOLD.
+            recovery_timeout: Seconds to stay open before allowing a probe.
+                Defaults to HBC_CIRCUIT_BREAKER_RECOVERY_TIMEOUT.
+        """
+        self.name = name
+        self.failure_threshold = failure_threshold or settings.circuit_breaker_failure_threshold
+        self.recovery_timeout = recovery_timeout or settings.circuit_breaker_recovery_timeout
+        self._state = CircuitState.CLOSED
+        self._consecutive_failures = 0
+        self._opened_at = 0.0
+        self._probe_started_at: float | None = None
+        self._rejected = 0
+        self._times_opened = 0
+
+    @property
+    def state(self) -> CircuitState:
+        """Current state (an expired OPEN circuit reports HALF_OPEN)."""
+        if (
+            self._state == CircuitState.OPEN
+            and time.monotonic() - self._opened_at >= self.recovery_timeout
+        ):
+            return CircuitState.HALF_OPEN
+        return self._state
+
+    def allow_request(self) -> bool:
+        """Check whether a request may proceed.
+
+        In HALF_OPEN only one probe is allowed at a time. A probe that never
+        reports back (e.g. cancelled) is replaced after a recovery timeout.
+
+        Returns:
+            True if the request may be sent, False if it should fail fast.
+        """
+        state = self.state
+        if state == CircuitState.CLOSED:
+            return True
+
+        now = time.monotonic()
+        if state == CircuitState.HALF_OPEN:
+            probe_stale = (
+                self._probe_started_at is not None
+                and now - self._probe_started_at >= self.recovery_timeout
+            )
+            if self._probe_started_at is None or probe_stale:
+                self._state = CircuitState.HALF_OPEN
+                self._probe_started_at = now
+                logger.info(f"[CIRCUIT] {self.name}: half-open, sending probe request")
+                return True
+
+        self._rejected += 1
+        return False
+
+    def record_success(self) -> None:
+        """Record a request that reached a healthy upstream."""
+        if self._state != CircuitState.CLOSED:
+            logger.info(f"[CIRCUIT] {self.name}: probe succeeded, closing circuit")
+        self._state = CircuitState.CLOSED
+        self._consecutive_failures = 0
+        self._probe_started_at = None
+
+    def record_failure(self) -> None:
+        """Record an outage-type failure (connection error, timeout, 5xx gateway)."""
+        self._consecutive_failures += 1
+        if self._state == CircuitState.HALF_OPEN:
+            logger.warning(f"[CIRCUIT] {self.name}: probe failed, re-opening circuit")
+            self._open()
+        elif (
+            self._state == CircuitState.CLOSED
+            and self._consecutive_failures >= self.failure_threshold
+        ):
+            logger.warning(
+                f"[CIRCUIT] {self.name}: {self._consecutive_failures} consecutive failures, "
+                f"opening circuit for {self.recovery_timeout:.0f}s"
+            )
+            self._open()
+
+    def retry_after(self) -> float:
+        """Seconds until the next probe is allowed (0 if not open)."""
+        if self._state != CircuitState.OPEN:
+            return 0.0
+        return max(0.0, self.recovery_timeout - (time.monotonic() - self._opened_at))
+
+    def reset(self) -> None:
+        """Force the breaker closed and clear its counters."""
+        self._state = CircuitState.CLOSED
+        self._consecutive_failures = 0
+        self._probe_started_at = None
+
+    def _open(self) -> None:
+        self._state = CircuitState.OPEN
+        self._opened_at = time.monotonic()
+        self._probe_started_at = None
+        self._times_opened += 1
+
+    def stats(self) -> dict[str, Any]:
+        """Get breaker state for debug output."""
+        return {
+            "state": self.state.value,
+            "consecutive_failures": self._consecutive_failures,
+            "failure_threshold": self.failure_threshold,
+            "retry_after_seconds": round(self.retry_after(), 1),
+            "times_opened": self._times_opened,
+            "rejected_requests": self._rejected,
+        }
+
+
+_breakers: dict[str, CircuitBreaker] = {}
+
+
+def get_circuit_breaker(name: str) -> CircuitBreaker | None:
+    """Get or create the named circuit breaker.
+
+    Args:
+        name: Breaker identity (e.g. "homebox", "llm:openai").
+
+    Returns:
+        The breaker, or None if circuit breakers are disabled
+        (HBC_CIRCUIT_BREAKER_ENABLED=false).
+    """
+    if not settings.circuit_breaker_enabled:
+        return None
+    breaker = _breakers.get(name)
+    if breaker is None:
+        breaker = CircuitBreaker(name)
+        _breakers[name] = breaker
+    return breaker
+
+
+def get_circuit_breaker_stats() -> dict[str, dict[str, Any]]:
+    """Get the state of every registered circuit breaker."""
+    return {name: breaker.stats() for name, breaker in _breakers.items()}
+
+
+def reset_circuit_breakers() -> int:
+    """Force all circuit breakers closed.
+
+    Returns:
+        Number of breakers reset.
+    """
+    for breaker in _breakers.values():
+        breaker.reset()
+    return len(_breakers)
@@ -17,6 +17,11 @@ Environment Variables:
     HBC_LLM_ALLOW_UNSAFE_MODELS: If true, allow models not in the curated allowlist (best-effort)
     HBC_LLM_TIMEOUT: LLM request timeout in seconds (default: 120)
     HBC_LLM_STREAM_TIMEOUT: LLM streaming timeout in seconds (default: 300)
+    HBC_LLM_HEDGING_ENABLED: Start the fallback provider when the primary is slower than
+        its rolling p90 latency, and use whichever answers first (default: false)
+    HBC_LLM_HEDGE_MIN_SAMPLES: Primary latency samples required before hedging (default: 10)
+    HBC_LLM_HEDGE_MAX_PER_MINUTE: Hedge requests allowed per minute; past it, calls wait
+        for the primary (default: 20)
     HBC_SERVER_HOST: Host to bind the web server to (default: 0.0.0.0)
     HBC_SERVER_PORT: Port for the web server (default: 8000). In production,
         this single port serves both the API and the static frontend.
@@ -28,7 +33,49 @@ Environment Variables:
         Options: raw (original), high (2560px, 85%), medium (1920px, 75%), low (1280px, 60%)
     HBC_CHAT_ENABLED: Enable the conversational assistant (default: true)
     HBC_CHAT_MAX_HISTORY: Max messages in conversation context (default: 20)
+    HBC_CHAT_MAX_HISTORY_TOKENS: Estimated token budget for conversation context
+        (default: 16000, 0 = no limit)
+    HBC_CHAT_TABULAR_TOOL_RESULTS: Send list tool results to the LLM as dense tables
+        (default: true)
     HBC_CHAT_APPROVAL_TIMEOUT: Seconds before pending approvals expire (default: 300)
+    HBC_CHAT_TOOL_CACHE_TTL: Seconds READ tool results are reused within a chat session;
+        writes clear the cache (default: 30, 0 = disabled)
+    HBC_CHAT_SESSION_STORE: Chat session backend, "memory" or "sqlite" (persistent, shared
+        between workers; stored in HBC_DATA_DIR) (default: memory)
+    HBC_CHAT_SESSION_CACHE_SIZE: Sessions kept in memory by the sqlite store (default: 256)
+    HBC_CHAT_SESSION_FLUSH_INTERVAL: Seconds between sqlite session write-behind flushes
+        (default: 1.0)
+    HBC_MCP_BATCH_ALLOW_WRITES: Allow WRITE tools (never destructive ones) in the MCP batch
+        endpoint without chat approval (default: false)
+    HBC_INVENTORY_SYNC_INTERVAL: Seconds between differential syncs of the local inventory
+        mirror used by search, chat tools and duplicate detection (default: 60, 0 = disabled)
+    HBC_INVENTORY_SYNC_IDLE_TIMEOUT: Seconds without requests before the inventory mirror
+        stops syncing (default: 900)
+    HBC_SEARCH_INDEX_ENABLED: Answer item searches from a local full-text index over the
+        inventory mirror instead of Homebox's query parameter (default: true)
+    HBC_SEARCH_CACHE_TTL: Seconds web search responses used for enrichment are cached
+        (default: 604800 = 7 days, 0 = disabled)
+    HBC_SEARCH_CACHE_MAX_ENTRIES: Max cached web search responses (default: 5000)
+    HBC_ENRICHMENT_CACHE_MAX_ENTRIES: Max products in the enrichment cache (default: 20000)
+    HBC_ENRICHMENT_CACHE_MAX_MB: Max total size of cached enrichment results in MB
+        (default: 64)
+    HBC_ENRICHMENT_SEARCH_CONCURRENCY: Max product web searches in flight (default: 4)
+    HBC_ENRICHMENT_FETCH_CONCURRENCY: Max retailer page fetches in flight (default: 6)
+    HBC_ENRICHMENT_PARSE_CONCURRENCY: Max enrichment LLM calls in flight (default: 3)
+    HBC_ENRICHMENT_PACK_TOKEN_BUDGET: Estimated prompt tokens per LLM call that enriches several
+        products of a batch at once, capped at half the model's context window; 0 uses one
+        call per product, as do models whose context window is unknown (default: 12000)
+    HBC_ENRICHMENT_PREFETCH_ENABLED: Enrich products found by vision detection in the
+        background, so a later lookup is a cache hit (default: false)
+    HBC_ENRICHMENT_PREFETCH_QUEUE_SIZE: Max detected products waiting for background
+        enrichment; more are dropped (default: 100)
+    HBC_ENRICHMENT_WARMUP_ENABLED: Enrich products already in Homebox (from the duplicate
+        detection index) in the background, resuming from a checkpoint (default: false)
+    HBC_ENRICHMENT_WARMUP_DAILY_QUERIES: Web search queries the warm-up may send per day
+        (default: 100)
+    HBC_ENRICHMENT_WARMUP_DAILY_TOKENS: Estimated LLM tokens the warm-up may use per day
+        (default: 200000)
+    HBC_ENRICHMENT_WARMUP_INTERVAL: Seconds between warm-up runs (default: 3600)
     HBC_DATA_DIR: Directory for persistent data storage (default: /data in Docker, ./data locally)
     HBC_STATE_MAX_RETRIES: Maximum retry attempts for failed image processing (default: 3)
     HBC_STATE_LOCK_TIMEOUT: Timeout in seconds for state file locking (default: 10)
@@ -36,7 +83,20 @@ Environment Variables:
     HBC_OLLAMA_INTERNAL: Use embedded/internal Ollama in Docker (default: false)
     HBC_OLLAMA_URL: External Ollama URL (default: http://localhost:11434)
     HBC_OLLAMA_MODEL: Ollama model to use (default: minicpm-v)
+    HBC_OLLAMA_NUM_CTX: Context window in tokens requested for Ollama text completions
+        (default: 8192)
     HBC_FALLBACK_TO_CLOUD: Fall back to cloud AI if Ollama fails (default: true)
+    HBC_CIRCUIT_BREAKER_ENABLED: Fail fast when Homebox or an LLM provider is down (default: true)
+    HBC_CIRCUIT_BREAKER_FAILURE_THRESHOLD: Consecutive upstream failures that open a
+        circuit (default: 5)
+    HBC_CIRCUIT_BREAKER_RECOVERY_TIMEOUT: Seconds an open circuit waits before sending a
+        probe request (default: 30)
+    HBC_HTTP_MAX_CONNECTIONS: Max pooled connections per upstream host (default: 20)
+    HBC_HTTP_MAX_KEEPALIVE_CONNECTIONS: Max idle keep-alive connections per host (default: 10)
+    HBC_HTTP_KEEPALIVE_EXPIRY: Seconds to keep idle upstream connections open (default: 30)
+    HBC_HTTP2_ENABLED: Use HTTP/2 for upstream calls, requires the h2 package (default: false)
+    HBC_HTTP_MAX_POOLS: Max upstream hosts with an open connection pool; the least
+        recently used idle pools are closed (default: 64)
 
 AI Output Customization env vars (HBC_AI_*) are handled separately in
 field_preferences.py via FieldPreferencesDefaults.
@@ -121,6 +181,10 @@ class Settings(BaseSettings):
     llm_timeout: int = 120
     # LLM streaming timeout (in seconds) - longer for large responses
     llm_stream_timeout: int = 300
+    # Hedged requests: race the fallback provider once the primary exceeds its p90
+    llm_hedging_enabled: bool = False
+    llm_hedge_min_samples: int = 10  # Samples needed before p90 is trusted
+    llm_hedge_max_per_minute: int = 20  # Bounds duplicate upstream calls from hedging
 
     # Demo mode - enables pre-filled credentials for demo deployments
     demo_mode: bool = False
@@ -139,8 +203,38 @@ class Settings(BaseSettings):
     # Chat/MCP configuration
     chat_enabled: bool = True  # Enable the conversational assistant
     chat_max_history: int = 20  # Max messages in conversation context
+    chat_max_history_tokens: int = 16_000  # Estimated token budget for context (0 = no limit)
+    chat_tabular_tool_results: bool = True  # Encode list tool results as tables for the LLM
     chat_approval_timeout: int = 300  # Seconds before pending approvals expire
+    chat_tool_cache_ttl: float = 30.0  # Seconds to reuse READ tool results (0 = disabled)
+    chat_session_store: str = "memory"  # Session backend: "memory" or "sqlite"
+    chat_session_cache_size: int = 256  # Hot sessions kept in memory (sqlite store)
+    chat_session_flush_interval: float = 1.0  # Write-behind flush interval (sqlite store)
     chat_max_response_tokens: int = 0  # 0 = no limit (LLM decides naturally)
+    mcp_batch_allow_writes: bool = False  # Allow WRITE tools in the MCP batch endpoint
+
+    # Local inventory mirror and item search index (fall back to Homebox until synced)
+    inventory_sync_interval: float = 60.0  # Seconds between differential syncs (0 = disabled)
+    inventory_sync_idle_timeout: float = 900.0  # Stop syncing after this long without requests
+    search_index_enabled: bool = True
+
+    # Web search response cache for enrichment (paid providers bill per query)
+    search_cache_ttl: float = 604_800.0  # Seconds to keep search responses (0 = disabled)
+    search_cache_max_entries: int = 5000  # Least recently used responses are evicted
+
+    # Enrichment result cache (single SQLite file; TTL comes from app preferences)
+    enrichment_cache_max_entries: int = 20_000  # Least recently used products are evicted
+    enrichment_cache_max_mb: int = 64  # Cap on total cached payload size
+    enrichment_search_concurrency: int = 4  # Product web searches in flight
+    enrichment_fetch_concurrency: int = 6  # Retailer page fetch rounds in flight
+    enrichment_parse_concurrency: int = 3  # Enrichment LLM calls in flight
+    enrichment_pack_token_budget: int = 12_000  # Prompt tokens per multi-product LLM call (0 = off)
+    enrichment_prefetch_enabled: bool = False  # Enrich detected products in the background
+    enrichment_prefetch_queue_size: int = 100  # Detected products waiting for prefetch
+    enrichment_warmup_enabled: bool = False  # Enrich existing inventory in the background
+    enrichment_warmup_daily_queries: int = 100  # Search queries per day for the warm-up
+    enrichment_warmup_daily_tokens: int = 200_000  # Estimated LLM tokens per day for the warm-up
+    enrichment_warmup_interval: float = 3600.0  # Seconds between warm-up runs
 
     # State management configuration (crash recovery)
     data_dir: str = "./data"  # Directory for persistent data storage
@@ -152,8 +246,21 @@ class Settings(BaseSettings):
     ollama_internal: bool = False  # Use embedded Ollama (Docker)
     ollama_url: str = "http://localhost:11434"  # External Ollama URL
     ollama_model: str = "minicpm-v"  # Model to use
+    ollama_num_ctx: int = 8192  # Context window (tokens) requested for text completions
     fallback_to_cloud: bool = True  # Fall back to cloud if Ollama fails
 
+    # Circuit breakers for Homebox and LLM providers
+    circuit_breaker_enabled: bool = True
+    circuit_breaker_failure_threshold: int = 5  # Consecutive failures before opening
+    circuit_breaker_recovery_timeout: float = 30.0  # Seconds open before a probe
+
+    # Outbound HTTP connection pooling (Ollama, search providers, retailer pages)
+    http_max_connections: int = 20  # Max connections per upstream host
+    http_max_keepalive_connections: int = 10  # Max idle keep-alive connections per host
+    http_keepalive_expiry: float = 30.0  # Seconds to keep idle connections open
+    http2_enabled: bool = False  # Requires the optional h2 package
+    http_max_pools: int = 64  # Origin pools kept open (LRU, idle pools only)
+
     @computed_field
     @property
     def api_url(self) -> str:
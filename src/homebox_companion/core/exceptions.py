@@ -84,6 +84,12 @@ class HomeboxConnectionError(HomeboxCompanionError):
     log_level: LogLevel = "warning"
 
 
+class HomeboxCircuitOpenError(HomeboxConnectionError):
+    """Homebox circuit breaker is open - failing fast without contacting the server."""
+
+    error_code = "HOMEBOX_CIRCUIT_OPEN"
+
+
 class HomeboxTimeoutError(HomeboxCompanionError):
     """Request timeout - server reachable but slow/unresponsive."""
 
@@ -118,6 +124,14 @@ class LLMServiceError(HomeboxCompanionError):
     log_level: LogLevel = "error"
 
 
+class LLMCircuitOpenError(LLMServiceError):
+    """LLM provider circuit breaker is open - failing fast so callers can fall back."""
+
+    status_code = 503
+    error_code = "LLM_CIRCUIT_OPEN"
+    log_level: LogLevel = "warning"
+
+
 class CapabilityNotSupportedError(HomeboxCompanionError):
     """Model doesn't support required capability (e.g., vision)."""
 
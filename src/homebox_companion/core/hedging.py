@@ -0,0 +1,252 @@
+"""Latency tracking and hedged requests for LLM provider calls.
+
+Sequential fallback only switches to the fallback provider after the
+primary raises, which can mean waiting out the full LLM timeout. Hedging
+instead launches the fallback once the primary has been slower than its
+usual p90 latency, and takes whichever valid result arrives first.
+
+Because the hedge only fires past the primary's rolling p90, roughly one
+request in ten pays for a second call, while the slow tail gets cut short.
+A primary that loses the race is recorded as a censored sample (its
+elapsed time, at least the hedge delay), so the p90 does not drift down to
+only the calls that won. Cancelling the loser may not stop the upstream
+request, so hedges are also capped per minute by HBC_LLM_HEDGE_MAX_PER_MINUTE;
+past the cap, calls simply wait for the primary.
+
+Example:
+    >>> tracker = get_latency_tracker()
+    >>> delay = tracker.hedge_delay("openai:gpt-5-mini")
+    >>> result = await hedged_call(call_primary, call_fallback, delay, primary_key=key)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import math
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from loguru import logger
+
+from .config import settings
+
+# Number of recent successful call durations kept per provider
+LATENCY_WINDOW_SIZE = 200
+
+# Percentile of the primary's latency at which the hedge request fires
+HEDGE_PERCENTILE = 0.9
+
+
+class LatencyTracker:
+    """Rolling latency histogram per provider.
+
+    Only successful calls (and primaries cut short by a hedge, as lower
+    bounds) are recorded, so a provider that fails fast does not drag its
+    percentiles down.
+    """
+
+    def __init__(self, window_size: int = LATENCY_WINDOW_SIZE) -> None:
+        """Initialize an empty tracker.
+
+        Args:
+            window_size: Number of recent samples kept per provider.
+        """
+        self._window_size = window_size
+        self._samples: dict[str, deque[float]] = {}
+
+    def record(self, key: str, seconds: float) -> None:
+        """Record a successful call duration.
+
+        Args:
+            key: Provider identity (e.g. "openai:gpt-5-mini").
+            seconds: Call duration in seconds.
+        """
+        samples = self._samples.get(key)
+        if samples is None:
+            samples = deque(maxlen=self._window_size)
+            self._samples[key] = samples
+        samples.append(seconds)
+
+    def sample_count(self, key: str) -> int:
+        """Get the number of samples recorded for a provider."""
+        return len(self._samples.get(key, ()))
+
+    def percentile(self, key: str, q: float) -> float | None:
+        """Get a latency percentile for a provider (nearest-rank).
+
+        Args:
+            key: Provider identity.
+            q: Percentile as a fraction (0.0-1.0).
+
+        Returns:
+            Latency in seconds, or None if there are no samples.
+        """
+        samples = self._samples.get(key)
+        if not samples:
+            return None
+        ordered = sorted(samples)
+        rank = max(1, math.ceil(q * len(ordered)))
+        return ordered[rank - 1]
+
+    def hedge_delay(self, key: str) -> float | None:
+        """Get how long to wait on a provider before hedging.
+
+        Args:
+            key: Provider identity.
+
+        Returns:
+            The provider's rolling p90 in seconds, or None if there are too
+            few samples to make a reliable decision.
+        """
+        if self.sample_count(key) < settings.llm_hedge_min_samples:
+            return None
+        return self.percentile(key, HEDGE_PERCENTILE)
+
+    def stats(self) -> dict[str, dict[str, Any]]:
+        """Get per-provider latency statistics.
+
+        Returns:
+            Dict mapping provider key to sample count and p50/p90/p99 seconds.
+        """
+        return {
+            key: {
+                "samples": len(samples),
+                "p50": self.percentile(key, 0.5),
+                "p90": self.percentile(key, 0.9),
+                "p99": self.percentile(key, 0.99),
+            }
+            for key, samples in self._samples.items()
+        }
+
+
+class HedgeBudget:
+    """Rolling one-minute cap on the number of hedge requests."""
+
+    def __init__(self, max_per_minute: int | None = None) -> None:
+        """Initialize an unused budget.
+
+        Args:
+            max_per_minute: Hedges allowed per minute.
+                Defaults to HBC_LLM_HEDGE_MAX_PER_MINUTE.
+        """
+        self._max_per_minute = (
+            settings.llm_hedge_max_per_minute if max_per_minute is None else max_per_minute
+        )
+        self._fired: deque[float] = deque()
+        self.skipped = 0
+
+    def try_acquire(self) -> bool:
+        """Spend one hedge if the last minute has room for it."""
+        now = time.monotonic()
+        while self._fired and now - self._fired[0] >= 60.0:
+            self._fired.popleft()
+        if len(self._fired) >= self._max_per_minute:
+            self.skipped += 1
+            return False
+        self._fired.append(now)
+        return True
+
+
+_latency_tracker = LatencyTracker()
+_hedge_budget = HedgeBudget()
+
+
+def get_latency_tracker() -> LatencyTracker:
+    """Get the process-wide LLM provider latency tracker."""
+    return _latency_tracker
+
+
+def get_hedge_budget() -> HedgeBudget:
+    """Get the process-wide hedge budget."""
+    return _hedge_budget
+
+
+async def hedged_call[T](
+    primary: Callable[[], Awaitable[T]],
+    fallback: Callable[[], Awaitable[T]],
+    delay: float,
+    *,
+    primary_key: str | None = None,
+    budget: HedgeBudget | None = None,
+) -> tuple[T, bool]:
+    """Run primary, launching fallback if primary has not finished after delay.
+
+    The first call to succeed wins and the other is cancelled. If the primary
+    fails before the hedge fires, the fallback starts immediately (plain
+    sequential fallback). If the hedge budget is spent, the primary is
+    awaited without hedging.
+
+    Args:
+        primary: Zero-argument callable for the primary provider call.
+        fallback: Zero-argument callable for the fallback provider call.
+        delay: Seconds to wait on the primary before hedging.
+        primary_key: Provider identity of the primary; if given, a primary
+            that loses the race is recorded as a censored latency sample.
+        budget: Hedge budget to spend from. Defaults to the process-wide one.
+
+    Returns:
+        Tuple of (result, won_by_fallback).
+
+    Raises:
+        The primary's exception (chained from the fallback's) if both fail.
+    """
+    budget = budget or _hedge_budget
+    start = time.monotonic()
+    primary_task = asyncio.ensure_future(primary())
+    fallback_task: asyncio.Future[T] | None = None
+    primary_error: BaseException | None = None
+
+    try:
+        done, _ = await asyncio.wait({primary_task}, timeout=delay)
+        if primary_task in done:
+            if primary_task.exception() is None:
+                return primary_task.result(), False
+            primary_error = primary_task.exception()
+        elif not budget.try_acquire():
+            logger.debug(f"[HEDGE] Budget spent, waiting for primary past {delay:.2f}s")
+            return await primary_task, False
+        else:
+            logger.info(f"[HEDGE] Primary still running after {delay:.2f}s, launching fallback")
+
+        fallback_task = asyncio.ensure_future(fallback())
+        pending: set[asyncio.Future[T]] = {fallback_task}
+        if primary_error is None:
+            pending.add(primary_task)
+
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if task.exception() is None:
+                    if task is fallback_task and primary_key and not primary_task.done():
+                        # Censored sample: the primary would have taken at least this long
+                        _latency_tracker.record(primary_key, max(time.monotonic() - start, delay))
+                    return task.result(), task is fallback_task
+                if task is primary_task:
+                    primary_error = task.exception()
+
+        # Both failed - the primary failure is the more relevant one
+        fallback_error = fallback_task.exception()
+        assert primary_error is not None
+        raise primary_error from fallback_error
+    finally:
+        for task in (primary_task, fallback_task):
+            if task is not None and not task.done():
+                task.cancel()
+
+
+async def timed[T](key: str, fn: Callable[[], Awaitable[T]]) -> T:
+    """Await fn and record its duration in the latency tracker on success.
+
+    Args:
+        key: Provider identity.
+        fn: Zero-argument callable for the provider call.
+
+    Returns:
+        The call's result.
+    """
+    start = time.monotonic()
+    result = await fn()
+    _latency_tracker.record(key, time.monotonic() - start)
+    return result
@@ -0,0 +1,127 @@
+"""Single-flight coalescing for concurrent identical async calls.
+
+When several callers request the same expensive operation at the same time
+(frontend retries, two tabs submitting the same photo, duplicate enrichment
+lookups), only the first caller performs the work. Later callers with the
+same key await the in-flight result instead of starting their own call.
+
+Coalescing only covers calls that overlap in time: once the in-flight call
+finishes, the key is released and the next call starts fresh. Results are
+not cached.
+
+Example:
+    >>> flight = SingleFlight("llm")
+    >>> result = await flight.do(key, lambda: expensive_call(...))
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+from collections.abc import Awaitable, Callable
+from typing import Any, TypeVar
+
+from loguru import logger
+
+T = TypeVar("T")
+
+
+def make_flight_key(*parts: Any) -> str:
+    """Build a stable hash key from JSON-serializable parts.
+
+    Args:
+        *parts: Values identifying the call (model, messages, options...).
+
+    Returns:
+        Hex SHA-256 digest of the canonical JSON encoding of the parts.
+    """
+    payload = json.dumps(parts, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+class SingleFlight:
+    """Coalesces concurrent calls that share the same key into one call.
+
+    The shared call runs as its own task and is shielded from waiter
+    cancellation, so one client disconnecting does not abort the call for
+    the others. Waiters are counted, and the call is cancelled once the last
+    one has gone. Exceptions propagate to every waiter.
+
+    Attributes:
+        name: Label used in log messages and stats.
+        calls: Number of calls that actually executed.
+        coalesced: Number of calls that joined an in-flight call.
+    """
+
+    def __init__(self, name: str) -> None:
+        """Initialize an empty single-flight group.
+
+        Args:
+            name: Label used in log messages and stats.
+        """
+        self.name = name
+        self.calls = 0
+        self.coalesced = 0
+        self._in_flight: dict[str, asyncio.Task[Any]] = {}
+        self._waiters: dict[asyncio.Task[Any], int] = {}
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[T]]) -> T:
+        """Run fn once for all concurrent callers with the same key.
+
+        Args:
+            key: Identity of the call (see make_flight_key).
+            fn: Zero-argument callable returning the awaitable to run.
+
+        Returns:
+            The result of the shared call.
+        """
+        task = self._in_flight.get(key)
+        if task is None or task.get_loop() is not asyncio.get_running_loop():
+            task = asyncio.ensure_future(fn())
+            self._in_flight[key] = task
+            task.add_done_callback(lambda t: self._release(key, t))
+            self.calls += 1
+        else:
+            self.coalesced += 1
+            logger.debug(f"[{self.name}] Joined in-flight call {key[:12]}...")
+
+        self._waiters[task] = self._waiters.get(task, 0) + 1
+        try:
+            return await asyncio.shield(task)
+        finally:
+            remaining = self._waiters.pop(task, 1) - 1
+            if remaining > 0:
+                self._waiters[task] = remaining
+            elif not task.done():
+                # Nobody is left to use the result; new callers start a fresh call
+                logger.debug(f"[{self.name}] Last waiter left, cancelling call {key[:12]}...")
+                if self._in_flight.get(key) is task:
+                    del self._in_flight[key]
+                task.cancel()
+
+    def is_in_flight(self, key: str) -> bool:
+        """Check whether a call with this key is running (a do() would join it)."""
+        task = self._in_flight.get(key)
+        return task is not None and task.get_loop() is asyncio.get_running_loop()
+
+    def _release(self, key: str, task: asyncio.Task[Any]) -> None:
+        """Remove a finished call from the in-flight table."""
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+        self._waiters.pop(task, None)
+        # Mark exceptions as retrieved even if every waiter was cancelled
+        if not task.cancelled():
+            task.exception()
+
+    def stats(self) -> dict[str, Any]:
+        """Get coalescing statistics.
+
+        Returns:
+            Dict with executed calls, coalesced calls and current in-flight count.
+        """
+        return {
+            "calls": self.calls,
+            "coalesced": self.coalesced,
+            "in_flight": len(self._in_flight),
+        }
@@ -0,0 +1,320 @@
+"""Shared pooled HTTP transports for outbound upstream calls.
+
+Without a shared registry every component builds its own httpx.AsyncClient:
+the Ollama provider, each search provider and, worst of all, the retailer
+page fetcher, which created a new client (and a new TLS handshake) per URL.
+
+The TransportRegistry owns one tuned connection pool per upstream origin
+(scheme://host:port) with keep-alive limits and optional HTTP/2. Components
+borrow lightweight AsyncClient wrappers via client_for(); closing a borrowed
+client does not close the shared pool. The registry itself is created in the
+app lifespan and closed on shutdown.
+
+The retailer fetcher talks to many origins, so at most HBC_HTTP_MAX_POOLS
+pools are kept: past that, the least recently used pools without requests
+in flight are closed. Borrowed clients look their pool up per request, so a
+client whose pool was evicted simply gets a fresh one.
+
+When no registry is active (CLI usage, tests), get_transport_registry()
+returns None and callers fall back to their own short-lived clients.
+
+Example:
+    >>> registry = get_transport_registry()
+    >>> client = registry.client_for("https://api.tavily.com", timeout=30.0)
+    >>> response = await client.post("https://api.tavily.com/search", json=payload)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import importlib.util
+from collections import OrderedDict
+from collections.abc import AsyncIterator
+from dataclasses import dataclass
+from typing import Any
+from urllib.parse import urlsplit
+
+import httpx
+from loguru import logger
+
+from .config import settings
+
+
+@dataclass
+class _PoolStats:
+    """Request counters for a single origin pool."""
+
+    requests: int = 0
+    errors: int = 0
+    active: int = 0  # Requests in flight; pools with any are never evicted
+
+
+class _CountedStream(httpx.AsyncByteStream):
+    """Response body that keeps its request counted as in flight until closed.
+
+    A streamed response (``client.stream()``) is still reading from the
+    pool's connection after the headers arrive, so the pool must not be
+    evicted before the body is closed.
+    """
+
+    def __init__(self, stream: httpx.AsyncByteStream, stats: _PoolStats) -> None:
+        self._stream = stream
+        self._stats = stats
+        self._open = True
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        async for chunk in self._stream:
+            yield chunk
+
+    async def aclose(self) -> None:
+        try:
+            await self._stream.aclose()
+        finally:
+            if self._open:
+                self._open = False
+                self._stats.active -= 1
+
+
+class _BorrowedTransport(httpx.AsyncBaseTransport):
+    """Transport wrapper that delegates to the shared pool of an origin.
+
+    The pool is looked up per request, so an evicted pool is replaced
+    transparently. aclose() is a no-op so that borrowers closing their
+    client (e.g. via ``async with``) leave the shared pool intact. Only the
+    registry closes the underlying transport.
+    """
+
+    def __init__(self, registry: TransportRegistry, origin: str) -> None:
+        self._registry = registry
+        self._origin = origin
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        pool, stats = self._registry._checkout(self._origin)
+        stats.requests += 1
+        stats.active += 1
+        try:
+            response = await pool.handle_async_request(request)
+        except BaseException as e:
+            if isinstance(e, Exception):
+                stats.errors += 1
+            stats.active -= 1
+            raise
+        if response.is_closed:
+            # Body already in memory (nothing left to read from the pool)
+            stats.active -= 1
+            return response
+        # Counted until the body is closed (httpx closes it once read)
+        response.stream = _CountedStream(response.stream, stats)
+        return response
+
+    async def aclose(self) -> None:
+        pass
+
+
+def _origin(url: str) -> str:
+    """Normalize a URL to its origin (scheme://host:port)."""
+    parts = urlsplit(url if "://" in url else f"https://{url}")
+    scheme = parts.scheme.lower() or "https"
+    host = (parts.hostname or "").lower()
+    port = parts.port or (443 if scheme == "https" else 80)
+    return f"{scheme}://{host}:{port}"
+
+
+class TransportRegistry:
+    """Hands out pooled HTTP clients per upstream origin.
+
+    Thread-safety: intended for use from a single event loop, like the
+    rest of the async service layer.
+    """
+
+    def __init__(
+        self,
+        max_connections: int | None = None,
+        max_keepalive_connections: int | None = None,
+        keepalive_expiry: float | None = None,
+        http2: bool | None = None,
+        max_pools: int | None = None,
+    ) -> None:
+        """Initialize an empty registry.
+
+        Args:
+            max_connections: Max connections per origin pool.
+            max_keepalive_connections: Max idle keep-alive connections per pool.
+            keepalive_expiry: Seconds an idle connection is kept open.
+            http2: Enable HTTP/2 (requires the optional ``h2`` package).
+            max_pools: Max origin pools kept open. Defaults to HBC_HTTP_MAX_POOLS.
+        """
+        self._limits = httpx.Limits(
+            max_connections=max_connections or settings.http_max_connections,
+            max_keepalive_connections=(
+                max_keepalive_connections or settings.http_max_keepalive_connections
+            ),
+            keepalive_expiry=keepalive_expiry or settings.http_keepalive_expiry,
+        )
+        want_http2 = settings.http2_enabled if http2 is None else http2
+        if want_http2 and importlib.util.find_spec("h2") is None:
+            logger.warning("HTTP/2 requested but the 'h2' package is not installed, using HTTP/1.1")
+            want_http2 = False
+        self._http2 = want_http2
+        self._max_pools = settings.http_max_pools if max_pools is None else max_pools
+        # Least recently used first
+        self._pools: OrderedDict[str, httpx.AsyncHTTPTransport] = OrderedDict()
+        self._stats: dict[str, _PoolStats] = {}
+        # Evicted pools still closing
+        self._closing: set[asyncio.Task[None]] = set()
+        self._closed = False
+        self.evictions = 0
+
+    @property
+    def is_closed(self) -> bool:
+        """Whether the registry has been closed."""
+        return self._closed
+
+    def _get_pool(self, origin: str) -> httpx.AsyncHTTPTransport:
+        """Get or create the shared transport for an origin."""
+        pool = self._pools.get(origin)
+        if pool is None:
+            if self._closed:
+                raise RuntimeError("TransportRegistry is closed")
+            pool = httpx.AsyncHTTPTransport(limits=self._limits, http2=self._http2)
+            self._pools[origin] = pool
+            self._stats[origin] = _PoolStats()
+            logger.debug(f"Created HTTP connection pool for {origin}")
+            self._evict()
+        else:
+            self._pools.move_to_end(origin)
+        return pool
+
+    def _checkout(self, origin: str) -> tuple[httpx.AsyncHTTPTransport, _PoolStats]:
+        """Get the pool and counters for a request to an origin."""
+        pool = self._get_pool(origin)
+        return pool, self._stats[origin]
+
+    def _evict(self) -> None:
+        """Close least recently used idle pools beyond max_pools."""
+        overflow = len(self._pools) - self._max_pools
+        if overflow <= 0:
+            return
+        # The newest pool (just created for a caller) is never a candidate
+        candidates = list(self._pools)[:-1]
+        idle = [origin for origin in candidates if self._stats[origin].active == 0]
+        for origin in idle[:overflow]:
+            pool = self._pools.pop(origin)
+            del self._stats[origin]
+            self.evictions += 1
+            logger.debug(f"Evicted HTTP connection pool for {origin}")
+            try:
+                task = asyncio.get_running_loop().create_task(self._close_pool(origin, pool))
+            except RuntimeError:
+                continue  # No event loop: nothing is connected yet, let it be collected
+            self._closing.add(task)
+            task.add_done_callback(self._closing.discard)
+
+    @staticmethod
+    async def _close_pool(origin: str, pool: httpx.AsyncHTTPTransport) -> None:
+        try:
+            await pool.aclose()
+        except Exception as e:
+            logger.warning(f"Failed to close HTTP pool for {origin}: {e}")
+
+    def client_for(
+        self,
+        url: str,
+        *,
+        timeout: float | httpx.Timeout | None = 30.0,
+        follow_redirects: bool = False,
+        **kwargs: Any,
+    ) -> httpx.AsyncClient:
+        """Get a client that reuses the pooled connections for a URL's origin.
+
+        The returned client is cheap to create and safe to close; requests
+        to other origins (e.g. after redirects) still work, they just share
+        the first origin's pool.
+
+        Args:
+            url: Any URL (or bare host) on the upstream origin.
+            timeout: Default request timeout for this client.
+            follow_redirects: Whether to follow redirects.
+            **kwargs: Extra httpx.AsyncClient arguments (headers, cookies...).
+
+        Returns:
+            An AsyncClient backed by the shared pool.
+
+        Raises:
+            RuntimeError: If the registry has been closed.
+        """
+        if self._closed:
+            raise RuntimeError("TransportRegistry is closed")
+        origin = _origin(url)
+        self._get_pool(origin)
+        return httpx.AsyncClient(
+            transport=_BorrowedTransport(self, origin),
+            timeout=timeout,
+            follow_redirects=follow_redirects,
+            **kwargs,
+        )
+
+    def stats(self) -> dict[str, dict[str, Any]]:
+        """Get per-pool connection and request statistics.
+
+        Returns:
+            Dict mapping origin to request/error/in-flight counts and
+            open/idle connection counts.
+        """
+        result: dict[str, dict[str, Any]] = {}
+        for origin, pool in self._pools.items():
+            # httpcore does not expose pool stats publicly; inspect best-effort
+            connections = getattr(getattr(pool, "_pool", None), "connections", []) or []
+            idle = sum(1 for conn in connections if conn.is_idle())
+            stats = self._stats[origin]
+            result[origin] = {
+                "requests": stats.requests,
+                "errors": stats.errors,
+                "active": stats.active,
+                "connections": len(connections),
+                "idle_connections": idle,
+                "http2": self._http2,
+            }
+        return result
+
+    async def aclose(self) -> None:
+        """Close all pools."""
+        self._closed = True
+        for origin, pool in self._pools.items():
+            await self._close_pool(origin, pool)
+        if self._closing:
+            await asyncio.gather(*self._closing)
+        count = len(self._pools)
+        self._pools.clear()
+        self._stats.clear()
+        logger.debug(f"Closed {count} HTTP connection pool(s)")
+
+
+# Active registry (set by the app lifespan)
+_registry: TransportRegistry | None = None
+
+
+def get_transport_registry() -> TransportRegistry | None:
+    """Get the active transport registry, if the app has started one."""
+    if _registry is not None and _registry.is_closed:
+        return None
+    return _registry
+
+
+def init_transport_registry() -> TransportRegistry:
+    """Create and activate the shared transport registry.
+
+    Returns:
+        The new active registry.
+    """
+    global _registry
+    _registry = TransportRegistry()
+    return _registry
+
+
+async def close_transport_registry() -> None:
+    """Close and deactivate the shared transport registry."""
+    global _registry
+    if _registry is not None:
+        await _registry.aclose()
+        _registry = None
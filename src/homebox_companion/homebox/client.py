@@ -6,9 +6,11 @@ The sync client has been removed - use async/await throughout.
 
 from __future__ import annotations
 
+import asyncio
 import functools
+import math
 import socket
-from collections.abc import Callable
+from collections.abc import AsyncIterator, Callable
 from functools import lru_cache
 from typing import Any, cast
 
@@ -16,10 +18,12 @@ import httpx
 from loguru import logger
 from throttled.asyncio import RateLimiterType, Throttled, rate_limiter, store
 
+from ..core.circuit_breaker import CircuitBreaker, get_circuit_breaker
 from ..core.config import settings
 from ..core.exceptions import (
     HomeboxAPIError,
     HomeboxAuthError,
+    HomeboxCircuitOpenError,
     HomeboxConnectionError,
     HomeboxTimeoutError,
 )
@@ -73,6 +77,54 @@ DEFAULT_HEADERS: dict[str, str] = {
 }
 
 
+# Page size used when walking all pages of an item listing
+DEFAULT_PAGE_SIZE = 100
+
+# Max item pages fetched concurrently by the paginator
+PAGE_FETCH_CONCURRENCY = 4
+
+# Upstream statuses that indicate Homebox (or its proxy) is down, not a bad request
+_OUTAGE_STATUS_CODES = frozenset({502, 503, 504})
+
+
+class _CircuitBreakerTransport(httpx.AsyncBaseTransport):
+    """Transport wrapper that guards every Homebox request with a circuit breaker.
+
+    Connection errors, timeouts and gateway errors count as failures. While the
+    circuit is open, requests fail immediately with HomeboxCircuitOpenError
+    instead of waiting for the connect timeout.
+    """
+
+    def __init__(self, transport: httpx.AsyncBaseTransport, breaker: CircuitBreaker) -> None:
+        self._transport = transport
+        self._breaker = breaker
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        if not self._breaker.allow_request():
+            retry_after = self._breaker.retry_after()
+            raise HomeboxCircuitOpenError(
+                f"Homebox circuit open, skipping {request.method} {request.url.path}",
+                user_message=(
+                    "Homebox server is currently unreachable. "
+                    f"Retrying automatically in {retry_after:.0f}s."
+                ),
+                context={"retry_after": round(retry_after, 1)},
+            )
+        try:
+            response = await self._transport.handle_async_request(request)
+        except httpx.TransportError:
+            self._breaker.record_failure()
+            raise
+        if response.status_code in _OUTAGE_STATUS_CODES:
+            self._breaker.record_failure()
+        else:
+            self._breaker.record_success()
+        return response
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+
 def _normalize_token(token: str) -> str:
     """Remove 'Bearer ' prefix from token if present.
 
@@ -112,11 +164,18 @@ class HomeboxClient:
     ) -> None:
         self.base_url = (base_url or settings.api_url).rstrip("/")
         self._owns_client = client is None
-        self.client = client or httpx.AsyncClient(
-            headers=DEFAULT_HEADERS,
-            timeout=DEFAULT_TIMEOUT,
-            follow_redirects=True,
-        )
+        if client is None:
+            transport: httpx.AsyncBaseTransport = httpx.AsyncHTTPTransport()
+            breaker = get_circuit_breaker("homebox")
+            if breaker is not None:
+                transport = _CircuitBreakerTransport(transport, breaker)
+            client = httpx.AsyncClient(
+                headers=DEFAULT_HEADERS,
+                timeout=DEFAULT_TIMEOUT,
+                follow_redirects=True,
+                transport=transport,
+            )
+        self.client = client
 
     async def aclose(self) -> None:
         """Close the underlying HTTP client if we own it."""
@@ -795,6 +854,116 @@ class HomeboxClient:
         )
         return response.get("items", [])
 
+    async def iter_item_pages(
+        self,
+        token: str,
+        *,
+        location_id: str | None = None,
+        label_ids: list[str] | None = None,
+        query: str | None = None,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        max_items: int | None = None,
+        concurrency: int = PAGE_FETCH_CONCURRENCY,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Iterate over item listing pages, fetching pages concurrently.
+
+        The first page is fetched alone to learn the total; the remaining
+        pages are then requested concurrently (bounded by concurrency) and
+        yielded in page order. Pages not yet consumed are cancelled if the
+        caller stops iterating early.
+
+        Args:
+            token: The bearer token from login.
+            location_id: Optional location ID to filter items.
+            label_ids: Optional list of label IDs to filter items.
+            query: Optional search query string.
+            page_size: Items per page request.
+            max_items: Stop after the pages covering this many items.
+            concurrency: Max page requests in flight.
+
+        Yields:
+            Paginated responses: {items: [...], page, pageSize, total}
+        """
+        filters: dict[str, Any] = {
+            "location_id": location_id,
+            "label_ids": label_ids,
+            "query": query,
+            "page_size": page_size,
+        }
+        first = await self.list_items(token, page=1, **filters)
+        yield first
+
+        total = first.get("total") or 0
+        wanted = total if max_items is None else min(total, max_items)
+        last_page = math.ceil(wanted / page_size)
+        if last_page <= 1 or not first.get("items"):
+            return
+
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def fetch(page: int) -> dict[str, Any]:
+            async with semaphore:
+                return await self.list_items(token, page=page, **filters)
+
+        tasks = [asyncio.ensure_future(fetch(page)) for page in range(2, last_page + 1)]
+        logger.debug(f"Fetching {len(tasks)} more item pages ({total} items total)")
+        try:
+            for task in tasks:
+                yield await task
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+
+    async def list_all_items(
+        self,
+        token: str,
+        *,
+        location_id: str | None = None,
+        label_ids: list[str] | None = None,
+        query: str | None = None,
+        max_items: int | None = None,
+        page_size: int = DEFAULT_PAGE_SIZE,
+    ) -> dict[str, Any]:
+        """List all matching items across pages (see iter_item_pages).
+
+        Items that shift between pages while fetching are de-duplicated by id.
+
+        Args:
+            token: The bearer token from login.
+            location_id: Optional location ID to filter items.
+            label_ids: Optional list of label IDs to filter items.
+            query: Optional search query string.
+            max_items: Optional cap on the number of items returned.
+            page_size: Items per page request.
+
+        Returns:
+            Response shaped like a single page: {items: [...], page, pageSize, total}
+        """
+        items: list[dict[str, Any]] = []
+        seen: set[str] = set()
+        total = 0
+        async for response in self.iter_item_pages(
+            token,
+            location_id=location_id,
+            label_ids=label_ids,
+            query=query,
+            page_size=page_size,
+            max_items=max_items,
+        ):
+            total = response.get("total", total)
+            for item in response.get("items", []):
+                item_id = item.get("id")
+                if item_id in seen:
+                    continue
+                if item_id:
+                    seen.add(item_id)
+                items.append(item)
+
+        if max_items is not None:
+            items = items[:max_items]
+        return {"items": items, "page": 1, "pageSize": len(items), "total": total}
+
     async def get_item(self, token: str, item_id: str) -> dict[str, Any]:
         """Get full item details by ID.
 
@@ -860,6 +1029,25 @@ class HomeboxClient:
         self._ensure_success(response, "Get item path")
         return response.json()
 
+    async def get_group(self, token: str) -> dict[str, Any]:
+        """Get the group (tenant) the token's user belongs to.
+
+        Args:
+            token: The bearer token from login.
+
+        Returns:
+            Group dict containing at least id and name.
+        """
+        response = await self.client.get(
+            f"{self.base_url}/groups",
+            headers={
+                "Accept": "application/json",
+                "Authorization": f"Bearer {token}",
+            },
+        )
+        self._ensure_success(response, "Get group")
+        return response.json()
+
     async def get_statistics(self, token: str) -> dict[str, Any]:
         """Get group statistics overview.
 
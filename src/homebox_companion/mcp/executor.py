@@ -7,27 +7,43 @@ The ToolExecutor is the single source of truth for:
 - Tool discovery and lookup
 - Tool schema generation (for LLM function calling)
 - Permission checking
-- Parameter validation and execution
+- Parameter validation and execution (single calls and batches)
 """
 
 from __future__ import annotations
 
+import asyncio
 import time
+from collections.abc import Collection, Sequence
 from functools import cached_property
 from typing import TYPE_CHECKING, Any
 
 from loguru import logger
 from pydantic import ValidationError
 
+from ..services.inventory_mirror import get_inventory_mirror
+from .schemas import get_tool_schema_set
 from .tools import get_tools
-from .types import DisplayInfo, Tool, ToolPermission, ToolResult, get_action_type_from_tool_name
+from .types import (
+    BatchCallResult,
+    DisplayInfo,
+    Tool,
+    ToolPermission,
+    ToolResult,
+    get_action_type_from_tool_name,
+)
 
 if TYPE_CHECKING:
     from ..homebox.client import HomeboxClient
+    from .result_cache import ToolResultCache
 
 
-# Cache TTL for tool schemas (5 minutes)
-_SCHEMA_CACHE_TTL = 300
+# Max READ calls of a batch running at once
+_BATCH_READ_CONCURRENCY = 8
+
+# Max WRITE calls of a batch in flight at once; the Homebox write rate
+# limiter paces them, this just keeps the pipeline full
+_BATCH_WRITE_CONCURRENCY = 4
 
 
 class ToolExecutor:
@@ -37,9 +53,10 @@ class ToolExecutor:
     scattered across the chat orchestrator and API routers. It provides:
 
     - Tool discovery via `list_tools()` and `get_tool()`
-    - Schema generation for LLM function calling via `get_tool_schemas()`
+    - Precomputed schemas for LLM function calling via `get_tool_schemas()`
+      and MCP discovery via `get_tool_listing_json()`
     - Permission checking via `requires_approval()`
-    - Validated execution via `execute()`
+    - Validated execution via `execute()` and `execute_batch()`
 
     Example:
         >>> executor = ToolExecutor(client)
@@ -56,7 +73,6 @@ class ToolExecutor:
             client: HomeboxClient instance for tool API calls.
         """
         self._client = client
-        self._schema_cache: tuple[list[dict[str, Any]], float] | None = None
 
     @property
     def client(self) -> HomeboxClient:
@@ -106,7 +122,9 @@ class ToolExecutor:
     ) -> list[dict[str, Any]]:
         """Get tool definitions in OpenAI/LiteLLM function calling format.
 
-        Uses instance-level caching with TTL to avoid rebuilding schemas.
+        Schemas are precomputed and serialized once per variant (see
+        mcp.schemas); each call decodes a fresh copy, which LLM provider
+        adapters are free to mutate.
 
         Args:
             include_write: If True, include WRITE and DESTRUCTIVE tools.
@@ -118,55 +136,23 @@ class ToolExecutor:
         Returns:
             List of tool schema dicts suitable for LLM function calling.
         """
-        import copy
-
-        # Check instance-level cache
-        if self._schema_cache and (time.time() - self._schema_cache[1]) < _SCHEMA_CACHE_TTL:
-            all_schemas = self._schema_cache[0]
-        else:
-            # Rebuild cache
-            all_schemas = []
-            for tool in self._tools_by_name.values():
-                all_schemas.append({
-                    "type": "function",
-                    "function": {
-                        "name": tool.name,
-                        "description": tool.description,
-                        "parameters": tool.Params.model_json_schema(),
-                    },
-                })
-            self._schema_cache = (all_schemas, time.time())
-            logger.debug(f"Built and cached {len(all_schemas)} tool schemas")
-
-        # Filter by permission if needed
-        if include_write:
-            schemas = all_schemas
-        else:
-            read_tool_names = {
-                t.name for t in self._tools_by_name.values()
-                if t.permission == ToolPermission.READ
-            }
-            schemas = [s for s in all_schemas if s["function"]["name"] in read_tool_names]
-
-        # Deep copy to prevent cache mutation
-        result = copy.deepcopy(schemas)
-
-        # Inject token parameter for MCP protocol compatibility
-        if include_token:
-            for schema in result:
-                params = schema["function"]["parameters"]
-                if "properties" not in params:
-                    params["properties"] = {}
-                params["properties"]["token"] = {
-                    "type": "string",
-                    "description": "Homebox authentication token (required)",
-                }
-                if "required" not in params:
-                    params["required"] = []
-                if "token" not in params["required"]:
-                    params["required"].append("token")
+        return get_tool_schema_set(include_write, include_token).schemas_copy()
 
-        return result
+    def get_tool_listing_json(
+        self,
+        include_write: bool = False,
+        include_token: bool = True,
+    ) -> bytes:
+        """Get the pre-serialized MCP tool listing.
+
+        Args:
+            include_write: If True, include WRITE and DESTRUCTIVE tools.
+            include_token: If True, include 'token' as a required parameter.
+
+        Returns:
+            JSON bytes of {"tools": {name: {description, parameters}}}.
+        """
+        return get_tool_schema_set(include_write, include_token).listing_json
 
     async def get_display_info(
         self,
@@ -273,19 +259,23 @@ class ToolExecutor:
         tool_name: str,
         params: dict[str, Any],
         token: str,
+        cache: ToolResultCache | None = None,
     ) -> ToolResult:
         """Execute a tool with validated parameters.
 
         This method handles:
         1. Tool lookup
         2. Parameter validation via Pydantic
-        3. Tool execution
-        4. Error handling and result wrapping
+        3. Result cache lookup (READ tools) or invalidation (WRITE/DESTRUCTIVE)
+        4. Tool execution
+        5. Error handling and result wrapping
 
         Args:
             tool_name: Name of the tool to execute.
             params: Raw parameters dict (will be validated).
             token: Homebox authentication token.
+            cache: Optional per-session result cache. READ results are served
+                from and stored in it; any other tool clears it.
 
         Returns:
             ToolResult with success/error status and data.
@@ -302,11 +292,91 @@ class ToolExecutor:
             logger.warning(f"Tool {tool_name} parameter validation failed: {e}")
             return ToolResult(success=False, error=f"Invalid parameters: {e}")
 
+        cache_key: str | None = None
+        if cache is not None and cache.enabled and tool.permission == ToolPermission.READ:
+            cache_key = cache.make_key(tool_name, validated_params)
+            cached = cache.get(cache_key)
+            if cached is not None:
+                logger.debug(f"Tool {tool_name} served from session cache")
+                return cached
+
         # Execute the tool
         logger.info(f"Executing tool: {tool_name}")
         try:
             result = await tool.execute(self._client, token, validated_params)
-            return result
         except Exception as e:
             logger.exception(f"Tool {tool_name} execution failed")
-            return ToolResult(success=False, error=str(e))
+            result = ToolResult(success=False, error=str(e))
+        finally:
+            # Even a failed write may have partially applied
+            if tool.permission != ToolPermission.READ:
+                if cache is not None:
+                    cache.invalidate(f"after {tool_name}")
+                get_inventory_mirror().request_sync()
+
+        if cache_key is not None:
+            cache.put(cache_key, result)
+        return result
+
+    async def execute_batch(
+        self,
+        calls: Sequence[tuple[str, dict[str, Any]]],
+        token: str,
+        *,
+        allowed_permissions: Collection[ToolPermission] = (ToolPermission.READ,),
+    ) -> list[BatchCallResult]:
+        """Execute many tool calls in one go.
+
+        READ calls run concurrently. WRITE calls are pipelined: started in
+        submission order with a few in flight at once, paced by the Homebox
+        write rate limiter. Calls are independent; a read is not ordered
+        relative to writes in the same batch.
+
+        Args:
+            calls: (tool_name, params) pairs.
+            token: Homebox authentication token.
+            allowed_permissions: Permissions a tool must have to run; other
+                calls fail without executing.
+
+        Returns:
+            One BatchCallResult per call, in input order.
+        """
+        read_slots = asyncio.Semaphore(_BATCH_READ_CONCURRENCY)
+        write_slots = asyncio.Semaphore(_BATCH_WRITE_CONCURRENCY)
+
+        async def run(tool_name: str, params: dict[str, Any]) -> BatchCallResult:
+            tool = self.get_tool(tool_name)
+            if not tool:
+                return BatchCallResult(
+                    tool=tool_name, result=ToolResult(success=False, error=f"Unknown tool: {tool_name}")
+                )
+            if tool.permission not in allowed_permissions:
+                return BatchCallResult(
+                    tool=tool_name,
+                    result=ToolResult(
+                        success=False,
+                        error=f"{tool.permission.value} tools are not allowed in this batch",
+                    ),
+                )
+
+            queued_at = time.perf_counter()
+            slots = read_slots if tool.permission == ToolPermission.READ else write_slots
+            async with slots:
+                started = time.perf_counter()
+                result = await self.execute(tool_name, params, token)
+                finished = time.perf_counter()
+            return BatchCallResult(
+                tool=tool_name,
+                result=result,
+                queued_ms=(started - queued_at) * 1000,
+                duration_ms=(finished - started) * 1000,
+            )
+
+        started = time.perf_counter()
+        results = await asyncio.gather(*(run(name, params) for name, params in calls))
+        logger.info(
+            f"Executed batch of {len(results)} tool calls "
+            f"({sum(1 for r in results if not r.result.success)} failed) "
+            f"in {(time.perf_counter() - started) * 1000:.0f}ms"
+        )
+        return list(results)
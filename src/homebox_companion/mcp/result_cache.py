@@ -0,0 +1,128 @@
+"""Per-session cache of READ tool results.
+
+Within one conversation the model often asks for the same data repeatedly:
+list_locations, get_location_tree and list_labels at the start of most turns,
+and the same get_item again in a follow-up tool round. Each of those is a
+Homebox round-trip.
+
+ToolResultCache remembers successful READ tool results for a short TTL,
+keyed by tool name and the validated (canonical) parameters, so defaults
+and aliases map to the same entry. Any WRITE or DESTRUCTIVE tool executed
+through the same cache clears it, so a conversation always sees its own
+changes. Changes made elsewhere (another session, the Homebox UI) become
+visible once the TTL expires.
+
+Example:
+    >>> cache = ToolResultCache()
+    >>> result = await executor.execute("list_labels", {}, token, cache=cache)
+"""
+
+from __future__ import annotations
+
+import json
+import time
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any
+
+from loguru import logger
+
+from ..core.config import settings
+
+if TYPE_CHECKING:
+    from pydantic import BaseModel
+
+    from .types import ToolResult
+
+# Max cached results per session (oldest evicted first)
+_DEFAULT_MAX_ENTRIES = 128
+
+
+class ToolResultCache:
+    """TTL cache of READ tool results for a single chat session.
+
+    Cached ToolResult objects are shared between hits and must be treated
+    as read-only.
+
+    Attributes:
+        hits: Number of lookups served from the cache.
+        misses: Number of lookups that had to execute the tool.
+        invalidations: Number of times a write cleared the cache.
+    """
+
+    def __init__(self, ttl: float | None = None, max_entries: int = _DEFAULT_MAX_ENTRIES) -> None:
+        """Initialize an empty cache.
+
+        Args:
+            ttl: Seconds a result stays valid. Defaults to HBC_CHAT_TOOL_CACHE_TTL
+                (0 disables caching).
+            max_entries: Max cached results.
+        """
+        self._ttl = settings.chat_tool_cache_ttl if ttl is None else ttl
+        self._max_entries = max_entries
+        self._entries: OrderedDict[str, tuple[ToolResult, float]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    @property
+    def enabled(self) -> bool:
+        """Whether results are cached at all."""
+        return self._ttl > 0
+
+    @staticmethod
+    def make_key(tool_name: str, params: BaseModel) -> str:
+        """Build a cache key from a tool name and its validated parameters.
+
+        Args:
+            tool_name: Tool name.
+            params: Validated tool Params instance.
+
+        Returns:
+            Canonical key string.
+        """
+        canonical = json.dumps(
+            params.model_dump(mode="json"), sort_keys=True, separators=(",", ":")
+        )
+        return f"{tool_name}:{canonical}"
+
+    def get(self, key: str) -> ToolResult | None:
+        """Get a cached result if present and not expired."""
+        entry = self._entries.get(key)
+        if entry is None or time.monotonic() - entry[1] > self._ttl:
+            if entry is not None:
+                del self._entries[key]
+            self.misses += 1
+            return None
+        self.hits += 1
+        return entry[0]
+
+    def put(self, key: str, result: ToolResult) -> None:
+        """Cache a successful result."""
+        if not self.enabled or not result.success:
+            return
+        self._entries[key] = (result, time.monotonic())
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, reason: str = "") -> None:
+        """Drop all cached results (after a write)."""
+        if self._entries:
+            logger.debug(f"Tool result cache cleared ({len(self._entries)} entries) {reason}")
+            self._entries.clear()
+        self.invalidations += 1
+
+    def clear(self) -> None:
+        """Drop all cached results without counting an invalidation."""
+        self._entries.clear()
+
+    def stats(self) -> dict[str, Any]:
+        """Get cache statistics."""
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+            "invalidations": self.invalidations,
+        }
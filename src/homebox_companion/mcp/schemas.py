@@ -0,0 +1,117 @@
+"""Precomputed tool schemas for LLM function calling and MCP discovery.
+
+Tool schemas only depend on the registered tool classes, which are fixed
+once tools.py is imported. Every variant (read-only or all tools, with or
+without the MCP token parameter) is therefore built and serialized once, on
+first use. Chat turns get fresh schema dicts decoded from the serialized
+bytes, since LLM provider adapters (e.g. LiteLLM's Gemini mapping) edit tool
+schemas in place, and the MCP listing endpoint writes its pre-serialized
+JSON bytes as-is.
+"""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Iterable
+from dataclasses import dataclass
+from functools import cache
+from typing import Any
+
+from loguru import logger
+
+from .tools import get_tools
+from .types import Tool, ToolPermission
+
+_TOKEN_PROPERTY = {
+    "type": "string",
+    "description": "Homebox authentication token (required)",
+}
+
+
+@dataclass(frozen=True, slots=True)
+class ToolSchemaSet:
+    """One precomputed schema variant.
+
+    Attributes:
+        schemas: Tool definitions in OpenAI/LiteLLM function calling format
+            (shared, must not be mutated; see schemas_copy())
+        schemas_json: `schemas` serialized to JSON bytes
+        listing_json: MCP tool listing ({"tools": {name: {description,
+            parameters}}}) serialized to JSON bytes
+    """
+
+    schemas: tuple[dict[str, Any], ...]
+    schemas_json: bytes
+    listing_json: bytes
+
+    def schemas_copy(self) -> list[dict[str, Any]]:
+        """Get a private copy of the schemas that the caller may mutate."""
+        return json.loads(self.schemas_json)
+
+
+def _function_schema(tool: Tool, include_token: bool) -> dict[str, Any]:
+    """Build a tool's function calling schema."""
+    parameters = tool.Params.model_json_schema()
+    if include_token:
+        parameters["properties"] = {**parameters.get("properties", {}), "token": _TOKEN_PROPERTY}
+        required = parameters.get("required", [])
+        if "token" not in required:
+            parameters["required"] = [*required, "token"]
+    return {
+        "type": "function",
+        "function": {
+            "name": tool.name,
+            "description": tool.description,
+            "parameters": parameters,
+        },
+    }
+
+
+def build_tool_schema_set(
+    tools: Iterable[Tool],
+    *,
+    include_write: bool,
+    include_token: bool,
+) -> ToolSchemaSet:
+    """Build a schema variant for the given tools.
+
+    Args:
+        tools: Tools to describe.
+        include_write: If False, only READ tools are included.
+        include_token: If True, add 'token' as a required parameter.
+
+    Returns:
+        The schema variant.
+    """
+    schemas = tuple(
+        _function_schema(tool, include_token)
+        for tool in tools
+        if include_write or tool.permission == ToolPermission.READ
+    )
+    listing = {
+        "tools": {
+            schema["function"]["name"]: {
+                "description": schema["function"]["description"],
+                "parameters": schema["function"]["parameters"],
+            }
+            for schema in schemas
+        }
+    }
+    return ToolSchemaSet(
+        schemas=schemas,
+        schemas_json=json.dumps(schemas, separators=(",", ":")).encode(),
+        listing_json=json.dumps(listing, separators=(",", ":")).encode(),
+    )
+
+
+@cache
+def get_tool_schema_set(include_write: bool = True, include_token: bool = False) -> ToolSchemaSet:
+    """Get a shared schema variant for the registered tools (built on first use)."""
+    schema_set = build_tool_schema_set(
+        get_tools(), include_write=include_write, include_token=include_token
+    )
+    logger.debug(
+        f"Built {len(schema_set.schemas)} tool schemas "
+        f"(include_write={include_write}, include_token={include_token})"
+    )
+    return schema_set
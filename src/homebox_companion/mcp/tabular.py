@@ -0,0 +1,204 @@
+"""Dense tabular encoding of list-shaped tool results for LLM context.
+
+List tools (list_items, search_items, list_locations, ...) return a list of
+view dicts that repeat every key, the same nested location object and a full
+URL per row. Inside the chat history that repetition is paid for in prompt
+tokens on every following turn.
+
+encode_table() rewrites such a list as:
+    - columns: the keys, listed once
+    - rows: one value array per record
+    - refs: nested locations and labels, stored once and referenced by short keys
+    - url_templates: "{id}" templates replacing per-row URLs that follow one
+    - defaults: the dominant value of a column; cells equal to it are null
+      (only for columns without missing values, so null stays unambiguous)
+
+Columns whose values are all empty are dropped. The encoding is only used
+when it is actually smaller than the plain JSON.
+
+Example:
+    >>> encode_table([{"id": "a", "name": "Drill", "quantity": 1}, ...])
+    {"_format": "...", "columns": ["id", "name"], "rows": [["a", "Drill"], ...], ...}
+"""
+
+from __future__ import annotations
+
+import json
+from collections import Counter
+from typing import Any
+
+__all__ = ["encode_table"]
+
+# Minimum rows before a table is worth its header overhead
+MIN_TABLE_ROWS = 2
+
+# Reading instructions embedded in every table for the LLM
+TABLE_FORMAT_HINT = (
+    "rows follow columns; null cell = column default; "
+    "L*/T* values are keys into refs; url = url_templates with {id}"
+)
+
+# Nested reference fields: field name -> (ref table name, key prefix)
+_REF_FIELDS = {
+    "location": ("locations", "L"),
+    "labels": ("labels", "T"),
+}
+
+
+def _is_empty(value: Any) -> bool:
+    """Check whether a value carries no information (None, "", [], {}, False)."""
+    return value is None or value is False or (isinstance(value, str | list | dict) and not value)
+
+
+def _url_template(records: list[dict[str, Any]]) -> str | None:
+    """Find a shared "{id}" URL template for records' url fields.
+
+    Returns:
+        The template if every record's url is the same prefix plus its id.
+    """
+    prefix: str | None = None
+    for record in records:
+        url, record_id = record.get("url"), record.get("id")
+        if not isinstance(url, str) or not record_id or not url.endswith(str(record_id)):
+            return None
+        record_prefix = url[: -len(str(record_id))]
+        if prefix is None:
+            prefix = record_prefix
+        elif record_prefix != prefix:
+            return None
+    return f"{prefix}{{id}}" if prefix is not None else None
+
+
+def _strip_record(record: dict[str, Any], drop_url: bool) -> dict[str, Any]:
+    """Drop empty or zero fields (and a templated url) from a referenced record.
+
+    Zero counts are dropped too: nested views (e.g. an item's location) are
+    built without counts, so a 0 there is a placeholder, not data.
+    """
+    return {
+        key: value
+        for key, value in record.items()
+        if not _is_empty(value) and value != 0 and not (drop_url and key == "url")
+    }
+
+
+class _RefTable:
+    """Deduplicates nested records by id and hands out short reference keys."""
+
+    def __init__(self, prefix: str) -> None:
+        self._prefix = prefix
+        self._keys: dict[str, str] = {}
+        self.records: dict[str, dict[str, Any]] = {}
+
+    def ref(self, record: dict[str, Any]) -> str:
+        record_id = str(record["id"])
+        key = self._keys.get(record_id)
+        if key is None:
+            key = f"{self._prefix}{len(self._keys) + 1}"
+            self._keys[record_id] = key
+            self.records[key] = record
+        return key
+
+
+def _is_ref_record(value: Any) -> bool:
+    return isinstance(value, dict) and bool(value.get("id"))
+
+
+def encode_table(data: Any) -> dict[str, Any] | None:
+    """Encode a list of flat records as a dense table.
+
+    Args:
+        data: Tool result data.
+
+    Returns:
+        Table dict with columns/rows (plus refs, url_templates and defaults
+        when used), or None if the data is not a list of records or the
+        table would not be smaller than plain JSON.
+    """
+    if not isinstance(data, list) or len(data) < MIN_TABLE_ROWS:
+        return None
+    if not all(isinstance(record, dict) for record in data):
+        return None
+
+    table: dict[str, Any] = {}
+    url_templates: dict[str, str] = {}
+
+    row_template = _url_template(data)
+    if row_template:
+        url_templates["row"] = row_template
+
+    # Replace nested locations/labels with short reference keys
+    ref_tables: dict[str, _RefTable] = {}
+    records: list[dict[str, Any]] = []
+    for record in data:
+        record = dict(record)
+        if row_template:
+            record.pop("url", None)
+        for field, (table_name, prefix) in _REF_FIELDS.items():
+            value = record.get(field)
+            refs = ref_tables.setdefault(table_name, _RefTable(prefix))
+            if _is_ref_record(value):
+                record[field] = refs.ref(value)
+            elif isinstance(value, list) and value and all(_is_ref_record(v) for v in value):
+                record[field] = [refs.ref(v) for v in value]
+        records.append(record)
+
+    refs_out: dict[str, dict[str, Any]] = {}
+    for table_name, refs in ref_tables.items():
+        if not refs.records:
+            continue
+        template = _url_template(list(refs.records.values()))
+        if template:
+            url_templates[table_name] = template
+        refs_out[table_name] = {
+            key: _strip_record(record, drop_url=bool(template))
+            for key, record in refs.records.items()
+        }
+
+    # Columns in first-seen order, dropping those with no information at all
+    columns: list[str] = []
+    for record in records:
+        for key in record:
+            if key not in columns:
+                columns.append(key)
+    columns = [col for col in columns if not all(_is_empty(r.get(col)) for r in records)]
+
+    # Dominant scalar value per column becomes the default (written as null).
+    # Values are compared by their JSON encoding so True/1 and False/0 differ,
+    # and columns with missing values get none: their null must mean "missing".
+    defaults: dict[str, str] = {}
+    for col in columns:
+        if col in ("id", "url") or any(r.get(col) is None for r in records):
+            continue
+        counts = Counter(
+            json.dumps(r.get(col)) for r in records if not isinstance(r.get(col), list | dict)
+        )
+        if not counts:
+            continue
+        encoded, count = counts.most_common(1)[0]
+        if count >= 2 and count * 2 >= len(records) and not _is_empty(json.loads(encoded)):
+            defaults[col] = encoded
+
+    rows = [
+        [
+            None
+            if col in defaults and json.dumps(record.get(col)) == defaults[col]
+            else record.get(col)
+            for col in columns
+        ]
+        for record in records
+    ]
+
+    table["_format"] = TABLE_FORMAT_HINT
+    table["columns"] = columns
+    table["rows"] = rows
+    if defaults:
+        table["defaults"] = {col: json.loads(encoded) for col, encoded in defaults.items()}
+    if refs_out:
+        table["refs"] = refs_out
+    if url_templates:
+        table["url_templates"] = url_templates
+
+    if len(json.dumps(table)) >= len(json.dumps(data)):
+        return None
+    return table
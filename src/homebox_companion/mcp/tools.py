@@ -17,12 +17,15 @@ from __future__ import annotations
 import base64
 import binascii
 from dataclasses import dataclass
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from loguru import logger
 from pydantic import Field
 
+from ..core.config import settings
 from ..homebox.views import CompactItemView, ItemView, LocationView, add_tree_urls
+from ..services.inventory_mirror import get_inventory_mirror
+from ..services.search_index import get_item_search_index
 from .types import Tool, ToolParams, ToolPermission, ToolResult
 
 if TYPE_CHECKING:
@@ -88,6 +91,127 @@ def _sort_items_by_location_and_name(items: list[dict]) -> list[dict]:
     )
 
 
+# Largest page requested from Homebox in one call; bigger requests are split
+# into concurrently fetched pages
+_MAX_PAGE_SIZE = 100
+
+# Max items scanned to build an aggregate summary
+_AGGREGATE_MAX_ITEMS = 5000
+
+# Example item names listed per group in aggregate summaries
+_AGGREGATE_EXAMPLES = 3
+
+
+async def _fetch_item_page(
+    client: HomeboxClient,
+    token: str,
+    *,
+    page: int | None,
+    page_size: int,
+    **filters: Any,
+) -> dict[str, Any]:
+    """Fetch one page of items, splitting oversized first-page requests.
+
+    Requests for more than _MAX_PAGE_SIZE items (without an explicit page)
+    are served by the concurrent paginator instead of one giant page.
+    """
+    if page is None and page_size > _MAX_PAGE_SIZE:
+        return await client.list_all_items(
+            token, max_items=page_size, page_size=_MAX_PAGE_SIZE, **filters
+        )
+    return await client.list_items(token, page=page, page_size=page_size, **filters)
+
+
+def _search_index_page(
+    client: HomeboxClient,
+    token: str,
+    query: str,
+    *,
+    page: int | None,
+    page_size: int,
+) -> dict[str, Any] | None:
+    """Answer a search from the local index, if it is populated and finds anything.
+
+    Returns None (use the Homebox query instead) until the inventory mirror
+    has synced for this token, or when there are no hits, since Homebox also
+    matches inside words.
+    """
+    if not settings.search_index_enabled:
+        return None
+    mirror = get_inventory_mirror()
+    mirror.touch(token)
+    index = get_item_search_index()
+    if not mirror.is_ready_for(token) or not index.is_ready:
+        return None
+    response = index.search_page(query, page=page or 1, page_size=page_size)
+    return response if response["total"] else None
+
+
+def _aggregate_items(items: list[dict[str, Any]], total: int) -> dict[str, Any]:
+    """Summarize raw items as counts grouped by location and label.
+
+    Args:
+        items: Raw Homebox item dicts.
+        total: Total matching items reported by Homebox.
+
+    Returns:
+        Dict with overall counts, per-location groups (with example names)
+        and per-label counts, largest groups first.
+    """
+    locations: dict[str, dict[str, Any]] = {}
+    labels: dict[str, dict[str, Any]] = {}
+    total_quantity = 0
+
+    for item in items:
+        quantity = item.get("quantity") or 0
+        total_quantity += quantity
+
+        location = item.get("location") or {}
+        location_key = location.get("id") or ""
+        group = locations.setdefault(
+            location_key,
+            {
+                "location": location.get("name") or "(no location)",
+                "location_id": location.get("id"),
+                "items": 0,
+                "quantity": 0,
+                "examples": [],
+            },
+        )
+        group["items"] += 1
+        group["quantity"] += quantity
+        if len(group["examples"]) < _AGGREGATE_EXAMPLES:
+            group["examples"].append(item.get("name", ""))
+
+        for label in item.get("labels") or []:
+            label_group = labels.setdefault(
+                label.get("id", ""),
+                {"label": label.get("name", ""), "label_id": label.get("id"), "items": 0},
+            )
+            label_group["items"] += 1
+
+    return {
+        "total_items": total,
+        "items_scanned": len(items),
+        "total_quantity": total_quantity,
+        "by_location": sorted(locations.values(), key=lambda g: -g["items"]),
+        "by_label": sorted(labels.values(), key=lambda g: -g["items"]),
+    }
+
+
+async def _aggregate_result(client: HomeboxClient, token: str, **filters: Any) -> ToolResult:
+    """Fetch all matching items and return only an aggregate summary."""
+    response = await client.list_all_items(token, max_items=_AGGREGATE_MAX_ITEMS, **filters)
+    summary = _aggregate_items(response.get("items", []), response.get("total", 0))
+    if summary["items_scanned"] < summary["total_items"]:
+        summary["truncated"] = True
+    logger.debug(
+        f"Aggregated {summary['items_scanned']} items into "
+        f"{len(summary['by_location'])} locations, {len(summary['by_label'])} labels"
+    )
+    return ToolResult(success=True, data=summary)
+
+
 # =============================================================================
 # READ-ONLY TOOLS
 # =============================================================================
@@ -118,10 +242,16 @@ class ListLocationsTool:
         token: str,
         params: Params,
     ) -> ToolResult:
-        locations = await client.list_locations(
-            token,
-            filter_children=params.filter_children or None,
-        )
+        mirror = get_inventory_mirror()
+        mirror.touch(token)
+        # The mirror holds the flat list; top-level filtering needs Homebox
+        if not params.filter_children and mirror.is_ready_for(token) and mirror.locations is not None:
+            locations = mirror.locations
+        else:
+            locations = await client.list_locations(
+                token,
+                filter_children=params.filter_children or None,
+            )
         # Convert to LocationView for URL generation
         locations = [LocationView.from_dict(loc).model_dump(by_alias=True) for loc in locations]
         logger.debug(f"list_locations returned {len(locations)} locations")
@@ -177,7 +307,12 @@ class ListLabelsTool:
     ) -> ToolResult:
         from ..core.config import settings
 
-        labels = await client.list_labels(token)
+        mirror = get_inventory_mirror()
+        mirror.touch(token)
+        if mirror.is_ready_for(token) and mirror.labels is not None:
+            labels = mirror.labels
+        else:
+            labels = await client.list_labels(token)
         logger.debug(f"list_labels returned {len(labels)} labels")
 
         # Add URL to each label for easy linking in chat
@@ -202,6 +337,8 @@ class ListItemsTool:
     description: str = (
         "List items in the inventory with optional filtering. "
         "Set page_size to the user's requested count (e.g., 'list 100 items' -> page_size=100). "
+        "Set aggregate=true for counts and overviews (e.g., 'how many things are in the garage') "
+        "instead of listing every item. "
         "For text-based searches, prefer using search_items instead."
     )
     permission: ToolPermission = ToolPermission.READ
@@ -237,6 +374,13 @@ class ListItemsTool:
                 "to reduce payload size. Set to false for full item details."
             ),
         )
+        aggregate: bool = Field(
+            default=False,
+            description=(
+                "If true, return counts grouped by location and label (with a few example "
+                "names) for ALL matching items instead of the items themselves."
+            ),
+        )
 
     async def execute(
         self,
@@ -282,7 +426,13 @@ class ListItemsTool:
                 f"to id '{resolved_location_id}'"
             )
 
-        response = await client.list_items(
+        if params.aggregate:
+            return await _aggregate_result(
+                client, token, location_id=resolved_location_id, label_ids=params.label_ids
+            )
+
+        response = await _fetch_item_page(
+            client,
             token,
             location_id=resolved_location_id,
             label_ids=params.label_ids,
@@ -326,7 +476,8 @@ class SearchItemsTool:
     name: str = "search_items"
     description: str = (
         "Search items by text query. Use for semantic searches like 'find rope'. "
-        "Set page_size to the user's requested count if specified."
+        "Set page_size to the user's requested count if specified. "
+        "Set aggregate=true to get counts per location and label instead of the items."
     )
     permission: ToolPermission = ToolPermission.READ
 
@@ -349,6 +500,13 @@ class SearchItemsTool:
                 "Set to false for full item details."
             ),
         )
+        aggregate: bool = Field(
+            default=False,
+            description=(
+                "If true, return counts grouped by location and label (with a few example "
+                "names) for ALL matching items instead of the items themselves."
+            ),
+        )
 
     async def execute(
         self,
@@ -356,12 +514,20 @@ class SearchItemsTool:
         token: str,
         params: Params,
     ) -> ToolResult:
-        response = await client.list_items(
-            token,
-            query=params.query,
-            page=params.page,
-            page_size=params.page_size,
+        if params.aggregate:
+            return await _aggregate_result(client, token, query=params.query)
+
+        response = _search_index_page(
+            client, token, params.query, page=params.page, page_size=params.page_size
         )
+        if response is None:
+            response = await _fetch_item_page(
+                client,
+                token,
+                query=params.query,
+                page=params.page,
+                page_size=params.page_size,
+            )
 
         # Extract items from pagination response
         items = response.get("items", [])
@@ -665,6 +831,7 @@ class CreateItemTool:
             label_ids=params.label_ids or [],
         )
         result = await client.create_item(token, item_data)
+        get_inventory_mirror().record_item(result)
         logger.info(f"create_item created item: {result.get('name', 'unknown')}")
         return ToolResult(success=True, data=result)
 
@@ -766,6 +933,7 @@ class UpdateItemTool:
             ]
 
         result = await client.update_item(token, params.item_id, update_data)
+        get_inventory_mirror().record_item(result)
         logger.info(f"update_item updated item: {result.get('name', 'unknown')}")
         return ToolResult(success=True, data=result)
 
@@ -1028,6 +1196,7 @@ class DeleteItemTool:
         params: Params,
     ) -> ToolResult:
         await client.delete_item(token, params.item_id)
+        get_inventory_mirror().forget_item(params.item_id)
         logger.info(f"delete_item deleted item: {params.item_id}")
         return ToolResult(success=True, data={"deleted_id": params.item_id})
 
@@ -4,6 +4,7 @@ This module contains the shared types used across MCP tool implementations:
 - ToolPermission: Enum for tool permission levels
 - ToolParams: Base class for tool parameter models
 - ToolResult: Standard result wrapper for tool execution
+- BatchCallResult: Result and timings of one call in a batch execution
 - Tool: Protocol defining the tool contract
 """
 
@@ -14,6 +15,8 @@ from typing import TYPE_CHECKING, Any, Literal, Protocol, runtime_checkable
 
 from pydantic import BaseModel, ConfigDict
 
+from .tabular import encode_table
+
 if TYPE_CHECKING:
     from ..homebox.client import HomeboxClient
 
@@ -21,6 +24,7 @@ __all__ = [
     "ToolPermission",
     "ToolParams",
     "ToolResult",
+    "BatchCallResult",
     "Tool",
     "DisplayInfo",
 ]
@@ -155,6 +159,54 @@ class ToolResult(BaseModel):
             return result
         return {"success": False, "error": self.error}
 
+    def to_llm_dict(self) -> dict[str, Any]:
+        """Convert to dictionary for the LLM conversation history.
+
+        Same as to_dict(), except list-shaped data (a bare list, or the
+        "items" list of a paginated response) is encoded as a dense table
+        (see tabular.encode_table) when that is smaller. Metadata is
+        computed from the original data, so counts stay accurate.
+        """
+        result = self.to_dict()
+        if not self.success:
+            return result
+        if isinstance(self.data, dict) and isinstance(self.data.get("items"), list):
+            table = encode_table(self.data["items"])
+            if table is not None:
+                result["data"] = {**self.data, "items": table}
+        else:
+            table = encode_table(self.data)
+            if table is not None:
+                result["data"] = table
+        return result
+
+
+class BatchCallResult(BaseModel):
+    """Result of one call in ToolExecutor.execute_batch.
+
+    Attributes:
+        tool: Name of the tool that was called
+        result: The tool result
+        queued_ms: Time spent waiting for a concurrency slot
+        duration_ms: Time spent executing (including rate limiter waits)
+    """
+
+    tool: str
+    result: ToolResult
+    queued_ms: float = 0.0
+    duration_ms: float = 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary for the batch MCP response."""
+        return {
+            "tool": self.tool,
+            **self.result.to_dict(),
+            "timing": {
+                "queued_ms": round(self.queued_ms, 1),
+                "duration_ms": round(self.duration_ms, 1),
+            },
+        }
+
 
 @runtime_checkable
 class Tool(Protocol):
@@ -79,6 +79,14 @@ class LiteLLMProvider:
                 return f"anthropic/{self.model}"
         return self.model
 
+    @property
+    def context_window(self) -> int | None:
+        """Max input tokens of the model, or None if LiteLLM does not know it."""
+        try:
+            return _get_litellm().get_model_info(self._get_litellm_model()).get("max_input_tokens")
+        except Exception:
+            return None
+
     async def complete(
         self,
         prompt: str,
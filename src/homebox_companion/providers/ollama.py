@@ -29,6 +29,9 @@ from typing import Any, AsyncIterator
 import httpx
 from loguru import logger
 
+from ..core.config import settings
+from ..core.transport import get_transport_registry
+
 
 class OllamaError(Exception):
     """Base exception for Ollama-related errors."""
@@ -61,6 +64,7 @@ class OllamaProvider:
         base_url: Base URL of the Ollama server
         model: Default model to use for completions
         timeout: Request timeout in seconds
+        num_ctx: Context window (tokens) requested for text completions
     """
 
     # Default extraction prompt for device labels
@@ -85,6 +89,7 @@ Be precise - only include what you can clearly read."""
         base_url: str = "http://localhost:11434",
         model: str = "minicpm-v",
         timeout: float = 120.0,
+        num_ctx: int | None = None,
     ):
         """Initialize the Ollama provider.
 
@@ -92,19 +97,36 @@ Be precise - only include what you can clearly read."""
             base_url: Base URL of the Ollama server (default: localhost:11434)
             model: Default model to use (default: minicpm-v)
             timeout: Request timeout in seconds (default: 120)
+            num_ctx: Context window for text completions. Ollama's own default
+                is only a few thousand tokens and silently truncates longer
+                prompts. Defaults to HBC_OLLAMA_NUM_CTX.
         """
         self.base_url = base_url.rstrip("/")
         self.model = model
         self.timeout = timeout
+        self.num_ctx = settings.ollama_num_ctx if num_ctx is None else num_ctx
         self._client: httpx.AsyncClient | None = None
 
     @property
     def client(self) -> httpx.AsyncClient:
-        """Get or create the HTTP client."""
+        """Get or create the HTTP client.
+
+        Uses the shared connection pool for this Ollama host when the app
+        has started a transport registry.
+        """
         if self._client is None or self._client.is_closed:
-            self._client = httpx.AsyncClient(timeout=self.timeout)
+            registry = get_transport_registry()
+            if registry is not None:
+                self._client = registry.client_for(self.base_url, timeout=self.timeout)
+            else:
+                self._client = httpx.AsyncClient(timeout=self.timeout)
         return self._client
 
+    @property
+    def context_window(self) -> int:
+        """Context window (tokens) of text completions."""
+        return self.num_ctx
+
     async def close(self) -> None:
         """Close the HTTP client."""
         if self._client is not None and not self._client.is_closed:
@@ -493,6 +515,7 @@ Be precise - only include what you can clearly read."""
             "model": model,
             "prompt": prompt,
             "stream": False,
+            "options": {"num_ctx": self.num_ctx},
         }
 
         if system:
@@ -534,6 +557,7 @@ Be precise - only include what you can clearly read."""
             "model": model,
             "messages": messages,
             "stream": False,
+            "options": {"num_ctx": self.num_ctx},
         }
 
         if format_json:
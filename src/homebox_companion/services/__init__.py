@@ -5,6 +5,8 @@ This module contains service classes that implement business logic:
 - GPUDetector: Hardware GPU detection for model selection
 - OllamaManager: Ollama lifecycle management
 - DuplicateDetector: Multi-strategy duplicate detection (serial, model, name)
+- InventoryMirror: Shared, differentially synced copy of items, locations and labels
+- ItemSearchIndex: Local full-text item search (BM25, prefix and typo tolerant)
 """
 
 from __future__ import annotations
@@ -17,7 +19,9 @@ from .duplicate_detector import (
     MatchType,
 )
 from .gpu_detector import GPUDetector, GPUInfo, GPUVendor, detect_gpu
+from .inventory_mirror import InventoryChanges, InventoryMirror, get_inventory_mirror
 from .ollama_manager import OllamaManager, OllamaMode, OllamaStatus
+from .search_index import ItemSearchIndex, SearchHit, get_item_search_index
 from .state_manager import ImageState, StateManager
 
 __all__ = [
@@ -39,4 +43,12 @@ __all__ = [
     "ExistingItem",
     "IndexStatus",
     "MatchType",
+    # Inventory mirror
+    "InventoryMirror",
+    "InventoryChanges",
+    "get_inventory_mirror",
+    # Item search
+    "ItemSearchIndex",
+    "SearchHit",
+    "get_item_search_index",
 ]
@@ -12,7 +12,8 @@ The multi-strategy approach helps catch duplicates even when:
 
 Features:
 - Persistent index storage (survives restarts)
-- Differential updates using asset IDs (only fetch new items)
+- Differential updates using asset IDs (only fetch new items), read from the
+  shared inventory mirror once it has synced
 - Manual rebuild capability
 - Incremental updates when items are created
 - Uses export endpoint for efficient bulk data retrieval
@@ -38,6 +39,7 @@ from typing import TYPE_CHECKING, Any
 from loguru import logger
 
 from ..core.config import settings
+from .inventory_mirror import DETAIL_FIELDS, get_inventory_mirror
 
 if TYPE_CHECKING:
     from ..homebox import HomeboxClient
@@ -345,6 +347,14 @@ class DuplicateDetector:
             is_loaded=self._is_loaded,
         )
 
+    def model_items(self) -> list[tuple[str, ExistingItem]]:
+        """Get indexed items with a manufacturer and model number.
+
+        Returns:
+            (normalized "MANUFACTURER|MODEL" key, item) pairs, sorted by key.
+        """
+        return sorted(self._model_index.items(), key=lambda entry: entry[0])
+
     def _parse_export_csv(self, csv_data: str) -> list[dict[str, Any]]:
         """Parse CSV export data from Homebox.
 
@@ -635,14 +645,18 @@ class DuplicateDetector:
             f"Starting differential update (highest known asset ID: {self._highest_asset_id})"
         )
 
-        # Fetch all items to compare
-        try:
-            response = await self._client.list_items(token)
-            # list_items returns paginated response: {items: [...], page, pageSize, total}
-            item_summaries = response.get("items", [])
-        except Exception as e:
-            logger.warning(f"Failed to fetch items for differential update: {e}")
-            return 0
+        # Fetch all items to compare (from the inventory mirror when it has synced)
+        mirror = get_inventory_mirror()
+        if mirror.is_ready_for(token):
+            item_summaries = mirror.items
+        else:
+            try:
+                response = await self._client.list_items(token)
+                # list_items returns paginated response: {items: [...], page, pageSize, total}
+                item_summaries = response.get("items", [])
+            except Exception as e:
+                logger.warning(f"Failed to fetch items for differential update: {e}")
+                return 0
 
         if not item_summaries:
             return 0
@@ -674,10 +688,16 @@ class DuplicateDetector:
         # Update total count
         self._total_items = len(item_summaries)
 
-        # Fetch details for new items only
+        # Mirrored records already carry the detail fields; fetch the rest
+        undetailed = []
+        for item in new_items:
+            if all(name in item for name in DETAIL_FIELDS):
+                self._add_detail_to_index(item)
+            else:
+                undetailed.append(item)
         await self._fetch_and_index_items(
             token,
-            new_items,
+            undetailed,
             max_concurrent=max_concurrent,
         )
 
@@ -20,13 +20,22 @@ Privacy considerations:
 """
 
 import asyncio
+import codecs
 import hashlib
 import json
 import re
+import sqlite3
+import threading
 import time
+from collections import OrderedDict
+from contextlib import aclosing, asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from collections.abc import AsyncIterator, Iterable, Iterator, Sequence
 from dataclasses import dataclass, asdict, field
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, TYPE_CHECKING
+from urllib.parse import urlsplit
 
 import httpx
 from loguru import logger
@@ -34,6 +43,9 @@ from loguru import logger
 if TYPE_CHECKING:
     from homebox_companion.providers.base import BaseProvider
 
+from homebox_companion.core.config import settings
+from homebox_companion.core.single_flight import SingleFlight
+from homebox_companion.core.transport import get_transport_registry
 from homebox_companion.services.debug_logger import debug_log
 from homebox_companion.services.search_providers import (
     BaseSearchProvider,
@@ -42,13 +54,286 @@ from homebox_companion.services.search_providers import (
     TavilySearchProvider,
     GoogleCSESearchProvider,
     SearXNGSearchProvider,
+    SearchUsage,
+    get_search_cache,
+    track_search_usage,
 )
 
+# Enrichment results kept in the cache's in-memory LRU
+_CACHE_MEMORY_ENTRIES = 512
+
+# Seconds between background sweeps of expired enrichment cache entries
+_CACHE_SWEEP_INTERVAL = 600.0
+
+# Max keys per bulk cache lookup query (SQLite host parameter limit)
+_CACHE_QUERY_CHUNK = 500
+
+# Max chars of search/retailer content sent to the AI per product
+_SEARCH_CONTENT_CHARS = 8000
+
+# Max products parsed by one packed AI call (bounds the response size)
+_PACK_MAX_ITEMS = 8
+
+# Max bytes of a retailer page read before parsing what has arrived
+_PAGE_MAX_BYTES = 1_048_576
+
+# Visible price mentions after which the rest of a retailer page is skipped
+_PAGE_ENOUGH_PRICES = 5
+
+# Streamed retailer page scanning (see _PageScanner)
+_BLOCK_START_RE = re.compile(r'<(script|style)\b([^>]*)>', re.IGNORECASE)
+_BLOCK_END_RES = {
+    "script": re.compile(r'</script\s*>', re.IGNORECASE),
+    "style": re.compile(r'</style\s*>', re.IGNORECASE),
+}
+_BLOCK_END_CARRY = 32  # Longest end-tag prefix carried over a chunk boundary
+_VISIBLE_PRICE_RE = re.compile(r'(?:[$€£]|USD\s*)\d[\d,]*(?:\.\d+)?', re.IGNORECASE)
+_JSON_LD_PRICE_RE = re.compile(r'"price"[:\s]*["\']?([\d,.]+)["\']?')
+
+# Retailer domain health and politeness (see RetailerDomainHealth)
+_DOMAIN_CONCURRENCY = 2  # Requests in flight per retailer domain
+_DOMAIN_MIN_INTERVAL = 0.5  # Seconds between request starts per domain
+_DOMAIN_BACKOFF_BASE = 60.0  # Seconds a failing domain is skipped (doubles per failure)
+_DOMAIN_BACKOFF_MAX = 3600.0
+_DOMAIN_DEFAULT_LATENCY = 1.0  # Assumed response time (seconds) of domains not fetched yet
+_DOMAIN_LATENCY_WEIGHT = 0.3  # Weight of the newest sample in a domain's latency average
 
 # =============================================================================
 # URL CONTENT FETCHER
 # =============================================================================
 
+def _json_ld_offer_price(block: str) -> str | None:
+    """Find the offer price (offers.price or offers.lowPrice) in a JSON-LD block."""
+    try:
+        data = json.loads(block)
+    except ValueError:
+        # Malformed JSON-LD is common; fall back to the first price-like field
+        match = _JSON_LD_PRICE_RE.search(block)
+        return match.group(1) if match else None
+
+    stack = [data]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, list):
+            stack.extend(node)
+            continue
+        if not isinstance(node, dict):
+            continue
+        offers = node.get("offers")
+        for offer in offers if isinstance(offers, list) else [offers]:
+            if isinstance(offer, dict):
+                price = offer.get("price", offer.get("lowPrice"))
+                if price not in (None, ""):
+                    return str(price)
+        stack.extend(value for value in node.values() if isinstance(value, dict | list))
+    return None
+
+
+class _PageScanner:
+    """Scans streamed HTML for prices as it arrives.
+
+    Script and style blocks are skipped, except that JSON-LD blocks are
+    searched for an offer price. Text outside those blocks is searched for
+    visible price mentions. While a block is open only the new text is
+    searched for its end tag, so feeding a page costs roughly one pass over
+    it however it is chunked.
+    """
+
+    def __init__(self) -> None:
+        self._parts: list[str] = []
+        self._pending = ""
+        self._block: str | None = None
+        self._block_json_ld = False
+        self._block_parts: list[str] = []
+        self.json_ld_price: str | None = None
+        self.visible_prices = 0
+
+    @property
+    def html(self) -> str:
+        """The HTML received so far."""
+        return "".join(self._parts)
+
+    @property
+    def done(self) -> bool:
+        """Whether enough price information has been seen."""
+        return self.json_ld_price is not None or self.visible_prices >= _PAGE_ENOUGH_PRICES
+
+    def feed(self, chunk: str) -> bool:
+        """Add a chunk of HTML. Returns True once enough prices were found."""
+        self._parts.append(chunk)
+        text = self._pending + chunk
+        self._pending = text[self._scan(text):]
+        return self.done
+
+    def _scan(self, text: str) -> int:
+        """Scan complete markup in text. Returns the offset scanned up to."""
+        pos = 0
+        while not self.done:
+            if self._block is not None:
+                block_end = _BLOCK_END_RES[self._block].search(text, pos)
+                if block_end is None:
+                    # Only a possibly split end tag is carried to the next chunk
+                    last_tag = text.rfind("<", max(pos, len(text) - _BLOCK_END_CARRY))
+                    scanned = last_tag if last_tag != -1 else len(text)
+                    if self._block_json_ld:
+                        self._block_parts.append(text[pos:scanned])
+                    return scanned
+                if self._block_json_ld:
+                    self._block_parts.append(text[pos:block_end.start()])
+                    self.json_ld_price = _json_ld_offer_price("".join(self._block_parts).strip())
+                self._block = None
+                self._block_parts = []
+                pos = block_end.end()
+                continue
+
+            block = _BLOCK_START_RE.search(text, pos)
+            if block is None:
+                # Leave a possibly incomplete tag (or number) for the next chunk
+                last_tag = text.rfind("<", pos)
+                visible_end = last_tag if last_tag != -1 else len(text)
+                self.visible_prices += len(_VISIBLE_PRICE_RE.findall(text, pos, visible_end))
+                return visible_end
+
+            self.visible_prices += len(_VISIBLE_PRICE_RE.findall(text, pos, block.start()))
+            self._block = block.group(1).lower()
+            self._block_json_ld = "ld+json" in block.group(2).lower() and self.json_ld_price is None
+            pos = block.end()
+        return pos
+
+
+def _is_domain_failure(status_code: int) -> bool:
+    """Whether a status means the whole domain is blocking, throttling or down."""
+    return status_code in (403, 429) or status_code >= 500
+
+
+def _retry_after(value: str | None) -> float | None:
+    """Parse a Retry-After header given in seconds (HTTP dates are ignored)."""
+    try:
+        return float(value) if value else None
+    except ValueError:
+        return None
+
+
+@dataclass
+class _DomainState:
+    """Health of one retailer domain."""
+
+    slots: asyncio.Semaphore = field(default_factory=lambda: asyncio.Semaphore(_DOMAIN_CONCURRENCY))
+    next_start: float = 0.0
+    failures: int = 0
+    blocked_until: float = 0.0
+    latency: float | None = None
+    last_error: str = ""
+    skipped: int = 0
+
+
+class RetailerDomainHealth:
+    """Per-domain health table for retailer page fetches.
+
+    - A domain that answers 403/429/5xx, times out or refuses connections is
+      skipped for an exponential backoff (1 min, doubling per consecutive
+      failure up to 1 h, or longer if it sent Retry-After)
+    - At most _DOMAIN_CONCURRENCY requests per domain run at once, and their
+      starts are spaced at least _DOMAIN_MIN_INTERVAL apart
+    - A moving average of each domain's response time is kept, so callers
+      can fetch from fast domains first
+
+    Not thread-safe; intended for use from a single event loop.
+    """
+
+    def __init__(self) -> None:
+        self._domains: dict[str, _DomainState] = {}
+
+    @staticmethod
+    def domain_of(url: str) -> str:
+        """Get the domain a URL's health is tracked under."""
+        host = (urlsplit(url).hostname or "").lower()
+        return host.removeprefix("www.")
+
+    def _state(self, domain: str) -> _DomainState:
+        state = self._domains.get(domain)
+        if state is None:
+            state = self._domains[domain] = _DomainState()
+        return state
+
+    def is_available(self, domain: str) -> bool:
+        """Check whether a domain may be fetched (not backing off)."""
+        state = self._domains.get(domain)
+        if state is None or time.monotonic() >= state.blocked_until:
+            return True
+        state.skipped += 1
+        return False
+
+    def expected_latency(self, domain: str) -> float:
+        """Recent average response time of a domain in seconds."""
+        state = self._domains.get(domain)
+        if state is None or state.latency is None:
+            return _DOMAIN_DEFAULT_LATENCY
+        return state.latency
+
+    @asynccontextmanager
+    async def slot(self, domain: str) -> AsyncIterator[None]:
+        """Hold one of a domain's request slots, respecting its request rate."""
+        state = self._state(domain)
+        async with state.slots:
+            now = time.monotonic()
+            start = max(now, state.next_start)
+            state.next_start = start + _DOMAIN_MIN_INTERVAL
+            if start > now:
+                await asyncio.sleep(start - now)
+            yield
+
+    def record_success(self, domain: str, elapsed: float) -> None:
+        """Record a response from a domain and its response time."""
+        state = self._state(domain)
+        if state.failures:
+            logger.info(f"Retailer domain {domain} is responding again")
+        state.failures = 0
+        state.blocked_until = 0.0
+        state.last_error = ""
+        if state.latency is None:
+            state.latency = elapsed
+        else:
+            state.latency += _DOMAIN_LATENCY_WEIGHT * (elapsed - state.latency)
+
+    def record_failure(self, domain: str, reason: str, retry_after: float | None = None) -> None:
+        """Record a blocked, throttled or unreachable domain and back off from it."""
+        state = self._state(domain)
+        state.failures += 1
+        backoff = min(_DOMAIN_BACKOFF_BASE * 2 ** (state.failures - 1), _DOMAIN_BACKOFF_MAX)
+        if retry_after:
+            backoff = max(backoff, min(retry_after, _DOMAIN_BACKOFF_MAX))
+        state.blocked_until = time.monotonic() + backoff
+        state.last_error = reason
+        logger.warning(f"Retailer domain {domain} failed ({reason}), skipping it for {backoff:.0f}s")
+
+    def stats(self) -> dict[str, dict[str, Any]]:
+        """Get per-domain health for debug output."""
+        now = time.monotonic()
+        return {
+            domain: {
+                "latency_ms": round(state.latency * 1000) if state.latency is not None else None,
+                "consecutive_failures": state.failures,
+                "retry_after_seconds": round(max(0.0, state.blocked_until - now), 1),
+                "last_error": state.last_error,
+                "skipped_requests": state.skipped,
+            }
+            for domain, state in self._domains.items()
+        }
+
+
+# Singleton instance (initialized lazily)
+_domain_health: RetailerDomainHealth | None = None
+
+
+def get_retailer_domain_health() -> RetailerDomainHealth:
+    """Get the shared retailer domain health table."""
+    global _domain_health
+    if _domain_health is None:
+        _domain_health = RetailerDomainHealth()
+    return _domain_health
+
+
 class URLContentFetcher:
     """Fetches and extracts content from retailer URLs."""
 
@@ -97,23 +382,50 @@ class URLContentFetcher:
         "ajmadison.com",
     }
 
-    def __init__(self, timeout: float = 10.0, custom_domains: list[str] | None = None):
+    # Browser-like request headers (some retailers block obvious bots)
+    REQUEST_HEADERS = {
+        # Use a realistic browser User-Agent
+        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36",
+        "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8",
+        "Accept-Language": "en-US,en;q=0.9",
+        "Accept-Encoding": "gzip, deflate, br",
+        "Connection": "keep-alive",
+        "Upgrade-Insecure-Requests": "1",
+        "Sec-Fetch-Dest": "document",
+        "Sec-Fetch-Mode": "navigate",
+        "Sec-Fetch-Site": "none",
+        "Sec-Fetch-User": "?1",
+        "Cache-Control": "max-age=0",
+    }
+
+    def __init__(
+        self,
+        timeout: float = 10.0,
+        custom_domains: list[str] | None = None,
+        domain_health: RetailerDomainHealth | None = None,
+    ):
         """
         Initialize the URL content fetcher.
 
         Args:
             timeout: Request timeout in seconds
             custom_domains: Additional retailer domains to recognize
+            domain_health: Domain health table (defaults to the shared one)
         """
         self.timeout = timeout
-        # Combine default domains with custom ones
+        self._domain_health = domain_health or get_retailer_domain_health()
         self._retailer_domains = set(self.DEFAULT_RETAILER_DOMAINS)
-        if custom_domains:
-            # Normalize custom domains (lowercase, strip whitespace)
-            normalized = {d.lower().strip() for d in custom_domains if d.strip()}
-            self._retailer_domains.update(normalized)
-            if normalized:
-                logger.info(f"Added {len(normalized)} custom retailer domains")
+        # Shared client, used when no transport registry is active
+        self._client: httpx.AsyncClient | None = None
+        self.set_custom_domains(custom_domains)
+
+    def set_custom_domains(self, custom_domains: list[str] | None) -> None:
+        """Recognize additional retailer domains besides the built-in ones."""
+        # Normalize custom domains (lowercase, strip whitespace)
+        normalized = {d.lower().strip() for d in custom_domains or [] if d.strip()}
+        self._retailer_domains = self.DEFAULT_RETAILER_DOMAINS | normalized
+        if normalized:
+            logger.debug(f"Added {len(normalized)} custom retailer domains")
 
     def is_retailer_url(self, url: str) -> bool:
         """Check if URL is from a known retailer."""
@@ -137,115 +449,148 @@ class URLContentFetcher:
 
     def _extract_price_context(self, text: str, window: int = 200) -> str:
         """Extract text around price mentions."""
-        # Find price patterns - support multiple formats:
-        # $199.00, $199, USD 199.00, 199.00 USD, €199, £199
-        price_patterns = [
-            r'\$[\d,]+\.?\d*',           # $199.00
-            r'USD\s*[\d,]+\.?\d*',        # USD 199.00
-            r'[\d,]+\.?\d*\s*USD',        # 199.00 USD
-            r'€[\d,]+\.?\d*',             # €199.00
-            r'£[\d,]+\.?\d*',             # £199.00
-            r'(?:price|cost|msrp)[:\s]*[\d,]+\.?\d*',  # price: 199.00
-        ]
-
-        all_matches = []
-        for pattern in price_patterns:
-            matches = list(re.finditer(pattern, text, re.IGNORECASE))
-            all_matches.extend(matches)
-
-        if not all_matches:
+        # Price formats: $199.00, $199, USD 199.00, 199.00 USD, €199, £199,
+        # price: 199.00 (see extract_candidates)
+        mentions = extract_candidates(text, max_prices=5).prices  # Limit to first 5 prices
+        if not mentions:
             return ""
 
-        # Sort by position and deduplicate overlapping matches
-        all_matches.sort(key=lambda m: m.start())
-
         # Get context around each price mention
         contexts = []
-        for match in all_matches[:5]:  # Limit to first 5 prices
-            start = max(0, match.start() - window)
-            end = min(len(text), match.end() + window)
+        for mention in mentions:
+            start = max(0, mention.start - window)
+            end = min(len(text), mention.end + window)
             context = text[start:end].strip()
             if context and context not in contexts:
                 contexts.append(context)
 
         return "\n---\n".join(contexts)
 
+    def _extract_page_text(self, html: str) -> tuple[str, str]:
+        """Strip a page to text and find its price context (CPU-bound)."""
+        text = self._strip_html(html)
+        return text, self._extract_price_context(text)
+
+    def _client_for(self, url: str) -> httpx.AsyncClient:
+        """Get an HTTP client for a URL, reusing pooled connections."""
+        # Enable cookies to handle session-based bot protection
+        registry = get_transport_registry()
+        if registry is not None:
+            return registry.client_for(url, timeout=self.timeout, follow_redirects=True, cookies={})
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(timeout=self.timeout, follow_redirects=True)
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the fetcher's shared client (registry pools stay open)."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def _read_page(self, response: httpx.Response) -> _PageScanner:
+        """Stream a page body until it is complete, too large, or has its price."""
+        try:
+            decoder = codecs.getincrementaldecoder(response.encoding or "utf-8")(errors="replace")
+        except LookupError:
+            decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        scanner = _PageScanner()
+        received = 0
+        async for chunk in response.aiter_bytes():
+            received += len(chunk)
+            if scanner.feed(decoder.decode(chunk)):
+                logger.debug(f"Stopped reading {response.url} after {received} bytes: price found")
+                break
+            if received >= _PAGE_MAX_BYTES:
+                logger.debug(f"Stopped reading {response.url} at {received} bytes: size limit")
+                break
+        else:
+            scanner.feed(decoder.decode(b"", final=True))
+        return scanner
+
     async def fetch_url_content(self, url: str) -> str | None:
-        """Fetch and extract text content from a URL."""
+        """
+        Fetch and extract text content from a URL.
+
+        The page is streamed and reading stops after _PAGE_MAX_BYTES, or as
+        soon as a JSON-LD offer price or enough visible prices have arrived.
+        HTML stripping runs in a worker thread.
+        """
+        domain = self._domain_health.domain_of(url)
         try:
-            async with httpx.AsyncClient(
-                timeout=self.timeout,
-                follow_redirects=True,
-                # Enable cookies to handle session-based bot protection
-                cookies={},
-            ) as client:
-                headers = {
-                    # Use a realistic browser User-Agent
-                    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36",
-                    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8",
-                    "Accept-Language": "en-US,en;q=0.9",
-                    "Accept-Encoding": "gzip, deflate, br",
-                    "Connection": "keep-alive",
-                    "Upgrade-Insecure-Requests": "1",
-                    "Sec-Fetch-Dest": "document",
-                    "Sec-Fetch-Mode": "navigate",
-                    "Sec-Fetch-Site": "none",
-                    "Sec-Fetch-User": "?1",
-                    "Cache-Control": "max-age=0",
-                }
-                response = await client.get(url, headers=headers)
-                response.raise_for_status()
-
-                # Only process HTML
-                content_type = response.headers.get("content-type", "")
-                if "text/html" not in content_type:
-                    logger.debug(f"Skipping non-HTML content: {content_type}")
+            async with self._domain_health.slot(domain):
+                # Another fetch may have failed on this domain while we waited
+                if not self._domain_health.is_available(domain):
+                    logger.debug(f"Skipping {url[:60]}: {domain} is backing off")
                     return None
-
-                html = response.text
-                logger.info(f"Fetched {len(html)} bytes of HTML from {url[:60]}...")
-
-                text = self._strip_html(html)
-                logger.info(f"Stripped to {len(text)} chars of text")
-                # Log a preview of the text for debugging
-                logger.debug(f"Text preview: {text[:500]}...")
-
-                # Extract price context for efficiency
-                price_context = self._extract_price_context(text)
-                if price_context:
-                    logger.info(f"Found price context: {len(price_context)} chars with prices")
-                    return price_context
-
-                # If no prices found in text, try to find JSON-LD structured data
-                # Many retailers embed price in JSON-LD schema
-                json_ld_match = re.search(r'<script[^>]*type=["\']application/ld\+json["\'][^>]*>(.*?)</script>', html, re.DOTALL | re.IGNORECASE)
-                if json_ld_match:
-                    json_ld_content = json_ld_match.group(1).strip()
-                    # Look for price patterns in the JSON-LD
-                    price_in_json = re.search(r'"price"[:\s]*["\']?([\d,.]+)["\']?', json_ld_content)
-                    if price_in_json:
-                        logger.info(f"Found price in JSON-LD structured data: ${price_in_json.group(1)}")
-                        return f"Product price from structured data: ${price_in_json.group(1)}\n\n{text[:2000]}"
-
-                # Return page content even without explicit prices
-                # The AI might still extract useful specs
-                if len(text) > 100:
-                    logger.info(f"No prices found in text, returning {min(len(text), 2000)} chars anyway")
-                    return text[:2000]
-
-                logger.warning(f"Page content too short after stripping: {len(text)} chars")
+                scanner = await self._fetch_page(url, domain)
+            if scanner is None:
                 return None
 
+            html = scanner.html
+            logger.info(f"Fetched {len(html)} chars of HTML from {url[:60]}...")
+
+            text, price_context = await asyncio.to_thread(self._extract_page_text, html)
+            logger.info(f"Stripped to {len(text)} chars of text")
+            # Log a preview of the text for debugging
+            logger.debug(f"Text preview: {text[:500]}...")
+
+            # Extract price context for efficiency
+            if price_context:
+                logger.info(f"Found price context: {len(price_context)} chars with prices")
+                return price_context
+
+            # If no prices found in text, use the JSON-LD structured data
+            # Many retailers embed price in JSON-LD schema
+            if scanner.json_ld_price:
+                logger.info(f"Found price in JSON-LD structured data: ${scanner.json_ld_price}")
+                return f"Product price from structured data: ${scanner.json_ld_price}\n\n{text[:2000]}"
+
+            # Return page content even without explicit prices
+            # The AI might still extract useful specs
+            if len(text) > 100:
+                logger.info(f"No prices found in text, returning {min(len(text), 2000)} chars anyway")
+                return text[:2000]
+
+            logger.warning(f"Page content too short after stripping: {len(text)} chars")
+            return None
+
         except httpx.HTTPStatusError as e:
-            logger.warning(f"HTTP {e.response.status_code} fetching {url[:60]}")
+            status = e.response.status_code
+            logger.warning(f"HTTP {status} fetching {url[:60]}")
+            if _is_domain_failure(status):
+                self._domain_health.record_failure(
+                    domain, f"HTTP {status}", _retry_after(e.response.headers.get("retry-after"))
+                )
             return None
         except httpx.TimeoutException:
             logger.warning(f"Timeout fetching {url[:60]}")
+            self._domain_health.record_failure(domain, "timeout")
+            return None
+        except httpx.TransportError as e:
+            logger.warning(f"Failed to fetch {url[:60]}: {type(e).__name__}: {e}")
+            self._domain_health.record_failure(domain, type(e).__name__)
             return None
         except Exception as e:
             logger.warning(f"Failed to fetch {url[:60]}: {type(e).__name__}: {e}")
             return None
 
+    async def _fetch_page(self, url: str, domain: str) -> _PageScanner | None:
+        """Request a page and stream its HTML. Returns None for non-HTML content."""
+        started = time.monotonic()
+        client = self._client_for(url)
+        async with client.stream("GET", url, headers=self.REQUEST_HEADERS) as response:
+            if not _is_domain_failure(response.status_code):
+                self._domain_health.record_success(domain, time.monotonic() - started)
+            response.raise_for_status()
+
+            # Only process HTML
+            content_type = response.headers.get("content-type", "")
+            if "text/html" not in content_type:
+                logger.debug(f"Skipping non-HTML content: {content_type}")
+                return None
+
+            return await self._read_page(response)
+
     async def fetch_retailer_content(
         self,
         search_results: list[SearchResult],
@@ -258,18 +603,25 @@ class URLContentFetcher:
             search_results: List of search results to check
             max_urls: Maximum number of URLs to fetch
 
+        Domains that are backing off after failures are skipped, and
+        domains that responded fast recently are fetched first.
+
         Returns:
             Combined content from retailer pages
         """
+        health = self._domain_health
+
         # Find retailer URLs
         retailer_urls = []
         for result in search_results:
             is_retailer = self.is_retailer_url(result.url)
             logger.debug(f"URL check: {result.url[:60]} -> retailer={is_retailer}")
-            if is_retailer:
-                retailer_urls.append(result.url)
-                if len(retailer_urls) >= max_urls:
-                    break
+            if not is_retailer:
+                continue
+            if not health.is_available(health.domain_of(result.url)):
+                logger.info(f"Skipping {result.url[:60]}: domain is backing off after failures")
+                continue
+            retailer_urls.append(result.url)
 
         if not retailer_urls:
             # Log the actual URLs we received to help debugging
@@ -277,6 +629,10 @@ class URLContentFetcher:
             logger.info(f"No retailer URLs found in {len(search_results)} results. URLs: {all_urls}")
             return ""
 
+        # Prefer fast domains; the sort is stable, so search rank breaks ties
+        retailer_urls.sort(key=lambda url: health.expected_latency(health.domain_of(url)))
+        retailer_urls = retailer_urls[:max_urls]
+
         logger.info(f"Fetching content from {len(retailer_urls)} retailer URLs")
 
         # Fetch URLs in parallel
@@ -341,71 +697,541 @@ class EnrichmentResult:
 
 
 class EnrichmentCache:
-    """File-based cache for enrichment results."""
+    """SQLite-backed cache for enrichment results with an in-memory LRU front.
+
+    All results live in one database file (enrichment.db in the cache
+    directory) instead of one JSON file per product. Recently used results
+    are also kept in memory, so repeated lookups skip the database.
+
+    - Expired entries are dropped on read and by a background sweep
+    - Total size is capped by max_entries and max_bytes; the least
+      recently used entries are evicted first. Entry count and byte total
+      are kept as running totals, so writes do not scan the table
+    - get_many() looks up many products in one query
+    - aget(), aget_many() and aset() are for async code: the in-memory LRU
+      is used directly and database work runs in a worker thread;
+      peek_many() only looks at the in-memory LRU
+    - Legacy per-product JSON files in the directory are imported once
+
+    Thread-safety: The in-memory LRU has its own lock, held only for
+    dictionary operations, so memory hits never wait on SQLite. Database
+    access and the running totals are guarded by a second lock; the SQLite
+    connection is shared with the sweeper thread.
+    """
 
-    def __init__(self, cache_dir: Path, ttl_seconds: int = 86400):
+    def __init__(
+        self,
+        cache_dir: Path,
+        ttl_seconds: int = 86400,
+        max_entries: int | None = None,
+        max_bytes: int | None = None,
+        memory_entries: int = _CACHE_MEMORY_ENTRIES,
+        sweep_interval: float = _CACHE_SWEEP_INTERVAL,
+    ):
         """
         Initialize cache.
 
         Args:
-            cache_dir: Directory to store cache files
+            cache_dir: Directory holding the cache database
             ttl_seconds: Time-to-live in seconds (default: 24 hours)
+            max_entries: Max cached products (default: HBC_ENRICHMENT_CACHE_MAX_ENTRIES)
+            max_bytes: Max total payload size (default: HBC_ENRICHMENT_CACHE_MAX_MB)
+            memory_entries: Results kept in the in-memory LRU
+            sweep_interval: Seconds between background sweeps (0 = no sweeper thread)
         """
         self.cache_dir = cache_dir
         self.cache_dir.mkdir(parents=True, exist_ok=True)
         self.ttl = ttl_seconds
+        self.max_entries = (
+            settings.enrichment_cache_max_entries if max_entries is None else max_entries
+        )
+        self.max_bytes = (
+            settings.enrichment_cache_max_mb * 1024 * 1024 if max_bytes is None else max_bytes
+        )
+        self._memory_entries = memory_entries
+        # cache key -> (result, created_at)
+        self._memory: OrderedDict[str, tuple[EnrichmentResult, float]] = OrderedDict()
+        # Access times of memory hits, written to the database by the sweep
+        self._touched: dict[str, float] = {}
+        # Guards _memory and _touched; never held while waiting for _db_lock
+        self._memory_lock = threading.Lock()
+        # Guards the connection and the running totals below
+        self._db_lock = threading.RLock()
+        self._count = 0
+        self._bytes = 0
+
+        self._conn = sqlite3.connect(
+            str(self.cache_dir / "enrichment.db"), check_same_thread=False, isolation_level=None
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("PRAGMA busy_timeout=5000")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS enrichment (
+                key TEXT PRIMARY KEY,
+                payload TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                created_at REAL NOT NULL,
+                last_access REAL NOT NULL
+            ) WITHOUT ROWID
+            """
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS enrichment_last_access ON enrichment (last_access)"
+        )
+        with self._db_lock:
+            self._import_json_files()
+            self._recount()
+            self._enforce_limits()
+
+        self._stop = threading.Event()
+        self._sweeper: threading.Thread | None = None
+        if sweep_interval > 0:
+            self._sweeper = threading.Thread(
+                target=self._sweep_loop,
+                args=(sweep_interval,),
+                name="enrichment-cache-sweeper",
+                daemon=True,
+            )
+            self._sweeper.start()
 
-    def _get_cache_key(self, manufacturer: str, model_number: str) -> str:
+    @staticmethod
+    def _get_cache_key(manufacturer: str, model_number: str) -> str:
         """Generate cache key from product identifiers."""
         key = f"{manufacturer}:{model_number}".lower().strip()
         return hashlib.md5(key.encode()).hexdigest()
 
-    def get(self, manufacturer: str, model_number: str) -> EnrichmentResult | None:
-        """Get cached enrichment result."""
-        cache_key = self._get_cache_key(manufacturer, model_number)
-        cache_file = self.cache_dir / f"{cache_key}.json"
+    def _import_json_files(self) -> None:
+        """Move unexpired legacy one-file-per-product entries into the database.
 
-        if not cache_file.exists():
-            return None
+        Note: Caller must hold self._db_lock.
+        """
+        imported = 0
+        now = time.time()
+        for cache_file in self.cache_dir.glob("*.json"):
+            try:
+                created_at = cache_file.stat().st_mtime
+                if now - created_at <= self.ttl:
+                    payload = json.dumps(json.loads(cache_file.read_text()))
+                    self._conn.execute(
+                        "INSERT OR IGNORE INTO enrichment "
+                        "(key, payload, size, created_at, last_access) VALUES (?, ?, ?, ?, ?)",
+                        (cache_file.stem, payload, len(payload), created_at, created_at),
+                    )
+                    imported += 1
+                cache_file.unlink()
+            except (OSError, json.JSONDecodeError, sqlite3.Error) as e:
+                logger.warning(f"Skipping legacy cache file {cache_file.name}: {e}")
+        if imported:
+            logger.info(f"Imported {imported} legacy enrichment cache files")
+
+    def _recount(self) -> None:
+        """Reload the running entry count and byte total. Caller must hold self._db_lock."""
+        self._count, self._bytes = self._conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM enrichment"
+        ).fetchone()
+
+    def _remember(self, key: str, result: EnrichmentResult, created_at: float) -> None:
+        """Add a result to the in-memory LRU."""
+        with self._memory_lock:
+            self._memory[key] = (result, created_at)
+            self._memory.move_to_end(key)
+            while len(self._memory) > self._memory_entries:
+                self._memory.popitem(last=False)
+
+    def _memory_get(self, key: str, now: float) -> EnrichmentResult | None:
+        """Look up one key in the in-memory LRU only."""
+        with self._memory_lock:
+            entry = self._memory.get(key)
+            if entry is None:
+                return None
+            result, created_at = entry
+            if now - created_at > self.ttl:
+                del self._memory[key]
+                return None
+            self._memory.move_to_end(key)
+            self._touched[key] = now
+            return result
 
-        # Check TTL
-        if time.time() - cache_file.stat().st_mtime > self.ttl:
-            cache_file.unlink()
-            logger.debug(f"Cache expired for {manufacturer} {model_number}")
-            return None
+    def _delete(self, key: str, size: int) -> None:
+        """Delete one database row. Caller must hold self._db_lock."""
+        if self._conn.execute("DELETE FROM enrichment WHERE key = ?", (key,)).rowcount:
+            self._count -= 1
+            self._bytes -= size
 
+    def _load_row(
+        self, key: str, payload: str, created_at: float, now: float
+    ) -> EnrichmentResult | None:
+        """Decode a database row, dropping it if expired or corrupt.
+
+        Note: Caller must hold self._db_lock.
+        """
+        if now - created_at > self.ttl:
+            self._delete(key, len(payload))
+            return None
         try:
-            data = json.loads(cache_file.read_text())
-            logger.debug(f"Cache hit for {manufacturer} {model_number}")
-            return EnrichmentResult.from_dict(data)
+            result = EnrichmentResult.from_dict(json.loads(payload))
         except (json.JSONDecodeError, TypeError) as e:
             logger.warning(f"Failed to read cache: {e}")
-            cache_file.unlink()
+            self._delete(key, len(payload))
             return None
+        self._remember(key, result, created_at)
+        with self._memory_lock:
+            self._touched[key] = now
+        return result
+
+    def _db_get_many(self, keys: list[str], now: float) -> dict[str, EnrichmentResult]:
+        """Look up keys in the database, in chunks."""
+        found: dict[str, EnrichmentResult] = {}
+        try:
+            with self._db_lock:
+                for start in range(0, len(keys), _CACHE_QUERY_CHUNK):
+                    chunk = keys[start : start + _CACHE_QUERY_CHUNK]
+                    rows = self._conn.execute(
+                        "SELECT key, payload, created_at FROM enrichment "
+                        f"WHERE key IN ({','.join('?' * len(chunk))})",
+                        chunk,
+                    ).fetchall()
+                    for key, payload, created_at in rows:
+                        result = self._load_row(key, payload, created_at, now)
+                        if result is not None:
+                            found[key] = result
+        except sqlite3.Error as e:
+            logger.warning(f"Failed to read cache: {e}")
+        return found
+
+    def get(self, manufacturer: str, model_number: str) -> EnrichmentResult | None:
+        """Get cached enrichment result."""
+        key = self._get_cache_key(manufacturer, model_number)
+        now = time.time()
+        result = self._memory_get(key, now)
+        if result is None:
+            result = self._db_get_many([key], now).get(key)
+        if result is not None:
+            logger.debug(f"Cache hit for {manufacturer} {model_number}")
+        return result
+
+    async def aget(self, manufacturer: str, model_number: str) -> EnrichmentResult | None:
+        """Get cached enrichment result, reading the database in a worker thread."""
+        result = self._memory_get(self._get_cache_key(manufacturer, model_number), time.time())
+        if result is not None:
+            logger.debug(f"Cache hit for {manufacturer} {model_number}")
+            return result
+        return await asyncio.to_thread(self.get, manufacturer, model_number)
+
+    def _group_keys(self, products: Iterable[tuple[str, str]]) -> dict[str, list[tuple[str, str]]]:
+        """Map cache keys to the products they cover (normalized duplicates share a key)."""
+        keys: dict[str, list[tuple[str, str]]] = {}
+        for product in products:
+            keys.setdefault(self._get_cache_key(*product), []).append(product)
+        return keys
+
+    def _memory_get_many(
+        self, keys: Iterable[str], now: float
+    ) -> tuple[dict[str, EnrichmentResult], list[str]]:
+        """Look up keys in the in-memory LRU. Returns (found, missing keys)."""
+        found: dict[str, EnrichmentResult] = {}
+        missing: list[str] = []
+        for key in keys:
+            result = self._memory_get(key, now)
+            if result is not None:
+                found[key] = result
+            else:
+                missing.append(key)
+        return found, missing
+
+    def get_many(
+        self, products: Iterable[tuple[str, str]]
+    ) -> dict[tuple[str, str], EnrichmentResult]:
+        """
+        Get cached results for many products at once.
+
+        Args:
+            products: (manufacturer, model_number) pairs
+
+        Returns:
+            Cached results keyed by the given (manufacturer, model_number) pair;
+            products without a valid cache entry are absent.
+        """
+        keys = self._group_keys(products)
+        now = time.time()
+        found, missing = self._memory_get_many(keys, now)
+        if missing:
+            found.update(self._db_get_many(missing, now))
+        return {product: result for key, result in found.items() for product in keys[key]}
+
+    def peek_many(
+        self, products: Iterable[tuple[str, str]]
+    ) -> dict[tuple[str, str], EnrichmentResult]:
+        """Like get_many(), but only consults the in-memory LRU (never blocks on the database)."""
+        keys = self._group_keys(products)
+        found, _ = self._memory_get_many(keys, time.time())
+        return {product: result for key, result in found.items() for product in keys[key]}
+
+    async def aget_many(
+        self, products: Iterable[tuple[str, str]]
+    ) -> dict[tuple[str, str], EnrichmentResult]:
+        """Like get_many(), reading the database in a worker thread."""
+        keys = self._group_keys(products)
+        now = time.time()
+        found, missing = self._memory_get_many(keys, now)
+        if missing:
+            found.update(await asyncio.to_thread(self._db_get_many, missing, now))
+        return {product: result for key, result in found.items() for product in keys[key]}
+
+    def _store(self, key: str, payload: str, now: float) -> None:
+        """Write one row and keep the totals and limits up to date."""
+        try:
+            with self._db_lock:
+                previous = self._conn.execute(
+                    "SELECT size FROM enrichment WHERE key = ?", (key,)
+                ).fetchone()
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO enrichment "
+                    "(key, payload, size, created_at, last_access) VALUES (?, ?, ?, ?, ?)",
+                    (key, payload, len(payload), now, now),
+                )
+                if previous is None:
+                    self._count += 1
+                else:
+                    self._bytes -= previous[0]
+                self._bytes += len(payload)
+                self._enforce_limits()
+        except sqlite3.Error as e:
+            logger.warning(f"Failed to write cache: {e}")
 
     def set(
         self, manufacturer: str, model_number: str, result: EnrichmentResult
     ) -> None:
         """Cache enrichment result."""
-        cache_key = self._get_cache_key(manufacturer, model_number)
-        cache_file = self.cache_dir / f"{cache_key}.json"
+        key = self._get_cache_key(manufacturer, model_number)
+        now = time.time()
+        self._remember(key, result, now)
+        self._store(key, json.dumps(result.to_dict()), now)
+        logger.debug(f"Cached result for {manufacturer} {model_number}")
 
+    async def aset(
+        self, manufacturer: str, model_number: str, result: EnrichmentResult
+    ) -> None:
+        """Cache enrichment result, writing the database in a worker thread.
+
+        The result is in the in-memory LRU (and so visible to lookups) as soon
+        as this is called.
+        """
+        key = self._get_cache_key(manufacturer, model_number)
+        now = time.time()
+        self._remember(key, result, now)
+        await asyncio.to_thread(self._store, key, json.dumps(result.to_dict()), now)
+        logger.debug(f"Cached result for {manufacturer} {model_number}")
+
+    def _enforce_limits(self) -> None:
+        """Evict least recently used entries over the entry/byte caps.
+
+        Note: Caller must hold self._db_lock.
+        """
+        if self._count <= self.max_entries and self._bytes <= self.max_bytes:
+            return
+
+        self._flush_touched()
+        evict: list[str] = []
+        for key, size in self._conn.execute(
+            "SELECT key, size FROM enrichment ORDER BY last_access"
+        ):
+            if self._count <= self.max_entries and self._bytes <= self.max_bytes:
+                break
+            evict.append(key)
+            self._count -= 1
+            self._bytes -= size
+        self._conn.executemany("DELETE FROM enrichment WHERE key = ?", ((k,) for k in evict))
+        with self._memory_lock:
+            for key in evict:
+                self._memory.pop(key, None)
+        logger.debug(f"Evicted {len(evict)} enrichment cache entries")
+
+    def _flush_touched(self) -> None:
+        """Persist access times of in-memory hits. Caller must hold self._db_lock."""
+        with self._memory_lock:
+            touched, self._touched = self._touched, {}
+        if touched:
+            self._conn.executemany(
+                "UPDATE enrichment SET last_access = ? WHERE key = ?",
+                ((accessed, key) for key, accessed in touched.items()),
+            )
+
+    def sweep(self) -> int:
+        """Drop expired entries and persist access times. Returns count of dropped entries."""
+        now = time.time()
         try:
-            cache_file.write_text(json.dumps(result.to_dict(), indent=2))
-            logger.debug(f"Cached result for {manufacturer} {model_number}")
-        except OSError as e:
-            logger.warning(f"Failed to write cache: {e}")
+            with self._db_lock:
+                self._flush_touched()
+                dropped = self._conn.execute(
+                    "DELETE FROM enrichment WHERE created_at < ?", (now - self.ttl,)
+                ).rowcount
+                self._recount()
+        except sqlite3.Error as e:
+            logger.warning(f"Enrichment cache sweep failed: {e}")
+            return 0
+        with self._memory_lock:
+            expired = [k for k, (_, created) in self._memory.items() if now - created > self.ttl]
+            for key in expired:
+                del self._memory[key]
+        if dropped:
+            logger.debug(f"Dropped {dropped} expired enrichment cache entries")
+        return dropped
+
+    def _sweep_loop(self, interval: float) -> None:
+        while not self._stop.wait(interval):
+            self.sweep()
 
     def clear(self) -> int:
         """Clear all cache entries. Returns count of cleared entries."""
-        count = 0
-        for cache_file in self.cache_dir.glob("*.json"):
+        with self._memory_lock:
+            self._memory.clear()
+            self._touched.clear()
+        try:
+            with self._db_lock:
+                cleared = self._conn.execute("DELETE FROM enrichment").rowcount
+                self._count = self._bytes = 0
+                return cleared
+        except sqlite3.Error as e:
+            logger.warning(f"Failed to clear cache: {e}")
+            return 0
+
+    def stats(self) -> dict[str, Any]:
+        """Get cache statistics."""
+        return {
+            "entries": self._count,
+            "bytes": self._bytes,
+            "in_memory": len(self._memory),
+            "max_entries": self.max_entries,
+            "max_bytes": self.max_bytes,
+        }
+
+    def close(self) -> None:
+        """Stop the sweeper and close the database."""
+        self._stop.set()
+        if self._sweeper is not None:
+            self._sweeper.join(timeout=5)
+        with self._db_lock:
             try:
-                cache_file.unlink()
-                count += 1
-            except OSError:
+                self._flush_touched()
+            except sqlite3.Error:
                 pass
-        return count
+            self._conn.close()
+
+
+# =============================================================================
+# EXTRACTION ENGINE
+# =============================================================================
+
+# One scan finds price, feature and year candidates. Every branch starts
+# with a character from the leading class, so the regex engine can skip
+# ahead to those characters instead of trying each branch at every
+# position; branches check the consumed character with a lookbehind.
+#
+# A number is a candidate once: "MSRP: $199" is one labeled price, "2024 USD"
+# a price rather than a year. Feature branches only consume their marker and
+# capture the text in a lookahead (capped in length to keep the scan
+# linear), so prices and years inside feature text are still found.
+_AMOUNT = r"\d(?:[\d,]*\d)?(?:\.\d+)?"
+_EXTRACTION_RE = re.compile(
+    rf"""
+    [$€£•*\-\dMmPpCcRrLlUu]
+    (?:
+        # $199.00, €199, £199
+        (?<=[$€£])(?P<amount>{_AMOUNT})
+        # USD 199.00
+      | (?<![^\W\d_].)(?<=[Uu])(?i:sd)\s*(?P<usd_amount>{_AMOUNT})
+        # MSRP: $199, list price 199.00, price: USD 199 (label at a word start)
+      | (?<![^\W\d_].)(?P<label>(?i:(?<=m)srp|(?<=r)etail\s+price|(?<=l)ist\s+price|(?<=p)rice|(?<=c)ost))
+        [:\s]*(?P<label_currency>[$€£]|(?i:usd))?\s*(?P<label_amount>{_AMOUNT})
+        # 199.00 USD, or a year from 2000 to 2039 (numbers are matched from their start)
+      | (?<=\d)(?<![\d,.]\d)(?P<digits>(?:[\d,]*\d)?(?:\.\d+)?)
+        (?:(?P<usd>\s*(?i:usd)\b)|(?<=\b20[0-3]\d)\b(?P<year>))
+        # Feature bullets: • text, - text, * text
+      | (?<=•)(?=\s*(?P<bullet>[^•\n]{{1,256}})(?:[•\n]|\Z))
+      | (?<=-)(?=\s+(?P<dash>[^\n]{{1,256}})(?:\n|\Z))
+      | (?<=\*)(?=\s+(?P<asterisk>[^\n]{{1,256}})(?:\n|\Z))
+    )
+    """,
+    re.VERBOSE,
+)
+
+# Feature kinds in the order EnrichmentParser.extract_features reports them
+_FEATURE_KINDS = ("bullet", "dash", "asterisk")
+
+
+@dataclass(frozen=True)
+class PriceMention:
+    """A price found in text."""
+
+    start: int
+    end: int
+    amount: str
+    currency: str = ""  # "$", "€", "£", "USD" or "" if unstated
+    label: str = ""  # "msrp", "retail price", "list price", "price", "cost" or ""
+
+    @property
+    def value(self) -> float | None:
+        """The amount as a number, if it parses."""
+        try:
+            return float(self.amount.replace(",", ""))
+        except ValueError:
+            return None
+
+
+@dataclass(frozen=True)
+class ExtractionCandidates:
+    """Price, feature and year candidates found by one scan of a text."""
+
+    prices: tuple[PriceMention, ...] = ()
+    features: tuple[tuple[str, str], ...] = ()  # (kind, text)
+    years: tuple[int, ...] = ()
+
+
+@lru_cache(maxsize=1)
+def extract_candidates(text: str, max_prices: int | None = None) -> ExtractionCandidates:
+    """
+    Scan text once for price, feature and year candidates.
+
+    The last result is cached, so parsing the same text for features, price
+    and year in a row (see EnrichmentParser) scans it only once. Only one
+    entry is kept, so at most one page text is held alive.
+
+    Args:
+        text: Plain text (e.g. a stripped retailer page or a description)
+        max_prices: Stop scanning once this many prices were found
+
+    Returns:
+        Candidates in the order they appear in the text
+    """
+    prices: list[PriceMention] = []
+    features: list[tuple[str, str]] = []
+    years: list[int] = []
+    for match in _EXTRACTION_RE.finditer(text):
+        kind = match.lastgroup
+        start = match.start()
+        if kind == "amount":
+            mention = PriceMention(start, match.end(), match[kind], text[start])
+        elif kind == "usd_amount":
+            mention = PriceMention(start, match.end(), match[kind], "USD")
+        elif kind == "label_amount":
+            currency = (match["label_currency"] or "").upper()
+            label = text[start:match.end("label")].lower()
+            mention = PriceMention(start, match.end(), match[kind], currency, " ".join(label.split()))
+        elif kind == "usd":
+            mention = PriceMention(start, match.end(), text[start:match.end("digits")], "USD")
+        elif kind == "year":
+            years.append(int(text[start:match.end("digits")]))
+            continue
+        else:
+            features.append((kind, match[kind].strip()))
+            continue
+        prices.append(mention)
+        if max_prices is not None and len(prices) >= max_prices:
+            break
+    return ExtractionCandidates(tuple(prices), tuple(features), tuple(years))
 
 
 class EnrichmentParser:
@@ -414,22 +1240,14 @@ class EnrichmentParser:
     @staticmethod
     def extract_features(text: str) -> list[str]:
         """Extract feature bullet points from description text."""
-        features = []
-
-        # Look for common patterns
-        patterns = [
-            r"•\s*(.+?)(?=•|$)",  # Bullet points
-            r"-\s+(.+?)(?=\n-|\n\n|$)",  # Dashes
-            r"\*\s+(.+?)(?=\n\*|\n\n|$)",  # Asterisks
+        candidates = extract_candidates(text).features
+        features = [
+            feature
+            for kind in _FEATURE_KINDS
+            for found_kind, feature in candidates
+            if found_kind == kind and 5 < len(feature) < 200
         ]
 
-        for pattern in patterns:
-            matches = re.findall(pattern, text, re.MULTILINE | re.DOTALL)
-            for match in matches:
-                cleaned = match.strip()
-                if cleaned and len(cleaned) > 5 and len(cleaned) < 200:
-                    features.append(cleaned)
-
         # Deduplicate while preserving order
         seen = set()
         unique_features = []
@@ -442,36 +1260,35 @@ class EnrichmentParser:
 
     @staticmethod
     def extract_price(text: str) -> float | None:
-        """Extract price from text."""
-        patterns = [
-            r"MSRP[:\s]*\$?([0-9,]+(?:\.[0-9]{2})?)",
-            r"(?:retail|list)\s+price[:\s]*\$?([0-9,]+(?:\.[0-9]{2})?)",
-            r"\$([0-9,]+(?:\.[0-9]{2})?)",
+        """Extract price from text.
+
+        Prefers the MSRP, then a retail/list price, then the first dollar amount.
+        """
+        prices = extract_candidates(text).prices
+        preferences = [
+            lambda p: p.label == "msrp" and p.currency in ("", "$"),
+            lambda p: p.label in ("retail price", "list price") and p.currency in ("", "$"),
+            lambda p: p.currency == "$",
         ]
 
-        for pattern in patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                price_str = match.group(1).replace(",", "")
-                try:
-                    price = float(price_str)
-                    # Sanity check - price should be reasonable
-                    if 1 <= price <= 100000:
-                        return price
-                except ValueError:
-                    continue
+        for preferred in preferences:
+            mention = next((p for p in prices if preferred(p)), None)
+            price = mention.value if mention else None
+            # Sanity check - price should be reasonable
+            if price is not None and 1 <= price <= 100000:
+                return price
 
         return None
 
     @staticmethod
     def extract_year(text: str) -> int | None:
         """Extract release year from text."""
-        # Look for 4-digit years in reasonable range (2000-2030)
-        matches = re.findall(r"\b(20[0-3][0-9])\b", text)
+        # Candidates are 4-digit years in reasonable range (2000-2039)
+        matches = extract_candidates(text).years
         if matches:
             # Return most recent plausible year
             current_year = 2026
-            years = [int(y) for y in matches if int(y) <= current_year]
+            years = [y for y in matches if y <= current_year]
             return max(years) if years else None
         return None
 
@@ -501,6 +1318,70 @@ class EnrichmentParser:
         return "Other"
 
 
+@dataclass
+class _PackItem:
+    """A cache miss waiting to be parsed by a packed AI call."""
+
+    key: str
+    manufacturer: str
+    model_number: str
+    product_name: str
+    search_content: str | None = None
+
+    def describe(self, number: int) -> str:
+        """Format the product as one numbered entry of a packed prompt."""
+        lines = [
+            f"### Product {number}",
+            f"Manufacturer: {self.manufacturer or 'Unknown'}",
+            f"Model: {self.model_number}",
+        ]
+        if self.product_name:
+            lines.append(f"Hint: {self.product_name}")
+        if self.search_content:
+            lines.append(f"Web search results:\n{self.search_content}")
+        else:
+            lines.append("Web search results: none, use your own knowledge")
+        return "\n".join(lines)
+
+    @property
+    def tokens(self) -> int:
+        """Estimated prompt tokens of this entry (~4 chars per token)."""
+        return len(self.describe(0)) // 4 + 1
+
+
+@dataclass
+class EnrichmentUsage:
+    """Search queries and estimated LLM tokens spent on enrichment."""
+
+    llm_tokens: int = 0
+    search: SearchUsage = field(default_factory=SearchUsage)
+
+    @property
+    def search_queries(self) -> int:
+        """Search queries sent to the provider (cached responses are free)."""
+        return self.search.queries
+
+
+_enrichment_usage: ContextVar[EnrichmentUsage | None] = ContextVar("enrichment_usage", default=None)
+
+
+@contextmanager
+def track_enrichment_usage() -> Iterator[EnrichmentUsage]:
+    """
+    Meter the enrichments run within this block (e.g. against a budget).
+
+    Only work done by the current task, and tasks it starts, is counted. A
+    lookup that joins an enrichment already in flight elsewhere costs nothing.
+    """
+    with track_search_usage() as search:
+        usage = EnrichmentUsage(search=search)
+        token = _enrichment_usage.set(usage)
+        try:
+            yield usage
+        finally:
+            _enrichment_usage.reset(token)
+
+
 class EnrichmentService:
     """
     Service to enrich product data using web search and/or AI.
@@ -587,6 +1468,46 @@ Model: {model_number}
 Web search results:
 {search_content}
 
+Respond with ONLY the JSON, no other text."""
+
+    # Prompt for enriching several products with one AI call
+    PACKED_ENRICHMENT_PROMPT = """You are a product specification expert. Provide detailed product information for each of the numbered products below.
+
+For products with web search results, extract the information from those results. For products without, use your own knowledge.
+
+Respond in JSON format, with one entry per product number:
+{{
+  "1": {{
+    "name": "Full official product name",
+    "description": "2-3 sentence product description",
+    "features": ["Feature 1", "Feature 2", ...],
+    "msrp": 999.99,
+    "release_year": 2023,
+    "category": "Product category"
+  }},
+  "2": {{ ... }}
+}}
+
+Rules:
+- Include an entry for every product number, and keep each product's information separate
+- Only include information you found in its search results or are confident about
+- For msrp: Use the MSRP/list price if available, otherwise the most common retail price
+  - Extract just the numeric value (e.g., 159.00 not "$159.00")
+  - Set to null if unknown
+- Set release_year to null if unknown
+- Features should focus on VALUE-RELEVANT specifications that affect replacement cost:
+  - Technology standards (Dolby Vision, HDR10+, Wi-Fi 6E, Bluetooth 5.3, etc.)
+  - Certifications (Energy Star, UL, IP ratings, MIL-STD, etc.)
+  - Performance specs (wattage, resolution, capacity, speed ratings)
+  - Build quality indicators (materials, construction type)
+  - Professional/consumer grade designation
+- Include ALL relevant features - do not limit the list
+- Avoid generic features like "easy to use" or counts of ports/inputs
+- If you don't recognize a product, use {{"name": "", "enriched": false}} as its entry
+
+Products:
+{products}
+
 Respond with ONLY the JSON, no other text."""
 
     def __init__(
@@ -606,7 +1527,16 @@ Respond with ONLY the JSON, no other text."""
         self.cache = EnrichmentCache(cache_dir / "enrichment_cache", cache_ttl)
         self.ai_provider = ai_provider
         self._search_provider: BaseSearchProvider | None = None
-        self._custom_retailer_domains: list[str] = []
+        self._search_provider_config: tuple[str | None, ...] | None = None
+        # One fetcher for all lookups, so retailer connections are reused
+        self._content_fetcher = URLContentFetcher(timeout=10.0)
+        # Concurrent lookups for the same manufacturer/model share one enrichment
+        self._enrich_flight = SingleFlight("enrichment")
+        # Each enrichment stage is bounded separately, so concurrent lookups
+        # (e.g. a batch) pipeline: some items search while others are parsed
+        self._search_slots = asyncio.Semaphore(settings.enrichment_search_concurrency)
+        self._fetch_slots = asyncio.Semaphore(settings.enrichment_fetch_concurrency)
+        self._parse_slots = asyncio.Semaphore(settings.enrichment_parse_concurrency)
 
     def set_provider(self, provider: "BaseProvider") -> None:
         """Set or update the AI provider."""
@@ -614,7 +1544,7 @@ Respond with ONLY the JSON, no other text."""
 
     def set_custom_retailer_domains(self, domains: list[str]) -> None:
         """Set custom retailer domains for price fetching."""
-        self._custom_retailer_domains = domains
+        self._content_fetcher.set_custom_domains(domains)
         if domains:
             logger.info(f"Set {len(domains)} custom retailer domains")
 
@@ -629,6 +1559,9 @@ Respond with ONLY the JSON, no other text."""
         """
         Configure the web search provider.
 
+        The current provider is kept when the configuration is unchanged, so
+        its per-provider query limit applies across requests.
+
         Args:
             provider_type: One of 'none', 'tavily', 'google_cse', 'searxng'
             tavily_api_key: API key for Tavily
@@ -636,6 +1569,11 @@ Respond with ONLY the JSON, no other text."""
             google_engine_id: Search Engine ID for Google CSE
             searxng_url: URL for SearXNG instance
         """
+        config = (provider_type, tavily_api_key, google_api_key, google_engine_id, searxng_url)
+        if config == self._search_provider_config:
+            return
+        self._search_provider_config = config
+
         if provider_type == "tavily" and tavily_api_key:
             self._search_provider = TavilySearchProvider(api_key=tavily_api_key)
             logger.info("Configured Tavily search provider")
@@ -708,7 +1646,7 @@ Respond with ONLY the JSON, no other text."""
         manufacturer = (manufacturer or "").strip()
 
         # Check cache first
-        cached = self.cache.get(manufacturer, model_number)
+        cached = await self.cache.aget(manufacturer, model_number)
         if cached is not None:
             logger.info(f"Enrichment cache hit for {manufacturer} {model_number}: enriched={cached.enriched}")
             debug_log("ENRICHMENT", "Cache hit", {
@@ -721,6 +1659,332 @@ Respond with ONLY the JSON, no other text."""
 
         logger.info(f"Enrichment cache miss for {manufacturer} {model_number}, will query AI")
 
+        return await self._enrich_flight.do(
+            self.cache._get_cache_key(manufacturer, model_number),
+            lambda: self._enrich_uncached(manufacturer, model_number, product_name),
+        )
+
+    async def enrich_many(
+        self,
+        products: Sequence[tuple[str, str, str]],
+    ) -> AsyncIterator[tuple[list[int], EnrichmentResult]]:
+        """
+        Enrich many products, yielding results as each one finishes.
+
+        Cached products are looked up in one go and yielded first. Products
+        with the same manufacturer/model are enriched once. The rest are
+        enriched concurrently, so the search, retailer fetch and AI parse
+        stages each run up to their own concurrency limit. Unless packing is
+        disabled (HBC_ENRICHMENT_PACK_TOKEN_BUDGET=0) or the provider's
+        context window is unknown, several products are parsed by each AI
+        call.
+
+        Args:
+            products: (manufacturer, model_number, product_name) triples
+
+        Yields:
+            (indices, result): indices of every input product the result
+            applies to, and the result
+        """
+        groups: dict[str, list[int]] = {}
+        identities: dict[str, tuple[str, str, str]] = {}
+        for index, (manufacturer, model_number, product_name) in enumerate(products):
+            manufacturer = (manufacturer or "").strip()
+            model_number = (model_number or "").strip()
+            if not model_number or not self.ai_provider:
+                yield [index], EnrichmentResult.empty(product_name)
+                continue
+            key = self.cache._get_cache_key(manufacturer, model_number)
+            groups.setdefault(key, []).append(index)
+            identities.setdefault(key, (manufacturer, model_number, product_name))
+
+        cached = await self.cache.aget_many(
+            (manufacturer, model_number) for manufacturer, model_number, _ in identities.values()
+        )
+        pending: dict[str, tuple[str, str, str]] = {}
+        for key, (manufacturer, model_number, product_name) in identities.items():
+            result = cached.get((manufacturer, model_number))
+            if result is not None:
+                yield groups[key], result
+            else:
+                pending[key] = (manufacturer, model_number, product_name)
+
+        logger.info(
+            f"Batch enrichment: {len(products)} products, {len(identities)} unique, "
+            f"{len(identities) - len(pending)} cached"
+        )
+
+        budget = self._pack_token_budget()
+        if budget > 0 and len(pending) > 1:
+            finished = self._enrich_packed(pending, budget)
+        else:
+            finished = self._enrich_each(pending)
+        async with aclosing(finished):
+            async for key, result in finished:
+                yield groups[key], result
+
+    async def _enrich_each(
+        self,
+        pending: dict[str, tuple[str, str, str]],
+    ) -> AsyncIterator[tuple[str, EnrichmentResult]]:
+        """Enrich cache misses concurrently with one enrich() call each."""
+
+        async def run(key: str) -> tuple[str, EnrichmentResult]:
+            return key, await self.enrich(*pending[key])
+
+        tasks = [asyncio.create_task(run(key)) for key in pending]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    def _pack_token_budget(self) -> int:
+        """
+        Get the prompt token budget of a packed AI call (0 = packing off).
+
+        The budget is capped at half the provider's context window, leaving
+        room for the packed answer. Providers that do not report a context
+        window are not packed, since a truncated prompt loses its
+        instructions and every product falls back to a single call.
+        """
+        budget = settings.enrichment_pack_token_budget
+        context_window = getattr(self.ai_provider, "context_window", None)
+        if budget <= 0 or not context_window:
+            return 0
+        return min(budget, context_window // 2)
+
+    async def _enrich_packed(
+        self,
+        pending: dict[str, tuple[str, str, str]],
+        budget: int,
+    ) -> AsyncIterator[tuple[str, EnrichmentResult]]:
+        """
+        Enrich cache misses with packed AI calls.
+
+        Every product goes through the enrichment single-flight, like
+        enrich(): products already being enriched (by enrich() or another
+        batch) join that call, and the rest are registered with a slot that
+        their pack resolves, so lookups started meanwhile join the pack.
+
+        Yields:
+            (cache key, result) as each product finishes
+        """
+        loop = asyncio.get_running_loop()
+        slots: dict[str, asyncio.Future[EnrichmentResult]] = {}
+
+        async def run(key: str) -> tuple[str, EnrichmentResult]:
+            if self._enrich_flight.is_in_flight(key):
+                # If that call finishes before we join it, this starts a fresh one
+                result = await self._enrich_flight.do(
+                    key, lambda: self._enrich_uncached(*pending[key])
+                )
+            else:
+                slot = slots[key] = loop.create_future()
+                result = await self._enrich_flight.do(key, lambda: slot)
+            return key, result
+
+        waiters = [asyncio.create_task(run(key)) for key in pending]
+        # Tasks start in creation order, so every waiter has registered its
+        # slot (or joined a running call) before the packs are planned
+        packing = asyncio.create_task(self._run_packs(pending, slots, budget))
+        try:
+            for next_done in asyncio.as_completed(waiters):
+                yield await next_done
+        finally:
+            for task in waiters:
+                task.cancel()
+            packing.cancel()
+
+    async def _run_packs(
+        self,
+        pending: dict[str, tuple[str, str, str]],
+        slots: dict[str, asyncio.Future[EnrichmentResult]],
+        budget: int,
+    ) -> None:
+        """
+        Enrich the products with a slot in packs and resolve their slots.
+
+        Search content for each product is gathered concurrently. As it
+        arrives, products are grouped into packs that fit the token budget
+        and each pack is parsed by one AI call. Products a pack fails to
+        cover are enriched with single-product calls. If packing is
+        cancelled (the batch went away), unresolved slots are handed to
+        single-product calls, so lookups that joined them still finish.
+        """
+        overhead = len(self.PACKED_ENRICHMENT_PROMPT) // 4 + 1
+        gathering = {asyncio.create_task(self._pack_item(key, *pending[key])) for key in slots}
+        parsing: set[asyncio.Task] = set()
+        pack: list[_PackItem] = []
+        pack_tokens = overhead
+
+        def flush() -> None:
+            nonlocal pack, pack_tokens
+            parsing.add(asyncio.create_task(self._enrich_pack(pack)))
+            pack, pack_tokens = [], overhead
+
+        try:
+            while gathering or parsing:
+                done, _ = await asyncio.wait(
+                    gathering | parsing, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    if task in gathering:
+                        gathering.discard(task)
+                        item = task.result()
+                        if pack and pack_tokens + item.tokens > budget:
+                            flush()
+                        pack.append(item)
+                        pack_tokens += item.tokens
+                        if len(pack) >= _PACK_MAX_ITEMS:
+                            flush()
+                    else:
+                        parsing.discard(task)
+                        for key, result in task.result():
+                            if not slots[key].done():
+                                slots[key].set_result(result)
+                if pack and not gathering:
+                    flush()
+        except Exception as e:
+            for slot in slots.values():
+                if not slot.done():
+                    slot.set_exception(e)
+        finally:
+            for task in gathering | parsing:
+                task.cancel()
+            for key, slot in slots.items():
+                if not slot.done():
+                    self._hand_off(slot, pending[key])
+
+    def _hand_off(
+        self,
+        slot: asyncio.Future[EnrichmentResult],
+        identity: tuple[str, str, str],
+    ) -> None:
+        """
+        Resolve an abandoned pack slot with a single-product call.
+
+        The single-flight cancels the slot once nobody waits on it, which
+        cancels the call too (before it starts, if the batch was the only
+        waiter).
+        """
+        task = asyncio.create_task(self._enrich_uncached(*identity))
+
+        def settle(task: asyncio.Task[EnrichmentResult]) -> None:
+            if task.cancelled():
+                slot.cancel()
+            elif (error := task.exception()) is not None:
+                if not slot.done():
+                    slot.set_exception(error)
+            elif not slot.done():
+                slot.set_result(task.result())
+
+        task.add_done_callback(settle)
+        slot.add_done_callback(lambda slot: task.cancel() if slot.cancelled() else None)
+
+    async def _pack_item(
+        self,
+        key: str,
+        manufacturer: str,
+        model_number: str,
+        product_name: str,
+    ) -> _PackItem:
+        """Gather a product's web search content for a packed AI call."""
+        search_content = None
+        if self.has_search_provider:
+            search_content = await self._search_content(manufacturer, model_number, product_name)
+        return _PackItem(key, manufacturer, model_number, product_name, search_content)
+
+    async def _enrich_pack(self, pack: list[_PackItem]) -> list[tuple[str, EnrichmentResult]]:
+        """Parse a pack of products with one AI call and cache the results."""
+        answers: dict[str, Any] = {}
+        if len(pack) > 1:
+            prompt = self.PACKED_ENRICHMENT_PROMPT.format(
+                products="\n\n".join(item.describe(n) for n, item in enumerate(pack, 1)),
+            )
+            debug_log("ENRICHMENT", "Calling AI provider for packed enrichment", {
+                "products": len(pack),
+                "prompt_length": len(prompt),
+            })
+            try:
+                response = await self._complete(prompt)
+                data = json.loads(self._strip_code_fence(response or ""))
+                if isinstance(data, dict):
+                    answers = data
+            except Exception as e:
+                logger.warning(f"Packed enrichment of {len(pack)} products failed: {e}")
+                debug_log("ENRICHMENT", f"Packed enrichment failed: {e}", level="WARNING")
+
+        finished: list[tuple[_PackItem, EnrichmentResult]] = []
+        fallbacks: list[tuple[_PackItem, bool]] = []  # (item, parse its search content)
+        for number, item in enumerate(pack, 1):
+            result = self._packed_result(answers.get(str(number)), item)
+            if result is None:
+                fallbacks.append((item, True))
+            elif item.search_content is not None and not result.enriched:
+                # Unhelpful search results fall back to AI knowledge, as in enrich()
+                fallbacks.append((item, False))
+            else:
+                finished.append((item, result))
+
+        if fallbacks:
+            if len(pack) > 1:
+                logger.info(
+                    f"Packed enrichment: {len(fallbacks)} of {len(pack)} products "
+                    "fall back to single-product calls"
+                )
+            results = await asyncio.gather(
+                *(self._enrich_single(item, parse_search) for item, parse_search in fallbacks)
+            )
+            finished.extend((item, result) for (item, _), result in zip(fallbacks, results, strict=True))
+
+        for item, result in finished:
+            await self.cache.aset(item.manufacturer, item.model_number, result)
+        return [(item.key, result) for item, result in finished]
+
+    def _packed_result(self, answer: Any, item: _PackItem) -> EnrichmentResult | None:
+        """
+        Validate one product's entry of a packed AI answer.
+
+        Returns:
+            EnrichmentResult, or None if the entry is missing or invalid
+        """
+        if not isinstance(answer, dict):
+            return None
+        try:
+            result = self._result_from_data(
+                answer, item.manufacturer, item.model_number, item.product_name
+            )
+        except Exception as e:
+            logger.warning(f"Invalid packed enrichment entry for {item.model_number}: {e}")
+            return None
+        if item.search_content is not None and result.enriched:
+            return self._as_web_search_result(result)
+        return result
+
+    async def _enrich_single(self, item: _PackItem, parse_search: bool = True) -> EnrichmentResult:
+        """Enrich a product of a pack with single-product AI calls."""
+        if parse_search and item.search_content is not None:
+            result = await self._parse_search_content(
+                item.search_content, item.manufacturer, item.model_number, item.product_name
+            )
+            if result and result.enriched:
+                return result
+        return await self._ai_enrich(item.manufacturer, item.model_number, item.product_name)
+
+    async def _enrich_uncached(
+        self,
+        manufacturer: str,
+        model_number: str,
+        product_name: str,
+    ) -> EnrichmentResult:
+        """
+        Run web search / AI enrichment for a cache miss and cache the result.
+
+        Concurrent calls for the same product are coalesced by enrich(),
+        so this runs once per manufacturer/model at a time.
+        """
         # Try web search first if configured
         result: EnrichmentResult | None = None
         if self.has_search_provider:
@@ -752,7 +2016,7 @@ Respond with ONLY the JSON, no other text."""
         })
 
         # Cache result (even if not enriched, to avoid repeated failed lookups)
-        self.cache.set(manufacturer, model_number, result)
+        await self.cache.aset(manufacturer, model_number, result)
 
         return result
 
@@ -773,6 +2037,26 @@ Respond with ONLY the JSON, no other text."""
         Returns:
             EnrichmentResult if successful, None to fall back to AI-only
         """
+        combined_content = await self._search_content(manufacturer, model_number, product_name)
+        if combined_content is None:
+            return None
+        return await self._parse_search_content(
+            combined_content, manufacturer, model_number, product_name
+        )
+
+    async def _search_content(
+        self,
+        manufacturer: str,
+        model_number: str,
+        product_name: str,
+    ) -> str | None:
+        """
+        Search for a product and fetch retailer pages for its prices.
+
+        Returns:
+            Search snippets combined with retailer page content, or None
+            if the search failed or found nothing useful
+        """
         if not self._search_provider or not self.ai_provider:
             logger.warning("Web search skipped: no search provider or AI provider")
             return None
@@ -780,11 +2064,12 @@ Respond with ONLY the JSON, no other text."""
         try:
             # Search for product specifications
             logger.info(f"Calling {self._search_provider.provider_name} for: {manufacturer} {model_number}")
-            search_response = await self._search_provider.search_product(
-                manufacturer=manufacturer,
-                model_number=model_number,
-                product_name=product_name,
-            )
+            async with self._search_slots:
+                search_response = await self._search_provider.search_product(
+                    manufacturer=manufacturer,
+                    model_number=model_number,
+                    product_name=product_name,
+                )
 
             if not search_response.success:
                 logger.warning(f"Web search failed: {search_response.error}")
@@ -808,14 +2093,11 @@ Respond with ONLY the JSON, no other text."""
                 logger.info(f"    Snippet: {result.snippet[:200]}")
 
             # Fetch actual page content from retailer URLs to get prices
-            content_fetcher = URLContentFetcher(
-                timeout=10.0,
-                custom_domains=self._custom_retailer_domains,
-            )
-            retailer_content = await content_fetcher.fetch_retailer_content(
-                search_response.results,
-                max_urls=2,
-            )
+            async with self._fetch_slots:
+                retailer_content = await self._content_fetcher.fetch_retailer_content(
+                    search_response.results,
+                    max_urls=2,
+                )
 
             # Combine snippets with retailer page content
             combined_content = search_content
@@ -827,21 +2109,40 @@ Respond with ONLY the JSON, no other text."""
                 debug_log("ENRICHMENT", "Web search content too short to be useful")
                 return None
 
-            debug_log("ENRICHMENT", "Parsing web search results with AI", {
+            debug_log("ENRICHMENT", "Web search content gathered", {
                 "result_count": len(search_response.results),
                 "snippet_length": len(search_content),
                 "retailer_content_length": len(retailer_content),
                 "total_content_length": len(combined_content),
             })
 
-            # Parse with AI
+            return combined_content[:_SEARCH_CONTENT_CHARS]  # Limit content size
+
+        except Exception as e:
+            logger.error(f"Web search enrichment failed: {e}")
+            debug_log("ENRICHMENT", f"Web search enrichment failed: {e}", level="ERROR")
+            return None
+
+    async def _parse_search_content(
+        self,
+        search_content: str,
+        manufacturer: str,
+        model_number: str,
+        product_name: str,
+    ) -> EnrichmentResult | None:
+        """Parse one product's web search content with AI.
+
+        Returns:
+            EnrichmentResult if successful, None to fall back to AI-only
+        """
+        try:
             prompt = self.WEB_SEARCH_PARSE_PROMPT.format(
                 manufacturer=manufacturer or "Unknown",
                 model_number=model_number,
-                search_content=combined_content[:8000],  # Limit content size
+                search_content=search_content,
             )
 
-            response = await self.ai_provider.complete(prompt)
+            response = await self._complete(prompt)
 
             if not response:
                 debug_log("ENRICHMENT", "Empty AI response when parsing search results", level="WARNING")
@@ -851,19 +2152,7 @@ Respond with ONLY the JSON, no other text."""
             result = self._parse_ai_response(response, manufacturer, model_number, product_name)
 
             if result.enriched:
-                # Mark source as web search
-                result = EnrichmentResult(
-                    enriched=result.enriched,
-                    source=f"web_search:{self._search_provider.provider_name.lower()}",
-                    name=result.name,
-                    description=result.description,
-                    features=result.features,
-                    msrp=result.msrp,
-                    release_year=result.release_year,
-                    category=result.category,
-                    additional_specs=result.additional_specs,
-                    confidence=min(result.confidence + 0.1, 1.0),  # Boost confidence for web search
-                )
+                result = self._as_web_search_result(result)
                 logger.info(f"Web search enrichment: name='{result.name}', features={len(result.features)}, "
                            f"msrp={result.msrp}, year={result.release_year}, category='{result.category}'")
             else:
@@ -876,6 +2165,35 @@ Respond with ONLY the JSON, no other text."""
             debug_log("ENRICHMENT", f"Web search enrichment failed: {e}", level="ERROR")
             return None
 
+    def _as_web_search_result(self, result: EnrichmentResult) -> EnrichmentResult:
+        """Mark an AI-parsed result as coming from the web search provider."""
+        provider_name = self._search_provider.provider_name.lower() if self._search_provider else "unknown"
+        return EnrichmentResult(
+            enriched=result.enriched,
+            source=f"web_search:{provider_name}",
+            name=result.name,
+            description=result.description,
+            features=result.features,
+            msrp=result.msrp,
+            release_year=result.release_year,
+            category=result.category,
+            additional_specs=result.additional_specs,
+            confidence=min(result.confidence + 0.1, 1.0),  # Boost confidence for web search
+        )
+
+    async def _complete(self, prompt: str) -> str | None:
+        """Run an AI completion within the parse stage's concurrency limit."""
+        async with self._parse_slots:
+            response = None
+            try:
+                response = await self.ai_provider.complete(prompt)
+                return response
+            finally:
+                usage = _enrichment_usage.get()
+                if usage is not None:
+                    # Rough estimate: ~4 characters per token
+                    usage.llm_tokens += (len(prompt) + len(response or "")) // 4
+
     async def _ai_enrich(
         self,
         manufacturer: str,
@@ -902,7 +2220,7 @@ Respond with ONLY the JSON, no other text."""
 
             # Call AI provider
             logger.info(f"Calling AI provider: {type(self.ai_provider).__name__}")
-            response = await self.ai_provider.complete(prompt)
+            response = await self._complete(prompt)
 
             if not response:
                 logger.warning("Empty response from AI provider")
@@ -944,88 +2262,9 @@ Respond with ONLY the JSON, no other text."""
     ) -> EnrichmentResult:
         """Parse AI response to EnrichmentResult."""
         try:
-            # Clean response - extract JSON if wrapped in markdown
-            response = response.strip()
-            if response.startswith("```"):
-                # Remove markdown code blocks
-                lines = response.split("\n")
-                json_lines = []
-                in_block = False
-                for line in lines:
-                    if line.startswith("```"):
-                        in_block = not in_block
-                        continue
-                    if in_block or not line.startswith("```"):
-                        json_lines.append(line)
-                response = "\n".join(json_lines)
-
+            response = self._strip_code_fence(response)
             data = json.loads(response)
-
-            # Check if AI recognized the product
-            if data.get("enriched") is False or not data.get("name"):
-                logger.debug(f"AI did not recognize product: {manufacturer} {model_number}")
-                return EnrichmentResult.empty(product_name)
-
-            # Extract and validate fields
-            name = data.get("name", "").strip()
-            description = data.get("description", "").strip()
-            features = data.get("features", [])
-            msrp = data.get("msrp")
-            release_year = data.get("release_year")
-            category = data.get("category", "")
-
-            # Validate features is a list of strings
-            if not isinstance(features, list):
-                features = []
-            features = [str(f) for f in features if f]  # No limit - include all relevant features
-
-            # Validate msrp
-            if msrp is not None:
-                try:
-                    msrp = float(msrp)
-                    if msrp <= 0 or msrp > 100000:
-                        msrp = None
-                except (ValueError, TypeError):
-                    msrp = None
-
-            # Validate release_year
-            if release_year is not None:
-                try:
-                    release_year = int(release_year)
-                    if release_year < 2000 or release_year > 2030:
-                        release_year = None
-                except (ValueError, TypeError):
-                    release_year = None
-
-            # Auto-categorize if not provided
-            if not category:
-                category = EnrichmentParser.categorize_product(
-                    manufacturer, model_number, name
-                )
-
-            # Calculate confidence
-            confidence = 0.5  # Base confidence for AI response
-            if features:
-                confidence += 0.15
-            if msrp:
-                confidence += 0.15
-            if release_year:
-                confidence += 0.1
-            if description:
-                confidence += 0.1
-
-            return EnrichmentResult(
-                enriched=True,
-                source="ai_knowledge",
-                name=name or f"{manufacturer} {model_number}",
-                description=description,
-                features=features,
-                msrp=msrp,
-                release_year=release_year,
-                category=category,
-                additional_specs={},
-                confidence=min(confidence, 1.0),
-            )
+            return self._result_from_data(data, manufacturer, model_number, product_name)
 
         except json.JSONDecodeError as e:
             logger.warning(f"Failed to parse AI response as JSON: {e}")
@@ -1038,6 +2277,98 @@ Respond with ONLY the JSON, no other text."""
             debug_log("ENRICHMENT", f"Error parsing AI response: {e}", level="ERROR")
             return EnrichmentResult.empty(product_name)
 
+    @staticmethod
+    def _strip_code_fence(response: str) -> str:
+        """Extract JSON from an AI response wrapped in a markdown code block."""
+        response = response.strip()
+        if response.startswith("```"):
+            # Remove markdown code blocks
+            lines = response.split("\n")
+            json_lines = []
+            in_block = False
+            for line in lines:
+                if line.startswith("```"):
+                    in_block = not in_block
+                    continue
+                if in_block or not line.startswith("```"):
+                    json_lines.append(line)
+            response = "\n".join(json_lines)
+        return response
+
+    def _result_from_data(
+        self,
+        data: dict[str, Any],
+        manufacturer: str,
+        model_number: str,
+        product_name: str,
+    ) -> EnrichmentResult:
+        """Validate one product's parsed AI answer into an EnrichmentResult."""
+        # Check if AI recognized the product
+        if data.get("enriched") is False or not data.get("name"):
+            logger.debug(f"AI did not recognize product: {manufacturer} {model_number}")
+            return EnrichmentResult.empty(product_name)
+
+        # Extract and validate fields
+        name = data.get("name", "").strip()
+        description = data.get("description", "").strip()
+        features = data.get("features", [])
+        msrp = data.get("msrp")
+        release_year = data.get("release_year")
+        category = data.get("category", "")
+
+        # Validate features is a list of strings
+        if not isinstance(features, list):
+            features = []
+        features = [str(f) for f in features if f]  # No limit - include all relevant features
+
+        # Validate msrp
+        if msrp is not None:
+            try:
+                msrp = float(msrp)
+                if msrp <= 0 or msrp > 100000:
+                    msrp = None
+            except (ValueError, TypeError):
+                msrp = None
+
+        # Validate release_year
+        if release_year is not None:
+            try:
+                release_year = int(release_year)
+                if release_year < 2000 or release_year > 2030:
+                    release_year = None
+            except (ValueError, TypeError):
+                release_year = None
+
+        # Auto-categorize if not provided
+        if not category:
+            category = EnrichmentParser.categorize_product(
+                manufacturer, model_number, name
+            )
+
+        # Calculate confidence
+        confidence = 0.5  # Base confidence for AI response
+        if features:
+            confidence += 0.15
+        if msrp:
+            confidence += 0.15
+        if release_year:
+            confidence += 0.1
+        if description:
+            confidence += 0.1
+
+        return EnrichmentResult(
+            enriched=True,
+            source="ai_knowledge",
+            name=name or f"{manufacturer} {model_number}",
+            description=description,
+            features=features,
+            msrp=msrp,
+            release_year=release_year,
+            category=category,
+            additional_specs={},
+            confidence=min(confidence, 1.0),
+        )
+
     def format_description(self, result: EnrichmentResult) -> str:
         """Format enrichment data for Homebox description field."""
         parts = []
@@ -1063,5 +2394,17 @@ Respond with ONLY the JSON, no other text."""
         return "\n".join(parts)
 
     def clear_cache(self) -> int:
-        """Clear the enrichment cache. Returns count of cleared entries."""
+        """Clear the enrichment cache. Returns count of cleared entries.
+
+        Cached web search responses are dropped too, so the next lookups
+        search again instead of re-parsing the same results.
+        """
+        searches = get_search_cache().clear()
+        if searches:
+            logger.info(f"Cleared {searches} cached search responses")
         return self.cache.clear()
+
+    async def aclose(self) -> None:
+        """Close the retailer fetcher's client and the result cache."""
+        await self._content_fetcher.aclose()
+        self.cache.close()
@@ -0,0 +1,154 @@
+"""Speculative enrichment of freshly detected products.
+
+Enrichment used to start only when the user asked for a lookup after
+detection returned, so every lookup paid for a web search and an LLM call
+while the user waited. When HBC_ENRICHMENT_PREFETCH_ENABLED is set, the
+vision detection endpoints hand each detected product with a manufacturer
+and model number to an EnrichmentPrefetcher, which enriches it in the
+background and leaves the result in the enrichment cache. By the time the
+user opens the item, the lookup is a cache hit.
+
+Prefetching runs at low priority: one background worker enriches one
+product at a time, so user lookups keep the remaining search, fetch and
+parse slots of the enrichment service. Products that are already cached,
+queued or being prefetched are skipped, and the queue is bounded (products
+submitted while it is full are dropped). A lookup for a product that is
+being prefetched joins the prefetch instead of starting a second one.
+
+Usage:
+    prefetcher = EnrichmentPrefetcher(service)
+    prefetcher.submit([("DeWalt", "DCD771", "Cordless drill")])
+    await prefetcher.close()  # App shutdown
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Iterable
+from typing import TYPE_CHECKING, Any
+
+from loguru import logger
+
+from ..core.config import settings
+
+if TYPE_CHECKING:
+    from .enrichment import EnrichmentService
+
+
+class EnrichmentPrefetcher:
+    """Background queue that warms the enrichment cache for detected products."""
+
+    def __init__(self, service: EnrichmentService, max_queued: int | None = None) -> None:
+        """Initialize an idle prefetcher.
+
+        Args:
+            service: Enrichment service whose cache is warmed.
+            max_queued: Products waiting for enrichment; more are dropped.
+                Defaults to HBC_ENRICHMENT_PREFETCH_QUEUE_SIZE.
+        """
+        self._service = service
+        self._queue: asyncio.Queue[tuple[str, str, str, str]] = asyncio.Queue(
+            settings.enrichment_prefetch_queue_size if max_queued is None else max_queued
+        )
+        # Cache keys of products queued or being enriched
+        self._pending: set[str] = set()
+        self._task: asyncio.Task[None] | None = None
+
+        self.submitted = 0
+        self.skipped_cached = 0
+        self.dropped = 0
+        self.prefetched = 0
+        self.failed = 0
+
+    def submit(self, products: Iterable[tuple[str, str, str]]) -> int:
+        """Queue products for background enrichment.
+
+        Products without both a manufacturer and a model number, and products
+        that are cached, queued or being enriched, are skipped. Only the
+        in-memory cache is checked here; the worker checks the database.
+
+        Args:
+            products: (manufacturer, model_number, product_name) triples
+
+        Returns:
+            Number of products queued
+        """
+        candidates: dict[str, tuple[str, str, str]] = {}
+        for manufacturer, model_number, product_name in products:
+            manufacturer = (manufacturer or "").strip()
+            model_number = (model_number or "").strip()
+            if not manufacturer or not model_number:
+                continue
+            key = self._service.cache._get_cache_key(manufacturer, model_number)
+            if key not in self._pending:
+                candidates.setdefault(key, (manufacturer, model_number, product_name or ""))
+        if not candidates:
+            return 0
+
+        self.submitted += len(candidates)
+        cached = self._service.cache.peek_many(
+            (manufacturer, model_number) for manufacturer, model_number, _ in candidates.values()
+        )
+        queued = 0
+        for key, (manufacturer, model_number, product_name) in candidates.items():
+            if (manufacturer, model_number) in cached:
+                self.skipped_cached += 1
+                continue
+            try:
+                self._queue.put_nowait((key, manufacturer, model_number, product_name))
+            except asyncio.QueueFull:
+                self.dropped += 1
+                continue
+            self._pending.add(key)
+            queued += 1
+
+        if queued:
+            logger.debug(f"Queued {queued} detected product(s) for enrichment prefetch")
+            if self._task is None or self._task.done():
+                self._task = asyncio.create_task(self._run())
+        return queued
+
+    async def _run(self) -> None:
+        while True:
+            key, manufacturer, model_number, product_name = await self._queue.get()
+            try:
+                if await self._service.cache.aget(manufacturer, model_number) is not None:
+                    self.skipped_cached += 1
+                    continue
+                result = await self._service.enrich(manufacturer, model_number, product_name)
+                if result.enriched:
+                    self.prefetched += 1
+                else:
+                    self.failed += 1
+            except Exception as e:
+                logger.debug(f"Enrichment prefetch failed for {manufacturer} {model_number}: {e}")
+                self.failed += 1
+            finally:
+                self._pending.discard(key)
+                self._queue.task_done()
+
+    async def join(self) -> None:
+        """Wait until every queued product has been enriched."""
+        await self._queue.join()
+
+    async def close(self) -> None:
+        """Stop the worker; queued products are discarded."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def stats(self) -> dict[str, Any]:
+        """Get prefetch statistics."""
+        return {
+            "running": self._task is not None and not self._task.done(),
+            "queued": self._queue.qsize(),
+            "submitted": self.submitted,
+            "skipped_cached": self.skipped_cached,
+            "dropped": self.dropped,
+            "prefetched": self.prefetched,
+            "failed": self.failed,
+        }
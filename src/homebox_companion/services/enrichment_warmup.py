@@ -0,0 +1,307 @@
+"""Background enrichment warm-up over the existing inventory.
+
+Only products that were looked up through the companion ever reach the
+enrichment cache, so questions about items already in Homebox ("what's the
+MSRP of my drill") pay for a web search and an LLM call while the user
+waits. When HBC_ENRICHMENT_WARMUP_ENABLED is set, EnrichmentWarmup walks the
+duplicate detector's manufacturer/model index and enriches each product in
+the background, one at a time, so those lookups hit a warm cache.
+
+The walk is bounded by a daily budget of search queries and (estimated)
+LLM tokens, metered with track_enrichment_usage(), so only the warm-up's
+own work counts against it; cache hits are free. Progress is checkpointed
+to a JSON file after every product: the walk resumes after a restart, and
+once the budget is spent it continues from the same place the next day.
+The model index is walked in key order; when the walk reaches the end it
+starts over, which refreshes products whose cache entries have expired.
+
+Every server worker creates the job, but only the one holding a lock file
+next to the checkpoint runs it, so the budget is spent once and workers do
+not overwrite each other's cursor. The others check the lock on every run
+and take over if the running worker exits.
+
+Usage:
+    warmup = EnrichmentWarmup(get_service, get_detector)
+    warmup.start()  # App startup
+    await warmup.close()  # App shutdown
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from collections.abc import Callable
+from dataclasses import asdict, dataclass
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from filelock import FileLock, Timeout
+from loguru import logger
+
+from ..core.config import settings
+from .enrichment import track_enrichment_usage
+
+if TYPE_CHECKING:
+    from .duplicate_detector import DuplicateDetector
+    from .enrichment import EnrichmentService
+
+# Default path for the persisted checkpoint
+CHECKPOINT_FILE = Path(settings.data_dir) / "enrichment_warmup.json"
+
+# Seconds between runs while the duplicate detector index is still loading
+NOT_READY_INTERVAL = 30.0
+
+
+@dataclass
+class WarmupCheckpoint:
+    """Persisted progress of the warm-up walk."""
+
+    cursor: str = ""
+    """Model key of the last product handled in the current walk ("" = start)."""
+
+    passes: int = 0
+    """Completed walks over the model index."""
+
+    day: str = ""
+    """UTC date (ISO format) the usage counters below belong to."""
+
+    search_queries: int = 0
+    """Search queries spent on `day`."""
+
+    llm_tokens: int = 0
+    """Estimated LLM tokens spent on `day`."""
+
+    enriched: int = 0
+    """Products enriched successfully (all time)."""
+
+    failed: int = 0
+    """Products that could not be enriched (all time)."""
+
+    @classmethod
+    def load(cls, path: Path) -> WarmupCheckpoint:
+        """Load a checkpoint, starting fresh if it is missing or unreadable."""
+        if not path.exists():
+            return cls()
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+            return cls(**{name: data[name] for name in cls.__dataclass_fields__ if name in data})
+        except Exception as e:
+            logger.warning(f"Failed to load enrichment warm-up checkpoint, starting over: {e}")
+            return cls()
+
+    def save(self, path: Path) -> None:
+        """Write the checkpoint atomically."""
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path = path.with_suffix(".tmp")
+            temp_path.write_text(json.dumps(asdict(self), indent=2), encoding="utf-8")
+            temp_path.replace(path)
+        except OSError as e:
+            logger.warning(f"Failed to save enrichment warm-up checkpoint: {e}")
+
+
+class EnrichmentWarmup:
+    """Resumable background job that enriches inventory products under a daily budget."""
+
+    def __init__(
+        self,
+        get_service: Callable[[], EnrichmentService | None],
+        get_detector: Callable[[], DuplicateDetector | None],
+        *,
+        checkpoint_path: Path | None = None,
+        daily_search_queries: int | None = None,
+        daily_llm_tokens: int | None = None,
+        interval: float | None = None,
+    ) -> None:
+        """Initialize the job (call start() to run it in the background).
+
+        Args:
+            get_service: Returns the enrichment service with an AI provider
+                configured, or None if enrichment is unavailable.
+            get_detector: Returns the duplicate detector, or None if not created yet.
+            checkpoint_path: Where progress is persisted. Defaults to the data dir.
+            daily_search_queries: Search queries per day.
+                Defaults to HBC_ENRICHMENT_WARMUP_DAILY_QUERIES.
+            daily_llm_tokens: Estimated LLM tokens per day.
+                Defaults to HBC_ENRICHMENT_WARMUP_DAILY_TOKENS.
+            interval: Seconds between runs. Defaults to HBC_ENRICHMENT_WARMUP_INTERVAL.
+        """
+        self._get_service = get_service
+        self._get_detector = get_detector
+        self._checkpoint_path = checkpoint_path or CHECKPOINT_FILE
+        self._daily_search_queries = (
+            settings.enrichment_warmup_daily_queries
+            if daily_search_queries is None
+            else daily_search_queries
+        )
+        self._daily_llm_tokens = (
+            settings.enrichment_warmup_daily_tokens if daily_llm_tokens is None else daily_llm_tokens
+        )
+        self._interval = settings.enrichment_warmup_interval if interval is None else interval
+        self._checkpoint = WarmupCheckpoint.load(self._checkpoint_path)
+        self._lock = FileLock(self._checkpoint_path.with_suffix(".lock"))
+        self._task: asyncio.Task[None] | None = None
+
+    # -------------------------------------------------------------------------
+    # Lifecycle
+    # -------------------------------------------------------------------------
+
+    def start(self) -> None:
+        """Start the background loop (call from the app lifespan)."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+            logger.debug(f"Enrichment warm-up started (every {self._interval}s)")
+
+    async def close(self) -> None:
+        """Stop the background loop; progress up to the last product is kept."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if self._lock.is_locked:
+            self._lock.release()
+
+    @property
+    def is_running(self) -> bool:
+        """Whether the background loop is active."""
+        return self._task is not None and not self._task.done()
+
+    @property
+    def is_leader(self) -> bool:
+        """Whether this process holds the lock and runs the warm-up."""
+        return self._lock.is_locked
+
+    def _acquire_lead(self) -> bool:
+        """Take the warm-up lock if no other worker holds it."""
+        if self._lock.is_locked:
+            return True
+        try:
+            self._checkpoint_path.parent.mkdir(parents=True, exist_ok=True)
+            self._lock.acquire(timeout=0)
+        except (Timeout, OSError):
+            return False
+        # Pick up where the previous leader stopped
+        self._checkpoint = WarmupCheckpoint.load(self._checkpoint_path)
+        logger.debug("Enrichment warm-up lock acquired, running in this worker")
+        return True
+
+    async def _run(self) -> None:
+        while True:
+            delay = self._interval
+            try:
+                if not self._acquire_lead():
+                    pass  # Another worker runs the warm-up
+                elif self._sources() is None:
+                    delay = min(self._interval, NOT_READY_INTERVAL)
+                else:
+                    await self.run_once()
+            except Exception as e:
+                logger.warning(f"Enrichment warm-up failed: {e}")
+            await asyncio.sleep(delay)
+
+    # -------------------------------------------------------------------------
+    # Walking the model index
+    # -------------------------------------------------------------------------
+
+    def _roll_day(self) -> None:
+        """Reset the usage counters when a new (UTC) day starts."""
+        today = datetime.now(UTC).date().isoformat()
+        if self._checkpoint.day != today:
+            self._checkpoint.day = today
+            self._checkpoint.search_queries = 0
+            self._checkpoint.llm_tokens = 0
+
+    @property
+    def budget_spent(self) -> bool:
+        """Whether today's search query or LLM token budget is used up."""
+        self._roll_day()
+        return (
+            self._checkpoint.search_queries >= self._daily_search_queries
+            or self._checkpoint.llm_tokens >= self._daily_llm_tokens
+        )
+
+    def _sources(self) -> tuple[EnrichmentService, DuplicateDetector] | None:
+        """Get the service and a loaded detector, or None if either is not ready."""
+        service = self._get_service()
+        detector = self._get_detector()
+        if service is None or service.ai_provider is None:
+            return None
+        if detector is None or not detector.get_status().is_loaded:
+            return None
+        return service, detector
+
+    async def run_once(self) -> int:
+        """Enrich products from the checkpoint onwards until the walk or budget ends.
+
+        The budget is checked before each product, so the last product of a
+        day may overshoot it by its own cost.
+
+        Returns:
+            Number of products handled (including cache hits)
+        """
+        sources = self._sources()
+        if sources is None:
+            return 0
+        service, detector = sources
+
+        checkpoint = self._checkpoint
+        handled = 0
+        for key, item in detector.model_items():
+            if key <= checkpoint.cursor:
+                continue
+            if self.budget_spent:
+                logger.info(
+                    f"Enrichment warm-up budget spent for today after {handled} product(s) "
+                    f"({checkpoint.search_queries} queries, ~{checkpoint.llm_tokens} tokens)"
+                )
+                break
+
+            with track_enrichment_usage() as usage:
+                try:
+                    result = await service.enrich(
+                        item.manufacturer or "", item.model_number or "", item.name
+                    )
+                    enriched = result.enriched
+                except Exception as e:
+                    logger.debug(f"Enrichment warm-up failed for {key}: {e}")
+                    enriched = False
+
+            checkpoint.search_queries += usage.search_queries
+            checkpoint.llm_tokens += usage.llm_tokens
+            if enriched:
+                checkpoint.enriched += 1
+            else:
+                checkpoint.failed += 1
+            checkpoint.cursor = key
+            checkpoint.save(self._checkpoint_path)
+            handled += 1
+        else:
+            checkpoint.cursor = ""
+            checkpoint.passes += 1
+            checkpoint.save(self._checkpoint_path)
+            if handled:
+                logger.info(f"Enrichment warm-up walk complete ({handled} product(s) this run)")
+        return handled
+
+    def stats(self) -> dict[str, Any]:
+        """Get warm-up progress and today's budget usage."""
+        if not self.is_leader:
+            # The leader's progress is only in the checkpoint file
+            self._checkpoint = WarmupCheckpoint.load(self._checkpoint_path)
+        self._roll_day()
+        return {
+            "running": self.is_running,
+            "leader": self.is_leader,
+            "cursor": self._checkpoint.cursor,
+            "passes": self._checkpoint.passes,
+            "enriched": self._checkpoint.enriched,
+            "failed": self._checkpoint.failed,
+            "search_queries_today": self._checkpoint.search_queries,
+            "search_query_budget": self._daily_search_queries,
+            "llm_tokens_today": self._checkpoint.llm_tokens,
+            "llm_token_budget": self._daily_llm_tokens,
+        }
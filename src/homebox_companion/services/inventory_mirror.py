@@ -0,0 +1,502 @@
+"""Local mirror of the Homebox inventory with differential synchronization.
+
+Several subsystems used to fetch the same Homebox data independently: the
+chat tools (labels, locations, item searches), the vision endpoints (labels
+for AI context), the duplicate detector (item list plus get_item per new
+item) and the search index. InventoryMirror keeps one in-memory copy of the
+items, locations and labels, refreshed by a single shared sync loop, and
+publishes a change feed that derived indices subscribe to.
+
+Synchronization is differential: each pass lists item summaries (cheap,
+paginated) and compares them with the mirror by `updatedAt` and asset ID.
+Only new or changed items get their detail fields (manufacturer, model and
+serial number, notes) fetched, via get_item when there are few and via the
+CSV export when there are many. Writes made through the companion are
+applied immediately with record_item()/forget_item(); changes made
+elsewhere show up within one sync interval.
+
+The loop only runs while someone is using the app: every consumer calls
+touch(token), and the loop syncs with the most recently seen token until
+it has been idle for HBC_INVENTORY_SYNC_IDLE_TIMEOUT seconds. Mirrored data
+is only served to tokens that have completed a sync, so an invalid token
+never reads inventory without Homebox checking it first. Verification is
+kept per token but short-lived: a token's verification expires
+_TOKEN_VERIFY_TTL seconds after its last sync (touch() then wakes a sync
+with it), and it only counts while the mirror holds the token's Homebox
+group (a sync with another group's token replaces the mirrored inventory).
+
+Like the duplicate detector index, the mirror is shared by all sessions of
+this worker.
+
+Usage:
+    mirror = get_inventory_mirror()
+    mirror.start(client)  # App startup
+    mirror.touch(token)  # Per request
+    if mirror.is_ready_for(token):
+        labels = mirror.labels
+"""
+
+from __future__ import annotations
+
+import asyncio
+import csv
+import hashlib
+import io
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+from loguru import logger
+
+from ..core.config import settings
+from ..core.exceptions import HomeboxAuthError
+
+if TYPE_CHECKING:
+    from ..homebox import HomeboxClient
+
+# Item fields missing from list summaries, filled from get_item or the export
+DETAIL_FIELDS = ("manufacturer", "modelNumber", "serialNumber", "notes")
+
+# Changed items above this count are detailed via one export instead of get_item calls
+_DETAIL_FETCH_LIMIT = 25
+
+# Concurrent get_item calls when fetching details
+_DETAIL_FETCH_CONCURRENCY = 5
+
+# Seconds a token stays verified for reads after the sync that checked it
+_TOKEN_VERIFY_TTL = 300.0
+
+
+def parse_export_details(csv_data: str) -> dict[str, dict[str, str]]:
+    """Extract the fields the list endpoint omits from a Homebox CSV export.
+
+    Args:
+        csv_data: Raw CSV string from the export endpoint.
+
+    Returns:
+        Map of item ID to the DETAIL_FIELDS values.
+    """
+    details: dict[str, dict[str, str]] = {}
+    for row in csv.DictReader(io.StringIO(csv_data)):
+        url = row.get("HB.url", "")
+        item_id = url.split("/")[-1] if url else ""
+        if not item_id:
+            continue
+        details[item_id] = {
+            "manufacturer": row.get("HB.manufacturer", ""),
+            "modelNumber": row.get("HB.model_number", ""),
+            "serialNumber": row.get("HB.serial_number", ""),
+            "notes": row.get("HB.notes", ""),
+        }
+    return details
+
+
+@dataclass
+class InventoryChanges:
+    """A batch of item changes published to subscribers."""
+
+    upserted: list[dict[str, Any]] = field(default_factory=list)
+    """New or changed item records."""
+
+    removed: list[str] = field(default_factory=list)
+    """IDs of deleted items."""
+
+    full: bool = False
+    """True if `upserted` is the complete inventory (first sync)."""
+
+    def __bool__(self) -> bool:
+        return bool(self.upserted or self.removed or self.full)
+
+
+type ChangeListener = Callable[[InventoryChanges], None]
+
+
+class InventoryMirror:
+    """In-memory copy of items, locations and labels with a shared sync loop.
+
+    Item records are Homebox item summaries merged with DETAIL_FIELDS (or
+    full items, when recorded from a write response). Returned records are
+    shared and must be treated as read-only.
+    """
+
+    def __init__(
+        self,
+        client: HomeboxClient | None = None,
+        *,
+        sync_interval: float | None = None,
+        idle_timeout: float | None = None,
+        verify_ttl: float = _TOKEN_VERIFY_TTL,
+    ) -> None:
+        """Initialize an empty mirror.
+
+        Args:
+            client: HomeboxClient used for syncing (or set later by start()).
+            sync_interval: Seconds between syncs. Defaults to HBC_INVENTORY_SYNC_INTERVAL.
+            idle_timeout: Seconds without touch() before the loop stops syncing.
+                Defaults to HBC_INVENTORY_SYNC_IDLE_TIMEOUT.
+            verify_ttl: Seconds a token stays verified after its last sync.
+        """
+        self._client = client
+        self._sync_interval = (
+            settings.inventory_sync_interval if sync_interval is None else sync_interval
+        )
+        self._idle_timeout = (
+            settings.inventory_sync_idle_timeout if idle_timeout is None else idle_timeout
+        )
+        self._items: dict[str, dict[str, Any]] = {}
+        self._labels: list[dict[str, Any]] | None = None
+        self._locations: list[dict[str, Any]] | None = None
+        self._listeners: list[ChangeListener] = []
+        self._synced_at: float | None = None
+        self._highest_asset_id = 0
+        # Homebox group the mirrored data belongs to
+        self._group_id: str | None = None
+
+        # Hashed token -> (group ID, time of its last sync), for gating reads
+        self._verified_tokens: dict[str, tuple[str, float]] = {}
+        self._verify_ttl = verify_ttl
+        self._token: str | None = None
+        self._last_touch = 0.0
+
+        self._task: asyncio.Task[None] | None = None
+        self._wake = asyncio.Event()
+        self._sync_lock = asyncio.Lock()
+        # IDs written locally while a sync is in flight; that sync leaves them alone
+        self._local_ids: set[str] | None = None
+
+        self.syncs = 0
+        self.items_fetched = 0
+
+    # -------------------------------------------------------------------------
+    # Lifecycle
+    # -------------------------------------------------------------------------
+
+    def start(self, client: HomeboxClient) -> None:
+        """Start the background sync loop (call from the app lifespan)."""
+        self._client = client
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+            logger.debug(f"Inventory mirror started (sync every {self._sync_interval}s)")
+
+    async def close(self) -> None:
+        """Stop the background sync loop."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    @property
+    def is_running(self) -> bool:
+        """Whether the background sync loop is active."""
+        return self._task is not None and not self._task.done()
+
+    def touch(self, token: str) -> None:
+        """Record activity so the sync loop keeps (or starts) syncing with this token.
+
+        Does nothing unless the mirror was started.
+        """
+        if not self.is_running:
+            return
+        idle = time.monotonic() - self._last_touch > self._idle_timeout
+        self._token = token
+        self._last_touch = time.monotonic()
+        if idle or not self.is_ready_for(token):
+            self._wake.set()
+
+    def request_sync(self) -> None:
+        """Sync as soon as possible (after a write Homebox may have side effects for).
+
+        Labels and locations are treated as unavailable until the sync completes,
+        so readers fall back to Homebox instead of seeing stale taxonomy.
+        """
+        self._labels = None
+        self._locations = None
+        self._wake.set()
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout=self._sync_interval)
+            except TimeoutError:
+                pass
+            self._wake.clear()
+
+            token = self._token
+            if token is None or time.monotonic() - self._last_touch > self._idle_timeout:
+                continue
+            try:
+                await self.sync(token)
+            except HomeboxAuthError:
+                logger.debug("Inventory sync token rejected, waiting for a fresh one")
+                self._verified_tokens.pop(self._token_key(token), None)
+                if self._token == token:
+                    self._token = None
+            except Exception as e:
+                logger.warning(f"Inventory sync failed: {e}")
+
+    # -------------------------------------------------------------------------
+    # Reading
+    # -------------------------------------------------------------------------
+
+    @staticmethod
+    def _token_key(token: str) -> str:
+        return hashlib.sha256(token.encode()).hexdigest()
+
+    @property
+    def is_synced(self) -> bool:
+        """Whether at least one sync has completed."""
+        return self._synced_at is not None
+
+    def is_ready_for(self, token: str) -> bool:
+        """Whether mirrored data may be served to a request with this token.
+
+        True only if the token's last sync is recent and was for the group
+        the mirror currently holds.
+        """
+        verified = self._verified_tokens.get(self._token_key(token))
+        if not self.is_synced or verified is None:
+            return False
+        group_id, verified_at = verified
+        return group_id == self._group_id and time.monotonic() - verified_at < self._verify_ttl
+
+    @property
+    def items(self) -> list[dict[str, Any]]:
+        """All mirrored item records."""
+        return list(self._items.values())
+
+    def get_item(self, item_id: str) -> dict[str, Any] | None:
+        """Get one mirrored item record."""
+        return self._items.get(item_id)
+
+    @property
+    def labels(self) -> list[dict[str, Any]] | None:
+        """Mirrored labels, or None if unavailable (not synced or invalidated)."""
+        return self._labels
+
+    @property
+    def locations(self) -> list[dict[str, Any]] | None:
+        """Mirrored flat location list, or None if unavailable."""
+        return self._locations
+
+    @property
+    def highest_asset_id(self) -> int:
+        """Highest numeric asset ID seen."""
+        return self._highest_asset_id
+
+    def subscribe(self, listener: ChangeListener) -> None:
+        """Register a callback for item changes.
+
+        The first sync is published as a full snapshot; later syncs and local
+        writes as incremental changes. Listeners must not block.
+        """
+        self._listeners.append(listener)
+
+    def _publish(self, changes: InventoryChanges) -> None:
+        if not changes:
+            return
+        for listener in self._listeners:
+            try:
+                listener(changes)
+            except Exception as e:
+                logger.warning(f"Inventory change listener failed: {e}")
+
+    # -------------------------------------------------------------------------
+    # Local writes
+    # -------------------------------------------------------------------------
+
+    def record_item(self, item: dict[str, Any]) -> None:
+        """Apply an item created or updated through the companion."""
+        item_id = item.get("id")
+        if not item_id or not self.is_synced:
+            return
+        if self._local_ids is not None:
+            self._local_ids.add(item_id)
+        self._items[item_id] = item
+        self._track_asset_id(item)
+        self._publish(InventoryChanges(upserted=[item]))
+
+    def forget_item(self, item_id: str) -> None:
+        """Apply an item deleted through the companion."""
+        if self._local_ids is not None:
+            self._local_ids.add(item_id)
+        if self._items.pop(item_id, None) is not None:
+            self._publish(InventoryChanges(removed=[item_id]))
+
+    def _track_asset_id(self, item: dict[str, Any]) -> None:
+        # Local import: duplicate_detector imports this module
+        from .duplicate_detector import DuplicateDetector
+
+        asset_id = DuplicateDetector.parse_asset_id(item.get("assetId"))
+        if asset_id > self._highest_asset_id:
+            self._highest_asset_id = asset_id
+
+    # -------------------------------------------------------------------------
+    # Syncing
+    # -------------------------------------------------------------------------
+
+    @staticmethod
+    def _is_changed(previous: dict[str, Any] | None, summary: dict[str, Any]) -> bool:
+        if previous is None:
+            return True
+        return (
+            previous.get("updatedAt") != summary.get("updatedAt")
+            or previous.get("assetId") != summary.get("assetId")
+        )
+
+    async def sync(self, token: str) -> InventoryChanges:
+        """Run one differential sync pass.
+
+        Args:
+            token: Bearer token to sync with; verified for reads on success.
+
+        Returns:
+            The item changes applied (also published to subscribers).
+        """
+        if self._client is None:
+            raise RuntimeError("InventoryMirror has no client")
+        async with self._sync_lock:
+            started = time.perf_counter()
+            self._local_ids = set()
+            try:
+                changes = await self._sync(self._client, token)
+            finally:
+                self._local_ids = None
+            # Other tokens stay verified until their TTL runs out
+            now = time.monotonic()
+            self._verified_tokens = {
+                key: verified
+                for key, verified in self._verified_tokens.items()
+                if now - verified[1] < self._verify_ttl
+            }
+            self._verified_tokens[self._token_key(token)] = (self._group_id or "", now)
+            self.syncs += 1
+            if changes:
+                logger.debug(
+                    f"Inventory sync: {len(changes.upserted)} changed, "
+                    f"{len(changes.removed)} removed in "
+                    f"{(time.perf_counter() - started) * 1000:.0f}ms"
+                )
+            return changes
+
+    async def _sync(self, client: HomeboxClient, token: str) -> InventoryChanges:
+        group, labels, locations, listing = await asyncio.gather(
+            client.get_group(token),
+            client.list_labels(token),
+            client.list_locations(token),
+            client.list_all_items(token),
+        )
+
+        # A token of another group: its inventory replaces the mirrored one
+        group_id = str(group.get("id") or "")
+        if self._group_id is not None and group_id != self._group_id:
+            logger.debug("Inventory sync token belongs to another group, replacing the mirror")
+            self._items = {}
+            self._synced_at = None
+            self._highest_asset_id = 0
+        self._group_id = group_id
+
+        summaries = {item["id"]: item for item in listing.get("items", []) if item.get("id")}
+        changed = [
+            summary
+            for item_id, summary in summaries.items()
+            if self._is_changed(self._items.get(item_id), summary)
+        ]
+        details = await self._fetch_details(client, token, changed)
+
+        # Items written locally meanwhile are newer than this listing
+        local_ids = self._local_ids or set()
+        first_sync = not self.is_synced
+        upserted = []
+        for summary in changed:
+            if summary["id"] in local_ids:
+                continue
+            record = {**summary, **details.get(summary["id"], {})}
+            self._items[summary["id"]] = record
+            self._track_asset_id(record)
+            upserted.append(record)
+        removed = [
+            item_id
+            for item_id in self._items
+            if item_id not in summaries and item_id not in local_ids
+        ]
+        for item_id in removed:
+            del self._items[item_id]
+
+        self._labels = labels
+        self._locations = locations
+        self._synced_at = time.monotonic()
+
+        if first_sync:
+            changes = InventoryChanges(upserted=self.items, full=True)
+        else:
+            changes = InventoryChanges(upserted=upserted, removed=removed)
+        self._publish(changes)
+        return changes
+
+    async def _fetch_details(
+        self,
+        client: HomeboxClient,
+        token: str,
+        items: list[dict[str, Any]],
+    ) -> dict[str, dict[str, Any]]:
+        """Fetch DETAIL_FIELDS for changed items (missing entries keep the summary only)."""
+        if not items:
+            return {}
+        self.items_fetched += len(items)
+
+        if len(items) > _DETAIL_FETCH_LIMIT:
+            try:
+                return parse_export_details(await client.export_items(token))
+            except HomeboxAuthError:
+                raise
+            except Exception as e:
+                logger.warning(f"Inventory export failed, mirroring item summaries only: {e}")
+                return {}
+
+        semaphore = asyncio.Semaphore(_DETAIL_FETCH_CONCURRENCY)
+
+        async def fetch(item_id: str) -> tuple[str, dict[str, Any] | None]:
+            async with semaphore:
+                try:
+                    detail = await client.get_item(token, item_id)
+                except HomeboxAuthError:
+                    raise
+                except Exception as e:
+                    logger.trace(f"Failed to fetch item {item_id} for mirror: {e}")
+                    return item_id, None
+            return item_id, {name: detail.get(name) for name in DETAIL_FIELDS}
+
+        results = await asyncio.gather(*(fetch(item["id"]) for item in items))
+        return {item_id: detail for item_id, detail in results if detail is not None}
+
+    def stats(self) -> dict[str, Any]:
+        """Get mirror statistics."""
+        return {
+            "running": self.is_running,
+            "synced": self.is_synced,
+            "items": len(self._items),
+            "labels": len(self._labels) if self._labels is not None else None,
+            "locations": len(self._locations) if self._locations is not None else None,
+            "age_seconds": (
+                round(time.monotonic() - self._synced_at, 1) if self._synced_at is not None else None
+            ),
+            "syncs": self.syncs,
+            "items_fetched": self.items_fetched,
+            "highest_asset_id": self._highest_asset_id,
+        }
+
+
+# Singleton instance (initialized lazily)
+_inventory_mirror: InventoryMirror | None = None
+
+
+def get_inventory_mirror() -> InventoryMirror:
+    """Get the shared inventory mirror."""
+    global _inventory_mirror
+    if _inventory_mirror is None:
+        _inventory_mirror = InventoryMirror()
+    return _inventory_mirror
@@ -0,0 +1,399 @@
+"""Local full-text search index for inventory items.
+
+Chat searches (search_items) and filtered item lists used to forward the
+query to Homebox's `q` parameter: one network round-trip per search, and
+Homebox's own substring matching with no ranking and no typo tolerance.
+
+ItemSearchIndex keeps an in-memory inverted index over each item's name,
+description, manufacturer, model number, notes, labels and location, and
+answers queries locally:
+
+- BM25 ranking with per-field weights (a hit in the name outranks one in notes)
+- Prefix matching ("scr" finds "screwdriver") via a sorted vocabulary
+- Typo tolerance (edit distance 1, or 2 for long words) via a
+  deletion neighbourhood, only for words with no literal/prefix match
+- Incremental updates from the inventory mirror's change feed, which
+  covers writes made through the companion immediately and changes made
+  elsewhere (Homebox UI, other clients) after the next sync
+
+Until the mirror has synced for the requesting token, callers fall back
+to the Homebox query.
+
+Usage:
+    mirror = get_inventory_mirror()
+    mirror.touch(token)
+    index = get_item_search_index()
+    if mirror.is_ready_for(token) and index.is_ready:
+        response = index.search_page("cordless drill", page=1, page_size=20)
+"""
+
+from __future__ import annotations
+
+import math
+import re
+from bisect import bisect_left, insort
+from collections.abc import Iterable
+from dataclasses import dataclass
+from typing import Any
+
+from .inventory_mirror import InventoryChanges, get_inventory_mirror
+
+# Field weights applied to term frequencies (BM25F-style)
+FIELD_WEIGHTS: dict[str, float] = {
+    "name": 3.0,
+    "manufacturer": 2.0,
+    "model": 2.0,
+    "labels": 1.5,
+    "location": 1.5,
+    "description": 1.0,
+    "notes": 0.5,
+}
+
+# BM25 parameters
+_BM25_K1 = 1.2
+_BM25_B = 0.75
+
+# Score multipliers for expanded (non-literal) term matches
+_PREFIX_WEIGHT = 0.8
+_TYPO_WEIGHT = 0.6
+
+# Query words shorter than this only match literally
+_MIN_PREFIX_LENGTH = 2
+_MIN_TYPO_LENGTH = 4
+
+# Words at least this long tolerate two edits instead of one
+_LONG_WORD_LENGTH = 8
+
+# Max vocabulary terms a single prefix expands to
+_MAX_PREFIX_EXPANSIONS = 50
+
+_TOKEN_RE = re.compile(r"\w+")
+
+
+def tokenize(text: str | None) -> list[str]:
+    """Split text into lowercase word tokens."""
+    if not text:
+        return []
+    return _TOKEN_RE.findall(text.casefold())
+
+
+def _deletes(term: str) -> set[str]:
+    """All variants of a term with one character removed."""
+    return {term[:i] + term[i + 1 :] for i in range(len(term))}
+
+
+def _within_distance(a: str, b: str, max_distance: int) -> bool:
+    """Check whether two words are within an edit distance (adjacent swaps count as one)."""
+    if abs(len(a) - len(b)) > max_distance:
+        return False
+    previous2: list[int] = []
+    previous = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        current = [i] + [0] * len(b)
+        for j in range(1, len(b) + 1):
+            cost = 0 if a[i - 1] == b[j - 1] else 1
+            current[j] = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost)
+            if i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                current[j] = min(current[j], previous2[j - 2] + 1)
+        if min(current) > max_distance:
+            return False
+        previous2, previous = previous, current
+    return previous[-1] <= max_distance
+
+
+def _document_fields(item: dict[str, Any]) -> dict[str, str]:
+    """Extract the searchable text of an item (API or export shape)."""
+    location = item.get("location")
+    labels = item.get("labels") or []
+    return {
+        "name": item.get("name") or "",
+        "description": item.get("description") or "",
+        "manufacturer": item.get("manufacturer") or "",
+        "model": item.get("modelNumber") or "",
+        "notes": item.get("notes") or "",
+        "labels": " ".join(
+            label.get("name") or "" for label in labels if isinstance(label, dict)
+        ),
+        "location": (location.get("name") or "") if isinstance(location, dict) else "",
+    }
+
+
+@dataclass(slots=True)
+class _Document:
+    """An indexed item."""
+
+    item: dict[str, Any]
+    term_freqs: dict[str, float]
+    length: float
+    location_id: str | None
+
+
+@dataclass(slots=True)
+class SearchHit:
+    """A ranked search result."""
+
+    item_id: str
+    score: float
+    item: dict[str, Any]
+
+
+class ItemSearchIndex:
+    """In-memory inverted index with BM25 ranking over inventory items.
+
+    All methods are synchronous and cheap. Items passed to upsert() are
+    stored as-is and returned from searches, so they should be Homebox item
+    dicts (summary or full).
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty index."""
+        self._docs: dict[str, _Document] = {}
+        self._postings: dict[str, dict[str, float]] = {}
+        self._vocab: list[str] = []  # Sorted, for prefix lookups
+        self._delete_map: dict[str, set[str]] = {}  # One-deletion variant -> terms
+        self._total_length = 0.0
+        self._is_ready = False
+
+    @property
+    def is_ready(self) -> bool:
+        """Whether the index has been populated with a full snapshot."""
+        return self._is_ready
+
+    def __len__(self) -> int:
+        return len(self._docs)
+
+    # -------------------------------------------------------------------------
+    # Mutation
+    # -------------------------------------------------------------------------
+
+    def upsert(self, item: dict[str, Any]) -> bool:
+        """Add or replace an item.
+
+        Args:
+            item: Homebox item dict (must have an id).
+
+        Returns:
+            True if the item was indexed.
+        """
+        item_id = item.get("id")
+        if not item_id:
+            return False
+        self._remove_document(item_id)
+
+        term_freqs: dict[str, float] = {}
+        length = 0.0
+        for field_name, text in _document_fields(item).items():
+            weight = FIELD_WEIGHTS[field_name]
+            for term in tokenize(text):
+                term_freqs[term] = term_freqs.get(term, 0.0) + weight
+                length += weight
+
+        location = item.get("location")
+        self._docs[item_id] = _Document(
+            item=item,
+            term_freqs=term_freqs,
+            length=length,
+            location_id=location.get("id") if isinstance(location, dict) else None,
+        )
+        self._total_length += length
+        for term, freq in term_freqs.items():
+            postings = self._postings.get(term)
+            if postings is None:
+                postings = self._postings[term] = {}
+                self._add_term(term)
+            postings[item_id] = freq
+        return True
+
+    def remove(self, item_id: str) -> bool:
+        """Remove an item.
+
+        Returns:
+            True if the item was indexed.
+        """
+        return self._remove_document(item_id)
+
+    def replace_all(self, items: Iterable[dict[str, Any]]) -> None:
+        """Replace the whole index contents and mark it ready."""
+        self._docs = {}
+        self._postings = {}
+        self._vocab = []
+        self._delete_map = {}
+        self._total_length = 0.0
+        for item in items:
+            self.upsert(item)
+        self._is_ready = True
+
+    def apply_changes(self, changes: InventoryChanges) -> None:
+        """Apply a batch from the inventory mirror's change feed."""
+        if changes.full:
+            self.replace_all(changes.upserted)
+            return
+        if not self._is_ready:
+            return
+        for item_id in changes.removed:
+            self.remove(item_id)
+        for item in changes.upserted:
+            self.upsert(item)
+
+    def _remove_document(self, item_id: str) -> bool:
+        doc = self._docs.pop(item_id, None)
+        if doc is None:
+            return False
+        self._total_length -= doc.length
+        for term in doc.term_freqs:
+            postings = self._postings[term]
+            del postings[item_id]
+            if not postings:
+                del self._postings[term]
+                self._remove_term(term)
+        return True
+
+    def _add_term(self, term: str) -> None:
+        insort(self._vocab, term)
+        for key in _deletes(term) | {term}:
+            self._delete_map.setdefault(key, set()).add(term)
+
+    def _remove_term(self, term: str) -> None:
+        position = bisect_left(self._vocab, term)
+        if position < len(self._vocab) and self._vocab[position] == term:
+            del self._vocab[position]
+        for key in _deletes(term) | {term}:
+            terms = self._delete_map.get(key)
+            if terms is not None:
+                terms.discard(term)
+                if not terms:
+                    del self._delete_map[key]
+
+    # -------------------------------------------------------------------------
+    # Querying
+    # -------------------------------------------------------------------------
+
+    def _expand(self, word: str) -> dict[str, float]:
+        """Map a query word to matching vocabulary terms and their score weights."""
+        matches: dict[str, float] = {}
+        if word in self._postings:
+            matches[word] = 1.0
+        if len(word) >= _MIN_PREFIX_LENGTH:
+            position = bisect_left(self._vocab, word)
+            expansions = 0
+            while (
+                position < len(self._vocab)
+                and expansions < _MAX_PREFIX_EXPANSIONS
+                and self._vocab[position].startswith(word)
+            ):
+                matches.setdefault(self._vocab[position], _PREFIX_WEIGHT)
+                position += 1
+                expansions += 1
+        if not matches and len(word) >= _MIN_TYPO_LENGTH:
+            max_distance = 2 if len(word) >= _LONG_WORD_LENGTH else 1
+            for key in _deletes(word) | {word}:
+                for term in self._delete_map.get(key, ()):
+                    if term not in matches and _within_distance(word, term, max_distance):
+                        matches[term] = _TYPO_WEIGHT
+        return matches
+
+    def search(
+        self,
+        query: str,
+        *,
+        location_id: str | None = None,
+        limit: int | None = None,
+    ) -> list[SearchHit]:
+        """Rank indexed items against a query.
+
+        If any item matches every query word, only those items are returned;
+        otherwise items matching any word are returned.
+
+        Args:
+            query: Free-text query.
+            location_id: Optional location ID filter (direct location only).
+            limit: Optional max number of hits.
+
+        Returns:
+            Hits ordered by descending score.
+        """
+        words = list(dict.fromkeys(tokenize(query)))
+        if not words or not self._docs:
+            return []
+
+        doc_count = len(self._docs)
+        average_length = self._total_length / doc_count or 1.0
+        scores: dict[str, float] = {}
+        coverage: dict[str, int] = {}
+
+        for word in words:
+            word_scores: dict[str, float] = {}
+            for term, weight in self._expand(word).items():
+                postings = self._postings[term]
+                idf = math.log(1 + (doc_count - len(postings) + 0.5) / (len(postings) + 0.5))
+                for doc_id, freq in postings.items():
+                    doc = self._docs[doc_id]
+                    if location_id is not None and doc.location_id != location_id:
+                        continue
+                    norm = _BM25_K1 * (1 - _BM25_B + _BM25_B * doc.length / average_length)
+                    score = weight * idf * freq * (_BM25_K1 + 1) / (freq + norm)
+                    if score > word_scores.get(doc_id, 0.0):
+                        word_scores[doc_id] = score
+            for doc_id, score in word_scores.items():
+                scores[doc_id] = scores.get(doc_id, 0.0) + score
+                coverage[doc_id] = coverage.get(doc_id, 0) + 1
+
+        if not scores:
+            return []
+        required = len(words) if len(words) in coverage.values() else 1
+        ranked = sorted(
+            (doc_id for doc_id, matched in coverage.items() if matched >= required),
+            key=lambda doc_id: (
+                -scores[doc_id],
+                (self._docs[doc_id].item.get("name") or "").casefold(),
+            ),
+        )
+        if limit is not None:
+            ranked = ranked[:limit]
+        return [SearchHit(doc_id, scores[doc_id], self._docs[doc_id].item) for doc_id in ranked]
+
+    def search_page(
+        self,
+        query: str,
+        *,
+        location_id: str | None = None,
+        page: int = 1,
+        page_size: int = 50,
+    ) -> dict[str, Any]:
+        """Search and return one page shaped like HomeboxClient.list_items.
+
+        Returns:
+            {items: [...], page, pageSize, total}
+        """
+        hits = self.search(query, location_id=location_id)
+        start = (max(page, 1) - 1) * page_size
+        return {
+            "items": [hit.item for hit in hits[start : start + page_size]],
+            "page": page,
+            "pageSize": page_size,
+            "total": len(hits),
+        }
+
+    def stats(self) -> dict[str, Any]:
+        """Get index statistics."""
+        return {
+            "ready": self._is_ready,
+            "items": len(self._docs),
+            "terms": len(self._vocab),
+        }
+
+
+# Singleton instance (initialized lazily)
+_search_index: ItemSearchIndex | None = None
+
+
+def get_item_search_index() -> ItemSearchIndex:
+    """Get the shared item search index, fed by the shared inventory mirror."""
+    global _search_index
+    if _search_index is None:
+        _search_index = ItemSearchIndex()
+        mirror = get_inventory_mirror()
+        if mirror.is_synced:
+            _search_index.replace_all(mirror.items)
+        mirror.subscribe(_search_index.apply_changes)
+    return _search_index
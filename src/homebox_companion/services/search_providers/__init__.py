@@ -5,18 +5,26 @@ Provides abstraction for multiple web search backends:
 - Tavily: AI-optimized search API
 - Google Custom Search: Google's programmable search
 - SearXNG: Self-hosted meta search engine (no API key needed)
+
+Responses to product search queries are cached (see cache.py).
 """
 
-from .base import BaseSearchProvider, SearchResult, SearchResponse
+from .base import BaseSearchProvider, SearchResult, SearchResponse, SearchUsage, track_search_usage
 from .tavily import TavilySearchProvider
 from .google_cse import GoogleCSESearchProvider
 from .searxng import SearXNGSearchProvider
+from .cache import SearchResponseCache, close_search_cache, get_search_cache
 
 __all__ = [
     "BaseSearchProvider",
     "SearchResult",
     "SearchResponse",
+    "SearchUsage",
+    "track_search_usage",
     "TavilySearchProvider",
     "GoogleCSESearchProvider",
     "SearXNGSearchProvider",
+    "SearchResponseCache",
+    "get_search_cache",
+    "close_search_cache",
 ]
@@ -5,12 +5,22 @@ All search providers implement this interface to allow easy swapping
 between Tavily, Google CSE, SearXNG, or any future providers.
 """
 
+import asyncio
 from abc import ABC, abstractmethod
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
 from dataclasses import dataclass, field
 from typing import Any
 
 from loguru import logger
 
+# Minimum results requested per product search query
+_PRODUCT_QUERY_RESULTS = 3
+
+# Reciprocal rank fusion constant (larger = flatter weighting of ranks)
+_RRF_K = 60
+
 
 @dataclass
 class SearchResult:
@@ -66,6 +76,32 @@ class SearchResponse:
         return "\n".join(parts)
 
 
+@dataclass
+class SearchUsage:
+    """Search queries sent to providers (cache hits are free)."""
+
+    queries: int = 0
+
+
+_search_usage: ContextVar[SearchUsage | None] = ContextVar("search_usage", default=None)
+
+
+@contextmanager
+def track_search_usage() -> Iterator[SearchUsage]:
+    """
+    Count product search queries sent to providers within this block.
+
+    Only queries made by the current task, and tasks it starts, are counted,
+    so concurrent searches elsewhere in the app are not.
+    """
+    usage = SearchUsage()
+    token = _search_usage.set(usage)
+    try:
+        yield usage
+    finally:
+        _search_usage.reset(token)
+
+
 class BaseSearchProvider(ABC):
     """
     Abstract base class for web search providers.
@@ -74,8 +110,16 @@ class BaseSearchProvider(ABC):
     - search(): Perform a web search
     - is_configured(): Check if provider has required credentials
     - provider_name: Human-readable provider name
+
+    Subclasses set max_concurrent_queries to cap how many of their queries
+    run at once (across all concurrent product searches).
     """
 
+    max_concurrent_queries: int = 3
+
+    def __init__(self) -> None:
+        self._query_slots = asyncio.Semaphore(self.max_concurrent_queries)
+
     @property
     @abstractmethod
     def provider_name(self) -> str:
@@ -117,18 +161,28 @@ class BaseSearchProvider(ABC):
         manufacturer: str,
         model_number: str,
         product_name: str = "",
+        max_results: int = 8,
     ) -> SearchResponse:
         """
         Search for product specifications and pricing.
 
-        Performs multiple searches to gather comprehensive product information:
+        Runs several queries concurrently (capped per provider) to gather
+        comprehensive product information:
         1. Specifications and features
         2. Pricing (MSRP, retail price)
+        3. Retailer pages
+
+        Responses are served from the shared search cache when possible.
+        Each query asks for enough results that all queries but one can fill
+        max_results, and once max_results unique results are in, queries
+        still pending are cancelled. Results are merged by reciprocal rank fusion, so the order
+        depends on each query's ranking, not on which query answered first.
 
         Args:
             manufacturer: Product manufacturer
             model_number: Model/part number
             product_name: Optional product name hint
+            max_results: Maximum number of unique results to return
 
         Returns:
             SearchResponse with combined results from all searches
@@ -154,26 +208,73 @@ class BaseSearchProvider(ABC):
             f"{base_query} site:lowes.com OR site:digikey.com OR site:mouser.com OR site:grainger.com",
         ]
 
-        # Collect all results
-        all_results: list[SearchResult] = []
+        from .cache import get_search_cache
+
+        cache = get_search_cache()
+        # Without the slowest query the others must still be able to fill
+        # max_results, or the early stop below could never trigger
+        per_query = max(_PRODUCT_QUERY_RESULTS, -(-max_results // (len(queries) - 1)))
+
+        async def run_query(query: str) -> SearchResponse:
+            cached = await cache.aget(self.provider_name, query, per_query, True)
+            if cached is not None:
+                return cached
+            async with self._query_slots:
+                logger.info(f"Product search query: {query}")
+                usage = _search_usage.get()
+                if usage is not None:
+                    usage.queries += 1
+                response = await self.search(query, max_results=per_query, include_content=True)
+            await cache.aset(self.provider_name, query, per_query, True, response)
+            return response
+
+        tasks = [asyncio.create_task(run_query(query)) for query in queries]
+        responses: dict[int, SearchResponse] = {}
         seen_urls: set[str] = set()
-
-        for query in queries:
-            logger.info(f"Product search query: {query}")
-            response = await self.search(query, max_results=3, include_content=True)
-
-            if response.success:
-                for result in response.results:
-                    # Deduplicate by URL
-                    if result.url not in seen_urls:
-                        seen_urls.add(result.url)
-                        all_results.append(result)
+        try:
+            pending = set(tasks)
+            while pending and len(seen_urls) < max_results:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    response = task.result()
+                    if response.success:
+                        responses[tasks.index(task)] = response
+                        seen_urls.update(result.url for result in response.results)
+            if pending:
+                logger.debug(
+                    f"Product search has {len(seen_urls)} results, "
+                    f"cancelling {len(pending)} pending queries"
+                )
+        finally:
+            for task in tasks:
+                task.cancel()
+
+        all_results = self._fuse_results(
+            [responses[index].results for index in sorted(responses)]
+        )
 
         # Return combined response
         combined_query = f"{base_query} (specs + pricing)"
         return SearchResponse(
             query=combined_query,
-            results=all_results[:8],  # Limit to top 8 unique results
+            results=all_results[:max_results],
             total_results=len(all_results),
             provider=self.provider_name,
         )
+
+    @staticmethod
+    def _fuse_results(ranked_lists: list[list[SearchResult]]) -> list[SearchResult]:
+        """
+        Merge ranked result lists by reciprocal rank fusion, deduplicating by URL.
+
+        Ties are broken by first appearance (list order, then rank), so the
+        output only depends on the input lists.
+        """
+        scores: dict[str, float] = {}
+        first_seen: dict[str, tuple[int, int, SearchResult]] = {}
+        for list_index, results in enumerate(ranked_lists):
+            for rank, result in enumerate(results):
+                scores[result.url] = scores.get(result.url, 0.0) + 1.0 / (_RRF_K + rank + 1)
+                first_seen.setdefault(result.url, (list_index, rank, result))
+        ordered = sorted(scores, key=lambda url: (-scores[url], first_seen[url][:2]))
+        return [first_seen[url][2] for url in ordered]
@@ -0,0 +1,304 @@
+"""
+Persistent cache for web search responses.
+
+Product searches repeat: the same "<manufacturer> <model> MSRP price retail"
+query is sent again whenever the enrichment cache entry for a product
+expires, or for another item of the same model. Tavily and Google CSE bill
+per query, so SearchResponseCache keeps successful responses in a SQLite
+database under the data directory, keyed by provider and normalized query.
+
+- Entries expire after HBC_SEARCH_CACHE_TTL seconds (0 disables the cache)
+- At most HBC_SEARCH_CACHE_MAX_ENTRIES entries are kept; the least recently
+  used ones are evicted first
+- Failed and empty responses are never cached
+- The entry count is kept as a running total, so writes do not scan the
+  table; async code uses aget()/aset(), which run the database work in a
+  worker thread
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+from loguru import logger
+
+from homebox_companion.core.config import settings
+
+from .base import SearchResponse, SearchResult
+
+# Run expired-entry cleanup at most this often (seconds)
+_SWEEP_INTERVAL = 600
+
+
+def normalize_query(query: str) -> str:
+    """Normalize a query for cache lookups (case and whitespace)."""
+    return " ".join(query.casefold().split())
+
+
+class SearchResponseCache:
+    """SQLite-backed, size-bounded cache of SearchResponse payloads.
+
+    Thread-safety: All database access happens under a lock.
+
+    Example:
+        >>> cache = SearchResponseCache()
+        >>> response = await cache.aget("Tavily", query, max_results=3, include_content=True)
+        >>> if response is None:
+        ...     response = await provider.search(query, 3, True)
+        ...     await cache.aset("Tavily", query, 3, True, response)
+    """
+
+    def __init__(
+        self,
+        path: str | Path | None = None,
+        ttl: float | None = None,
+        max_entries: int | None = None,
+    ) -> None:
+        """Open (or create) the cache database.
+
+        Args:
+            path: Database file. Defaults to search_cache.db in HBC_DATA_DIR.
+            ttl: Entry lifetime in seconds. Defaults to HBC_SEARCH_CACHE_TTL.
+            max_entries: Max cached responses. Defaults to HBC_SEARCH_CACHE_MAX_ENTRIES.
+        """
+        self._path = Path(path) if path else Path(settings.data_dir) / "search_cache.db"
+        self._ttl = settings.search_cache_ttl if ttl is None else ttl
+        self._max_entries = settings.search_cache_max_entries if max_entries is None else max_entries
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._last_sweep = 0.0
+        # Rows in the table, loaded when the database is opened
+        self._count = 0
+        self._conn: sqlite3.Connection | None = None
+
+    @property
+    def enabled(self) -> bool:
+        """Whether responses are cached."""
+        return self._ttl > 0 and self._max_entries > 0
+
+    def _connection(self) -> sqlite3.Connection:
+        """Open the database on first use. Caller must hold self._lock."""
+        if self._conn is None:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(
+                str(self._path), check_same_thread=False, isolation_level=None
+            )
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute("PRAGMA busy_timeout=5000")
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS search_responses (
+                    key TEXT PRIMARY KEY,
+                    provider TEXT NOT NULL,
+                    query TEXT NOT NULL,
+                    payload TEXT NOT NULL,
+                    created_at REAL NOT NULL,
+                    last_access REAL NOT NULL
+                ) WITHOUT ROWID
+                """
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS search_responses_last_access "
+                "ON search_responses (last_access)"
+            )
+            (self._count,) = self._conn.execute("SELECT COUNT(*) FROM search_responses").fetchone()
+        return self._conn
+
+    @staticmethod
+    def _key(provider: str, query: str, max_results: int, include_content: bool) -> str:
+        raw = f"{provider}\x00{normalize_query(query)}\x00{max_results}\x00{int(include_content)}"
+        return hashlib.sha256(raw.encode()).hexdigest()
+
+    def get(
+        self,
+        provider: str,
+        query: str,
+        max_results: int,
+        include_content: bool,
+    ) -> SearchResponse | None:
+        """Get a cached response, or None on a miss or expired entry."""
+        if not self.enabled:
+            return None
+        key = self._key(provider, query, max_results, include_content)
+        now = time.time()
+        try:
+            with self._lock:
+                conn = self._connection()
+                row = conn.execute(
+                    "SELECT payload, created_at FROM search_responses WHERE key = ?", (key,)
+                ).fetchone()
+                if row is None or now - row[1] > self._ttl:
+                    if row is not None:
+                        self._count -= conn.execute(
+                            "DELETE FROM search_responses WHERE key = ?", (key,)
+                        ).rowcount
+                    self._misses += 1
+                    return None
+                conn.execute(
+                    "UPDATE search_responses SET last_access = ? WHERE key = ?", (now, key)
+                )
+                self._hits += 1
+            data = json.loads(row[0])
+        except (sqlite3.Error, json.JSONDecodeError) as e:
+            logger.warning(f"Search cache read failed: {e}")
+            return None
+
+        logger.debug(f"Search cache hit ({provider}): {query}")
+        return SearchResponse(
+            query=query,
+            results=[SearchResult(**result) for result in data.get("results", [])],
+            total_results=data.get("total_results", 0),
+            provider=provider,
+        )
+
+    async def aget(
+        self,
+        provider: str,
+        query: str,
+        max_results: int,
+        include_content: bool,
+    ) -> SearchResponse | None:
+        """Like get(), running the database lookup in a worker thread."""
+        if not self.enabled:
+            return None
+        return await asyncio.to_thread(self.get, provider, query, max_results, include_content)
+
+    def set(
+        self,
+        provider: str,
+        query: str,
+        max_results: int,
+        include_content: bool,
+        response: SearchResponse,
+    ) -> None:
+        """Cache a successful response."""
+        if not self.enabled or not response.success:
+            return
+        key = self._key(provider, query, max_results, include_content)
+        payload = json.dumps({
+            "results": [result.to_dict() for result in response.results],
+            "total_results": response.total_results,
+        })
+        now = time.time()
+        try:
+            with self._lock:
+                conn = self._connection()
+                exists = conn.execute(
+                    "SELECT 1 FROM search_responses WHERE key = ?", (key,)
+                ).fetchone()
+                conn.execute(
+                    "INSERT OR REPLACE INTO search_responses "
+                    "(key, provider, query, payload, created_at, last_access) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    (key, provider, normalize_query(query), payload, now, now),
+                )
+                if exists is None:
+                    self._count += 1
+                self._enforce_limits(conn, now)
+        except sqlite3.Error as e:
+            logger.warning(f"Search cache write failed: {e}")
+
+    async def aset(
+        self,
+        provider: str,
+        query: str,
+        max_results: int,
+        include_content: bool,
+        response: SearchResponse,
+    ) -> None:
+        """Like set(), running the database write in a worker thread."""
+        if not self.enabled or not response.success:
+            return
+        await asyncio.to_thread(self.set, provider, query, max_results, include_content, response)
+
+    def _enforce_limits(self, conn: sqlite3.Connection, now: float) -> None:
+        """Drop expired entries (periodically) and evict LRU entries over the cap.
+
+        Note: Caller must hold self._lock.
+        """
+        if now - self._last_sweep > _SWEEP_INTERVAL:
+            self._last_sweep = now
+            expired = conn.execute(
+                "DELETE FROM search_responses WHERE created_at < ?", (now - self._ttl,)
+            ).rowcount
+            self._count -= expired
+            if expired:
+                logger.debug(f"Search cache dropped {expired} expired entries")
+
+        overflow = self._count - self._max_entries
+        if overflow > 0:
+            evicted = conn.execute(
+                "DELETE FROM search_responses WHERE key IN ("
+                "SELECT key FROM search_responses ORDER BY last_access LIMIT ?)",
+                (overflow,),
+            ).rowcount
+            self._count -= evicted
+            self._evictions += evicted
+
+    def clear(self) -> int:
+        """Remove all cached responses. Returns count of cleared entries."""
+        try:
+            with self._lock:
+                cleared = self._connection().execute("DELETE FROM search_responses").rowcount
+                self._count = 0
+                return cleared
+        except sqlite3.Error as e:
+            logger.warning(f"Search cache clear failed: {e}")
+            return 0
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def stats(self) -> dict[str, Any]:
+        """Get cache statistics (without creating the database)."""
+        lookups = self._hits + self._misses
+        if self.enabled and self._path.exists():
+            try:
+                with self._lock:
+                    self._connection()  # Loads the entry count on first use
+            except sqlite3.Error:
+                pass
+        return {
+            "enabled": self.enabled,
+            "entries": self._count,
+            "max_entries": self._max_entries,
+            "ttl_seconds": self._ttl,
+            "hits": self._hits,
+            "misses": self._misses,
+            "hit_rate": round(self._hits / lookups, 3) if lookups else 0.0,
+            "evictions": self._evictions,
+        }
+
+
+# Singleton instance (initialized lazily)
+_search_cache: SearchResponseCache | None = None
+
+
+def get_search_cache() -> SearchResponseCache:
+    """Get the shared search response cache."""
+    global _search_cache
+    if _search_cache is None:
+        _search_cache = SearchResponseCache()
+    return _search_cache
+
+
+def close_search_cache() -> None:
+    """Close the shared search response cache (on app shutdown)."""
+    global _search_cache
+    if _search_cache is not None:
+        _search_cache.close()
+        _search_cache = None
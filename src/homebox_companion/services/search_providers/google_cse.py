@@ -24,6 +24,7 @@ from urllib.parse import urlencode
 
 import httpx
 
+from homebox_companion.core.transport import get_transport_registry
 from homebox_companion.services.debug_logger import debug_log
 from .base import BaseSearchProvider, SearchResult, SearchResponse
 
@@ -54,6 +55,7 @@ class GoogleCSESearchProvider(BaseSearchProvider):
             api_key: Google Cloud API key
             search_engine_id: Programmable Search Engine ID (cx)
         """
+        super().__init__()
         self._api_key = api_key
         self._search_engine_id = search_engine_id
         self._client: httpx.AsyncClient | None = None
@@ -73,7 +75,11 @@ class GoogleCSESearchProvider(BaseSearchProvider):
     async def _get_client(self) -> httpx.AsyncClient:
         """Get or create HTTP client."""
         if self._client is None:
-            self._client = httpx.AsyncClient(timeout=30.0)
+            registry = get_transport_registry()
+            if registry is not None:
+                self._client = registry.client_for(GOOGLE_CSE_API_URL, timeout=30.0)
+            else:
+                self._client = httpx.AsyncClient(timeout=30.0)
         return self._client
 
     async def close(self) -> None:
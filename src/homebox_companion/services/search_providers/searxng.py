@@ -23,6 +23,7 @@ from urllib.parse import urlencode, urljoin
 import httpx
 from loguru import logger
 
+from homebox_companion.core.transport import get_transport_registry
 from homebox_companion.services.debug_logger import debug_log
 from .base import BaseSearchProvider, SearchResult, SearchResponse
 
@@ -37,6 +38,9 @@ class SearXNGSearchProvider(BaseSearchProvider):
     The JSON API must be enabled on the SearXNG instance.
     """
 
+    # Public instances rate-limit bursts of queries from one client
+    max_concurrent_queries = 2
+
     def __init__(self, instance_url: str | None = None):
         """
         Initialize SearXNG provider.
@@ -44,6 +48,7 @@ class SearXNGSearchProvider(BaseSearchProvider):
         Args:
             instance_url: URL to SearXNG instance (e.g., https://searx.example.com)
         """
+        super().__init__()
         self._instance_url = instance_url.rstrip("/") if instance_url else None
         self._client: httpx.AsyncClient | None = None
 
@@ -61,10 +66,18 @@ class SearXNGSearchProvider(BaseSearchProvider):
     async def _get_client(self) -> httpx.AsyncClient:
         """Get or create HTTP client."""
         if self._client is None:
-            self._client = httpx.AsyncClient(
-                timeout=30.0,
-                follow_redirects=True,
-            )
+            registry = get_transport_registry()
+            if registry is not None and self._instance_url:
+                self._client = registry.client_for(
+                    self._instance_url,
+                    timeout=30.0,
+                    follow_redirects=True,
+                )
+            else:
+                self._client = httpx.AsyncClient(
+                    timeout=30.0,
+                    follow_redirects=True,
+                )
         return self._client
 
     async def close(self) -> None:
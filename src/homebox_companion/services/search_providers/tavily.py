@@ -15,6 +15,7 @@ from typing import Any
 
 import httpx
 
+from homebox_companion.core.transport import get_transport_registry
 from homebox_companion.services.debug_logger import debug_log
 from .base import BaseSearchProvider, SearchResult, SearchResponse
 
@@ -38,6 +39,7 @@ class TavilySearchProvider(BaseSearchProvider):
         Args:
             api_key: Tavily API key (get one at https://tavily.com)
         """
+        super().__init__()
         self._api_key = api_key
         self._client: httpx.AsyncClient | None = None
 
@@ -55,7 +57,11 @@ class TavilySearchProvider(BaseSearchProvider):
     async def _get_client(self) -> httpx.AsyncClient:
         """Get or create HTTP client."""
         if self._client is None:
-            self._client = httpx.AsyncClient(timeout=30.0)
+            registry = get_transport_registry()
+            if registry is not None:
+                self._client = registry.client_for(TAVILY_API_URL, timeout=30.0)
+            else:
+                self._client = httpx.AsyncClient(timeout=30.0)
         return self._client
 
     async def close(self) -> None:
@@ -2,14 +2,25 @@
 
 from __future__ import annotations
 
+import asyncio
+import json
 import os
-from collections.abc import Generator
+from collections.abc import AsyncIterator, Generator, Iterator
 from pathlib import Path
 
 import pytest
 import pytest_asyncio
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+from homebox_companion.services.enrichment import EnrichmentService
+from homebox_companion.services.search_providers import (
+    BaseSearchProvider,
+    SearchResponse,
+    SearchResponseCache,
+    SearchResult,
+)
+from homebox_companion.services.search_providers import cache as cache_module
+
 # Demo server URL for integration tests
 DEMO_HOMEBOX_URL = "https://demo.homebox.software"
 DEMO_USERNAME = "demo@example.com"
@@ -275,3 +286,94 @@ async def cleanup_locations(homebox_api_url: str, homebox_credentials: tuple[str
                         pass
         except Exception:
             pass
+
+
+# ---------------------------------------------------------------------------
+# Enrichment Fakes
+# ---------------------------------------------------------------------------
+
+
+def _enrichment_answer(model: str) -> dict:
+    return {"name": f"Product {model}", "description": "", "features": []}
+
+
+class _FakeEnrichmentAIProvider:
+    """AI provider answering single and packed enrichment prompts, tracking concurrency."""
+
+    def __init__(self) -> None:
+        self.delay = 0.0
+        self.packed_response: str | None = None
+        self.skip: set[str] = set()
+        self.context_window: int | None = 128_000
+        self.prompts: list[str] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def complete(self, prompt: str) -> str:
+        self.prompts.append(prompt)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(self.delay)
+        self.in_flight -= 1
+        models = [block.split("\n")[0] for block in prompt.split("Model: ")[1:]]
+        if "### Product" not in prompt:
+            return json.dumps(_enrichment_answer(models[0]))
+        if self.packed_response is not None:
+            return self.packed_response
+        return json.dumps({
+            str(number): _enrichment_answer(model)
+            for number, model in enumerate(models, 1)
+            if model not in self.skip
+        })
+
+    @property
+    def packed_prompts(self) -> list[str]:
+        return [prompt for prompt in self.prompts if "### Product" in prompt]
+
+
+class _FakeSearchProvider(BaseSearchProvider):
+    """Search provider returning one result per query."""
+
+    @property
+    def provider_name(self) -> str:
+        return "Fake"
+
+    def is_configured(self) -> bool:
+        return True
+
+    async def search(self, query: str, max_results: int = 5, include_content: bool = True) -> SearchResponse:
+        result = SearchResult(
+            title=query,
+            url=f"https://reviews.example/{hash(query)}",
+            snippet="A cordless tool with a brushless motor and two batteries.",
+        )
+        return SearchResponse(query=query, results=[result], total_results=1, provider="Fake")
+
+
+@pytest.fixture
+def search_cache(tmp_path, monkeypatch) -> Iterator[SearchResponseCache]:
+    """Give the test its own search cache."""
+    cache = SearchResponseCache(tmp_path / "search_cache.db", ttl=3600, max_entries=100)
+    monkeypatch.setattr(cache_module, "_search_cache", cache)
+    yield cache
+    cache.close()
+
+
+@pytest.fixture
+def search_provider() -> _FakeSearchProvider:
+    """Fake web search provider."""
+    return _FakeSearchProvider()
+
+
+@pytest.fixture
+def ai_provider() -> _FakeEnrichmentAIProvider:
+    """Fake AI provider for enrichment."""
+    return _FakeEnrichmentAIProvider()
+
+
+@pytest_asyncio.fixture
+async def service(tmp_path, ai_provider) -> AsyncIterator[EnrichmentService]:
+    """Enrichment service backed by the fake AI provider and a temporary cache."""
+    service = EnrichmentService(cache_dir=tmp_path, ai_provider=ai_provider)
+    yield service
+    await service.aclose()
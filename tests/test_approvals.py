@@ -0,0 +1,177 @@
+"""Tests for ApprovalService bulk execution and dependency planning."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+import pytest
+
+from homebox_companion.chat.approvals import ApprovalService, plan_dependencies
+from homebox_companion.chat.session import ChatSession, PendingApproval
+from homebox_companion.mcp.tools import get_tools
+from homebox_companion.mcp.types import ToolResult
+
+pytestmark = pytest.mark.unit
+
+
+class _FakeExecutor:
+    """Records executed calls and how many ran at once."""
+
+    def __init__(self, failing: set[str] = frozenset()) -> None:
+        self.failing = failing
+        self.started: list[str] = []
+        self.finished: list[str] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def execute(self, tool_name: str, params: dict[str, Any], token: str, cache=None) -> ToolResult:
+        self.started.append(tool_name)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+        self.finished.append(tool_name)
+        if tool_name in self.failing:
+            return ToolResult(success=False, error="boom")
+        return ToolResult(success=True, data={"id": f"new-{len(self.finished)}", **params})
+
+    def get_tool(self, name: str):
+        return next((tool for tool in get_tools() if tool.name == name), None)
+
+
+def _queue(session: ChatSession, tool_name: str, **params: Any) -> str:
+    approval = PendingApproval(
+        id=f"approval-{len(session.pending_approvals)}", tool_name=tool_name, parameters=params
+    )
+    session.add_pending_approval(approval)
+    return approval.id
+
+
+class TestPlanDependencies:
+    """Tests for plan_dependencies."""
+
+    def test_independent_creates_have_no_dependencies(self):
+        calls = [("create_item", {"name": f"Item {n}", "location_id": "loc-1"}) for n in range(3)]
+
+        assert plan_dependencies(calls) == [set(), set(), set()]
+
+    def test_location_create_before_item_create(self):
+        calls = [
+            ("create_location", {"name": "Shelf"}),
+            ("create_item", {"name": "Drill", "location_id": "loc-1"}),
+            ("create_label", {"name": "Tools"}),
+        ]
+
+        assert plan_dependencies(calls) == [set(), {0}, set()]
+
+    def test_same_item_writes_stay_ordered(self):
+        calls = [
+            ("update_item", {"item_id": "a", "name": "A"}),
+            ("update_item", {"item_id": "b", "name": "B"}),
+            ("delete_item", {"item_id": "a"}),
+        ]
+
+        assert plan_dependencies(calls) == [set(), set(), {0}]
+
+    def test_location_update_before_item_move(self):
+        calls = [
+            ("update_location", {"location_id": "loc-1", "name": "Garage"}),
+            ("update_item", {"item_id": "a", "location_id": "loc-1"}),
+            ("update_item", {"item_id": "b", "location_id": "loc-2"}),
+        ]
+
+        assert plan_dependencies(calls) == [set(), {0}, set()]
+
+    def test_all_items_write_waits_for_item_writes(self):
+        calls = [
+            ("update_item", {"item_id": "a", "name": "A"}),
+            ("create_label", {"name": "Tools"}),
+            ("ensure_asset_ids", {}),
+            ("update_item", {"item_id": "b", "name": "B"}),
+        ]
+
+        assert plan_dependencies(calls) == [set(), set(), {0}, {2}]
+
+
+class TestExecuteMany:
+    """Tests for ApprovalService.execute_many."""
+
+    @pytest.mark.asyncio
+    async def test_independent_writes_run_concurrently(self):
+        session = ChatSession()
+        ids = [_queue(session, "create_item", name=f"Item {n}", location_id="loc-1") for n in range(6)]
+        executor = _FakeExecutor()
+
+        outcomes = await ApprovalService(session, executor).execute_many(ids, "token")
+
+        assert [approval_id for approval_id, _, _ in outcomes] == ids
+        assert all(result.success for _, result, _ in outcomes)
+        assert executor.max_in_flight > 1
+        assert session.pending_approvals == {}
+
+    @pytest.mark.asyncio
+    async def test_dependent_call_waits(self):
+        session = ChatSession()
+        ids = [
+            _queue(session, "create_item", name="Drill", location_id="loc-1"),
+            _queue(session, "create_location", name="Shelf"),
+            _queue(session, "create_item", name="Saw", location_id="loc-2"),
+        ]
+        executor = _FakeExecutor()
+
+        await ApprovalService(session, executor).execute_many(ids, "token")
+
+        # The second create_item only starts after the location exists
+        assert executor.started.index("create_location") < executor.started.index("create_item", 1)
+        assert executor.finished.index("create_location") < executor.started.index("create_item", 1)
+
+    @pytest.mark.asyncio
+    async def test_dependents_of_failed_call_are_skipped(self):
+        session = ChatSession()
+        ids = [
+            _queue(session, "create_location", name="Shelf"),
+            _queue(session, "create_item", name="Saw", location_id="loc-2"),
+        ]
+        executor = _FakeExecutor(failing={"create_location"})
+
+        outcomes = await ApprovalService(session, executor).execute_many(ids, "token")
+
+        assert "Skipped" in outcomes[1][1].error
+        assert executor.started == ["create_location"]
+        assert session.pending_approvals == {}
+
+    @pytest.mark.asyncio
+    async def test_unknown_approval_is_reported(self):
+        session = ChatSession()
+        known = _queue(session, "create_label", name="Tools")
+
+        outcomes = await ApprovalService(session, _FakeExecutor()).execute_many(
+            ["missing", known], "token"
+        )
+
+        assert outcomes[0][1].success is False
+        assert outcomes[0][2] is None
+        assert outcomes[1][1].success is True
+
+    @pytest.mark.asyncio
+    async def test_modified_params_are_applied(self):
+        session = ChatSession()
+        approval_id = _queue(session, "create_label", name="Tools")
+
+        outcomes = await ApprovalService(session, _FakeExecutor()).execute_many(
+            [approval_id], "token", modified_params={approval_id: {"name": "Gear"}}
+        )
+
+        assert outcomes[0][1].data["name"] == "Gear"
+
+    def test_default_batch_holds_back_destructive_tools(self):
+        session = ChatSession()
+        create = _queue(session, "create_label", name="Tools")
+        delete = _queue(session, "delete_item", item_id="item-1")
+        unknown = _queue(session, "format_disk")
+
+        approved, held_back = ApprovalService(session, _FakeExecutor()).default_batch()
+
+        assert approved == [create]
+        assert held_back == [delete, unknown]
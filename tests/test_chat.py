@@ -487,7 +487,7 @@ class TestChatOrchestrator:
         mock_response.choices[0].message.tool_calls = None
 
         with patch(
-            "homebox_companion.chat.llm_client.litellm.acompletion",
+            "homebox_companion.ai.llm.litellm.acompletion",
             new=AsyncMock(return_value=mock_response),
         ):
             events = []
@@ -536,7 +536,7 @@ class TestChatOrchestrator:
             yield chunk3
 
         with patch(
-            "homebox_companion.chat.llm_client.litellm.acompletion",
+            "homebox_companion.ai.llm.litellm.acompletion",
             new=AsyncMock(return_value=mock_streaming_response()),
         ):
             events = []
@@ -565,7 +565,7 @@ class TestChatOrchestrator:
             yield chunk
 
         with patch(
-            "homebox_companion.chat.llm_client.litellm.acompletion",
+            "homebox_companion.ai.llm.litellm.acompletion",
             new=AsyncMock(return_value=mock_streaming_response()),
         ):
             events = []
@@ -580,7 +580,7 @@ class TestChatOrchestrator:
     ):
         """process_message should yield error event on LLM failure."""
         with patch(
-            "homebox_companion.chat.llm_client.litellm.acompletion",
+            "homebox_companion.ai.llm.litellm.acompletion",
             new=AsyncMock(side_effect=Exception("API Error")),
         ):
             events = []
@@ -710,7 +710,7 @@ class TestChatOrchestrator:
                 )
 
         with patch(
-            "homebox_companion.chat.llm_client.litellm.acompletion",
+            "homebox_companion.ai.llm.litellm.acompletion",
             new=AsyncMock(side_effect=acompletion_side_effect),
         ):
             events = []
@@ -821,7 +821,7 @@ class TestChatOrchestrator:
             return create_streaming_tool_response()
 
         with patch(
-            "homebox_companion.chat.llm_client.litellm.acompletion",
+            "homebox_companion.ai.llm.litellm.acompletion",
             new=AsyncMock(side_effect=acompletion_side_effect),
         ):
             events = []
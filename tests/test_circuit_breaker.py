@@ -0,0 +1,249 @@
+"""Tests for circuit breakers around Homebox and LLM provider calls."""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, patch
+
+import httpx
+import pytest
+
+from homebox_companion.ai import llm
+from homebox_companion.chat.llm_client import LLMClient
+from homebox_companion.core import circuit_breaker
+from homebox_companion.core.circuit_breaker import (
+    CircuitBreaker,
+    CircuitState,
+    get_circuit_breaker,
+    get_circuit_breaker_stats,
+    reset_circuit_breakers,
+)
+from homebox_companion.core.exceptions import (
+    HomeboxCircuitOpenError,
+    LLMCircuitOpenError,
+    LLMServiceError,
+)
+from homebox_companion.homebox.client import _CircuitBreakerTransport
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture(autouse=True)
+def _isolated_breakers(monkeypatch):
+    monkeypatch.setattr(circuit_breaker, "_breakers", {})
+    yield
+
+
+class _Clock:
+    """Controllable replacement for time.monotonic."""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch) -> _Clock:
+    fake = _Clock()
+    monkeypatch.setattr(circuit_breaker.time, "monotonic", fake)
+    return fake
+
+
+class TestCircuitBreaker:
+    """Tests for CircuitBreaker state transitions."""
+
+    def test_opens_after_threshold(self, clock):
+        breaker = CircuitBreaker("test", failure_threshold=3, recovery_timeout=10)
+        for _ in range(2):
+            breaker.record_failure()
+        assert breaker.allow_request()
+
+        breaker.record_failure()
+
+        assert breaker.state == CircuitState.OPEN
+        assert not breaker.allow_request()
+        assert breaker.stats()["rejected_requests"] == 1
+
+    def test_success_resets_failure_count(self, clock):
+        breaker = CircuitBreaker("test", failure_threshold=2, recovery_timeout=10)
+        breaker.record_failure()
+        breaker.record_success()
+        breaker.record_failure()
+
+        assert breaker.state == CircuitState.CLOSED
+
+    def test_half_open_allows_single_probe(self, clock):
+        breaker = CircuitBreaker("test", failure_threshold=1, recovery_timeout=10)
+        breaker.record_failure()
+        clock.now += 10
+
+        assert breaker.state == CircuitState.HALF_OPEN
+        assert breaker.allow_request()
+        assert not breaker.allow_request()
+
+        breaker.record_success()
+        assert breaker.state == CircuitState.CLOSED
+        assert breaker.allow_request()
+
+    def test_failed_probe_reopens(self, clock):
+        breaker = CircuitBreaker("test", failure_threshold=1, recovery_timeout=10)
+        breaker.record_failure()
+        clock.now += 10
+        assert breaker.allow_request()
+
+        breaker.record_failure()
+
+        assert breaker.state == CircuitState.OPEN
+        assert breaker.retry_after() == 10
+        assert breaker.stats()["times_opened"] == 2
+
+    def test_stale_probe_is_replaced(self, clock):
+        breaker = CircuitBreaker("test", failure_threshold=1, recovery_timeout=10)
+        breaker.record_failure()
+        clock.now += 10
+        assert breaker.allow_request()  # Probe that never reports back
+
+        clock.now += 10
+        assert breaker.allow_request()
+
+    def test_registry_and_reset(self):
+        breaker = get_circuit_breaker("homebox")
+        assert breaker is get_circuit_breaker("homebox")
+        for _ in range(breaker.failure_threshold):
+            breaker.record_failure()
+        assert get_circuit_breaker_stats()["homebox"]["state"] == "open"
+
+        assert reset_circuit_breakers() == 1
+        assert get_circuit_breaker_stats()["homebox"]["state"] == "closed"
+
+    def test_disabled(self, monkeypatch):
+        monkeypatch.setattr(circuit_breaker.settings, "circuit_breaker_enabled", False)
+        assert get_circuit_breaker("homebox") is None
+
+
+class TestHomeboxTransport:
+    """Tests for the circuit breaker transport used by HomeboxClient."""
+
+    @pytest.mark.asyncio
+    async def test_connect_errors_open_circuit_then_fail_fast(self, clock):
+        calls = 0
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            nonlocal calls
+            calls += 1
+            raise httpx.ConnectError("connection refused", request=request)
+
+        breaker = CircuitBreaker("homebox", failure_threshold=2, recovery_timeout=30)
+        transport = _CircuitBreakerTransport(httpx.MockTransport(handler), breaker)
+        async with httpx.AsyncClient(transport=transport) as client:
+            for _ in range(2):
+                with pytest.raises(httpx.ConnectError):
+                    await client.get("http://homebox.local/api/v1/items")
+
+            with pytest.raises(HomeboxCircuitOpenError):
+                await client.get("http://homebox.local/api/v1/items")
+
+        assert calls == 2
+
+    @pytest.mark.asyncio
+    async def test_gateway_errors_count_but_client_errors_do_not(self, clock):
+        statuses = iter([503, 404, 502])
+        transport = _CircuitBreakerTransport(
+            httpx.MockTransport(lambda request: httpx.Response(next(statuses))),
+            CircuitBreaker("homebox", failure_threshold=2, recovery_timeout=30),
+        )
+        async with httpx.AsyncClient(transport=transport) as client:
+            for _ in range(3):
+                await client.get("http://homebox.local/api/v1/items")
+
+        assert transport._breaker.state == CircuitState.CLOSED
+
+
+class TestLLMBreaker:
+    """Tests for the LLM provider circuit breaker."""
+
+    @pytest.mark.asyncio
+    async def test_connection_errors_open_provider_circuit(self):
+        mock = AsyncMock(
+            side_effect=llm.litellm.APIConnectionError(
+                message="down", llm_provider="openai", model="gpt-5-mini"
+            )
+        )
+        messages = [{"role": "user", "content": "hi"}]
+        with patch.object(llm.litellm, "acompletion", mock), patch.object(
+            llm, "is_rate_limiting_enabled", return_value=False
+        ):
+            breaker = llm._get_provider_breaker("gpt-5-mini", None)
+            for i in range(breaker.failure_threshold):
+                with pytest.raises(LLMServiceError):
+                    await llm._acompletion_with_repair(
+                        [{"role": "user", "content": f"hi {i}"}], model="gpt-5-mini", api_key="k"
+                    )
+
+            with pytest.raises(LLMCircuitOpenError):
+                await llm._acompletion_with_repair(messages, model="gpt-5-mini", api_key="k")
+
+        assert mock.await_count == breaker.failure_threshold
+        assert "llm:openai" in get_circuit_breaker_stats()
+
+    @pytest.mark.asyncio
+    async def test_timeouts_open_provider_circuit(self):
+        mock = AsyncMock(
+            side_effect=llm.litellm.Timeout(message="slow", model="gpt-5-mini", llm_provider="openai")
+        )
+        breaker = llm._get_provider_breaker("gpt-5-mini", None)
+
+        with patch.object(llm.litellm, "acompletion", mock):
+            for _ in range(breaker.failure_threshold):
+                with pytest.raises(llm.litellm.Timeout):
+                    await llm._guarded_acompletion(breaker, model="gpt-5-mini", messages=[])
+
+        assert breaker.state == CircuitState.OPEN
+
+    @pytest.mark.asyncio
+    async def test_unrecognised_errors_leave_breaker_alone(self):
+        breaker = llm._get_provider_breaker("gpt-5-mini", None)
+        breaker.record_failure()
+
+        with patch.object(llm.litellm, "acompletion", AsyncMock(side_effect=ValueError("bug"))):
+            with pytest.raises(ValueError):
+                await llm._guarded_acompletion(breaker, model="gpt-5-mini", messages=[])
+
+        assert breaker.stats()["consecutive_failures"] == 1
+
+    @pytest.mark.asyncio
+    async def test_chat_client_fails_fast_while_open(self):
+        breaker = llm._get_provider_breaker("gpt-5-mini", None)
+        for _ in range(breaker.failure_threshold):
+            breaker.record_failure()
+        client = LLMClient()
+        mock = AsyncMock()
+        messages = [{"role": "user", "content": "hi"}]
+
+        with patch.object(client, "_get_llm_config", return_value=("gpt-5-mini", "k", None)), patch.object(
+            llm.litellm, "acompletion", mock
+        ):
+            with pytest.raises(LLMCircuitOpenError):
+                await client.complete(messages)
+            with pytest.raises(LLMCircuitOpenError):
+                async for _ in client.complete_stream(messages):
+                    pass
+
+        mock.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_chat_stream_outage_counts_as_failure(self):
+        async def dropped_stream():
+            yield "chunk"
+            raise llm.litellm.APIConnectionError(message="reset", llm_provider="openai", model="gpt-5-mini")
+
+        client = LLMClient()
+        with patch.object(client, "_get_llm_config", return_value=("gpt-5-mini", "k", None)), patch.object(
+            llm.litellm, "acompletion", AsyncMock(return_value=dropped_stream())
+        ):
+            with pytest.raises(llm.litellm.APIConnectionError):
+                async for _ in client.complete_stream([{"role": "user", "content": "hi"}]):
+                    pass
+
+        assert llm._get_provider_breaker("gpt-5-mini", None).stats()["consecutive_failures"] == 1
@@ -0,0 +1,202 @@
+"""Tests for batch enrichment (EnrichmentService.enrich_many)."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from homebox_companion.core.config import settings
+from homebox_companion.services.enrichment import EnrichmentResult, EnrichmentService
+
+pytestmark = pytest.mark.unit
+
+
+async def _collect(service: EnrichmentService, products) -> dict[int, EnrichmentResult]:
+    results: dict[int, EnrichmentResult] = {}
+    async for indices, result in service.enrich_many(products):
+        for index in indices:
+            results[index] = result
+    return results
+
+
+class TestEnrichMany:
+    """Tests for EnrichmentService.enrich_many."""
+
+    @pytest.mark.asyncio
+    async def test_duplicates_are_enriched_once(self, service, ai_provider):
+        products = [
+            ("DeWalt", "DCD771", ""),
+            ("dewalt", "DCD771 ", "Drill"),
+            ("Makita", "XFD131", ""),
+        ]
+
+        results = await _collect(service, products)
+
+        assert len(ai_provider.prompts) == 1
+        assert results[0] is results[1]
+        assert results[2].name == "Product XFD131"
+
+    @pytest.mark.asyncio
+    async def test_cached_products_come_first(self, service, ai_provider):
+        service.cache.set("Makita", "XFD131", EnrichmentResult(
+            enriched=True, source="ai", name="Cached driver", description=""
+        ))
+
+        order = [
+            indices
+            async for indices, _ in service.enrich_many(
+                [("DeWalt", "DCD771", ""), ("Makita", "XFD131", "")]
+            )
+        ]
+
+        assert order == [[1], [0]]
+        assert len(ai_provider.prompts) == 1
+
+    @pytest.mark.asyncio
+    async def test_missing_model_number_gets_empty_result(self, service, ai_provider):
+        results = await _collect(service, [("DeWalt", " ", "Drill")])
+
+        assert results[0].enriched is False
+        assert ai_provider.prompts == []
+
+    @pytest.mark.asyncio
+    async def test_parse_stage_is_bounded(self, service, ai_provider, monkeypatch):
+        ai_provider.delay = 0.01
+        monkeypatch.setattr(settings, "enrichment_pack_token_budget", 0)
+        service._parse_slots = asyncio.Semaphore(2)
+        products = [("Brand", f"M{n}", "") for n in range(6)]
+
+        results = await _collect(service, products)
+
+        assert len(results) == 6
+        assert ai_provider.max_in_flight == 2
+
+
+class TestPackedEnrichment:
+    """Tests for parsing several products with one AI call."""
+
+    @pytest.mark.asyncio
+    async def test_products_share_one_call(self, service, ai_provider):
+        products = [("Brand", f"M{n}", "") for n in range(3)]
+
+        results = await _collect(service, products)
+
+        assert len(ai_provider.prompts) == 1
+        assert [results[n].name for n in range(3)] == ["Product M0", "Product M1", "Product M2"]
+        assert all(result.source == "ai_knowledge" for result in results.values())
+        assert service.cache.get("Brand", "M1").name == "Product M1"
+
+    @pytest.mark.asyncio
+    async def test_batch_joins_running_lookup(self, service, ai_provider):
+        ai_provider.delay = 0.01
+        lookup = asyncio.create_task(service.enrich("Brand", "M0"))
+        await asyncio.sleep(0.001)
+
+        results = await _collect(service, [("Brand", f"M{n}", "") for n in range(3)])
+
+        assert results[0] is await lookup
+        assert len(ai_provider.prompts) == 2
+        assert "M0" not in ai_provider.packed_prompts[0]
+
+    @pytest.mark.asyncio
+    async def test_lookup_joins_running_pack(self, service, ai_provider):
+        ai_provider.delay = 0.01
+        batch = asyncio.create_task(_collect(service, [("Brand", f"M{n}", "") for n in range(3)]))
+        await asyncio.sleep(0.001)
+
+        result = await service.enrich("Brand", "M1")
+
+        assert result is (await batch)[1]
+        assert len(ai_provider.prompts) == 1
+
+    @pytest.mark.asyncio
+    async def test_cancelled_batch_leaves_joined_lookup_running(self, service, ai_provider):
+        ai_provider.delay = 0.01
+        batch = asyncio.create_task(_collect(service, [("Brand", f"M{n}", "") for n in range(3)]))
+        await asyncio.sleep(0.001)
+        lookup = asyncio.create_task(service.enrich("Brand", "M1"))
+        await asyncio.sleep(0.001)
+
+        batch.cancel()
+        result = await lookup
+
+        assert result.name == "Product M1"
+        # The pack was abandoned and only the joined product was redone
+        assert len(ai_provider.packed_prompts) == 1
+        assert [p for p in ai_provider.prompts if "### Product" not in p] == [ai_provider.prompts[1]]
+        assert "M1" in ai_provider.prompts[1]
+
+    @pytest.mark.asyncio
+    async def test_packs_are_bounded(self, service, ai_provider, monkeypatch):
+        prompt_tokens = len(EnrichmentService.PACKED_ENRICHMENT_PROMPT) // 4
+        monkeypatch.setattr(settings, "enrichment_pack_token_budget", prompt_tokens + 60)
+        products = [("Brand", f"M{n}", "") for n in range(4)]
+
+        results = await _collect(service, products)
+
+        assert len(results) == 4
+        assert len(ai_provider.packed_prompts) == 2
+        assert all(prompt.count("### Product") == 2 for prompt in ai_provider.packed_prompts)
+
+    @pytest.mark.asyncio
+    async def test_budget_is_capped_by_context_window(self, service, ai_provider):
+        prompt_tokens = len(EnrichmentService.PACKED_ENRICHMENT_PROMPT) // 4
+        ai_provider.context_window = 2 * (prompt_tokens + 60)
+        products = [("Brand", f"M{n}", "") for n in range(4)]
+
+        await _collect(service, products)
+
+        assert [prompt.count("### Product") for prompt in ai_provider.prompts] == [2, 2]
+
+    @pytest.mark.asyncio
+    async def test_unknown_context_window_is_not_packed(self, service, ai_provider):
+        ai_provider.context_window = None
+        products = [("Brand", f"M{n}", "") for n in range(3)]
+
+        results = await _collect(service, products)
+
+        assert len(results) == 3
+        assert len(ai_provider.prompts) == 3
+        assert not ai_provider.packed_prompts
+
+    @pytest.mark.asyncio
+    async def test_pack_size_is_capped(self, service, ai_provider):
+        products = [("Brand", f"M{n}", "") for n in range(10)]
+
+        await _collect(service, products)
+
+        assert [prompt.count("### Product") for prompt in ai_provider.prompts] == [8, 2]
+
+    @pytest.mark.asyncio
+    async def test_failed_pack_falls_back_to_single_calls(self, service, ai_provider):
+        ai_provider.packed_response = "not json"
+        products = [("Brand", f"M{n}", "") for n in range(3)]
+
+        results = await _collect(service, products)
+
+        assert len(ai_provider.prompts) == 4
+        assert [results[n].name for n in range(3)] == ["Product M0", "Product M1", "Product M2"]
+
+    @pytest.mark.asyncio
+    async def test_missing_entry_falls_back_alone(self, service, ai_provider):
+        ai_provider.skip = {"M1"}
+        products = [("Brand", f"M{n}", "") for n in range(3)]
+
+        results = await _collect(service, products)
+
+        assert len(ai_provider.prompts) == 2
+        assert "### Product" not in ai_provider.prompts[1]
+        assert "M1" in ai_provider.prompts[1]
+        assert results[1].name == "Product M1"
+
+    @pytest.mark.asyncio
+    async def test_search_content_is_packed(self, service, ai_provider, search_provider, search_cache):
+        service._search_provider = search_provider
+        products = [("Brand", f"M{n}", "") for n in range(3)]
+
+        results = await _collect(service, products)
+
+        assert len(ai_provider.prompts) == 1
+        assert "brushless motor" in ai_provider.prompts[0]
+        assert all(result.source == "web_search:fake" for result in results.values())
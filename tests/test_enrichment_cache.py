@@ -0,0 +1,137 @@
+"""Tests for the SQLite-backed enrichment cache."""
+
+from __future__ import annotations
+
+import json
+import os
+import time
+from collections.abc import Iterator
+
+import pytest
+
+from homebox_companion.services.enrichment import EnrichmentCache, EnrichmentResult
+
+pytestmark = pytest.mark.unit
+
+
+def _result(name: str, description: str = "") -> EnrichmentResult:
+    return EnrichmentResult(enriched=True, source="ai", name=name, description=description)
+
+
+@pytest.fixture
+def cache(tmp_path) -> Iterator[EnrichmentCache]:
+    cache = EnrichmentCache(tmp_path, ttl_seconds=3600, max_entries=100, sweep_interval=0)
+    yield cache
+    cache.close()
+
+
+class TestEnrichmentCache:
+    """Tests for EnrichmentCache."""
+
+    def test_round_trip_and_persistence(self, tmp_path, cache):
+        cache.set("DeWalt", "DCD771", _result("Drill"))
+
+        assert cache.get("dewalt", "DCD771").name == "Drill"
+
+        reopened = EnrichmentCache(tmp_path, ttl_seconds=3600, sweep_interval=0)
+        assert reopened.get("DeWalt", "DCD771").name == "Drill"
+        reopened.close()
+
+    def test_expired_entries_are_dropped(self, tmp_path):
+        cache = EnrichmentCache(tmp_path, ttl_seconds=0, sweep_interval=0)
+        cache.set("DeWalt", "DCD771", _result("Drill"))
+
+        time.sleep(0.01)
+
+        assert cache.get("DeWalt", "DCD771") is None
+        assert cache.stats()["entries"] == 0
+        cache.close()
+
+    def test_get_many(self, cache):
+        cache.set("DeWalt", "DCD771", _result("Drill"))
+        cache.set("Makita", "XFD131", _result("Driver"))
+        cache._memory.clear()  # Force the database path for one of them
+        cache.get("Makita", "XFD131")
+
+        found = cache.get_many([("DeWalt", "DCD771"), ("makita", "XFD131"), ("Bosch", "GSR12V")])
+
+        assert {product: r.name for product, r in found.items()} == {
+            ("DeWalt", "DCD771"): "Drill",
+            ("makita", "XFD131"): "Driver",
+        }
+
+    def test_entry_cap_evicts_least_recently_used(self, tmp_path):
+        cache = EnrichmentCache(tmp_path, max_entries=2, sweep_interval=0)
+        cache.set("A", "1", _result("a"))
+        time.sleep(0.001)
+        cache.set("B", "2", _result("b"))
+        time.sleep(0.001)
+        cache.get("A", "1")
+        time.sleep(0.001)
+        cache.set("C", "3", _result("c"))
+
+        assert cache.get("B", "2") is None
+        assert cache.get("A", "1") is not None
+        assert cache.stats()["entries"] == 2
+        cache.close()
+
+    def test_byte_cap(self, tmp_path):
+        cache = EnrichmentCache(tmp_path, max_bytes=1000, sweep_interval=0)
+        for n in range(5):
+            cache.set("Brand", str(n), _result("x", description="y" * 300))
+
+        assert cache.stats()["bytes"] <= 1000
+        assert cache.get("Brand", "4") is not None
+        cache.close()
+
+    def test_sweep_drops_expired(self, tmp_path):
+        cache = EnrichmentCache(tmp_path, ttl_seconds=3600, sweep_interval=0)
+        cache.set("DeWalt", "DCD771", _result("Drill"))
+        cache.ttl = 0
+        time.sleep(0.01)
+
+        assert cache.sweep() == 1
+        stats = cache.stats()
+        assert (stats["entries"], stats["in_memory"]) == (0, 0)
+        cache.close()
+
+    def test_running_totals_match_database(self, cache):
+        cache.set("DeWalt", "DCD771", _result("Drill"))
+        cache.set("DeWalt", "DCD771", _result("Drill", description="Cordless"))
+        cache.set("Makita", "XFD131", _result("Driver"))
+
+        stats = cache.stats()
+        assert (stats["entries"], stats["bytes"]) == tuple(
+            cache._conn.execute("SELECT COUNT(*), SUM(size) FROM enrichment").fetchone()
+        )
+
+    @pytest.mark.asyncio
+    async def test_async_access(self, cache):
+        await cache.aset("DeWalt", "DCD771", _result("Drill"))
+        cache._memory.clear()  # Force the database path
+
+        assert (await cache.aget("dewalt", "DCD771")).name == "Drill"
+        found = await cache.aget_many([("DeWalt", "DCD771"), ("Bosch", "GSR12V")])
+        assert list(found) == [("DeWalt", "DCD771")]
+        assert cache.peek_many([("DeWalt", "DCD771")])[("DeWalt", "DCD771")].name == "Drill"
+
+    def test_clear(self, cache):
+        cache.set("DeWalt", "DCD771", _result("Drill"))
+
+        assert cache.clear() == 1
+        assert cache.get("DeWalt", "DCD771") is None
+
+    def test_imports_legacy_json_files(self, tmp_path):
+        key = EnrichmentCache._get_cache_key("DeWalt", "DCD771")
+        legacy = tmp_path / f"{key}.json"
+        legacy.write_text(json.dumps(_result("Drill").to_dict(), indent=2))
+        stale = tmp_path / "stale.json"
+        stale.write_text(json.dumps(_result("Old").to_dict()))
+        os.utime(stale, (time.time() - 7200, time.time() - 7200))
+
+        cache = EnrichmentCache(tmp_path, ttl_seconds=3600, sweep_interval=0)
+
+        assert cache.get("DeWalt", "DCD771").name == "Drill"
+        assert cache.stats()["entries"] == 1
+        assert list(tmp_path.glob("*.json")) == []
+        cache.close()
@@ -0,0 +1,86 @@
+"""Tests for background enrichment of detected products."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator
+
+import pytest
+import pytest_asyncio
+
+from homebox_companion.services.enrichment import EnrichmentResult
+from homebox_companion.services.enrichment_prefetch import EnrichmentPrefetcher
+
+pytestmark = pytest.mark.unit
+
+
+@pytest_asyncio.fixture
+async def prefetcher(service) -> AsyncIterator[EnrichmentPrefetcher]:
+    prefetcher = EnrichmentPrefetcher(service, max_queued=10)
+    yield prefetcher
+    await prefetcher.close()
+
+
+class TestEnrichmentPrefetcher:
+    """Tests for EnrichmentPrefetcher."""
+
+    @pytest.mark.asyncio
+    async def test_warms_cache(self, service, prefetcher):
+        queued = prefetcher.submit([("DeWalt", "DCD771", "Drill"), ("Makita", "XFD131", "")])
+        await prefetcher.join()
+
+        assert queued == 2
+        assert service.cache.get("DeWalt", "DCD771").name == "Product DCD771"
+        assert prefetcher.stats()["prefetched"] == 2
+
+    @pytest.mark.asyncio
+    async def test_skips_cached_duplicate_and_incomplete(self, service, prefetcher, ai_provider):
+        service.cache.set("Bosch", "GSR12V", EnrichmentResult(
+            enriched=True, source="ai", name="Cached driver", description=""
+        ))
+
+        queued = prefetcher.submit([
+            ("Bosch", "GSR12V", ""),
+            ("DeWalt", "DCD771", ""),
+            ("dewalt", " DCD771", "Drill"),
+            ("", "XFD131", "No manufacturer"),
+            ("Makita", None, "No model"),
+        ])
+        queued += prefetcher.submit([("DeWalt", "DCD771", "")])
+        await prefetcher.join()
+
+        assert queued == 1
+        assert len(ai_provider.prompts) == 1
+        assert prefetcher.stats()["skipped_cached"] == 1
+
+    @pytest.mark.asyncio
+    async def test_runs_one_product_at_a_time(self, prefetcher, ai_provider):
+        ai_provider.delay = 0.01
+
+        prefetcher.submit([("Brand", f"M{n}", "") for n in range(4)])
+        await prefetcher.join()
+
+        assert len(ai_provider.prompts) == 4
+        assert ai_provider.max_in_flight == 1
+
+    @pytest.mark.asyncio
+    async def test_full_queue_drops_products(self, service):
+        prefetcher = EnrichmentPrefetcher(service, max_queued=2)
+
+        queued = prefetcher.submit([("Brand", f"M{n}", "") for n in range(5)])
+        await prefetcher.join()
+        await prefetcher.close()
+
+        assert queued == 2
+        assert prefetcher.stats()["dropped"] == 3
+
+    @pytest.mark.asyncio
+    async def test_lookup_joins_running_prefetch(self, service, prefetcher, ai_provider):
+        ai_provider.delay = 0.05
+
+        prefetcher.submit([("DeWalt", "DCD771", "")])
+        await asyncio.sleep(0.01)
+        result = await service.enrich("DeWalt", "DCD771")
+
+        assert result.name == "Product DCD771"
+        assert len(ai_provider.prompts) == 1
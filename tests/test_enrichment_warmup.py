@@ -0,0 +1,158 @@
+"""Tests for the background enrichment warm-up over existing inventory."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from homebox_companion.services import enrichment_warmup as warmup_module
+from homebox_companion.services.duplicate_detector import DuplicateDetector
+from homebox_companion.services.enrichment import track_enrichment_usage
+from homebox_companion.services.enrichment_warmup import EnrichmentWarmup, WarmupCheckpoint
+
+pytestmark = [pytest.mark.unit, pytest.mark.usefixtures("search_cache")]
+
+_PRODUCTS = [("Bosch", "GSR12V"), ("DeWalt", "DCD771"), ("Makita", "XFD131")]
+
+
+@pytest.fixture
+def detector(tmp_path) -> DuplicateDetector:
+    detector = DuplicateDetector(client=None, index_path=tmp_path / "duplicate_index.json")
+    for n, (manufacturer, model) in enumerate(_PRODUCTS):
+        detector._add_to_all_indices({
+            "id": f"item-{n}",
+            "name": f"{manufacturer} tool",
+            "manufacturer": manufacturer,
+            "model_number": model,
+        })
+    detector._add_to_all_indices({"id": "item-x", "name": "Shoebox"})
+    detector._is_loaded = True
+    return detector
+
+
+def _warmup(tmp_path, service, detector, **kwargs) -> EnrichmentWarmup:
+    return EnrichmentWarmup(
+        lambda: service,
+        lambda: detector,
+        checkpoint_path=tmp_path / "warmup.json",
+        **{"daily_search_queries": 100, "daily_llm_tokens": 100_000, **kwargs},
+    )
+
+
+class TestEnrichmentWarmup:
+    """Tests for EnrichmentWarmup."""
+
+    @pytest.mark.asyncio
+    async def test_walks_model_index(self, tmp_path, service, detector, ai_provider):
+        warmup = _warmup(tmp_path, service, detector)
+
+        assert await warmup.run_once() == 3
+
+        assert service.cache.get("DeWalt", "DCD771").name == "Product DCD771"
+        stats = warmup.stats()
+        assert (stats["enriched"], stats["passes"], stats["cursor"]) == (3, 1, "")
+        assert stats["llm_tokens_today"] > 0
+
+        # The next walk finds everything cached
+        await warmup.run_once()
+        assert len(ai_provider.prompts) == 3
+
+    @pytest.mark.asyncio
+    async def test_budget_stops_walk_and_run_resumes(self, tmp_path, service, detector, ai_provider):
+        warmup = _warmup(tmp_path, service, detector, daily_llm_tokens=1)
+
+        assert await warmup.run_once() == 1
+        assert await warmup.run_once() == 0
+        assert WarmupCheckpoint.load(tmp_path / "warmup.json").cursor == "BOSCH|GSR12V"
+
+        resumed = _warmup(tmp_path, service, detector)
+        assert await resumed.run_once() == 2
+        assert [p.split("Model: ")[1].split("\n")[0] for p in ai_provider.prompts] == [
+            "GSR12V",
+            "DCD771",
+            "XFD131",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_search_queries_are_metered(self, tmp_path, service, detector, search_provider):
+        service._search_provider = search_provider
+        warmup = _warmup(tmp_path, service, detector, daily_search_queries=3)
+
+        assert await warmup.run_once() == 1
+
+        assert warmup.stats()["search_queries_today"] == 3
+        assert warmup.budget_spent
+
+    @pytest.mark.asyncio
+    async def test_budget_resets_daily(self, tmp_path, service, detector):
+        stale = WarmupCheckpoint(cursor="BOSCH|GSR12V", day="2000-01-01", llm_tokens=10**9)
+        stale.save(tmp_path / "warmup.json")
+        warmup = _warmup(tmp_path, service, detector)
+
+        assert await warmup.run_once() == 2
+
+    @pytest.mark.asyncio
+    async def test_waits_for_loaded_index(self, tmp_path, service, detector):
+        detector._is_loaded = False
+        warmup = _warmup(tmp_path, service, detector)
+
+        assert await warmup.run_once() == 0
+        assert warmup.stats()["passes"] == 0
+
+    @pytest.mark.asyncio
+    async def test_polls_until_index_loaded(self, tmp_path, service, detector, monkeypatch):
+        monkeypatch.setattr(warmup_module, "NOT_READY_INTERVAL", 0.01)
+        detector._is_loaded = False
+        warmup = _warmup(tmp_path, service, detector, interval=3600)
+
+        warmup.start()
+        await asyncio.sleep(0.05)
+        detector._is_loaded = True
+        for _ in range(100):
+            if warmup.stats()["passes"]:
+                break
+            await asyncio.sleep(0.01)
+        await warmup.close()
+
+        assert warmup.stats()["enriched"] == 3
+
+    @pytest.mark.asyncio
+    async def test_only_one_worker_runs(self, tmp_path, service, detector, ai_provider):
+        first = _warmup(tmp_path, service, detector, interval=3600)
+        second = _warmup(tmp_path, service, detector, interval=3600)
+
+        first.start()
+        second.start()
+        for _ in range(100):
+            if first.stats()["passes"] or second.stats()["passes"]:
+                break
+            await asyncio.sleep(0.01)
+
+        assert [first.is_leader, second.is_leader].count(True) == 1
+        assert len(ai_provider.prompts) == 3
+
+        # The other worker takes over once the leader stops
+        leader, follower = (first, second) if first.is_leader else (second, first)
+        await leader.close()
+        assert follower._acquire_lead()
+        assert follower.stats()["passes"] == 1
+        await follower.close()
+
+
+class TestTrackEnrichmentUsage:
+    """Tests for track_enrichment_usage."""
+
+    @pytest.mark.asyncio
+    async def test_only_tracked_work_is_counted(self, service):
+        async def tracked() -> int:
+            with track_enrichment_usage() as usage:
+                await service.enrich("Bosch", "GSR12V")
+            return usage.llm_tokens
+
+        tokens, _ = await asyncio.gather(tracked(), service.enrich("DeWalt", "DCD771"))
+        with track_enrichment_usage() as usage:
+            await service.enrich("Bosch", "GSR12V")  # Cached
+
+        assert 0 < tokens < 1000
+        assert usage.llm_tokens == 0
@@ -0,0 +1,191 @@
+"""Tests for the single-pass price, feature and year extraction engine."""
+
+from __future__ import annotations
+
+import re
+import timeit
+from pathlib import Path
+
+import pytest
+
+from homebox_companion.services.enrichment import (
+    EnrichmentParser,
+    PriceMention,
+    URLContentFetcher,
+    extract_candidates,
+)
+
+pytestmark = pytest.mark.unit
+
+RETAILER_PAGES = sorted((Path(__file__).resolve().parent / "assets" / "retailer_pages").glob("*.html"))
+
+
+@pytest.fixture(scope="module")
+def page_texts() -> list[str]:
+    """Saved retailer pages, stripped to text the way the fetcher does."""
+    fetcher = URLContentFetcher()
+    return [fetcher._strip_html(path.read_text()) for path in RETAILER_PAGES]
+
+
+class TestExtractCandidates:
+    """Tests for extract_candidates."""
+
+    def test_price_formats(self):
+        text = "Now $1,299.99, was €1.099 or £950; USD 1200 here, 1,150.00 usd there. Cost: 80"
+
+        prices = extract_candidates(text).prices
+
+        assert [(p.amount, p.currency, p.label) for p in prices] == [
+            ("1,299.99", "$", ""),
+            ("1.099", "€", ""),
+            ("950", "£", ""),
+            ("1200", "USD", ""),
+            ("1,150.00", "USD", ""),
+            ("80", "", "cost"),
+        ]
+        assert prices[0].value == 1299.99
+        assert text[prices[0].start:prices[0].end] == "$1,299.99"
+
+    def test_labeled_price_is_one_candidate(self):
+        prices = extract_candidates("MSRP: $199.00 | List  Price USD 249").prices
+
+        assert prices == (
+            PriceMention(0, 13, "199.00", "$", "msrp"),
+            PriceMention(16, 35, "249", "USD", "list price"),
+        )
+
+    def test_labels_need_a_word_start(self):
+        prices = extract_candidates("Spreadsheet price 5 vs. overprice 9").prices
+
+        assert [(p.amount, p.label) for p in prices] == [("5", "price")]
+
+    def test_years_are_whole_numbers(self):
+        text = "Released 2023, model X2024 and 12024 parts, 2019 USD"
+
+        candidates = extract_candidates(text)
+
+        assert candidates.years == (2023,)
+        assert [p.amount for p in candidates.prices] == ["2019"]
+
+    def test_features(self):
+        text = "Highlights • Brushless motor • 2-speed gearbox\n- Belt clip\n* LED work light"
+
+        features = extract_candidates(text).features
+
+        assert features == (
+            ("bullet", "Brushless motor"),
+            ("bullet", "2-speed gearbox"),
+            ("dash", "Belt clip"),
+            ("asterisk", "LED work light"),
+        )
+
+    def test_prices_inside_features_are_found(self):
+        candidates = extract_candidates("• Includes battery worth $99 (2024 model)\n")
+
+        assert candidates.features == (("bullet", "Includes battery worth $99 (2024 model)"),)
+        assert [p.amount for p in candidates.prices] == ["99"]
+        assert candidates.years == (2024,)
+
+    def test_max_prices_stops_early(self):
+        prices = extract_candidates("$1 $2 $3 $4 $5 $6 $7", max_prices=3).prices
+
+        assert [p.amount for p in prices] == ["1", "2", "3"]
+
+
+class TestEnrichmentParser:
+    """Tests for EnrichmentParser on top of the extraction engine."""
+
+    def test_extract_price_prefers_msrp(self):
+        text = "Sale $149.99. List price: $219.00. MSRP: $229.00"
+
+        assert EnrichmentParser.extract_price(text) == 229.0
+        assert EnrichmentParser.extract_price("Sale $149.99. Retail price 219") == 219.0
+        assert EnrichmentParser.extract_price("Sale $1,049.00") == 1049.0
+        assert EnrichmentParser.extract_price("Only €99") is None
+
+    def test_extract_features_orders_by_kind(self):
+        text = "- Dash feature here\n• Bullet feature one\n• x\n- Dash feature here"
+
+        assert EnrichmentParser.extract_features(text) == ["Bullet feature one", "Dash feature here"]
+
+    def test_extract_year(self):
+        assert EnrichmentParser.extract_year("Released 2021, refreshed 2024, roadmap 2031") == 2024
+        assert EnrichmentParser.extract_year("Roadmap 2031") is None
+        assert EnrichmentParser.extract_year("No year") is None
+
+    def test_scans_text_once_and_keeps_only_the_last(self):
+        extract_candidates.cache_clear()
+        text = "• Cordless drill with two batteries\nMSRP: $199.00, released 2023"
+
+        EnrichmentParser.extract_features(text)
+        EnrichmentParser.extract_price(text)
+        EnrichmentParser.extract_year(text)
+        EnrichmentParser.extract_price("Sale $149.99")
+
+        info = extract_candidates.cache_info()
+        assert (info.hits, info.misses, info.currsize) == (2, 2, 1)
+
+
+class TestRetailerPages:
+    """Tests against saved retailer pages."""
+
+    def test_price_context(self, page_texts):
+        fetcher = URLContentFetcher()
+
+        for text in page_texts:
+            context = fetcher._extract_price_context(text)
+            assert 0 < len(context.split("\n---\n")) <= 5
+            assert "$" in context
+
+    def test_parser(self, page_texts):
+        for text in page_texts:
+            assert EnrichmentParser.extract_price(text) is not None
+            assert EnrichmentParser.extract_year(text) is not None
+            assert EnrichmentParser.extract_features(text)
+
+
+# Reference implementation: one regex pass per format, as used before the
+# extraction engine.
+_LEGACY_PRICE_PATTERNS = [
+    r"\$[\d,]+\.?\d*",
+    r"USD\s*[\d,]+\.?\d*",
+    r"[\d,]+\.?\d*\s*USD",
+    r"€[\d,]+\.?\d*",
+    r"£[\d,]+\.?\d*",
+    r"(?:price|cost|msrp)[:\s]*[\d,]+\.?\d*",
+]
+_LEGACY_FEATURE_PATTERNS = [r"•\s*(.+?)(?=•|$)", r"-\s+(.+?)(?=\n-|\n\n|$)", r"\*\s+(.+?)(?=\n\*|\n\n|$)"]
+_LEGACY_PARSER_PRICE_PATTERNS = [
+    r"MSRP[:\s]*\$?([0-9,]+(?:\.[0-9]{2})?)",
+    r"(?:retail|list)\s+price[:\s]*\$?([0-9,]+(?:\.[0-9]{2})?)",
+    r"\$([0-9,]+(?:\.[0-9]{2})?)",
+]
+
+
+def _legacy_extract(text: str) -> None:
+    matches = [m for p in _LEGACY_PRICE_PATTERNS for m in re.finditer(p, text, re.IGNORECASE)]
+    sorted(matches, key=lambda m: m.start())[:5]
+    for pattern in _LEGACY_FEATURE_PATTERNS:
+        re.findall(pattern, text, re.MULTILINE | re.DOTALL)
+    for pattern in _LEGACY_PARSER_PRICE_PATTERNS:
+        if re.search(pattern, text, re.IGNORECASE):
+            break
+    re.findall(r"\b(20[0-3][0-9])\b", text)
+
+
+def _engine_extract(text: str) -> None:
+    extract_candidates.cache_clear()
+    extract_candidates(text)
+
+
+@pytest.mark.benchmark
+class TestExtractionBenchmark:
+    """Compare one engine scan against the per-pattern passes it replaced."""
+
+    def test_single_scan_is_faster(self, page_texts):
+        def best(extract) -> float:
+            return min(timeit.repeat(lambda: [extract(text) for text in page_texts], number=10, repeat=5))
+
+        legacy, engine = best(_legacy_extract), best(_engine_extract)
+
+        assert engine < legacy
@@ -0,0 +1,145 @@
+"""Tests for latency tracking and hedged provider calls."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from homebox_companion.core.config import settings
+from homebox_companion.core.hedging import (
+    HedgeBudget,
+    LatencyTracker,
+    get_latency_tracker,
+    hedged_call,
+)
+
+pytestmark = pytest.mark.unit
+
+
+def _after(seconds: float, value=None, error: Exception | None = None):
+    """Build a call that finishes after a delay with a value or error."""
+    state = {"cancelled": False}
+
+    async def call():
+        try:
+            await asyncio.sleep(seconds)
+        except asyncio.CancelledError:
+            state["cancelled"] = True
+            raise
+        if error is not None:
+            raise error
+        return value
+
+    call.state = state  # type: ignore[attr-defined]
+    return call
+
+
+class TestLatencyTracker:
+    """Tests for LatencyTracker."""
+
+    def test_percentiles(self):
+        tracker = LatencyTracker()
+        for i in range(1, 11):
+            tracker.record("openai:gpt-5-mini", float(i))
+
+        assert tracker.percentile("openai:gpt-5-mini", 0.5) == 5.0
+        assert tracker.percentile("openai:gpt-5-mini", 0.9) == 9.0
+        assert tracker.percentile("unknown", 0.9) is None
+
+    def test_window_is_rolling(self):
+        tracker = LatencyTracker(window_size=3)
+        for value in (100.0, 1.0, 1.0, 1.0):
+            tracker.record("k", value)
+
+        assert tracker.sample_count("k") == 3
+        assert tracker.percentile("k", 0.99) == 1.0
+
+    def test_hedge_delay_requires_min_samples(self, monkeypatch):
+        monkeypatch.setattr(settings, "llm_hedge_min_samples", 5)
+        tracker = LatencyTracker()
+        for _ in range(4):
+            tracker.record("k", 2.0)
+        assert tracker.hedge_delay("k") is None
+
+        tracker.record("k", 2.0)
+        assert tracker.hedge_delay("k") == 2.0
+
+
+class TestHedgedCall:
+    """Tests for hedged_call."""
+
+    @pytest.mark.asyncio
+    async def test_fast_primary_never_starts_fallback(self):
+        fallback_started = False
+
+        async def fallback():
+            nonlocal fallback_started
+            fallback_started = True
+            return "fallback"
+
+        result, fallback_won = await hedged_call(_after(0.001, "primary"), fallback, delay=0.5)
+
+        assert (result, fallback_won) == ("primary", False)
+        assert not fallback_started
+
+    @pytest.mark.asyncio
+    async def test_slow_primary_loses_to_fallback_and_is_cancelled(self):
+        primary = _after(1.0, "primary")
+
+        result, fallback_won = await hedged_call(primary, _after(0.01, "fallback"), delay=0.01)
+
+        assert (result, fallback_won) == ("fallback", True)
+        await asyncio.sleep(0)
+        assert primary.state["cancelled"]
+
+    @pytest.mark.asyncio
+    async def test_failed_fallback_waits_for_primary(self):
+        result, fallback_won = await hedged_call(
+            _after(0.05, "primary"), _after(0.001, error=ValueError("down")), delay=0.01
+        )
+
+        assert (result, fallback_won) == ("primary", False)
+
+    @pytest.mark.asyncio
+    async def test_primary_error_before_hedge_falls_back(self):
+        result, fallback_won = await hedged_call(
+            _after(0.001, error=ValueError("primary down")), _after(0.001, "fallback"), delay=1.0
+        )
+
+        assert (result, fallback_won) == ("fallback", True)
+
+    @pytest.mark.asyncio
+    async def test_both_fail_raises_primary_error(self):
+        with pytest.raises(ValueError, match="primary down") as exc_info:
+            await hedged_call(
+                _after(0.02, error=ValueError("primary down")),
+                _after(0.001, error=RuntimeError("fallback down")),
+                delay=0.01,
+            )
+
+        assert isinstance(exc_info.value.__cause__, RuntimeError)
+
+    @pytest.mark.asyncio
+    async def test_losing_primary_is_recorded_as_censored_sample(self):
+        tracker = get_latency_tracker()
+        before = tracker.sample_count("test:loser")
+
+        await hedged_call(
+            _after(1.0, "primary"), _after(0.01, "fallback"), delay=0.05, primary_key="test:loser"
+        )
+
+        assert tracker.sample_count("test:loser") == before + 1
+        assert tracker.percentile("test:loser", 1.0) >= 0.05
+
+    @pytest.mark.asyncio
+    async def test_spent_budget_waits_for_primary(self):
+        budget = HedgeBudget(max_per_minute=1)
+        fallback = _after(0.001, "fallback")
+
+        first = await hedged_call(_after(0.05, "primary"), fallback, delay=0.01, budget=budget)
+        second = await hedged_call(_after(0.05, "primary"), fallback, delay=0.01, budget=budget)
+
+        assert first == ("fallback", True)
+        assert second == ("primary", False)
+        assert budget.skipped == 1
@@ -0,0 +1,187 @@
+"""Tests for token-budgeted chat history assembly.
+
+Covers token-based pruning with tool pairing preserved, the per-message
+format cache, and prefix stability of the default history window.
+"""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from homebox_companion.chat import session as session_module
+from homebox_companion.chat.session import ChatSession
+from homebox_companion.chat.types import ChatMessage, ToolCall
+
+pytestmark = pytest.mark.unit
+
+
+def _add_turn(session: ChatSession, index: int, result_items: int = 0) -> None:
+    """Add a user message and an assistant reply, optionally via a tool call."""
+    session.add_message(ChatMessage(role="user", content=f"Question {index}"))
+    if result_items:
+        call_id = f"call_{index}"
+        session.add_message(
+            ChatMessage(
+                role="assistant",
+                content="",
+                tool_calls=[ToolCall(id=call_id, name="list_items", arguments={"page": index})],
+            )
+        )
+        data = [{"id": str(n), "name": f"Item {n}" * 5} for n in range(result_items)]
+        session.add_message(
+            ChatMessage(
+                role="tool",
+                content=json.dumps({"success": True, "data": data}),
+                tool_call_id=call_id,
+            )
+        )
+    session.add_message(ChatMessage(role="assistant", content=f"Answer {index}"))
+
+
+class TestTokenBudget:
+    """Tests for token-based pruning."""
+
+    def test_large_tool_result_is_pruned_with_its_call(self):
+        session = ChatSession()
+        _add_turn(session, 0, result_items=200)
+        _add_turn(session, 1)
+
+        history = session.get_history(max_messages=100, max_tokens=200)
+
+        # The oversized result is dropped together with its assistant call
+        assert [m["content"] for m in history] == ["Answer 0", "Question 1", "Answer 1"]
+
+    def test_old_tool_result_counts_at_compressed_size(self):
+        session = ChatSession()
+        _add_turn(session, 0, result_items=200)
+        for i in range(1, 4):
+            _add_turn(session, i)
+
+        history = session.get_history(max_messages=100, max_tokens=200)
+
+        assert len(history) == 10
+        tool_message = history[2]
+        assert json.loads(tool_message["content"])["_summary"] == "200 items returned"
+
+    def test_short_messages_not_cut_by_budget(self):
+        session = ChatSession()
+        for i in range(20):
+            _add_turn(session, i)
+
+        history = session.get_history(max_messages=100, max_tokens=10_000)
+
+        assert len(history) == 40
+
+    def test_latest_turn_is_kept_even_over_budget(self):
+        session = ChatSession()
+        _add_turn(session, 0)
+        _add_turn(session, 1, result_items=200)
+
+        history = session.get_history(max_messages=100, max_tokens=10)
+
+        roles = [m["role"] for m in history]
+        assert roles == ["user", "assistant", "tool", "assistant"]
+        assert history[0]["content"] == "Question 1"
+
+
+class TestFormatCache:
+    """Tests for the per-message LLM format cache."""
+
+    def test_formatting_happens_once_per_message(self, monkeypatch):
+        session = ChatSession()
+        _add_turn(session, 0, result_items=3)
+
+        calls = 0
+        original = ChatMessage.to_llm_format
+
+        def counting(self):
+            nonlocal calls
+            calls += 1
+            return original(self)
+
+        monkeypatch.setattr(ChatMessage, "to_llm_format", counting)
+        session.get_history()
+        session.get_history()
+
+        assert calls == 0
+
+    def test_updated_tool_message_is_reformatted(self):
+        session = ChatSession()
+        _add_turn(session, 0, result_items=3)
+        session.get_history()
+
+        session.update_tool_message("call_0", '{"success": false, "rejected": true}')
+
+        tool_message = next(m for m in session.get_history() if m["role"] == "tool")
+        assert tool_message["content"] == '{"success": false, "rejected": true}'
+
+    def test_returned_dicts_do_not_alias_cache(self):
+        session = ChatSession()
+        _add_turn(session, 0)
+
+        session.get_history()[0]["content"] = "mutated"
+
+        assert session.get_history()[0]["content"] == "Question 0"
+
+
+class TestPrefixStability:
+    """Tests for carrying the default window start across turns."""
+
+    def test_prefix_unchanged_between_trims(self, monkeypatch):
+        monkeypatch.setattr(session_module.settings, "chat_max_history", 8)
+        monkeypatch.setattr(session_module.settings, "chat_max_history_tokens", 0)
+        session = ChatSession()
+        for i in range(5):
+            _add_turn(session, i)
+
+        # First call overflows the 8-message limit and trims to 6
+        first = session.get_history()
+        assert len(first) == 6
+
+        # Next turn appends without moving the start
+        _add_turn(session, 5)
+        second = session.get_history()
+        assert second[: len(first)] == first
+        assert len(second) == 8
+
+        # Another turn overflows again and trims
+        _add_turn(session, 6)
+        third = session.get_history()
+        assert len(third) == 6
+        assert third[-1]["content"] == "Answer 6"
+
+    def test_tool_result_form_fixed_until_trim(self, monkeypatch):
+        monkeypatch.setattr(session_module.settings, "chat_max_history", 20)
+        monkeypatch.setattr(session_module.settings, "chat_max_history_tokens", 0)
+        session = ChatSession()
+        for i in range(4):
+            _add_turn(session, i)
+        _add_turn(session, 4, result_items=20)
+        first = session.get_history()
+
+        # Aging past the compression threshold alone does not rewrite the prefix
+        for i in range(5, 9):
+            _add_turn(session, i)
+        second = session.get_history()
+        assert second[: len(first)] == first
+        assert "_summary" not in json.loads(second[10]["content"])
+
+        # The next trim moves the window start and compresses the old result
+        _add_turn(session, 9)
+        third = session.get_history()
+        tool_message = next(m for m in third if m["role"] == "tool")
+        assert json.loads(tool_message["content"])["_summary"] == "20 items returned"
+
+    def test_clear_resets_window(self, monkeypatch):
+        monkeypatch.setattr(session_module.settings, "chat_max_history", 4)
+        session = ChatSession()
+        for i in range(4):
+            _add_turn(session, i)
+        session.get_history()
+
+        session.clear()
+        _add_turn(session, 0)
+
+        assert len(session.get_history()) == 2
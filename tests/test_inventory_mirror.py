@@ -0,0 +1,293 @@
+"""Tests for the shared inventory mirror."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from homebox_companion.core.exceptions import HomeboxAuthError
+from homebox_companion.services.duplicate_detector import DuplicateDetector
+from homebox_companion.services.inventory_mirror import (
+    InventoryChanges,
+    InventoryMirror,
+    parse_export_details,
+)
+
+pytestmark = pytest.mark.unit
+
+
+def _summary(item_id: str, name: str, updated: str = "2024-01-01", asset_id: str = "") -> dict:
+    return {"id": item_id, "name": name, "updatedAt": updated, "assetId": asset_id}
+
+
+def _detail(item_id: str) -> dict:
+    return {
+        "id": item_id,
+        "manufacturer": "Acme",
+        "modelNumber": f"M-{item_id}",
+        "serialNumber": f"SN-{item_id}",
+        "notes": "",
+    }
+
+
+@pytest.fixture
+def client() -> MagicMock:
+    client = MagicMock()
+    client.get_group = AsyncMock(return_value={"id": "group-1", "name": "Home"})
+    client.list_labels = AsyncMock(return_value=[{"id": "lab-1", "name": "Tools"}])
+    client.list_locations = AsyncMock(return_value=[{"id": "loc-1", "name": "Garage"}])
+    client.list_all_items = AsyncMock(
+        return_value={"items": [_summary("1", "Drill"), _summary("2", "Saw")], "total": 2}
+    )
+    client.get_item = AsyncMock(side_effect=lambda token, item_id: _detail(item_id))
+    client.export_items = AsyncMock(return_value="")
+    return client
+
+
+@pytest.fixture
+def mirror(client) -> InventoryMirror:
+    return InventoryMirror(client, sync_interval=60, idle_timeout=60)
+
+
+class TestSync:
+    """Tests for differential synchronization."""
+
+    @pytest.mark.asyncio
+    async def test_first_sync_is_full_snapshot(self, mirror):
+        received: list[InventoryChanges] = []
+        mirror.subscribe(received.append)
+
+        await mirror.sync("token")
+
+        assert received[0].full
+        assert {item["id"] for item in received[0].upserted} == {"1", "2"}
+        assert mirror.get_item("1")["serialNumber"] == "SN-1"
+        assert mirror.labels == [{"id": "lab-1", "name": "Tools"}]
+        assert mirror.locations == [{"id": "loc-1", "name": "Garage"}]
+
+    @pytest.mark.asyncio
+    async def test_only_changed_items_are_detailed(self, mirror, client):
+        await mirror.sync("token")
+        client.get_item.reset_mock()
+        client.list_all_items.return_value = {
+            "items": [_summary("1", "Drill"), _summary("2", "Saw", updated="2024-02-01")]
+        }
+
+        changes = await mirror.sync("token")
+
+        assert [item["id"] for item in changes.upserted] == ["2"]
+        assert [call.args[1] for call in client.get_item.await_args_list] == ["2"]
+
+    @pytest.mark.asyncio
+    async def test_asset_id_change_counts_as_change(self, mirror, client):
+        await mirror.sync("token")
+        client.list_all_items.return_value = {
+            "items": [_summary("1", "Drill", asset_id="000-007"), _summary("2", "Saw")]
+        }
+
+        changes = await mirror.sync("token")
+
+        assert [item["id"] for item in changes.upserted] == ["1"]
+        assert mirror.highest_asset_id == 7
+
+    @pytest.mark.asyncio
+    async def test_deleted_items_are_removed(self, mirror, client):
+        await mirror.sync("token")
+        client.list_all_items.return_value = {"items": [_summary("1", "Drill")]}
+
+        changes = await mirror.sync("token")
+
+        assert changes.removed == ["2"]
+        assert mirror.get_item("2") is None
+
+    @pytest.mark.asyncio
+    async def test_many_changes_use_export(self, mirror, client):
+        summaries = [_summary(str(n), f"Item {n}") for n in range(30)]
+        client.list_all_items.return_value = {"items": summaries}
+        client.export_items.return_value = (
+            "HB.url,HB.manufacturer,HB.model_number,HB.serial_number,HB.notes\n"
+            "https://hb/item/3,Bosch,X1,SN3,Loud\n"
+        )
+
+        await mirror.sync("token")
+
+        client.get_item.assert_not_called()
+        assert mirror.get_item("3")["manufacturer"] == "Bosch"
+        assert "manufacturer" not in mirror.get_item("4")
+
+    @pytest.mark.asyncio
+    async def test_local_write_during_sync_is_kept(self, mirror, client):
+        await mirror.sync("token")
+        release = asyncio.Event()
+
+        async def slow_listing(token):
+            await release.wait()
+            return {"items": [_summary("1", "Drill"), _summary("2", "Saw")]}
+
+        client.list_all_items = AsyncMock(side_effect=slow_listing)
+        sync = asyncio.create_task(mirror.sync("token"))
+        await asyncio.sleep(0)
+        mirror.record_item({"id": "3", "name": "Ladder"})
+        mirror.forget_item("2")
+        release.set()
+        await sync
+
+        assert mirror.get_item("3") is not None
+        assert mirror.get_item("2") is None
+
+    def test_parse_export_details(self):
+        details = parse_export_details(
+            "HB.name,HB.url,HB.manufacturer,HB.model_number,HB.serial_number,HB.notes\n"
+            "Camera,https://hb/item/1,Sony,A7,123,\n"
+            "Orphan,,Acme,X,,\n"
+        )
+
+        assert details == {
+            "1": {"manufacturer": "Sony", "modelNumber": "A7", "serialNumber": "123", "notes": ""}
+        }
+
+
+class TestReadGating:
+    """Tests for token verification and local writes."""
+
+    @pytest.mark.asyncio
+    async def test_only_synced_tokens_are_ready(self, mirror):
+        assert not mirror.is_ready_for("token")
+
+        await mirror.sync("token")
+
+        assert mirror.is_ready_for("token")
+        assert not mirror.is_ready_for("other")
+
+    @pytest.mark.asyncio
+    async def test_tokens_stay_verified_per_token(self, mirror):
+        await mirror.sync("token")
+        await mirror.sync("other")
+
+        assert mirror.is_ready_for("other")
+        assert mirror.is_ready_for("token")
+
+    @pytest.mark.asyncio
+    async def test_verification_expires(self, client):
+        mirror = InventoryMirror(client, sync_interval=60, idle_timeout=60, verify_ttl=0.01)
+        await mirror.sync("token")
+
+        await asyncio.sleep(0.02)
+
+        assert not mirror.is_ready_for("token")
+
+    @pytest.mark.asyncio
+    async def test_other_group_replaces_mirror(self, mirror, client):
+        await mirror.sync("token")
+        received: list[InventoryChanges] = []
+        mirror.subscribe(received.append)
+        client.get_group.return_value = {"id": "group-2", "name": "Office"}
+        client.list_all_items.return_value = {"items": [_summary("9", "Printer")], "total": 1}
+
+        await mirror.sync("office-token")
+
+        assert [item["id"] for item in mirror.items] == ["9"]
+        assert received[-1].full
+        assert mirror.is_ready_for("office-token")
+        assert not mirror.is_ready_for("token")
+
+    @pytest.mark.asyncio
+    async def test_local_writes_are_published(self, mirror):
+        await mirror.sync("token")
+        received: list[InventoryChanges] = []
+        mirror.subscribe(received.append)
+
+        mirror.record_item({"id": "3", "name": "Ladder"})
+        mirror.forget_item("1")
+
+        assert received[0].upserted == [{"id": "3", "name": "Ladder"}]
+        assert received[1].removed == ["1"]
+
+    @pytest.mark.asyncio
+    async def test_request_sync_hides_taxonomy(self, mirror):
+        await mirror.sync("token")
+
+        mirror.request_sync()
+
+        assert mirror.labels is None
+        assert mirror.locations is None
+
+
+class TestSyncLoop:
+    """Tests for the shared background loop."""
+
+    @pytest.mark.asyncio
+    async def test_touch_triggers_sync(self, mirror, client):
+        mirror.start(client)
+        try:
+            mirror.touch("token")
+            for _ in range(100):
+                if mirror.is_ready_for("token"):
+                    break
+                await asyncio.sleep(0.01)
+
+            assert mirror.is_ready_for("token")
+        finally:
+            await mirror.close()
+        assert not mirror.is_running
+
+    @pytest.mark.asyncio
+    async def test_alternating_users_do_not_resync(self, mirror, client):
+        await mirror.sync("token")
+        await mirror.sync("other")
+        mirror.start(client)
+        try:
+            mirror.touch("token")  # First touch after idle syncs once
+            await asyncio.sleep(0.05)
+            calls = client.list_all_items.await_count
+
+            for token in ("other", "token", "other", "token"):
+                mirror.touch(token)
+                await asyncio.sleep(0.01)
+
+            assert client.list_all_items.await_count == calls
+        finally:
+            await mirror.close()
+
+    @pytest.mark.asyncio
+    async def test_touch_without_start_is_noop(self, mirror, client):
+        mirror.touch("token")
+        await asyncio.sleep(0)
+
+        client.list_all_items.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_rejected_token_is_dropped(self, mirror, client):
+        await mirror.sync("token")
+        client.list_all_items.side_effect = HomeboxAuthError("expired")
+        mirror.start(client)
+        try:
+            mirror.touch("token")
+            mirror.request_sync()
+            for _ in range(100):
+                if not mirror.is_ready_for("token"):
+                    break
+                await asyncio.sleep(0.01)
+
+            assert not mirror.is_ready_for("token")
+        finally:
+            await mirror.close()
+
+
+@pytest.mark.asyncio
+async def test_duplicate_detector_reads_from_mirror(monkeypatch, mirror, client, tmp_path):
+    from homebox_companion.services import duplicate_detector as detector_module
+
+    await mirror.sync("token")
+    monkeypatch.setattr(detector_module, "get_inventory_mirror", lambda: mirror)
+    client.get_item.reset_mock()
+    detector = DuplicateDetector(client, index_path=tmp_path / "index.json")
+
+    added = await detector._differential_update("token")
+
+    assert added == 2
+    client.get_item.assert_not_called()
+    matches = await detector.find_duplicates("token", [{"name": "Thing", "serial_number": "sn-2"}])
+    assert matches[0].existing_item.id == "2"
@@ -0,0 +1,158 @@
+"""Tests for concurrent item pagination and aggregate item listings."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import httpx
+import pytest
+
+from homebox_companion import HomeboxClient
+from homebox_companion.mcp.tools import ListItemsTool, SearchItemsTool
+
+pytestmark = pytest.mark.unit
+
+TOTAL_ITEMS = 250
+
+
+def _raw_item(n: int) -> dict:
+    location = {"id": f"loc-{n % 2}", "name": ["Garage", "Kitchen"][n % 2]}
+    labels = [{"id": "lab-1", "name": "Tools"}] if n % 5 == 0 else []
+    return {"id": f"item-{n}", "name": f"Item {n}", "quantity": 2, "location": location, "labels": labels}
+
+
+class _FakeHomebox:
+    """httpx handler serving a paginated /items endpoint."""
+
+    def __init__(self) -> None:
+        self.pages: list[int] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        page = int(request.url.params.get("page", 1))
+        page_size = int(request.url.params.get("pageSize", 50))
+        self.pages.append(page)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+        start = (page - 1) * page_size
+        items = [_raw_item(n) for n in range(start, min(start + page_size, TOTAL_ITEMS))]
+        return httpx.Response(
+            200,
+            json={"items": items, "page": page, "pageSize": page_size, "total": TOTAL_ITEMS},
+        )
+
+
+@pytest.fixture
+def fake_homebox() -> _FakeHomebox:
+    return _FakeHomebox()
+
+
+@pytest.fixture
+def client(fake_homebox: _FakeHomebox) -> HomeboxClient:
+    transport = httpx.MockTransport(fake_homebox)
+    return HomeboxClient(
+        base_url="http://homebox.test/api/v1",
+        client=httpx.AsyncClient(transport=transport),
+    )
+
+
+class TestPaginator:
+    """Tests for HomeboxClient.iter_item_pages / list_all_items."""
+
+    @pytest.mark.asyncio
+    async def test_fetches_all_pages_in_order(self, client, fake_homebox):
+        response = await client.list_all_items("token", page_size=50)
+
+        assert response["total"] == TOTAL_ITEMS
+        assert [item["id"] for item in response["items"]] == [
+            f"item-{n}" for n in range(TOTAL_ITEMS)
+        ]
+        assert sorted(fake_homebox.pages) == [1, 2, 3, 4, 5]
+
+    @pytest.mark.asyncio
+    async def test_remaining_pages_fetched_concurrently(self, client, fake_homebox):
+        await client.list_all_items("token", page_size=25)
+
+        # The first page is alone; later pages overlap up to the concurrency limit
+        assert fake_homebox.pages[0] == 1
+        assert 1 < fake_homebox.max_in_flight <= 4
+
+    @pytest.mark.asyncio
+    async def test_max_items_limits_pages(self, client, fake_homebox):
+        response = await client.list_all_items("token", max_items=120, page_size=50)
+
+        assert len(response["items"]) == 120
+        assert sorted(fake_homebox.pages) == [1, 2, 3]
+
+    @pytest.mark.asyncio
+    async def test_early_exit_stops_fetching(self, client):
+        pages = client.iter_item_pages("token", page_size=10)
+        first = await anext(pages)
+        await pages.aclose()
+
+        assert first["page"] == 1
+
+
+@pytest.fixture
+def mock_client() -> MagicMock:
+    items = [_raw_item(n) for n in range(10)]
+    client = MagicMock()
+    client.list_items = AsyncMock(
+        return_value={"items": items[:5], "page": 1, "pageSize": 5, "total": 10}
+    )
+    client.list_all_items = AsyncMock(
+        return_value={"items": items, "page": 1, "pageSize": 10, "total": 10}
+    )
+    return client
+
+
+class TestItemTools:
+    """Tests for aggregate mode and large requests in the item tools."""
+
+    @pytest.mark.asyncio
+    async def test_list_items_aggregate(self, mock_client):
+        tool = ListItemsTool()
+
+        result = await tool.execute(mock_client, "token", tool.Params(aggregate=True))
+
+        assert result.success
+        summary = result.data
+        assert summary["total_items"] == 10
+        assert summary["total_quantity"] == 20
+        garage = next(g for g in summary["by_location"] if g["location"] == "Garage")
+        assert garage["items"] == 5
+        assert len(garage["examples"]) == 3
+        assert summary["by_label"] == [{"label": "Tools", "label_id": "lab-1", "items": 2}]
+        assert "truncated" not in summary
+
+    @pytest.mark.asyncio
+    async def test_search_items_aggregate_passes_query(self, mock_client):
+        tool = SearchItemsTool()
+
+        await tool.execute(mock_client, "token", tool.Params(query="drill", aggregate=True))
+
+        assert mock_client.list_all_items.await_args.kwargs["query"] == "drill"
+        mock_client.list_items.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_large_page_size_uses_paginator(self, mock_client):
+        tool = ListItemsTool()
+
+        result = await tool.execute(mock_client, "token", tool.Params(page_size=500))
+
+        assert result.success
+        assert mock_client.list_all_items.await_args.kwargs["max_items"] == 500
+        mock_client.list_items.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_small_page_size_uses_single_page(self, mock_client):
+        tool = ListItemsTool()
+
+        await tool.execute(mock_client, "token", tool.Params(page_size=5))
+
+        mock_client.list_items.assert_awaited_once()
+        mock_client.list_all_items.assert_not_called()
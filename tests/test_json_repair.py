@@ -0,0 +1,181 @@
+"""Tests for local JSON repair in the LLM client.
+
+Covers the deterministic repair stage that runs before the remote (LLM)
+repair round-trip, image stripping for remote repair requests, and the
+per-tier hit counters.
+"""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from homebox_companion.ai import llm
+from homebox_companion.ai.llm import (
+    _acompletion_with_repair,
+    _repair_json_locally,
+    _strip_image_parts,
+    get_json_repair_stats,
+    reset_json_repair_stats,
+)
+
+pytestmark = pytest.mark.unit
+
+
+def _completion(content: str) -> SimpleNamespace:
+    """Build a minimal litellm-like completion response."""
+    return SimpleNamespace(
+        choices=[SimpleNamespace(message=SimpleNamespace(content=content))],
+        usage=SimpleNamespace(prompt_tokens=10, completion_tokens=5, total_tokens=15),
+    )
+
+
+@pytest.fixture(autouse=True)
+def _reset_stats():
+    reset_json_repair_stats()
+    yield
+    reset_json_repair_stats()
+
+
+class TestRepairJsonLocally:
+    """Tests for _repair_json_locally."""
+
+    def test_trailing_commas(self):
+        assert _repair_json_locally('{"items": [1, 2, ], "name": "x",}') == {
+            "items": [1, 2],
+            "name": "x",
+        }
+
+    def test_unbalanced_brackets(self):
+        assert _repair_json_locally('{"items": [{"name": "a"}, {"name": "b"}') == {
+            "items": [{"name": "a"}, {"name": "b"}]
+        }
+
+    def test_truncated_string(self):
+        assert _repair_json_locally('{"items": [{"name": "Cordless dri') == {
+            "items": [{"name": "Cordless dri"}]
+        }
+
+    def test_truncated_key_cuts_back_to_last_member(self):
+        assert _repair_json_locally('{"name": "Drill", "quantity": 1, "descr') == {
+            "name": "Drill",
+            "quantity": 1,
+        }
+
+    def test_dangling_colon(self):
+        assert _repair_json_locally('{"name": "Drill", "notes":') == {"name": "Drill", "notes": None}
+
+    def test_brackets_inside_strings_are_ignored(self):
+        assert _repair_json_locally('{"name": "Bin [large] {blue}", "tags": ["a",') == {
+            "name": "Bin [large] {blue}",
+            "tags": ["a"],
+        }
+
+    def test_extracts_largest_object_from_prose(self):
+        raw = 'Sure! Here is {"a": 1} and the full answer: {"items": [{"name": "x"}]} Hope it helps.'
+        assert _repair_json_locally(raw) == {"items": [{"name": "x"}]}
+
+    def test_markdown_wrapped(self):
+        assert _repair_json_locally('```json\n{"items": [],}\n```') == {"items": []}
+
+    def test_expected_keys_must_be_present(self):
+        assert _repair_json_locally('{"name": "x",', expected_keys=["items"]) is None
+
+    def test_unrepairable_returns_none(self):
+        assert _repair_json_locally("I could not identify any items.") is None
+
+
+class TestStripImageParts:
+    """Tests for _strip_image_parts."""
+
+    def test_replaces_images_with_note(self):
+        messages = [
+            {"role": "system", "content": "sys"},
+            {
+                "role": "user",
+                "content": [
+                    {"type": "text", "text": "What is this?"},
+                    {"type": "image_url", "image_url": {"url": "data:image/png;base64,abc"}},
+                    {"type": "image_url", "image_url": {"url": "data:image/png;base64,def"}},
+                ],
+            },
+        ]
+
+        stripped = _strip_image_parts(messages)
+
+        assert stripped[0] == messages[0]
+        parts = stripped[1]["content"]
+        assert all(p["type"] == "text" for p in parts)
+        assert "2 image(s) omitted" in parts[-1]["text"]
+        # Original messages are untouched
+        assert len(messages[1]["content"]) == 3
+
+
+class TestRepairTiers:
+    """Tests for repair tier selection and hit counters."""
+
+    @pytest.mark.asyncio
+    async def test_direct_parse(self):
+        mock = AsyncMock(return_value=_completion('{"items": []}'))
+        with patch.object(llm.litellm, "acompletion", mock), patch.object(
+            llm, "is_rate_limiting_enabled", return_value=False
+        ):
+            result = await _acompletion_with_repair(
+                [{"role": "user", "content": "hi"}], model="gpt-5-mini", api_key="k"
+            )
+
+        assert result.content == {"items": []}
+        assert mock.await_count == 1
+        assert get_json_repair_stats()["tiers"]["direct"]["count"] == 1
+
+    @pytest.mark.asyncio
+    async def test_local_repair_skips_llm_round_trip(self):
+        mock = AsyncMock(return_value=_completion('{"items": [{"name": "x"},'))
+        with patch.object(llm.litellm, "acompletion", mock), patch.object(
+            llm, "is_rate_limiting_enabled", return_value=False
+        ):
+            result = await _acompletion_with_repair(
+                [{"role": "user", "content": "hi"}],
+                model="gpt-5-mini",
+                api_key="k",
+                expected_keys=["items"],
+            )
+
+        assert result.content == {"items": [{"name": "x"}]}
+        assert mock.await_count == 1
+        stats = get_json_repair_stats()
+        assert stats["tiers"]["local"]["count"] == 1
+        assert stats["tiers"]["local"]["rate"] == 1.0
+
+    @pytest.mark.asyncio
+    async def test_remote_repair_drops_images(self):
+        mock = AsyncMock(
+            side_effect=[_completion("no json here"), _completion('{"items": []}')]
+        )
+        messages = [
+            {
+                "role": "user",
+                "content": [
+                    {"type": "text", "text": "Detect items"},
+                    {"type": "image_url", "image_url": {"url": "data:image/png;base64,abc"}},
+                ],
+            }
+        ]
+        with patch.object(llm.litellm, "acompletion", mock), patch.object(
+            llm, "is_rate_limiting_enabled", return_value=False
+        ):
+            result = await _acompletion_with_repair(
+                messages, model="gpt-5-mini", api_key="k", expected_keys=["items"]
+            )
+
+        assert result.content == {"items": []}
+        assert result.usage.total_tokens == 30
+        repair_messages = mock.await_args_list[1].kwargs["messages"]
+        assert not any(
+            isinstance(m["content"], list)
+            and any(p.get("type") == "image_url" for p in m["content"])
+            for m in repair_messages
+        )
+        assert get_json_repair_stats()["tiers"]["remote"]["count"] == 1
@@ -0,0 +1,174 @@
+"""Tests for the local item search index."""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+import pytest_asyncio
+
+from homebox_companion.mcp.tools import SearchItemsTool
+from homebox_companion.services import inventory_mirror as inventory_mirror_module
+from homebox_companion.services import search_index as search_index_module
+from homebox_companion.services.inventory_mirror import InventoryChanges, InventoryMirror
+from homebox_companion.services.search_index import ItemSearchIndex
+
+pytestmark = pytest.mark.unit
+
+
+def _item(item_id: str, name: str, *, description: str = "", location: str = "Garage",
+          labels: tuple[str, ...] = (), **extra) -> dict:
+    return {
+        "id": item_id,
+        "name": name,
+        "description": description,
+        "quantity": 1,
+        "location": {"id": f"loc-{location.lower()}", "name": location},
+        "labels": [{"id": f"lab-{label.lower()}", "name": label} for label in labels],
+        **extra,
+    }
+
+
+ITEMS = [
+    _item("1", "Cordless Drill", description="18V with two batteries", labels=("Tools",)),
+    _item("2", "Drill Bit Set", description="Titanium bits for the cordless drill"),
+    _item("3", "Screwdriver Set", location="Kitchen", labels=("Tools",)),
+    _item("4", "Garden Hose", location="Shed", notes="Leaks at the connector"),
+    _item("5", "Camera", description="Mirrorless body", manufacturer="Sony", modelNumber="A7 III"),
+]
+
+
+@pytest.fixture
+def index() -> ItemSearchIndex:
+    index = ItemSearchIndex()
+    index.replace_all(ITEMS)
+    return index
+
+
+def _ids(hits) -> list[str]:
+    return [hit.item_id for hit in hits]
+
+
+class TestSearch:
+    """Tests for ranking and matching."""
+
+    def test_name_match_outranks_description_match(self, index):
+        assert _ids(index.search("cordless")) == ["1", "2"]
+
+    def test_all_words_must_match_when_possible(self, index):
+        assert _ids(index.search("drill bits")) == ["2"]
+
+    def test_falls_back_to_any_word(self, index):
+        assert set(_ids(index.search("drill piano"))) == {"1", "2"}
+
+    def test_prefix_match(self, index):
+        assert _ids(index.search("scr")) == ["3"]
+
+    def test_typo_tolerance(self, index):
+        assert _ids(index.search("screwdrivr")) == ["3"]
+        assert _ids(index.search("cmaera")) == ["5"]
+
+    def test_short_words_do_not_fuzz(self, index):
+        assert index.search("hse") == []
+
+    @pytest.mark.parametrize(
+        ("query", "expected"),
+        [("sony", "5"), ("a7", "5"), ("leaks", "4"), ("kitchen", "3"), ("titanium", "2")],
+    )
+    def test_all_fields_are_searchable(self, index, query, expected):
+        assert _ids(index.search(query))[0] == expected
+
+    def test_location_filter(self, index):
+        assert _ids(index.search("set", location_id="loc-kitchen")) == ["3"]
+
+    def test_search_page(self, index):
+        response = index.search_page("set", page=2, page_size=1)
+
+        assert response["total"] == 2
+        assert response["page"] == 2
+        assert len(response["items"]) == 1
+
+
+class TestIncrementalUpdates:
+    """Tests for upsert/remove."""
+
+    def test_upsert_replaces_old_terms(self, index):
+        index.upsert(_item("4", "Watering Can", location="Shed"))
+
+        assert index.search("hose") == []
+        assert _ids(index.search("watering")) == ["4"]
+
+    def test_remove_drops_item_and_vocabulary(self, index):
+        assert index.remove("5") is True
+        assert index.remove("5") is False
+
+        assert index.search("sony") == []
+        assert "mirrorless" not in index._vocab
+        assert index.search("camra") == []
+
+    def test_mirror_changes_are_applied(self, index):
+        index.apply_changes(InventoryChanges(upserted=[_item("6", "Tripod")], removed=["1"]))
+
+        assert _ids(index.search("tripod")) == ["6"]
+        assert _ids(index.search("batteries")) == []
+
+    def test_incremental_changes_before_snapshot_are_ignored(self):
+        index = ItemSearchIndex()
+
+        index.apply_changes(InventoryChanges(upserted=[ITEMS[0]]))
+
+        assert not index.is_ready
+        assert len(index) == 0
+
+
+class TestSearchItemsTool:
+    """Tests for search_items using the index."""
+
+    @pytest.fixture
+    def client(self) -> MagicMock:
+        client = MagicMock()
+        client.list_items = AsyncMock(
+            return_value={"items": [_item("9", "Remote drill")], "page": 1, "pageSize": 50, "total": 1}
+        )
+        return client
+
+    @pytest_asyncio.fixture
+    async def shared_index(self, monkeypatch, index):
+        mirror_client = MagicMock()
+        mirror_client.get_group = AsyncMock(return_value={"id": "group-1"})
+        mirror_client.list_labels = AsyncMock(return_value=[])
+        mirror_client.list_locations = AsyncMock(return_value=[])
+        mirror_client.list_all_items = AsyncMock(return_value={"items": []})
+        mirror = InventoryMirror(mirror_client)
+        await mirror.sync("token")
+        monkeypatch.setattr(inventory_mirror_module, "_inventory_mirror", mirror)
+        monkeypatch.setattr(search_index_module, "_search_index", index)
+        return index
+
+    @pytest.mark.asyncio
+    async def test_served_from_index(self, client, shared_index):
+        tool = SearchItemsTool()
+
+        result = await tool.execute(client, "token", tool.Params(query="cordles batteries"))
+
+        assert result.success
+        assert [item["id"] for item in result.data["items"]] == ["1"]
+        assert result.data["pagination"]["total"] == 1
+        client.list_items.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_unverified_token_uses_homebox(self, client, shared_index):
+        tool = SearchItemsTool()
+
+        result = await tool.execute(client, "other-token", tool.Params(query="drill"))
+
+        assert [item["id"] for item in result.data["items"]] == ["9"]
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_homebox_without_hits(self, client, shared_index):
+        tool = SearchItemsTool()
+
+        result = await tool.execute(client, "token", tool.Params(query="emote"))
+
+        assert [item["id"] for item in result.data["items"]] == ["9"]
+        assert client.list_items.await_args.kwargs["query"] == "emote"
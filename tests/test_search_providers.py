@@ -0,0 +1,220 @@
+"""Tests for the shared product search logic of web search providers."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+
+import pytest
+
+from homebox_companion.services.search_providers import (
+    BaseSearchProvider,
+    SearchResponse,
+    SearchResponseCache,
+    SearchResult,
+    close_search_cache,
+    get_search_cache,
+)
+from homebox_companion.services.search_providers import cache as cache_module
+
+pytestmark = [pytest.mark.unit, pytest.mark.usefixtures("search_cache")]
+
+
+class _FakeProvider(BaseSearchProvider):
+    """Provider answering each query kind after a configurable delay."""
+
+    max_concurrent_queries = 3
+
+    def __init__(self, delays: dict[str, float], results_per_query: int | None = 3) -> None:
+        super().__init__()
+        self.delays = delays
+        self.results_per_query = results_per_query
+        self.queries: list[str] = []
+        self.completed: list[str] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    @property
+    def provider_name(self) -> str:
+        return "Fake"
+
+    def is_configured(self) -> bool:
+        return True
+
+    async def search(self, query: str, max_results: int = 5, include_content: bool = True) -> SearchResponse:
+        kind = "specs" if "specs" in query else "price" if "MSRP" in query else "retail"
+        self.queries.append(kind)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delays[kind])
+        finally:
+            self.in_flight -= 1
+        self.completed.append(kind)
+        results = [
+            SearchResult(title=f"{kind} {n}", url=f"https://{kind}.example/{n}", snippet="")
+            for n in range(max_results if self.results_per_query is None else self.results_per_query)
+        ]
+        # Both specs and price searches find the shared review page
+        if kind != "retail":
+            results.insert(1, SearchResult(title="review", url="https://review.example", snippet=""))
+        return SearchResponse(query=query, results=results, total_results=len(results), provider="Fake")
+
+
+def _urls(response: SearchResponse) -> list[str]:
+    return [result.url for result in response.results]
+
+
+class TestSearchProduct:
+    """Tests for BaseSearchProvider.search_product."""
+
+    @pytest.mark.asyncio
+    async def test_queries_run_concurrently(self):
+        provider = _FakeProvider({"specs": 0.02, "price": 0.02, "retail": 0.02})
+
+        await provider.search_product("Makita", "XFD131")
+
+        assert provider.max_in_flight == 3
+
+    @pytest.mark.asyncio
+    async def test_concurrency_is_capped_per_provider(self):
+        provider = _FakeProvider({"specs": 0.01, "price": 0.01, "retail": 0.01})
+        provider._query_slots = asyncio.Semaphore(1)
+
+        await asyncio.gather(
+            provider.search_product("Makita", "XFD131"),
+            provider.search_product("DeWalt", "DCD771"),
+        )
+
+        assert provider.max_in_flight == 1
+
+    @pytest.mark.asyncio
+    async def test_order_is_independent_of_arrival(self):
+        fast_retail = _FakeProvider({"specs": 0.03, "price": 0.02, "retail": 0.0})
+        slow_retail = _FakeProvider({"specs": 0.0, "price": 0.01, "retail": 0.03})
+
+        first = await fast_retail.search_product("Makita", "XFD131", max_results=20)
+        second = await slow_retail.search_product("Makita", "XFD131", max_results=20)
+
+        assert _urls(first) == _urls(second)
+        # The page found by two queries is fused to the top
+        assert _urls(first)[0] == "https://review.example"
+        assert len(set(_urls(first))) == len(_urls(first))
+
+    @pytest.mark.asyncio
+    async def test_stops_once_enough_results(self):
+        provider = _FakeProvider({"specs": 0.0, "price": 0.5, "retail": 0.5}, results_per_query=5)
+
+        response = await provider.search_product("Makita", "XFD131", max_results=5)
+
+        assert len(response.results) == 5
+        assert provider.completed == ["specs"]
+
+    @pytest.mark.asyncio
+    async def test_default_search_drops_slowest_query(self):
+        # Provider returning as many results as each query asks for
+        provider = _FakeProvider({"specs": 0.0, "price": 0.01, "retail": 0.5}, results_per_query=None)
+
+        response = await provider.search_product("Makita", "XFD131")
+
+        assert len(response.results) == 8
+        assert provider.completed == ["specs", "price"]
+
+    def test_fuse_results_rewards_agreement(self):
+        shared = SearchResult(title="shared", url="https://shared.example", snippet="")
+        a = [SearchResult(title="a", url="https://a.example", snippet=""), shared]
+        b = [SearchResult(title="b", url="https://b.example", snippet=""), shared]
+
+        fused = BaseSearchProvider._fuse_results([a, b])
+
+        assert [r.url for r in fused] == [
+            "https://shared.example",
+            "https://a.example",
+            "https://b.example",
+        ]
+
+
+def _response(query: str, *urls: str) -> SearchResponse:
+    results = [SearchResult(title=url, url=url, snippet="snippet") for url in urls]
+    return SearchResponse(query=query, results=results, total_results=len(results), provider="Fake")
+
+
+class TestSearchResponseCache:
+    """Tests for SearchResponseCache."""
+
+    def test_round_trip_with_normalized_query(self, search_cache):
+        search_cache.set("Fake", "Makita  XFD131 price", 3, True, _response("q", "https://a.example"))
+
+        cached = search_cache.get("Fake", "makita xfd131 PRICE", 3, True)
+
+        assert cached is not None
+        assert [r.url for r in cached.results] == ["https://a.example"]
+        assert search_cache.get("Other", "makita xfd131 price", 3, True) is None
+        assert search_cache.stats()["hit_rate"] == 0.5
+
+    def test_failed_responses_are_not_cached(self, search_cache):
+        search_cache.set("Fake", "q", 3, True, SearchResponse(query="q", error="boom"))
+
+        assert search_cache.get("Fake", "q", 3, True) is None
+
+    def test_expired_entries_are_ignored(self, tmp_path):
+        cache = SearchResponseCache(tmp_path / "expired.db", ttl=0.01, max_entries=10)
+        cache.set("Fake", "q", 3, True, _response("q", "https://a.example"))
+
+        time.sleep(0.02)
+
+        assert cache.get("Fake", "q", 3, True) is None
+        cache.close()
+
+    def test_least_recently_used_entries_are_evicted(self, tmp_path):
+        cache = SearchResponseCache(tmp_path / "bounded.db", ttl=3600, max_entries=2)
+        cache.set("Fake", "a", 3, True, _response("a", "https://a.example"))
+        time.sleep(0.001)
+        cache.set("Fake", "b", 3, True, _response("b", "https://b.example"))
+        time.sleep(0.001)
+        cache.get("Fake", "a", 3, True)
+        time.sleep(0.001)
+        cache.set("Fake", "c", 3, True, _response("c", "https://c.example"))
+
+        assert cache.get("Fake", "b", 3, True) is None
+        assert cache.get("Fake", "a", 3, True) is not None
+        assert cache.stats()["entries"] == 2
+        cache.close()
+
+    @pytest.mark.asyncio
+    async def test_async_access_and_entry_count(self, search_cache):
+        await search_cache.aset("Fake", "q", 3, True, _response("q", "https://a.example"))
+        await search_cache.aset("Fake", "q", 3, True, _response("q", "https://b.example"))
+
+        cached = await search_cache.aget("Fake", "q", 3, True)
+
+        assert _urls(cached) == ["https://b.example"]
+        assert search_cache.stats()["entries"] == 1
+
+    def test_stats_do_not_create_database(self, tmp_path):
+        cache = SearchResponseCache(tmp_path / "unused.db", ttl=3600, max_entries=10)
+
+        assert cache.stats()["entries"] == 0
+        assert not (tmp_path / "unused.db").exists()
+
+    def test_close_shared_cache(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(cache_module.settings, "data_dir", str(tmp_path))
+        monkeypatch.setattr(cache_module, "_search_cache", None)
+        cache = get_search_cache()
+        cache.set("Fake", "q", 3, True, _response("q", "https://a.example"))
+
+        close_search_cache()
+
+        assert cache._conn is None
+        assert get_search_cache() is not cache
+
+    @pytest.mark.asyncio
+    async def test_product_search_uses_cache(self):
+        first = _FakeProvider({"specs": 0.0, "price": 0.0, "retail": 0.0})
+        second = _FakeProvider({"specs": 0.0, "price": 0.0, "retail": 0.0})
+
+        expected = await first.search_product("Makita", "XFD131")
+        cached = await second.search_product("Makita", "XFD131")
+
+        assert second.queries == []
+        assert _urls(cached) == _urls(expected)
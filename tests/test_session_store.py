@@ -0,0 +1,257 @@
+"""Tests for the SQLite-backed chat session store."""
+
+from __future__ import annotations
+
+import sqlite3
+import time
+
+import pytest
+
+from homebox_companion.chat.session import ChatSession, PendingApproval
+from homebox_companion.chat.store import SessionStoreProtocol, SQLiteSessionStore
+from homebox_companion.chat.types import ChatMessage, ToolCall
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    return tmp_path / "sessions.db"
+
+
+@pytest.fixture
+def store(db_path):
+    store = SQLiteSessionStore(db_path, flush_interval=0)
+    yield store
+    store.close()
+
+
+def _add_exchange(session: ChatSession) -> None:
+    session.add_message(ChatMessage(role="user", content="Where is my drill?"))
+    session.add_message(
+        ChatMessage(
+            role="assistant",
+            content="",
+            tool_calls=[ToolCall(id="c1", name="search_items", arguments={"query": "drill"})],
+        )
+    )
+    session.add_message(ChatMessage(role="tool", content='{"success": true}', tool_call_id="c1"))
+    session.add_message(ChatMessage(role="assistant", content="In the garage."))
+
+
+def _stored_count(db_path) -> int:
+    conn = sqlite3.connect(db_path)
+    try:
+        return conn.execute("SELECT COUNT(*) FROM chat_messages").fetchone()[0]
+    finally:
+        conn.close()
+
+
+class TestSQLiteSessionStore:
+    """Tests for SQLiteSessionStore."""
+
+    def test_satisfies_protocol(self, store):
+        assert isinstance(store, SessionStoreProtocol)
+
+    def test_uses_wal_mode(self, store, db_path):
+        conn = sqlite3.connect(db_path)
+        try:
+            assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        finally:
+            conn.close()
+
+    def test_hot_session_is_same_object(self, store):
+        assert store.get("token") is store.get("token")
+
+    def test_session_survives_restart(self, db_path):
+        store = SQLiteSessionStore(db_path, flush_interval=0)
+        session = store.get("token")
+        _add_exchange(session)
+        session_id = session.session_id
+        store.close()
+
+        reopened = SQLiteSessionStore(db_path, flush_interval=0)
+        try:
+            restored = reopened.get("token")
+            assert restored.session_id == session_id
+            assert [m.role for m in restored.messages] == ["user", "assistant", "tool", "assistant"]
+            assert restored.messages[1].tool_calls[0].arguments == {"query": "drill"}
+            # Tool message index is rebuilt
+            assert restored.update_tool_message("c1", '{"success": false}')
+        finally:
+            reopened.close()
+
+    def test_flush_writes_only_changes(self, store, db_path):
+        session = store.get("token")
+        _add_exchange(session)
+        store.flush()
+
+        session.update_tool_message("c1", '{"success": false, "rejected": true}')
+        session.add_message(ChatMessage(role="user", content="Thanks"))
+        store.flush()
+
+        conn = sqlite3.connect(db_path)
+        try:
+            rows = conn.execute(
+                "SELECT seq, data FROM chat_messages ORDER BY seq"
+            ).fetchall()
+            version = conn.execute("SELECT version FROM chat_sessions").fetchone()[0]
+        finally:
+            conn.close()
+        assert [seq for seq, _ in rows] == [0, 1, 2, 3, 4]
+        assert "rejected" in rows[2][1]
+        assert version == 2
+
+    def test_cleared_session_deletes_stored_messages(self, db_path):
+        store = SQLiteSessionStore(db_path, flush_interval=0)
+        session = store.get("token")
+        _add_exchange(session)
+        store.flush()
+        session.clear()
+        store.close()
+
+        reopened = SQLiteSessionStore(db_path, flush_interval=0)
+        try:
+            assert reopened.get("token").messages == []
+        finally:
+            reopened.close()
+
+    def test_other_worker_writes_are_picked_up(self, db_path):
+        worker_a = SQLiteSessionStore(db_path, flush_interval=0)
+        worker_b = SQLiteSessionStore(db_path, flush_interval=0)
+        try:
+            _add_exchange(worker_a.get("token"))
+            worker_a.flush()
+
+            session_b = worker_b.get("token")
+            assert len(session_b.messages) == 4
+            session_b.add_message(ChatMessage(role="user", content="And my saw?"))
+            worker_b.flush()
+
+            assert worker_a.get("token").messages[-1].content == "And my saw?"
+        finally:
+            worker_a.close()
+            worker_b.close()
+
+    def test_concurrent_appends_are_merged(self, db_path):
+        worker_a = SQLiteSessionStore(db_path, flush_interval=0)
+        worker_b = SQLiteSessionStore(db_path, flush_interval=0)
+        try:
+            _add_exchange(worker_a.get("token"))
+            worker_a.flush()
+            session_b = worker_b.get("token")
+
+            worker_a.get("token").add_message(ChatMessage(role="user", content="From A"))
+            worker_a.flush()
+            session_b.update_tool_message("c1", '{"success": false}')
+            session_b.add_message(ChatMessage(role="user", content="From B"))
+            worker_b.flush()
+
+            for worker in (worker_a, worker_b):
+                messages = worker.get("token").messages
+                assert [m.content for m in messages[4:]] == ["From A", "From B"]
+                assert messages[2].content == '{"success": false}'
+        finally:
+            worker_a.close()
+            worker_b.close()
+
+    def test_pending_approvals_are_shared(self, db_path):
+        worker_a = SQLiteSessionStore(db_path, flush_interval=0)
+        worker_b = SQLiteSessionStore(db_path, flush_interval=0)
+        try:
+            session_a = worker_a.get("token")
+            _add_exchange(session_a)
+            approval = PendingApproval(
+                id="a1", tool_name="update_item", parameters={"item_id": "i1"}, tool_call_id="c1"
+            )
+            session_a.add_pending_approval(approval)
+            worker_a.flush()
+
+            session_b = worker_b.get("token")
+            assert session_b.get_pending_approval("a1") == approval
+            assert session_b.remove_approval("a1")
+            worker_b.flush()
+
+            assert worker_a.get("token").list_pending_approvals() == []
+        finally:
+            worker_a.close()
+            worker_b.close()
+
+    def test_session_deleted_elsewhere_stays_deleted(self, db_path):
+        worker_a = SQLiteSessionStore(db_path, flush_interval=0)
+        worker_b = SQLiteSessionStore(db_path, flush_interval=0)
+        try:
+            session_a = worker_a.get("token")
+            _add_exchange(session_a)
+            worker_a.flush()
+            worker_b.delete("token")
+
+            session_a.add_message(ChatMessage(role="user", content="Late"))
+            worker_a.flush()
+
+            assert _stored_count(db_path) == 0
+            assert worker_a.get("token").messages == []
+        finally:
+            worker_a.close()
+            worker_b.close()
+
+    def test_background_flusher(self, db_path):
+        store = SQLiteSessionStore(db_path, flush_interval=0.01)
+        try:
+            _add_exchange(store.get("token"))
+            for _ in range(100):
+                if _stored_count(db_path) == 4:
+                    break
+                time.sleep(0.01)
+            assert _stored_count(db_path) == 4
+        finally:
+            store.close()
+
+    def test_lru_eviction_flushes(self, db_path):
+        store = SQLiteSessionStore(db_path, cache_size=1, flush_interval=0)
+        try:
+            _add_exchange(store.get("first"))
+            store.get("second")  # Evicts "first"
+
+            assert len(store.get("first").messages) == 4
+        finally:
+            store.close()
+
+    def test_expired_session_is_replaced(self, db_path):
+        store = SQLiteSessionStore(db_path, session_ttl=1, flush_interval=0)
+        try:
+            session = store.get("token")
+            _add_exchange(session)
+            store._hot[store._get_session_key("token")].last_access -= 10
+
+            assert store.get("token").messages == []
+        finally:
+            store.close()
+
+    def test_flush_sweeps_expired_sessions(self, store, db_path):
+        _add_exchange(store.get("token"))
+        store.flush()
+        conn = sqlite3.connect(db_path)
+        try:
+            conn.execute("UPDATE chat_sessions SET last_access = 0")
+            conn.commit()
+        finally:
+            conn.close()
+        store._last_cleanup = 0
+
+        store.get("other")  # Lookups never sweep
+        assert _stored_count(db_path) == 4
+
+        store.flush()
+        assert _stored_count(db_path) == 0
+
+    def test_delete_and_clear_all(self, store):
+        _add_exchange(store.get("a"))
+        store.get("b")
+        store.flush()
+
+        assert store.session_count == 2
+        assert store.delete("a") is True
+        assert store.delete("a") is False
+        assert store.clear_all() == 1
+        assert store.session_count == 0
@@ -0,0 +1,154 @@
+"""Tests for single-flight coalescing of concurrent identical calls."""
+
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from homebox_companion.ai import llm
+from homebox_companion.core.single_flight import SingleFlight, make_flight_key
+from homebox_companion.services.enrichment import EnrichmentResult, EnrichmentService
+
+pytestmark = pytest.mark.unit
+
+
+class TestMakeFlightKey:
+    """Tests for make_flight_key."""
+
+    def test_dict_order_does_not_matter(self):
+        assert make_flight_key({"a": 1, "b": 2}) == make_flight_key({"b": 2, "a": 1})
+
+    def test_different_parts_differ(self):
+        assert make_flight_key("gpt-5-mini", []) != make_flight_key("gpt-5-nano", [])
+
+
+class TestSingleFlight:
+    """Tests for SingleFlight."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_share_one_execution(self):
+        flight = SingleFlight("test")
+        calls = 0
+
+        async def work():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return calls
+
+        results = await asyncio.gather(*(flight.do("k", work) for _ in range(5)))
+
+        assert results == [1] * 5
+        assert calls == 1
+        assert flight.stats() == {"calls": 1, "coalesced": 4, "in_flight": 0}
+
+    @pytest.mark.asyncio
+    async def test_sequential_calls_are_not_cached(self):
+        flight = SingleFlight("test")
+        work = AsyncMock(side_effect=[1, 2])
+
+        assert await flight.do("k", work) == 1
+        assert await flight.do("k", work) == 2
+
+    @pytest.mark.asyncio
+    async def test_exception_propagates_to_all_waiters(self):
+        flight = SingleFlight("test")
+
+        async def fail():
+            await asyncio.sleep(0.01)
+            raise ValueError("boom")
+
+        results = await asyncio.gather(
+            flight.do("k", fail), flight.do("k", fail), return_exceptions=True
+        )
+
+        assert all(isinstance(r, ValueError) for r in results)
+        assert flight.stats()["in_flight"] == 0
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_does_not_cancel_shared_call(self):
+        flight = SingleFlight("test")
+
+        async def work():
+            await asyncio.sleep(0.02)
+            return "done"
+
+        first = asyncio.create_task(flight.do("k", work))
+        second = asyncio.create_task(flight.do("k", work))
+        await asyncio.sleep(0)
+        first.cancel()
+
+        assert await second == "done"
+
+    @pytest.mark.asyncio
+    async def test_last_waiter_leaving_cancels_shared_call(self):
+        flight = SingleFlight("test")
+        cancelled = asyncio.Event()
+
+        async def work():
+            try:
+                await asyncio.sleep(1.0)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        waiters = [asyncio.create_task(flight.do("k", work)) for _ in range(2)]
+        await asyncio.sleep(0)
+        for waiter in waiters:
+            waiter.cancel()
+        await asyncio.gather(*waiters, return_exceptions=True)
+
+        await asyncio.wait_for(cancelled.wait(), timeout=0.5)
+        assert flight.stats()["in_flight"] == 0
+
+
+class TestCompletionCoalescing:
+    """Tests for coalescing in the LLM client."""
+
+    @pytest.mark.asyncio
+    async def test_identical_requests_share_upstream_call_and_usage(self):
+        async def slow_completion(**kwargs):
+            await asyncio.sleep(0.01)
+            return SimpleNamespace(
+                choices=[SimpleNamespace(message=SimpleNamespace(content='{"items": []}'))],
+                usage=SimpleNamespace(prompt_tokens=10, completion_tokens=5, total_tokens=15),
+            )
+
+        mock = AsyncMock(side_effect=slow_completion)
+        messages = [{"role": "user", "content": "same photo"}]
+        with patch.object(llm.litellm, "acompletion", mock), patch.object(
+            llm, "is_rate_limiting_enabled", return_value=False
+        ):
+            first, second = await asyncio.gather(
+                llm._acompletion_with_repair(messages, model="gpt-5-mini", api_key="k"),
+                llm._acompletion_with_repair(messages, model="gpt-5-mini", api_key="k"),
+            )
+
+        assert mock.await_count == 1
+        assert first.usage is second.usage
+        assert first.content == second.content
+        assert first.content is not second.content
+
+
+class TestEnrichmentCoalescing:
+    """Tests for coalescing in EnrichmentService.enrich."""
+
+    @pytest.mark.asyncio
+    async def test_same_product_enriched_once(self, tmp_path):
+        service = EnrichmentService(cache_dir=tmp_path, ai_provider=object())
+
+        async def ai_enrich(manufacturer, model_number, product_name):
+            await asyncio.sleep(0.01)
+            return EnrichmentResult(enriched=True, source="ai", name="Drill", description="")
+
+        with patch.object(service, "_ai_enrich", AsyncMock(side_effect=ai_enrich)) as mock:
+            results = await asyncio.gather(
+                service.enrich("DeWalt", "DCD771"),
+                service.enrich("dewalt", "DCD771 "),
+            )
+
+        assert mock.await_count == 1
+        assert all(r.enriched for r in results)
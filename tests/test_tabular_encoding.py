@@ -0,0 +1,182 @@
+"""Tests for the dense tabular encoding of list-shaped tool results."""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from homebox_companion.chat.session import ChatSession
+from homebox_companion.mcp.tabular import encode_table
+from homebox_companion.mcp.types import ToolResult
+
+pytestmark = pytest.mark.unit
+
+BASE = "https://homebox.example"
+
+
+def _item(n: int, location_id: str = "loc-1", quantity: int = 1) -> dict:
+    """Build a full ItemView-shaped dict."""
+    return {
+        "id": f"item-{n}",
+        "name": f"Item {n}",
+        "description": "",
+        "quantity": quantity,
+        "assetId": None,
+        "location": {
+            "id": location_id,
+            "name": f"Shelf {location_id}",
+            "description": "",
+            "itemCount": 0,
+            "children": [],
+            "url": f"{BASE}/location/{location_id}",
+        },
+        "labels": [{"id": "lab-1", "name": "Tools"}],
+        "notes": None,
+        "insured": False,
+        "url": f"{BASE}/item/item-{n}",
+    }
+
+
+def _decode(table: dict) -> list[dict]:
+    """Reverse the encoding the way the LLM is told to read it."""
+    defaults = table.get("defaults", {})
+    refs = table.get("refs", {})
+    templates = table.get("url_templates", {})
+    records = []
+    for row in table["rows"]:
+        record = {}
+        for col, value in zip(table["columns"], row, strict=True):
+            if value is None and col in defaults:
+                value = defaults[col]
+            if col == "location":
+                value = refs["locations"][value]
+            elif col == "labels":
+                value = [refs["labels"][key] for key in value]
+            record[col] = value
+        if "row" in templates:
+            record["url"] = templates["row"].format(id=record["id"])
+        records.append(record)
+    return records
+
+
+class TestEncodeTable:
+    """Tests for encode_table."""
+
+    def test_round_trips_information(self):
+        items = [_item(1), _item(2, quantity=3), _item(3, location_id="loc-2")]
+
+        table = encode_table(items)
+
+        assert table is not None
+        decoded = _decode(table)
+        for original, record in zip(items, decoded, strict=True):
+            assert record["id"] == original["id"]
+            assert record["name"] == original["name"]
+            assert record["quantity"] == original["quantity"]
+            assert record["url"] == original["url"]
+            assert record["location"]["id"] == original["location"]["id"]
+            assert record["labels"][0]["name"] == "Tools"
+
+    def test_shrinks_payload(self):
+        items = [_item(n, location_id=f"loc-{n % 3}") for n in range(50)]
+
+        table = encode_table(items)
+
+        assert table is not None
+        assert len(json.dumps(table)) < len(json.dumps(items)) / 2
+
+    def test_deduplicates_references(self):
+        table = encode_table([_item(n) for n in range(5)])
+
+        assert table is not None
+        assert list(table["refs"]["locations"]) == ["L1"]
+        assert list(table["refs"]["labels"]) == ["T1"]
+        assert table["url_templates"]["locations"] == f"{BASE}/location/{{id}}"
+
+    def test_drops_empty_columns_and_defaults(self):
+        table = encode_table([_item(n) for n in range(5)])
+
+        assert table is not None
+        for col in ("description", "assetId", "notes", "insured", "url"):
+            assert col not in table["columns"]
+        assert table["defaults"]["quantity"] == 1
+        quantity_col = table["columns"].index("quantity")
+        assert all(row[quantity_col] is None for row in table["rows"])
+        # Empty fields are stripped from referenced records too
+        assert table["refs"]["locations"]["L1"] == {"id": "loc-1", "name": "Shelf loc-1"}
+
+    def test_missing_values_are_not_defaulted(self):
+        items = [{**_item(n), "manufacturer": "DeWalt" if n < 6 else None} for n in range(10)]
+
+        table = encode_table(items)
+
+        assert table is not None
+        assert "manufacturer" not in table.get("defaults", {})
+        assert [r["manufacturer"] for r in _decode(table)] == ["DeWalt"] * 6 + [None] * 4
+
+    def test_defaults_compare_types(self):
+        items = [{**_item(n), "quantity": 1 if n < 3 else True} for n in range(5)]
+
+        table = encode_table(items)
+
+        assert table is not None
+        assert table["defaults"]["quantity"] == 1
+        assert [r["quantity"] for r in _decode(table)] == [1, 1, 1, True, True]
+
+    @pytest.mark.parametrize(
+        "data",
+        [None, {"id": "x"}, [], [{"id": "x"}], ["a", "b"], [{"id": "x"}, "b"]],
+    )
+    def test_non_tabular_data_is_left_alone(self, data):
+        assert encode_table(data) is None
+
+
+class TestToolResultLLMDict:
+    """Tests for ToolResult.to_llm_dict."""
+
+    def test_list_result_is_tabular_and_keeps_metadata(self):
+        result = ToolResult(success=True, data=[_item(n) for n in range(4)])
+
+        llm_dict = result.to_llm_dict()
+
+        assert llm_dict["metadata"]["count"] == 4
+        assert "rows" in llm_dict["data"]
+        # The frontend form is untouched
+        assert result.to_dict()["data"][0]["url"] == f"{BASE}/item/item-0"
+
+    def test_paginated_items_are_tabular(self):
+        pagination = {"page": 1, "page_size": 50, "total": 4, "items_returned": 4}
+        result = ToolResult(
+            success=True, data={"items": [_item(n) for n in range(4)], "pagination": pagination}
+        )
+
+        data = result.to_llm_dict()["data"]
+
+        assert data["pagination"] == pagination
+        assert len(data["items"]["rows"]) == 4
+
+    def test_errors_and_single_items_unchanged(self):
+        error = ToolResult(success=False, error="boom")
+        single = ToolResult(success=True, data=_item(1))
+
+        assert error.to_llm_dict() == error.to_dict()
+        assert single.to_llm_dict() == single.to_dict()
+
+
+def test_history_compression_understands_tables():
+    session = ChatSession()
+    table_result = ToolResult(success=True, data=[_item(n) for n in range(4)]).to_llm_dict()
+
+    summary = json.loads(session._compress_tool_result(json.dumps(table_result)))
+
+    assert summary["_summary"] == "4 items returned"
+
+
+def test_history_compression_understands_paginated_tables():
+    session = ChatSession()
+    result = ToolResult(success=True, data={"items": [_item(n) for n in range(3)], "pagination": {}})
+
+    summary = json.loads(session._compress_tool_result(json.dumps(result.to_llm_dict())))
+
+    assert summary["_summary"] == "3 items returned"
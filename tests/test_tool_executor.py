@@ -5,11 +5,15 @@ These tests verify the centralized tool execution service.
 
 from __future__ import annotations
 
+import asyncio
+import json
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
+from litellm.llms.vertex_ai.gemini.vertex_and_google_ai_studio_gemini import VertexGeminiConfig
 
 from homebox_companion.mcp.executor import ToolExecutor
+from homebox_companion.mcp.schemas import get_tool_schema_set
 from homebox_companion.mcp.types import ToolPermission
 
 
@@ -183,6 +187,53 @@ class TestToolExecutorCaching:
         # Should be the same list (cached)
         assert schemas1 == schemas2
 
+    def test_schemas_are_private_copies(self, mock_client: MagicMock):
+        """Callers get their own schema dicts, so mutating them is harmless."""
+        schemas1 = ToolExecutor(mock_client).get_tool_schemas()
+        schemas1[0]["function"]["parameters"].clear()
+
+        schemas2 = ToolExecutor(mock_client).get_tool_schemas()
+
+        assert schemas2[0]["function"]["parameters"]
+        assert schemas2 == list(get_tool_schema_set(True, False).schemas)
+
+    def test_gemini_mapping_leaves_cached_schemas_intact(self, mock_client: MagicMock):
+        """LiteLLM's Gemini tool mapping edits schemas in place; the cache must not see it."""
+        cached = get_tool_schema_set(True, False)
+        before = json.dumps(cached.schemas)
+
+        VertexGeminiConfig()._map_function(ToolExecutor(mock_client).get_tool_schemas(), {})
+
+        assert json.dumps(cached.schemas) == before
+        assert json.loads(cached.schemas_json) == json.loads(before)
+
+    def test_token_variant_does_not_leak(self, mock_client: MagicMock):
+        """The token parameter only appears in the token variant."""
+        executor = ToolExecutor(mock_client)
+
+        with_token = executor.get_tool_schemas(include_token=True)
+        without_token = executor.get_tool_schemas()
+
+        for schema in with_token:
+            assert "token" in schema["function"]["parameters"]["required"]
+        for schema in without_token:
+            assert "token" not in schema["function"]["parameters"].get("properties", {})
+
+    def test_listing_json_matches_read_schemas(self, mock_client: MagicMock):
+        """The pre-serialized MCP listing holds the read-only token schemas."""
+        executor = ToolExecutor(mock_client)
+
+        listing = json.loads(executor.get_tool_listing_json())
+        schemas = executor.get_tool_schemas(include_write=False, include_token=True)
+
+        assert listing["tools"] == {
+            s["function"]["name"]: {
+                "description": s["function"]["description"],
+                "parameters": s["function"]["parameters"],
+            }
+            for s in schemas
+        }
+
 
 class TestGetDisplayInfo:
     """Tests for ToolExecutor.get_display_info method."""
@@ -336,3 +387,78 @@ class TestGetDisplayInfo:
         assert info.target_name is None
 
 
+
+
+class TestExecuteBatch:
+    """Tests for ToolExecutor.execute_batch."""
+
+    @pytest.fixture
+    def mock_client(self) -> MagicMock:
+        """Create a mock HomeboxClient that tracks concurrent get_item calls."""
+        client = MagicMock()
+        client.in_flight = 0
+        client.max_in_flight = 0
+
+        async def get_item(token: str, item_id: str) -> dict:
+            client.in_flight += 1
+            client.max_in_flight = max(client.max_in_flight, client.in_flight)
+            await asyncio.sleep(0.01)
+            client.in_flight -= 1
+            return {"id": item_id, "name": f"Item {item_id}"}
+
+        client.get_item = AsyncMock(side_effect=get_item)
+        client.update_item = AsyncMock(
+            side_effect=lambda token, item_id, data: {"id": item_id, "name": data["name"]}
+        )
+        return client
+
+    @pytest.fixture
+    def executor(self, mock_client: MagicMock) -> ToolExecutor:
+        return ToolExecutor(mock_client)
+
+    @pytest.mark.asyncio
+    async def test_reads_run_concurrently_and_keep_order(
+        self, executor: ToolExecutor, mock_client: MagicMock
+    ):
+        calls = [("get_item", {"item_id": f"item{n}"}) for n in range(6)]
+
+        results = await executor.execute_batch(calls, "token")
+
+        assert [r.result.data["id"] for r in results] == [f"item{n}" for n in range(6)]
+        assert mock_client.max_in_flight > 1
+        for r in results:
+            assert r.result.success
+            assert r.duration_ms > 0
+            assert set(r.to_dict()["timing"]) == {"queued_ms", "duration_ms"}
+
+    @pytest.mark.asyncio
+    async def test_writes_rejected_by_default(
+        self, executor: ToolExecutor, mock_client: MagicMock
+    ):
+        results = await executor.execute_batch(
+            [("update_item", {"item_id": "item1", "name": "New"}), ("nonexistent_tool", {})],
+            "token",
+        )
+
+        assert [r.result.success for r in results] == [False, False]
+        assert "not allowed" in results[0].result.error
+        assert "Unknown tool" in results[1].result.error
+        mock_client.update_item.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_writes_allowed_with_permission(
+        self, executor: ToolExecutor, mock_client: MagicMock
+    ):
+        results = await executor.execute_batch(
+            [
+                ("update_item", {"item_id": "item1", "name": "First"}),
+                ("update_item", {"item_id": "item2", "name": "Second"}),
+                ("get_item", {"item_id": "item3"}),
+            ],
+            "token",
+            allowed_permissions=(ToolPermission.READ, ToolPermission.WRITE),
+        )
+
+        assert all(r.result.success for r in results)
+        assert [r.result.data["name"] for r in results[:2]] == ["First", "Second"]
+        assert mock_client.update_item.await_count == 2
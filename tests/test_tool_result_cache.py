@@ -0,0 +1,114 @@
+"""Tests for the per-session READ tool result cache."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from homebox_companion.chat.session import ChatSession
+from homebox_companion.mcp.executor import ToolExecutor
+from homebox_companion.mcp.result_cache import ToolResultCache
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture
+def mock_client() -> MagicMock:
+    client = MagicMock()
+    client.list_labels = AsyncMock(return_value=[{"id": "lab1", "name": "Tools"}])
+    client.get_item = AsyncMock(return_value={"id": "item1", "name": "Drill"})
+    client.create_label = AsyncMock(return_value={"id": "lab2", "name": "Garden"})
+    return client
+
+
+@pytest.fixture
+def executor(mock_client: MagicMock) -> ToolExecutor:
+    return ToolExecutor(mock_client)
+
+
+class TestExecutorCaching:
+    """Tests for ToolExecutor.execute with a result cache."""
+
+    @pytest.mark.asyncio
+    async def test_repeated_read_is_served_from_cache(self, executor, mock_client):
+        cache = ToolResultCache(ttl=30)
+
+        first = await executor.execute("list_labels", {}, "token", cache=cache)
+        second = await executor.execute("list_labels", {}, "token", cache=cache)
+
+        assert first.success and second.data == first.data
+        assert mock_client.list_labels.await_count == 1
+        assert cache.stats()["hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_different_params_are_separate_entries(self, executor, mock_client):
+        cache = ToolResultCache(ttl=30)
+
+        await executor.execute("get_item", {"item_id": "item1"}, "token", cache=cache)
+        await executor.execute("get_item", {"item_id": "item2"}, "token", cache=cache)
+
+        assert mock_client.get_item.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_write_invalidates(self, executor, mock_client):
+        cache = ToolResultCache(ttl=30)
+
+        await executor.execute("list_labels", {}, "token", cache=cache)
+        await executor.execute("create_label", {"name": "Garden"}, "token", cache=cache)
+        await executor.execute("list_labels", {}, "token", cache=cache)
+
+        assert mock_client.list_labels.await_count == 2
+        assert cache.stats()["invalidations"] == 1
+
+    @pytest.mark.asyncio
+    async def test_failed_write_still_invalidates(self, executor, mock_client):
+        cache = ToolResultCache(ttl=30)
+        mock_client.create_label.side_effect = RuntimeError("boom")
+
+        await executor.execute("list_labels", {}, "token", cache=cache)
+        result = await executor.execute("create_label", {"name": "Garden"}, "token", cache=cache)
+
+        assert not result.success
+        assert cache.stats()["entries"] == 0
+
+    @pytest.mark.asyncio
+    async def test_errors_are_not_cached(self, executor, mock_client):
+        cache = ToolResultCache(ttl=30)
+        mock_client.list_labels.side_effect = [RuntimeError("down"), []]
+
+        first = await executor.execute("list_labels", {}, "token", cache=cache)
+        second = await executor.execute("list_labels", {}, "token", cache=cache)
+
+        assert not first.success
+        assert second.success
+
+    @pytest.mark.asyncio
+    async def test_expired_entries_are_refetched(self, executor, mock_client):
+        cache = ToolResultCache(ttl=0.01)
+
+        await executor.execute("list_labels", {}, "token", cache=cache)
+        await asyncio.sleep(0.02)
+        await executor.execute("list_labels", {}, "token", cache=cache)
+
+        assert mock_client.list_labels.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_zero_ttl_disables(self, executor, mock_client):
+        cache = ToolResultCache(ttl=0)
+
+        await executor.execute("list_labels", {}, "token", cache=cache)
+        await executor.execute("list_labels", {}, "token", cache=cache)
+
+        assert mock_client.list_labels.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_session_clear_empties_tool_cache(executor):
+    session = ChatSession()
+    await executor.execute("list_labels", {}, "token", cache=session.tool_cache)
+
+    session.clear()
+
+    assert session.tool_cache.stats()["entries"] == 0
@@ -0,0 +1,168 @@
+"""Tests for the shared HTTP transport registry."""
+
+from __future__ import annotations
+
+import asyncio
+
+import httpx
+import pytest
+
+from homebox_companion.core import transport
+from homebox_companion.core.transport import (
+    TransportRegistry,
+    _origin,
+    close_transport_registry,
+    get_transport_registry,
+    init_transport_registry,
+)
+
+pytestmark = pytest.mark.unit
+
+
+def _ok(request: httpx.Request) -> httpx.Response:
+    return httpx.Response(200, json={"host": request.url.host})
+
+
+async def _streamed(request: httpx.Request) -> httpx.Response:
+    async def body():
+        yield b"page"
+
+    return httpx.Response(200, content=body())
+
+
+class TestOrigin:
+    """Tests for origin normalization."""
+
+    @pytest.mark.parametrize(
+        ("url", "expected"),
+        [
+            ("https://API.tavily.com/search", "https://api.tavily.com:443"),
+            ("http://localhost:11434", "http://localhost:11434"),
+            ("http://searx.local/search?q=x", "http://searx.local:80"),
+            ("www.homedepot.com", "https://www.homedepot.com:443"),
+        ],
+    )
+    def test_origin(self, url, expected):
+        assert _origin(url) == expected
+
+
+class TestTransportRegistry:
+    """Tests for TransportRegistry."""
+
+    def test_same_origin_shares_pool(self):
+        registry = TransportRegistry()
+        registry.client_for("https://api.tavily.com/search")
+        registry.client_for("https://api.tavily.com/other")
+        registry.client_for("https://www.googleapis.com/customsearch/v1")
+
+        assert set(registry.stats()) == {
+            "https://api.tavily.com:443",
+            "https://www.googleapis.com:443",
+        }
+
+    @pytest.mark.asyncio
+    async def test_closing_borrowed_client_keeps_pool_and_counts_requests(self):
+        registry = TransportRegistry()
+        origin = "https://example.com:443"
+        registry.client_for("https://example.com")
+        registry._pools[origin] = httpx.MockTransport(_ok)  # type: ignore[assignment]
+
+        async with registry.client_for("https://example.com") as client:
+            await client.get("https://example.com/a")
+        async with registry.client_for("https://example.com") as client:
+            response = await client.get("https://example.com/b")
+
+        assert response.json() == {"host": "example.com"}
+        assert registry.stats()[origin]["requests"] == 2
+        assert registry.stats()[origin]["errors"] == 0
+        assert registry.stats()[origin]["active"] == 0
+
+    @pytest.mark.asyncio
+    async def test_closed_registry_refuses_new_clients(self):
+        registry = TransportRegistry()
+        registry.client_for("https://example.com")
+        await registry.aclose()
+
+        assert registry.stats() == {}
+        with pytest.raises(RuntimeError):
+            registry.client_for("https://example.com")
+
+    @pytest.mark.asyncio
+    async def test_least_recently_used_idle_pool_is_evicted_and_closed(self):
+        registry = TransportRegistry(max_pools=2)
+        registry.client_for("https://a.example")
+        registry.client_for("https://b.example")
+        pool_b = registry._pools["https://b.example:443"]
+        closed = []
+
+        async def aclose() -> None:
+            closed.append(True)
+
+        pool_b.aclose = aclose  # type: ignore[method-assign]
+        registry.client_for("https://a.example")  # a is now more recent than b
+        registry.client_for("https://c.example")
+        await asyncio.sleep(0)
+
+        assert set(registry.stats()) == {"https://a.example:443", "https://c.example:443"}
+        assert registry.evictions == 1
+        assert closed == [True]
+        await registry.aclose()
+
+    @pytest.mark.asyncio
+    async def test_client_of_evicted_pool_gets_a_fresh_one(self):
+        registry = TransportRegistry(max_pools=1)
+        client = registry.client_for("https://a.example")
+        registry.client_for("https://b.example")
+        assert "https://a.example:443" not in registry.stats()
+
+        # Recreate the pool as a mock so the client's next request can be served
+        registry._checkout("https://a.example:443")
+        registry._pools["https://a.example:443"] = httpx.MockTransport(_ok)  # type: ignore[assignment]
+
+        assert (await client.get("https://a.example/x")).json() == {"host": "a.example"}
+        assert registry.stats()["https://a.example:443"]["requests"] == 1
+        await registry.aclose()
+
+    @pytest.mark.asyncio
+    async def test_pools_with_requests_in_flight_are_kept(self):
+        registry = TransportRegistry(max_pools=1)
+        registry.client_for("https://a.example")
+        registry._stats["https://a.example:443"].active = 1
+
+        registry.client_for("https://b.example")
+
+        assert set(registry.stats()) == {"https://a.example:443", "https://b.example:443"}
+        await registry.aclose()
+
+    @pytest.mark.asyncio
+    async def test_streaming_response_keeps_pool_until_closed(self):
+        registry = TransportRegistry(max_pools=1)
+        client = registry.client_for("https://a.example")
+        registry._pools["https://a.example:443"] = httpx.MockTransport(_streamed)  # type: ignore[assignment]
+
+        async with client.stream("GET", "https://a.example/page") as response:
+            registry.client_for("https://b.example")
+            assert "https://a.example:443" in registry.stats()
+            await response.aread()
+        assert registry.stats()["https://a.example:443"]["active"] == 0
+
+        registry.client_for("https://c.example")
+        assert "https://a.example:443" not in registry.stats()
+        await registry.aclose()
+
+    def test_http2_falls_back_without_h2(self, monkeypatch):
+        monkeypatch.setattr(transport.importlib.util, "find_spec", lambda name: None)
+        registry = TransportRegistry(http2=True)
+        assert registry._http2 is False
+
+
+class TestRegistryLifecycle:
+    """Tests for the module-level registry used by the app lifespan."""
+
+    @pytest.mark.asyncio
+    async def test_init_and_close(self):
+        registry = init_transport_registry()
+        assert get_transport_registry() is registry
+
+        await close_transport_registry()
+        assert get_transport_registry() is None
@@ -0,0 +1,251 @@
+"""Tests for the streaming retailer page fetcher."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from collections.abc import AsyncIterator
+
+import httpx
+import pytest
+import pytest_asyncio
+
+from homebox_companion.services import enrichment
+from homebox_companion.services.enrichment import (
+    RetailerDomainHealth,
+    URLContentFetcher,
+    _PageScanner,
+)
+from homebox_companion.services.search_providers import SearchResult
+
+pytestmark = pytest.mark.unit
+
+_JSON_LD = json.dumps({
+    "@context": "https://schema.org",
+    "@type": "Product",
+    "name": "Drill",
+    "offers": {"@type": "Offer", "price": "199.00", "priceCurrency": "USD"},
+})
+
+
+class _Page:
+    """Streamed HTML page that records how many chunks were read."""
+
+    def __init__(self, chunks: list[str] | None = None, filler: int = 0) -> None:
+        self.chunks = chunks or []
+        self.filler = filler
+        self.read = 0
+
+    async def stream(self) -> AsyncIterator[bytes]:
+        for chunk in self.chunks:
+            self.read += 1
+            yield chunk.encode()
+        for _ in range(self.filler):
+            self.read += 1
+            yield b"<p>" + b"specifications " * 4000 + b"</p>"
+
+
+@pytest.fixture(autouse=True)
+def no_request_spacing(monkeypatch) -> None:
+    monkeypatch.setattr(enrichment, "_DOMAIN_MIN_INTERVAL", 0.0)
+
+
+@pytest_asyncio.fixture
+async def fetcher() -> AsyncIterator[URLContentFetcher]:
+    fetcher = URLContentFetcher(timeout=5.0, domain_health=RetailerDomainHealth())
+    yield fetcher
+    await fetcher.aclose()
+
+
+def _serve(fetcher: URLContentFetcher, page: _Page, status: int = 200, content_type: str = "text/html") -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(status, headers={"content-type": content_type}, content=page.stream())
+
+    fetcher._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+
+class TestPageScanner:
+    """Tests for _PageScanner."""
+
+    def test_json_ld_price_across_chunks(self):
+        scanner = _PageScanner()
+        html = f'<html><head><script type="application/ld+json">{_JSON_LD}</script></head>'
+
+        assert scanner.feed(html[:40]) is False
+        assert scanner.feed(html[40:]) is True
+        assert scanner.json_ld_price == "199.00"
+        assert scanner.html == html
+
+    def test_script_prices_are_not_visible(self):
+        scanner = _PageScanner()
+        scanner.feed('<p>Now $149.99</p><scr')
+        scanner.feed('ipt>var p = "$5.00";</script><p>Was $199</p><p>')
+
+        assert scanner.visible_prices == 2
+        assert scanner.json_ld_price is None
+
+    def test_enough_visible_prices(self):
+        scanner = _PageScanner()
+
+        assert scanner.feed("<li>$1</li>" * 5 + "<p>") is True
+
+    def test_end_tag_split_across_chunks(self):
+        scanner = _PageScanner()
+        scanner.feed(f'<script type="application/ld+json">{_JSON_LD}</scr')
+
+        assert scanner.json_ld_price is None
+        assert scanner.feed("ipt>") is True
+        assert scanner.json_ld_price == "199.00"
+
+    def test_long_script_is_not_rescanned(self):
+        scanner = _PageScanner()
+        html = '<script id="__NEXT_DATA__">' + 'var p = "$5.00";' * 20000 + "</script><p>Now $149.99</p><p>"
+
+        for start in range(0, len(html), 4096):
+            scanner.feed(html[start:start + 4096])
+            assert len(scanner._pending) <= 4096 + 32
+
+        assert scanner.visible_prices == 1
+        assert scanner.html == html
+
+
+class TestFetchUrlContent:
+    """Tests for URLContentFetcher.fetch_url_content."""
+
+    @pytest.mark.asyncio
+    async def test_stops_after_json_ld_price(self, fetcher):
+        page = _Page(
+            [f'<html><head><title>DeWalt drill</title><script type="application/ld+json">{_JSON_LD}</script>'],
+            filler=50,
+        )
+        _serve(fetcher, page)
+
+        content = await fetcher.fetch_url_content("https://www.homedepot.com/p/123")
+
+        assert content.startswith("Product price from structured data: $199.00")
+        assert page.read < 5
+
+    @pytest.mark.asyncio
+    async def test_stops_at_byte_limit(self, fetcher, monkeypatch):
+        monkeypatch.setattr(enrichment, "_PAGE_MAX_BYTES", 100_000)
+        page = _Page(["<html><body>"], filler=50)
+        _serve(fetcher, page)
+
+        content = await fetcher.fetch_url_content("https://www.lowes.com/pd/123")
+
+        assert content.startswith("specifications")
+        assert page.read < 5
+
+    @pytest.mark.asyncio
+    async def test_returns_price_context(self, fetcher):
+        page = _Page(["<html><body><h1>Drill</h1>", "<p>Our price: $179.00, save today</p></body></html>"])
+        _serve(fetcher, page)
+
+        content = await fetcher.fetch_url_content("https://www.acmetools.com/drill")
+
+        assert "$179.00" in content
+        assert "<p>" not in content
+
+    @pytest.mark.asyncio
+    async def test_skips_non_html_and_errors(self, fetcher):
+        _serve(fetcher, _Page(['{"price": 1}']), content_type="application/json")
+        assert await fetcher.fetch_url_content("https://www.zoro.com/api") is None
+
+        _serve(fetcher, _Page(["Forbidden"]), status=403)
+        assert await fetcher.fetch_url_content("https://www.zoro.com/p/1") is None
+
+    @pytest.mark.asyncio
+    async def test_client_is_shared(self, fetcher):
+        first = fetcher._client_for("https://www.homedepot.com/p/1")
+        second = fetcher._client_for("https://www.lowes.com/pd/2")
+
+        assert first is second
+        await fetcher.aclose()
+        assert fetcher._client is None
+
+
+def _results(*urls: str) -> list[SearchResult]:
+    return [SearchResult(title=url, url=url, snippet="") for url in urls]
+
+
+class TestRetailerDomainHealth:
+    """Tests for negative caching and politeness in the retailer fetcher."""
+
+    @pytest.mark.asyncio
+    async def test_throttled_domain_is_skipped(self, fetcher):
+        requested: list[str] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requested.append(request.url.host)
+            if request.url.host == "www.amazon.com":
+                return httpx.Response(429, headers={"retry-after": "600"})
+            return httpx.Response(200, headers={"content-type": "text/html"}, text="<p>Price $99.00</p>")
+
+        fetcher._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        results = _results("https://www.amazon.com/dp/1", "https://www.lowes.com/pd/1")
+
+        await fetcher.fetch_retailer_content(results)
+        content = await fetcher.fetch_retailer_content(results)
+
+        assert requested.count("www.amazon.com") == 1
+        assert "$99.00" in content
+        stats = fetcher._domain_health.stats()["amazon.com"]
+        assert stats["retry_after_seconds"] > 590
+        assert stats["skipped_requests"] == 1
+
+    def test_backoff_grows_and_success_resets(self):
+        health = RetailerDomainHealth()
+
+        health.record_failure("amazon.com", "timeout")
+        health.record_failure("amazon.com", "timeout")
+
+        assert health.is_available("amazon.com") is False
+        assert 110 < health.stats()["amazon.com"]["retry_after_seconds"] <= 120
+
+        health.record_success("amazon.com", 0.2)
+        assert health.is_available("amazon.com") is True
+        assert health.stats()["amazon.com"]["consecutive_failures"] == 0
+
+    @pytest.mark.asyncio
+    async def test_not_found_does_not_block_domain(self, fetcher):
+        _serve(fetcher, _Page(["Not found"]), status=404)
+
+        assert await fetcher.fetch_url_content("https://www.zoro.com/p/1") is None
+        assert fetcher._domain_health.is_available("zoro.com") is True
+
+    @pytest.mark.asyncio
+    async def test_fast_domains_are_preferred(self, fetcher):
+        requested: list[str] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requested.append(request.url.host)
+            return httpx.Response(200, headers={"content-type": "text/html"}, text="<p>Price $99.00</p>")
+
+        fetcher._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        fetcher._domain_health.record_success("homedepot.com", 4.0)
+        fetcher._domain_health.record_success("lowes.com", 0.1)
+
+        await fetcher.fetch_retailer_content(
+            _results("https://www.homedepot.com/p/1", "https://www.lowes.com/pd/1"), max_urls=1
+        )
+
+        assert requested == ["www.lowes.com"]
+
+    @pytest.mark.asyncio
+    async def test_requests_per_domain_are_bounded(self, fetcher):
+        in_flight = 0
+        max_in_flight = 0
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return httpx.Response(200, headers={"content-type": "text/html"}, text="<p>Price $99.00</p>")
+
+        fetcher._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+        await asyncio.gather(*(fetcher.fetch_url_content(f"https://www.zoro.com/p/{n}") for n in range(5)))
+
+        assert max_in_flight == enrichment._DOMAIN_CONCURRENCY